@@ -211,9 +211,10 @@ AppState subscription.  Add this ONCE at app startup (e.g. in main.py):
             sys.path.insert(0, os.path.join(base, "world_map_module", "world_map"))
             from map_god_registry import WorldStateSync
             sync = WorldStateSync(os.path.join(base, "world_map_module", "data"))
-            for p in AppState.get().characters:
-                if p.god_id:
-                    sync.on_character_update(p.nome, p.god_id)
+            with sync.transacao():      # one write for the whole roster
+                for p in AppState.get().characters:
+                    if p.god_id:
+                        sync.on_character_update(p.nome, p.god_id)
             sync.reload()
         except Exception as e:
             pass  # WorldMap module not present — silent skip
@@ -0,0 +1,67 @@
+"""
+Fixtures compartilhadas dos testes (pytest).
+
+Os testes que mexem em dados trabalham sobre cópias dos JSON de data/ em
+tmp_path; os caminhos do data.app_state são trocados com monkeypatch e
+voltam ao original no teardown, então um teste não vaza para o próximo.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import data.app_state as app_state
+from data.app_state import AppState
+
+DATA_DIR = os.path.dirname(os.path.abspath(app_state.__file__))
+
+# Chave do storage → arquivo JSON em data/
+ARQUIVOS_JSON = {
+    "weapons":    "armas.json",
+    "characters": "personagens.json",
+    "match":      "match_config.json",
+    "tournament": "tournament_state.json",
+    "gods":       "gods.json",
+}
+# Constante do app_state → nome do arquivo
+ARQUIVOS_APP_STATE = {
+    "FILE_WEAPONS":     "armas.json",
+    "FILE_CHARS":       "personagens.json",
+    "FILE_MATCH":       "match_config.json",
+    "FILE_TOURNAMENT":  "tournament_state.json",
+    "FILE_GODS":        "gods.json",
+    "FILE_FIGHT_LOG":   "fight_results.jsonl",
+    "FILE_FIGHT_STATS": "fight_stats.json",
+    "FILE_DB":          "neural_fights.db",
+    "FILE_SNAPSHOT":    "catalog_snapshot.bin",
+}
+
+
+@pytest.fixture
+def json_paths(tmp_path):
+    """Cópias dos JSON de data/ em tmp_path: {chave do storage: caminho}."""
+    paths = {}
+    for chave, nome in ARQUIVOS_JSON.items():
+        origem = os.path.join(DATA_DIR, nome)
+        if os.path.exists(origem):
+            shutil.copy(origem, tmp_path)
+        paths[chave] = str(tmp_path / nome)
+    return paths
+
+
+@pytest.fixture
+def app_state_isolado(tmp_path, json_paths, monkeypatch):
+    """AppState novo lendo e escrevendo só em tmp_path; o singleton é descartado no fim."""
+    for const, nome in ARQUIVOS_APP_STATE.items():
+        monkeypatch.setattr(app_state, const, str(tmp_path / nome))
+    for chave, caminho in json_paths.items():
+        monkeypatch.setitem(app_state.JSON_PATHS, chave, caminho)
+    AppState.reset()
+    yield tmp_path
+    if AppState._instance is not None:
+        AppState._instance.flush()
+    AppState.reset()
@@ -1,40 +1,54 @@
 """
 NEURAL FIGHTS - Módulo Core
 Funcionalidades essenciais do jogo.
-"""
 
-from core.physics import (
-    normalizar_angulo,
-    distancia_pontos,
-    colisao_linha_circulo,
-    intersect_line_circle,
-    colisao_linha_linha
-)
-from core.skills import SKILL_DB, get_skill_data
-from core.entities import Lutador
-from core.game_feel import (
-    GameFeelManager,
-    HitStopManager,
-    SuperArmorSystem,
-    ChannelingSystem,
-    CameraFeel,
-    ChannelState,
-    SuperArmorState,
-)
+Os nomes abaixo são importados sob demanda (ver utils/importacao_tardia.py):
+`from core.physics import ...` não carrega mais core.arena → pygame, então
+workers headless (core + models + ai) sobem sem o stack de renderização.
+"""
 
-# v10.0 - Combat e Hitbox movidos para core
-from core.combat import (
-    ArmaProjetil, FlechaProjetil, OrbeMagico,
-    Projetil, AreaEffect, Beam, Buff, DotEffect,
-)
-from core.hitbox import (
-    DEBUG_HITBOX, DEBUG_VISUAL,
-    HitboxInfo, SistemaHitbox,
-    sistema_hitbox, verificar_hit, get_debug_visual, atualizar_debug,
-)
+from utils.importacao_tardia import exportacoes_tardias
 
-# v10.0 - Arena movida para core
-from core.arena import Arena
+__getattr__, __dir__ = exportacoes_tardias(__name__, {
+    # Physics
+    'normalizar_angulo':      '.physics',
+    'distancia_pontos':       '.physics',
+    'colisao_linha_circulo':  '.physics',
+    'intersect_line_circle':  '.physics',
+    'colisao_linha_linha':    '.physics',
+    # Skills
+    'SKILL_DB':               '.skills',
+    'get_skill_data':         '.skills',
+    # Entities
+    'Lutador':                '.entities',
+    # Game Feel v8.0
+    'GameFeelManager':        '.game_feel',
+    'HitStopManager':         '.game_feel',
+    'SuperArmorSystem':       '.game_feel',
+    'ChannelingSystem':       '.game_feel',
+    'CameraFeel':             '.game_feel',
+    'ChannelState':           '.game_feel',
+    'SuperArmorState':        '.game_feel',
+    # v10.0 - Combat e Hitbox movidos para core
+    'ArmaProjetil':           '.combat',
+    'FlechaProjetil':         '.combat',
+    'OrbeMagico':             '.combat',
+    'Projetil':               '.combat',
+    'AreaEffect':             '.combat',
+    'Beam':                   '.combat',
+    'Buff':                   '.combat',
+    'DotEffect':              '.combat',
+    'DEBUG_HITBOX':           '.hitbox',
+    'DEBUG_VISUAL':           '.hitbox',
+    'HitboxInfo':             '.hitbox',
+    'SistemaHitbox':          '.hitbox',
+    'sistema_hitbox':         '.hitbox',
+    'verificar_hit':          '.hitbox',
+    'get_debug_visual':       '.hitbox',
+    'atualizar_debug':        '.hitbox',
+    # v10.0 - Arena movida para core (importa pygame)
+    'Arena':                  '.arena',
+})
 
 __all__ = [
     # Physics
@@ -5,12 +5,30 @@ Sistema expandido com múltiplos mapas temáticos.
 """
 
 import math
+from collections import OrderedDict
 import pygame
 from utils.config import PPM, LARGURA, ALTURA
 from dataclasses import dataclass, field
 from typing import Tuple, List, Optional
 
 
+# Tipos de obstáculo com animação por tempo (não entram na camada estática)
+OBSTACULOS_ANIMADOS = ("lava", "fogo", "cristal", "nucleo")
+
+# Camada estática: degrau relativo entre baldes de zoom (erro máx. ~metade disso)
+LIMIAR_ZOOM_CAMADA = 0.005
+# Margem em metros em volta da arena (paredes, encosto do trono, copas)
+MARGEM_CAMADA = 3.0
+# Acima disso (zoom muito alto em arena grande) desenha direto, sem cache
+MAX_PIXELS_CAMADA = 8_000_000
+# Quantos baldes de zoom manter por arena (zoom oscila durante a luta)
+MAX_CAMADAS = 2
+# Frames seguidos no mesmo balde antes de renderizar uma camada nova: a câmera
+# faz lerp contínuo do zoom, e numa transição cada frame cai num balde novo —
+# aí renderizar a arena inteira por frame custa bem mais que as primitivas
+FRAMES_ZOOM_ESTAVEL = 30
+
+
 @dataclass
 class Obstaculo:
     """Um obstáculo na arena"""
@@ -504,6 +522,15 @@ class Arena:
         
         # Efeitos especiais ativos
         self.efeitos_ativos = list(config.efeitos_especiais) if config.efeitos_especiais else []
+        
+        # Camadas estáticas pré-renderizadas: {(balde_zoom, cor_fundo): (surface, zoom)}
+        self.obstaculos_estaticos = [o for o in self.obstaculos if o.tipo not in OBSTACULOS_ANIMADOS]
+        self.obstaculos_animados = [o for o in self.obstaculos if o.tipo in OBSTACULOS_ANIMADOS]
+        self._camadas: OrderedDict = OrderedDict()
+        self.camadas_renderizadas = 0
+        # Balde de zoom do frame anterior e há quantos frames o zoom está nele
+        self._balde_atual = None
+        self._frames_no_balde = 0
     
     def colide_obstaculo(self, x: float, y: float, raio: float) -> Optional[Obstaculo]:
         """
@@ -784,10 +811,23 @@ class Arena:
         # Limpa completamente - colisões já foram processadas neste frame
         self.colisoes_recentes.clear()
     
-    def desenhar(self, surface: pygame.Surface, camera):
+    def desenhar(self, surface: pygame.Surface, camera, cor_fundo=None):
         """
         Desenha a arena na tela.
+        
+        Com cor_fundo, chão/grid/obstáculos estáticos/paredes vêm de uma camada
+        pré-renderizada por balde de zoom (um blit) e o fundo só é preenchido
+        fora dela — o chamador não precisa dar tela.fill() antes. Durante uma
+        transição de zoom (sem camada pronta) desenha com primitivas.
+        Sem cor_fundo, desenha tudo com primitivas como antes.
         """
+        if cor_fundo is not None and self._desenhar_camada(surface, camera, cor_fundo):
+            self._desenhar_obstaculos(surface, camera, self.obstaculos_animados)
+            self._desenhar_efeitos_colisao(surface, camera)
+            return
+        if cor_fundo is not None:
+            surface.fill(cor_fundo)
+        
         # Desenha chão
         self._desenhar_chao(surface, camera)
         
@@ -801,6 +841,86 @@ class Arena:
         # Desenha efeitos de colisão com paredes
         self._desenhar_efeitos_colisao(surface, camera)
     
+    def _desenhar_camada(self, surface: pygame.Surface, camera, cor_fundo) -> bool:
+        """
+        Blita a camada estática do balde de zoom atual, renderizando-a se
+        necessário. Retorna False (o chamador desenha com primitivas) se a
+        camada seria grande demais ou se o zoom ainda está em transição.
+        """
+        zoom = camera.zoom
+        if zoom <= 0:
+            return False
+        balde = round(math.log(zoom) / math.log1p(LIMIAR_ZOOM_CAMADA))
+        if balde == self._balde_atual:
+            self._frames_no_balde += 1
+        else:
+            self._balde_atual = balde
+            self._frames_no_balde = 1
+        chave = (balde, tuple(cor_fundo))
+        camada = self._camadas.get(chave)
+        if camada is None:
+            if self._frames_no_balde < FRAMES_ZOOM_ESTAVEL:
+                return False
+            zoom_balde = (1 + LIMIAR_ZOOM_CAMADA) ** balde
+            camada = self._renderizar_camada(zoom_balde, cor_fundo)
+            if camada is None:
+                return False
+            self._camadas[chave] = camada
+            while len(self._camadas) > MAX_CAMADAS:
+                self._camadas.popitem(last=False)
+        else:
+            self._camadas.move_to_end(chave)
+        
+        s, zoom_balde = camada
+        # Ancora pelo centro da arena: o erro de escala fica simétrico nas bordas
+        cx, cy = camera.converter(self.centro_x * PPM, self.centro_y * PPM)
+        origem_x = cx - s.get_width() // 2
+        origem_y = cy - s.get_height() // 2
+        surface.blit(s, (origem_x, origem_y))
+        
+        # Dirty rect: só o que a camada não cobre recebe o fundo
+        tela_rect = surface.get_rect()
+        camada_rect = pygame.Rect(origem_x, origem_y, s.get_width(), s.get_height()).clip(tela_rect)
+        if camada_rect.width == 0 or camada_rect.height == 0:
+            surface.fill(cor_fundo)
+            return True
+        for faixa in (
+            pygame.Rect(0, 0, tela_rect.width, camada_rect.top),
+            pygame.Rect(0, camada_rect.bottom, tela_rect.width, tela_rect.height - camada_rect.bottom),
+            pygame.Rect(0, camada_rect.top, camada_rect.left, camada_rect.height),
+            pygame.Rect(camada_rect.right, camada_rect.top, tela_rect.width - camada_rect.right, camada_rect.height),
+        ):
+            if faixa.width > 0 and faixa.height > 0:
+                surface.fill(cor_fundo, faixa)
+        return True
+    
+    def _renderizar_camada(self, zoom: float, cor_fundo):
+        """Renderiza chão, grid, obstáculos estáticos e paredes num Surface opaco."""
+        margem = self.config.espessura_parede + MARGEM_CAMADA
+        # Meia largura/altura em px: o centro da arena fica no centro do Surface
+        meio_w = int(math.ceil((self.largura / 2 + margem) * PPM * zoom))
+        meio_h = int(math.ceil((self.altura / 2 + margem) * PPM * zoom))
+        if (meio_w * 2) * (meio_h * 2) > MAX_PIXELS_CAMADA:
+            return None
+        
+        s = pygame.Surface((meio_w * 2, meio_h * 2))
+        s.fill(cor_fundo)
+        cam = _CameraCamada(self.centro_x * PPM, self.centro_y * PPM, zoom, meio_w, meio_h)
+        self._desenhar_chao(s, cam)
+        self._desenhar_obstaculos(s, cam, self.obstaculos_estaticos)
+        if self.config.tem_paredes:
+            self._desenhar_paredes(s, cam)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            s = s.convert()
+        self.camadas_renderizadas += 1
+        return s, zoom
+    
+    def invalidar_camadas(self):
+        """Descarta as camadas estáticas (ex.: obstáculo destruído ou cor alterada)."""
+        self._camadas.clear()
+        self.obstaculos_estaticos = [o for o in self.obstaculos if o.tipo not in OBSTACULOS_ANIMADOS]
+        self.obstaculos_animados = [o for o in self.obstaculos if o.tipo in OBSTACULOS_ANIMADOS]
+    
     def _desenhar_chao(self, surface: pygame.Surface, camera):
         """Desenha o chão da arena"""
         cor = self.config.cor_chao
@@ -847,9 +967,9 @@ class Arena:
             pygame.draw.line(surface, cor_grid, p1, p2, 1)
             y += grid_size
     
-    def _desenhar_obstaculos(self, surface: pygame.Surface, camera):
-        """Desenha os obstáculos da arena"""
-        for obs in self.obstaculos:
+    def _desenhar_obstaculos(self, surface: pygame.Surface, camera, obstaculos=None):
+        """Desenha os obstáculos da arena (todos, ou só a lista dada)"""
+        for obs in (self.obstaculos if obstaculos is None else obstaculos):
             cx, cy = camera.converter(obs.x * PPM, obs.y * PPM)
             cx, cy = int(cx), int(cy)  # Ensure integers
             half_w = int(camera.converter_tam(obs.largura * PPM / 2))
@@ -1090,6 +1210,22 @@ class Arena:
                 surface.blit(s, (cx - raio, cy - raio))
 
 
+class _CameraCamada:
+    """Câmera mínima (converter / converter_tam) para renderizar a camada estática."""
+    
+    def __init__(self, x: float, y: float, zoom: float, meio_w: int, meio_h: int):
+        self.x, self.y = x, y
+        self.zoom = zoom
+        self.meio_w, self.meio_h = meio_w, meio_h
+    
+    def converter(self, world_x, world_y):
+        return (int((world_x - self.x) * self.zoom + self.meio_w),
+                int((world_y - self.y) * self.zoom + self.meio_h))
+    
+    def converter_tam(self, tamanho):
+        return int(tamanho * self.zoom)
+
+
 # Instância global da arena (pode ser substituída)
 _arena_atual: Optional[Arena] = None
 
@@ -39,6 +39,10 @@ def carregar_arma_por_nome(nome):
     """Legacy: find a weapon by name."""
     return AppState.get().get_weapon(nome)
 
+def carregar_personagem_por_nome(nome):
+    """Legacy: find a character by name."""
+    return AppState.get().get_character(nome)
+
 def carregar_json(arquivo):
     """Legacy: raw JSON read (still hits disk — use sparingly)."""
     import json, os
@@ -10,7 +10,14 @@ Architecture:
     ├── match_config:     dict
     ├── tournament_state: dict
     ├── gods:             dict  (Neural Fights world state)
-    └── session_stats:    dict
+    ├── session_stats:    dict
+    ├── fight_journal:    FightJournal  (append-only results + Elo)
+    └── storage:          JsonStorage | SqliteStorage  (see data/storage.py)
+
+With the JSON backend, weapons + characters are loaded from a pickled
+snapshot (data/catalog_snapshot.bin, see data/snapshot.py) when it still
+matches the JSON files; it is rewritten on flush() after they change.
+NEURAL_FIGHTS_SNAPSHOT=0 disables it.
 
 Usage:
     from data.app_state import AppState
@@ -20,10 +27,24 @@ Usage:
     weapons = state.weapons
     chars   = state.characters
 
-    # Write (auto-saves to disk + notifies all subscribers)
+    # Write (saved in the background after a short quiet period + notifies all subscribers)
     state.set_weapons(my_list)
     state.set_characters(my_list)
     state.update_match_config(p1="Caleb", p2="Bjorn")
+    state.flush()           # force pending writes (e.g. before starting a subprocess)
+
+    # Files written by other processes: reload only what changed
+    state.watch_files()
+    state.check_files()     # call periodically (Tk after loop)
+
+    # Indexed lookups (O(1), see data/catalog.py)
+    char  = state.get_character("Caleb")
+    fire  = state.get_characters_by_class("Mago (Fogo)")
+    epics = state.get_weapons_by_rarity("Épico")
+
+    # Fight results (appended to the journal, no full-file rewrite)
+    state.record_fight_result("Caleb", "Bjorn", duration=42.5, ko=True)
+    state.fight_journal.leaderboard(10)
 
     # Subscribe to changes
     state.subscribe("weapons_changed", my_callback)
@@ -33,15 +54,29 @@ Usage:
     state.subscribe("gods_changed", my_callback)
     state.subscribe("any", my_callback)   # wildcard
 
+    # weapons_changed / characters_changed carry a ChangeSet: names in
+    # .added / .updated / .removed (or .reset for a full replace); it still
+    # iterates like the full list it used to be.
+    def my_callback(change):
+        for name in change.added: ...
+
+    # Bulk edits: one coalesced event per channel at the end of the block
+    with state.batch():
+        for p in imported:
+            state.add_character(p)
+
     # Unsubscribe
     state.unsubscribe("weapons_changed", my_callback)
 """
 
-import json
+import atexit
 import os
 import sys
 import threading
+from collections import deque
+from contextlib import contextmanager
 from copy import deepcopy
+from dataclasses import dataclass, field
 from typing import Callable, Any
 
 # ── path bootstrap ────────────────────────────────────────────────────────────
@@ -51,6 +86,11 @@ if _ROOT not in sys.path:
     sys.path.insert(0, _ROOT)
 
 from models import Personagem, Arma
+from data.catalog import Catalog
+from data.fight_journal import FightJournal
+from data.storage import open_storage
+from data.file_watcher import FileWatcher
+from data.snapshot import CatalogSnapshot
 
 # ── File paths ────────────────────────────────────────────────────────────────
 DATA_DIR          = _HERE
@@ -59,6 +99,26 @@ FILE_WEAPONS      = os.path.join(DATA_DIR, "armas.json")
 FILE_MATCH        = os.path.join(DATA_DIR, "match_config.json")
 FILE_TOURNAMENT   = os.path.join(DATA_DIR, "tournament_state.json")
 FILE_GODS         = os.path.join(DATA_DIR, "gods.json")
+FILE_FIGHT_LOG    = os.path.join(DATA_DIR, "fight_results.jsonl")
+FILE_FIGHT_STATS  = os.path.join(DATA_DIR, "fight_stats.json")
+FILE_DB           = os.path.join(DATA_DIR, "neural_fights.db")
+FILE_SNAPSHOT     = os.path.join(DATA_DIR, "catalog_snapshot.bin")
+
+# Model sources: editing them invalidates the pickled catalogue
+_MODELS_DIR   = os.path.join(_ROOT, "models")
+SNAPSHOT_CODE = [os.path.join(_MODELS_DIR, f) for f in ("weapons.py", "characters.py", "constants.py")]
+
+# JSON files double as the import/export format of the SQLite backend
+JSON_PATHS = {
+    "weapons":    FILE_WEAPONS,
+    "characters": FILE_CHARS,
+    "match":      FILE_MATCH,
+    "tournament": FILE_TOURNAMENT,
+    "gods":       FILE_GODS,
+}
+
+# Recent results kept in memory; the full history lives in the journal
+SESSION_LOG_MAX   = 200
 
 # ── Default values ────────────────────────────────────────────────────────────
 DEFAULT_MATCH_CONFIG = {
@@ -92,11 +152,75 @@ DEFAULT_GODS_STATE = {
 }
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+@dataclass
+class ChangeSet:
+    """
+    Payload of weapons_changed / characters_changed: which names changed.
+    reset=True means the whole list was replaced (set_*, reload) and
+    subscribers should rebuild.  Iterating / len() go over the current
+    items, so code written for the old list payload keeps working.
+    """
+    items:   list
+    added:   set = field(default_factory=set)
+    updated: set = field(default_factory=set)
+    removed: set = field(default_factory=set)
+    reset:   bool = False
+
+    @classmethod
+    def diff(cls, old: list, new: list) -> "ChangeSet":
+        """Exact per-name diff (compares to_dict()), e.g. after a reload from disk."""
+        old_by_name = {x.nome: x for x in old}
+        new_by_name = {x.nome: x for x in new}
+        updated = {n for n in new_by_name.keys() & old_by_name.keys()
+                   if new_by_name[n].to_dict() != old_by_name[n].to_dict()}
+        return cls(new, added=new_by_name.keys() - old_by_name.keys(), updated=updated,
+                   removed=old_by_name.keys() - new_by_name.keys())
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.updated or self.removed or self.reset)
+
+    @classmethod
+    def replaced(cls, old: list, new: list) -> "ChangeSet":
+        old_names = {x.nome for x in old}
+        new_names = {x.nome for x in new}
+        return cls(new, added=new_names - old_names, updated=new_names & old_names,
+                   removed=old_names - new_names, reset=True)
+
+    def merge(self, newer: "ChangeSet") -> "ChangeSet":
+        """Fold a later change into this one (used while batching)."""
+        for name in newer.added:
+            if name in self.removed:
+                self.removed.discard(name)
+                self.updated.add(name)
+            else:
+                self.added.add(name)
+        for name in newer.updated:
+            if name not in self.added:
+                self.updated.add(name)
+        for name in newer.removed:
+            if name in self.added:
+                self.added.discard(name)
+            else:
+                self.updated.discard(name)
+                self.removed.add(name)
+        self.reset = self.reset or newer.reset
+        self.items = newer.items
+        return self
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 class AppState:
     """
     Singleton central store.  All data lives here.
-    Views subscribe to events; mutations auto-persist to disk.
+    Views subscribe to events; mutations persist to disk (write-behind).
     """
 
     _instance: "AppState | None" = None
@@ -129,13 +253,35 @@ class AppState:
         self._session:    dict             = {
             "total_fights": 0,
             "total_kos": 0,
-            "fight_log": [],
+            "fight_log": deque(maxlen=SESSION_LOG_MAX),
         }
+        # Tournament stats changed in memory but not yet written to disk
+        self._tournament_dirty = False
 
         # event_name → list[callback]
         self._subscribers: dict[str, list[Callable]] = {}
+        # batch(): nesting depth and the coalesced events waiting to fire
+        self._batch_depth = 0
+        self._batched: dict[str, Any] = {}
+
+        # Name/god/class indexes, invalidated by _notify (not deferred by batch())
+        self._catalog = Catalog(self)
+
+        # JSON files by default, SQLite with NEURAL_FIGHTS_STORAGE=sqlite
+        self._storage = open_storage(JSON_PATHS, FILE_DB)
+        self._watcher: "FileWatcher | None" = None
+
+        # Pickled weapons + characters; the SQLite backend loads fast enough on its own
+        self._snapshot: "CatalogSnapshot | None" = None
+        if self._storage.name == "json" and os.environ.get("NEURAL_FIGHTS_SNAPSHOT", "1") != "0":
+            self._snapshot = CatalogSnapshot(
+                FILE_SNAPSHOT, {k: JSON_PATHS[k] for k in ("weapons", "characters")}, SNAPSHOT_CODE)
+        # In-memory catalogue no longer matches the snapshot on disk
+        self._snapshot_stale = False
 
         self._load_all()
+        self._journal = FightJournal(FILE_FIGHT_LOG, FILE_FIGHT_STATS)
+        atexit.register(self.flush)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PUBLIC — Data Access (read)
@@ -163,21 +309,41 @@ class AppState:
 
     @property
     def session_stats(self) -> dict:
-        return deepcopy(self._session)
+        stats = deepcopy(self._session)
+        stats["fight_log"] = list(stats["fight_log"])
+        return stats
 
-    # ── Convenience lookups ───────────────────────────────────────────────────
+    @property
+    def fight_journal(self) -> FightJournal:
+        return self._journal
+
+    @property
+    def catalog(self) -> Catalog:
+        return self._catalog
+
+    @property
+    def storage(self):
+        return self._storage
+
+    # ── Convenience lookups (indexed) ─────────────────────────────────────────
 
     def get_character(self, name: str) -> "Personagem | None":
-        return next((p for p in self._characters if p.nome == name), None)
+        return self._catalog.character(name)
 
     def get_weapon(self, name: str) -> "Arma | None":
-        return next((a for a in self._weapons if a.nome == name), None)
+        return self._catalog.weapon(name)
 
     def get_weapon_for_character(self, char: "Personagem") -> "Arma | None":
         return self.get_weapon(char.nome_arma) if char.nome_arma else None
 
     def get_characters_by_god(self, god_id: str) -> list[Personagem]:
-        return [p for p in self._characters if p.god_id == god_id]
+        return self._catalog.characters_by_god(god_id)
+
+    def get_characters_by_class(self, classe: str) -> list[Personagem]:
+        return self._catalog.characters_by_class(classe)
+
+    def get_weapons_by_rarity(self, raridade: str) -> list[Arma]:
+        return self._catalog.weapons_by_rarity(raridade)
 
     def character_names(self) -> list[str]:
         return [p.nome for p in self._characters]
@@ -193,26 +359,29 @@ class AppState:
 
     def set_weapons(self, weapons: list[Arma]):
         """Replace the full weapons list."""
+        change = ChangeSet.replaced(self._weapons, weapons)
         self._weapons = list(weapons)
         self._save_weapons()
-        self._notify("weapons_changed", self._weapons)
+        change.items = self._weapons
+        self._notify("weapons_changed", change)
 
     def add_weapon(self, weapon: Arma):
         self._weapons.append(weapon)
-        self._save_weapons()
-        self._notify("weapons_changed", self._weapons)
+        self._storage.insert_item("weapons", len(self._weapons) - 1, self._weapons)
+        self._notify("weapons_changed", ChangeSet(self._weapons, added={weapon.nome}))
 
     def update_weapon(self, index: int, weapon: Arma):
         if 0 <= index < len(self._weapons):
+            old_name = self._weapons[index].nome
             self._weapons[index] = weapon
-            self._save_weapons()
-            self._notify("weapons_changed", self._weapons)
+            self._storage.update_item("weapons", index, self._weapons)
+            self._notify("weapons_changed", self._renamed(self._weapons, old_name, weapon.nome))
 
     def delete_weapon(self, index: int):
         if 0 <= index < len(self._weapons):
-            del self._weapons[index]
-            self._save_weapons()
-            self._notify("weapons_changed", self._weapons)
+            name = self._weapons.pop(index).nome
+            self._storage.delete_item("weapons", index, self._weapons)
+            self._notify("weapons_changed", ChangeSet(self._weapons, removed={name}))
 
     def delete_weapon_by_name(self, name: str):
         idx = next((i for i, a in enumerate(self._weapons) if a.nome == name), None)
@@ -223,26 +392,29 @@ class AppState:
 
     def set_characters(self, characters: list[Personagem]):
         """Replace the full characters list."""
+        change = ChangeSet.replaced(self._characters, characters)
         self._characters = list(characters)
         self._save_characters()
-        self._notify("characters_changed", self._characters)
+        change.items = self._characters
+        self._notify("characters_changed", change)
 
     def add_character(self, character: Personagem):
         self._characters.append(character)
-        self._save_characters()
-        self._notify("characters_changed", self._characters)
+        self._storage.insert_item("characters", len(self._characters) - 1, self._characters)
+        self._notify("characters_changed", ChangeSet(self._characters, added={character.nome}))
 
     def update_character(self, index: int, character: Personagem):
         if 0 <= index < len(self._characters):
+            old_name = self._characters[index].nome
             self._characters[index] = character
-            self._save_characters()
-            self._notify("characters_changed", self._characters)
+            self._storage.update_item("characters", index, self._characters)
+            self._notify("characters_changed", self._renamed(self._characters, old_name, character.nome))
 
     def delete_character(self, index: int):
         if 0 <= index < len(self._characters):
-            del self._characters[index]
-            self._save_characters()
-            self._notify("characters_changed", self._characters)
+            name = self._characters.pop(index).nome
+            self._storage.delete_item("characters", index, self._characters)
+            self._notify("characters_changed", ChangeSet(self._characters, removed={name}))
 
     def delete_character_by_name(self, name: str):
         idx = next((i for i, p in enumerate(self._characters) if p.nome == name), None)
@@ -251,12 +423,12 @@ class AppState:
 
     def set_character_god(self, char_name: str, god_id: "str | None"):
         """Assign or remove a god allegiance from a character."""
-        for p in self._characters:
+        for i, p in enumerate(self._characters):
             if p.nome == char_name:
                 p.god_id = god_id
+                self._storage.update_item("characters", i, self._characters)
                 break
-        self._save_characters()
-        self._notify("characters_changed", self._characters)
+        self._notify("characters_changed", ChangeSet(self._characters, updated={char_name}))
         self._notify("gods_changed", self._gods)
 
     # ── Match Config ──────────────────────────────────────────────────────────
@@ -279,23 +451,27 @@ class AppState:
 
     def set_tournament_state(self, state: dict):
         self._tournament = deepcopy(state)
+        self._tournament_dirty = False
         self._save_tournament()
         self._notify("tournament_changed", self._tournament)
 
     def update_tournament(self, **kwargs):
         self._tournament.update(kwargs)
+        self._tournament_dirty = False
         self._save_tournament()
         self._notify("tournament_changed", self._tournament)
 
     def record_fight_result(self, winner: str, loser: str, duration: float, ko: bool):
-        """Append a fight result to tournament stats and session log."""
+        """
+        Append a fight result to the journal, tournament stats and session log.
+        The journal persists it in the next batch; tournament_state.json is
+        only rewritten on the next tournament save or flush().
+        """
+        entry = self._journal.append(winner, loser, duration, ko)
         self._session["total_fights"] += 1
         if ko:
             self._session["total_kos"] += 1
-        self._session["fight_log"].append({
-            "winner": winner, "loser": loser,
-            "duration": duration, "ko": ko,
-        })
+        self._session["fight_log"].append(entry)
         stats = self._tournament.get("stats", {})
         stats["total_fights"] = stats.get("total_fights", 0) + 1
         if ko:
@@ -308,10 +484,24 @@ class AppState:
             if longest is None or duration > longest:
                 stats["longest_fight"] = duration
         self._tournament["stats"] = stats
-        self._save_tournament()
+        self._tournament_dirty = True
         self._notify("tournament_changed", self._tournament)
         self._notify("session_stats_changed", self._session)
 
+    def flush(self):
+        """
+        Write everything pending to disk: fight results, dirty tournament
+        stats and the storage write-behind queue.  Call before handing the
+        data files to another process.
+        """
+        self._journal.flush()
+        if self._tournament_dirty:
+            self._tournament_dirty = False
+            self._save_tournament()
+        self._storage.flush()
+        if self._snapshot_stale:
+            self._write_snapshot()
+
     # ── Gods / World State (Neural Fights Lore) ───────────────────────────────
 
     def register_god(self, god_id: str, name: str, nature: str,
@@ -328,12 +518,20 @@ class AppState:
 
     def claim_territory(self, territory_id: str, territory_name: str, god_id: str,
                         visual_theme: dict = None):
-        """A god claims a territory on the 3D Atlas."""
-        self._gods["territories"][territory_id] = {
+        """A god claims a territory on the 3D Atlas.  Re-claiming is a no-op."""
+        claim = {
             "name": territory_name,
             "owner_god_id": god_id,
             "visual_theme": visual_theme or {},
         }
+        previous = self._gods["territories"].get(territory_id)
+        if previous == claim:
+            return
+        if previous and previous.get("owner_god_id") != god_id:
+            old_god = self._gods["gods"].get(previous.get("owner_god_id"))
+            if old_god and territory_id in old_god.get("territories", []):
+                old_god["territories"].remove(territory_id)
+        self._gods["territories"][territory_id] = claim
         god = self._gods["gods"].get(god_id)
         if god and territory_id not in god.get("territories", []):
             god.setdefault("territories", []).append(territory_id)
@@ -358,13 +556,83 @@ class AppState:
 
     def reload_all(self):
         """Re-read all JSON files from disk. Notifies all channels."""
+        self._storage.flush()       # don't lose edits still waiting to be written
         self._load_all()
-        self._notify("weapons_changed",       self._weapons)
-        self._notify("characters_changed",    self._characters)
+        self._tournament_dirty = False
+        self._catalog.invalidate()
+        self._notify("weapons_changed",       ChangeSet(self._weapons, reset=True))
+        self._notify("characters_changed",    ChangeSet(self._characters, reset=True))
         self._notify("match_config_changed",  self._match)
         self._notify("tournament_changed",    self._tournament)
         self._notify("gods_changed",          self._gods)
 
+    # ── Hot reload of files changed by other processes ────────────────────────
+
+    def watch_files(self, interval: float = 1.0) -> FileWatcher:
+        """
+        Start watching the JSON files for changes made by external tools
+        (generators, scripts, the world-map server).  Call check_files()
+        from the thread that owns the AppState (e.g. a Tk after loop, or
+        between fights in a worker): reloads replace the collections and
+        fire subscribers, so they must not run on another thread.
+        """
+        if self._watcher is None:
+            self._watcher = FileWatcher(JSON_PATHS, interval)
+            self._storage.on_write = self._watcher.mark_seen
+        return self._watcher
+
+    def check_files(self) -> list[str]:
+        """Poll the watched files; reload and notify only the changed collections."""
+        watcher = self._watcher or self.watch_files()
+        changed = watcher.poll()
+        self._reload_changed(changed)
+        return changed
+
+    def _reload_changed(self, keys: list):
+        with self.batch():
+            for key in keys:
+                self.reload_collection(key)
+
+    def reload_collection(self, key: str):
+        """
+        Re-read one collection ("weapons", "characters", "match",
+        "tournament", "gods") and emit its event.  Skipped while a local
+        write for it is still queued — that write supersedes the file.
+        """
+        if self._storage.has_pending(key):
+            return
+        if hasattr(self._storage, "import_json"):
+            self._storage.import_json({key: JSON_PATHS[key]})
+        if key == "weapons":
+            change = self._reload_diff(self._weapons, self._load_weapons())
+            if not change.empty:        # same data: keep the objects views already hold
+                self._weapons = change.items
+                self._snapshot_stale = True
+                self._notify("weapons_changed", change)
+        elif key == "characters":
+            change = self._reload_diff(self._characters, self._load_characters())
+            if not change.empty:
+                self._characters = change.items
+                self._snapshot_stale = True
+                self._notify("characters_changed", change)
+        elif key == "match":
+            self._match = self._load_doc("match", DEFAULT_MATCH_CONFIG)
+            self._notify("match_config_changed", self._match)
+        elif key == "tournament":
+            self._tournament = self._load_doc("tournament", DEFAULT_TOURNAMENT_STATE)
+            self._tournament_dirty = False
+            self._notify("tournament_changed", self._tournament)
+        elif key == "gods":
+            self._gods = self._load_doc("gods", DEFAULT_GODS_STATE)
+            self._notify("gods_changed", self._gods)
+
+    @staticmethod
+    def _reload_diff(old: list, new: list) -> ChangeSet:
+        change = ChangeSet.diff(old, new)
+        if change.empty and [x.nome for x in old] != [x.nome for x in new]:
+            change.reset = True         # only the order changed: indexes must follow the file
+        return change
+
     # ═══════════════════════════════════════════════════════════════════════════
     # PUBLIC — Event Bus
     # ═══════════════════════════════════════════════════════════════════════════
@@ -385,6 +653,23 @@ class AppState:
             except ValueError:
                 pass
 
+    @contextmanager
+    def batch(self):
+        """
+        Suppress notifications inside the block and fire one coalesced event
+        per channel when the outermost batch exits.  ChangeSets are merged;
+        other payloads keep the latest value.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._batched = self._batched, {}
+                for event, data in pending.items():
+                    self._dispatch(event, data)
+
     def unsubscribe_all(self, callback: Callable):
         """Remove a callback from every event it was subscribed to."""
         for listeners in self._subscribers.values():
@@ -396,46 +681,39 @@ class AppState:
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _load_all(self):
-        self._weapons    = self._load_weapons()
-        self._characters = self._load_characters()
-        self._match      = self._load_json(FILE_MATCH,      DEFAULT_MATCH_CONFIG)
-        self._tournament = self._load_json(FILE_TOURNAMENT, DEFAULT_TOURNAMENT_STATE)
-        self._gods       = self._load_json(FILE_GODS,       DEFAULT_GODS_STATE)
+        if not self._load_snapshot():
+            self._weapons    = self._load_weapons()
+            self._characters = self._load_characters()
+            self._write_snapshot()
+        self._match      = self._load_doc("match",      DEFAULT_MATCH_CONFIG)
+        self._tournament = self._load_doc("tournament", DEFAULT_TOURNAMENT_STATE)
+        self._gods       = self._load_doc("gods",       DEFAULT_GODS_STATE)
 
     # ── Loaders ───────────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _load_json(path: str, default: dict) -> dict:
-        if not os.path.exists(path):
-            return deepcopy(default)
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # Merge missing top-level keys from default
-            merged = deepcopy(default)
+    def _load_doc(self, name: str, default: dict) -> dict:
+        data = self._storage.load_doc(name)
+        # Merge missing top-level keys from default
+        merged = deepcopy(default)
+        if isinstance(data, dict):
             merged.update(data)
-            return merged
-        except Exception as e:
-            print(f"[AppState] Warning loading {path}: {e}")
-            return deepcopy(default)
+        return merged
 
     def _load_weapons(self) -> list[Arma]:
-        if not os.path.exists(FILE_WEAPONS):
+        raw = self._storage.load_list("weapons")
+        if not raw:
             return []
         try:
-            with open(FILE_WEAPONS, "r", encoding="utf-8") as f:
-                raw = json.load(f)
             return [Arma(**item) for item in raw]
         except Exception as e:
             print(f"[AppState] Warning loading weapons: {e}")
             return []
 
     def _load_characters(self) -> list[Personagem]:
-        if not os.path.exists(FILE_CHARS):
+        raw_chars = self._storage.load_list("characters")
+        if not raw_chars:
             return []
         try:
-            with open(FILE_CHARS, "r", encoding="utf-8") as f:
-                raw_chars = json.load(f)
             # Build weapon-weight lookup from in-memory weapons (already loaded)
             weapon_weights = {a.nome: a.peso for a in self._weapons}
             result = []
@@ -456,36 +734,73 @@ class AppState:
             print(f"[AppState] Warning loading characters: {e}")
             return []
 
+    # ── Binary snapshot ───────────────────────────────────────────────────────
+
+    def _load_snapshot(self) -> bool:
+        if self._snapshot is None:
+            return False
+        payload = self._snapshot.load()
+        if payload is None:
+            return False
+        self._weapons    = payload["weapons"]
+        self._characters = payload["characters"]
+        self._snapshot_stale = False
+        return True
+
+    def _write_snapshot(self):
+        """Pickle the current lists; only valid once the JSON files hold the same data."""
+        if self._snapshot is None:
+            return
+        # Keyed on the bytes this process read / wrote, not on what is on disk now
+        if self._snapshot.save({"weapons": self._weapons, "characters": self._characters},
+                               self._storage.digests):
+            self._snapshot_stale = False
+
     # ── Savers ────────────────────────────────────────────────────────────────
 
     def _save_weapons(self):
-        self._write_json(FILE_WEAPONS, [a.to_dict() for a in self._weapons])
+        self._storage.save_list("weapons", self._weapons)
 
     def _save_characters(self):
-        self._write_json(FILE_CHARS, [p.to_dict() for p in self._characters])
+        self._storage.save_list("characters", self._characters)
 
     def _save_match(self):
-        self._write_json(FILE_MATCH, self._match)
+        self._storage.save_doc("match", self._match)
 
     def _save_tournament(self):
-        self._write_json(FILE_TOURNAMENT, self._tournament)
+        self._storage.save_doc("tournament", self._tournament)
 
     def _save_gods(self):
-        self._write_json(FILE_GODS, self._gods)
-
-    @staticmethod
-    def _write_json(path: str, data):
-        try:
-            tmp = path + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-            os.replace(tmp, path)          # atomic rename — no corrupt files
-        except Exception as e:
-            print(f"[AppState] Error saving {path}: {e}")
+        self._storage.save_doc("gods", self._gods)
 
     # ── Internal notify ───────────────────────────────────────────────────────
 
+    @staticmethod
+    def _renamed(items: list, old_name: str, new_name: str) -> ChangeSet:
+        if old_name == new_name:
+            return ChangeSet(items, updated={new_name})
+        return ChangeSet(items, added={new_name}, removed={old_name})
+
     def _notify(self, event: str, data: Any = None):
+        # The catalogue is invalidated right away: lookups inside batch() must
+        # already see the change; only the subscriber events are deferred
+        if event == "weapons_changed":
+            self._snapshot_stale = True
+            self._catalog.invalidate_weapons()
+        elif event == "characters_changed":
+            self._snapshot_stale = True
+            self._catalog.invalidate_characters()
+        if self._batch_depth:
+            queued = self._batched.get(event)
+            if isinstance(queued, ChangeSet) and isinstance(data, ChangeSet):
+                queued.merge(data)
+            else:
+                self._batched.pop(event, None)      # keep firing order = last change
+                self._batched[event] = data
+            return
+        self._dispatch(event, data)
+
+    def _dispatch(self, event: str, data: Any = None):
         # Specific subscribers
         for cb in list(self._subscribers.get(event, [])):
             try:
@@ -0,0 +1,130 @@
+"""
+NEURAL FIGHTS — Catalog (indexed in-memory view over AppState)
+===============================================================
+Name-keyed dicts and secondary indexes over AppState's weapons and
+characters, so lookups are O(1) instead of linear scans / JSON re-parses.
+
+Indexes:
+    weapon(name)            → Arma | None
+    character(name)         → Personagem | None
+    characters_by_god(id)   → list[Personagem]
+    characters_by_class(c)  → list[Personagem]
+    weapons_by_rarity(r)    → list[Arma]
+    weapon_weight(name)     → float
+
+Invalidation is driven by AppState._notify: every "weapons_changed" /
+"characters_changed" marks the affected indexes dirty synchronously (even
+inside AppState.batch(), where the subscriber events are deferred) and they
+are rebuilt lazily on the next lookup.
+
+Usage:
+    from data.app_state import AppState
+    cat = AppState.get().catalog
+    char = cat.character("Caleb")
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from data.app_state import AppState
+    from models import Personagem, Arma
+
+
+class Catalog:
+    def __init__(self, state: "AppState"):
+        self._state = state
+        self._weapons_by_name:  dict[str, "Arma"]             = {}
+        self._chars_by_name:    dict[str, "Personagem"]       = {}
+        self._chars_by_god:     dict[str, list["Personagem"]] = {}
+        self._chars_by_class:   dict[str, list["Personagem"]] = {}
+        self._weapons_by_rarity: dict[str, list["Arma"]]      = {}
+        self._weapons_dirty = True
+        self._chars_dirty   = True
+
+    # ── Invalidation ──────────────────────────────────────────────────────────
+
+    def invalidate_weapons(self):
+        self._weapons_dirty = True
+        # Character stats depend on weapon weight
+        self._chars_dirty = True
+
+    def invalidate_characters(self):
+        self._chars_dirty = True
+
+    def invalidate(self):
+        """Force a full rebuild on the next lookup (e.g. after reload_all)."""
+        self._weapons_dirty = True
+        self._chars_dirty   = True
+
+    # ── Rebuild ───────────────────────────────────────────────────────────────
+
+    def _ensure(self):
+        if self._weapons_dirty:
+            self._rebuild_weapons()
+        if self._chars_dirty:
+            self._rebuild_characters()
+
+    def _rebuild_weapons(self):
+        by_name, by_rarity = {}, {}
+        for a in self._state._weapons:
+            by_name.setdefault(a.nome, a)        # first wins, like next(...)
+            by_rarity.setdefault(a.raridade, []).append(a)
+        self._weapons_by_name = by_name
+        self._weapons_by_rarity = by_rarity
+        self._weapons_dirty = False
+
+    def _rebuild_characters(self):
+        by_name, by_god, by_class = {}, {}, {}
+        weights = self._weapons_by_name
+        for p in self._state._characters:
+            by_name.setdefault(p.nome, p)
+            if p.god_id:
+                by_god.setdefault(p.god_id, []).append(p)
+            by_class.setdefault(p.classe, []).append(p)
+            # Keep derived stats in sync with the current weapon weight
+            arma = weights.get(p.nome_arma)
+            p.calcular_status(arma.peso if arma else 0)
+        self._chars_by_name  = by_name
+        self._chars_by_god   = by_god
+        self._chars_by_class = by_class
+        self._chars_dirty = False
+
+    # ── Lookups ───────────────────────────────────────────────────────────────
+
+    def weapon(self, name: str) -> "Arma | None":
+        self._ensure()
+        return self._weapons_by_name.get(name)
+
+    def character(self, name: str) -> "Personagem | None":
+        self._ensure()
+        return self._chars_by_name.get(name)
+
+    def weapon_weight(self, name: str) -> float:
+        arma = self.weapon(name)
+        return arma.peso if arma else 0
+
+    def characters_by_god(self, god_id: str) -> list["Personagem"]:
+        self._ensure()
+        return list(self._chars_by_god.get(god_id, []))
+
+    def characters_by_class(self, classe: str) -> list["Personagem"]:
+        self._ensure()
+        return list(self._chars_by_class.get(classe, []))
+
+    def weapons_by_rarity(self, raridade: str) -> list["Arma"]:
+        self._ensure()
+        return list(self._weapons_by_rarity.get(raridade, []))
+
+    def classes(self) -> list[str]:
+        self._ensure()
+        return list(self._chars_by_class)
+
+    def __contains__(self, name: str) -> bool:
+        self._ensure()
+        return name in self._chars_by_name or name in self._weapons_by_name
+
+    def __repr__(self):
+        self._ensure()
+        return (f"<Catalog  weapons={len(self._weapons_by_name)}"
+                f"  characters={len(self._chars_by_name)}"
+                f"  gods={len(self._chars_by_god)}  classes={len(self._chars_by_class)}>")
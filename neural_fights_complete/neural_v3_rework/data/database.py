@@ -1,6 +1,7 @@
 """
 NEURAL FIGHTS - Módulo Database
 Funções de persistência de dados (JSON).
+As funções de carga/salvamento são visões sobre o AppState (data/app_state.py).
 [PHASE 3] Adicionado hook para sincronização com World Map (WorldStateSync).
 """
 import json
@@ -8,8 +9,6 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models import Personagem, Arma
-
 # Caminhos dos arquivos de dados - agora dentro de data/
 DATA_DIR = os.path.dirname(os.path.abspath(__file__))
 ARQUIVO_CHARS = os.path.join(DATA_DIR, "personagens.json")
@@ -18,13 +17,18 @@ ARQUIVO_MATCH = os.path.join(DATA_DIR, "match_config.json")
 
 # ── [PHASE 3] WorldStateSync Hook ────────────────────────────────────────────
 # Hook opcional: ativa automaticamente se o módulo world_map_module estiver presente.
-# Não quebra o projeto se ausente.
+# Não quebra o projeto se ausente. Inicializado no primeiro uso (não no import):
+# workers headless que só leem o catálogo não tocam sys.path nem o world map.
 _world_sync = None
 _worldmap_enabled = False
+_worldmap_iniciado = False
 
 def _init_worldmap_hook():
     """Tenta inicializar o hook do World Map. Falha silenciosamente se ausente."""
-    global _world_sync, _worldmap_enabled
+    global _world_sync, _worldmap_enabled, _worldmap_iniciado
+    if _worldmap_iniciado:
+        return
+    _worldmap_iniciado = True
     try:
         # Caminho do módulo do World Map (pasta irmã do projeto)
         base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -43,8 +47,6 @@ def _init_worldmap_hook():
             print("[WorldMap Hook] Pasta data/ não encontrada — hook desativado.")
     except Exception as e:
         print(f"[WorldMap Hook] Desativado: {e}")
-
-_init_worldmap_hook()
 # ─────────────────────────────────────────────────────────────────────────────
 
 
@@ -59,69 +61,64 @@ def salvar_json(arquivo, dados):
     with open(arquivo, "w", encoding="utf-8") as f:
         json.dump(dados, f, indent=4, ensure_ascii=False)
 
+def _state():
+    # Import tardio: data.app_state não depende deste módulo
+    from data.app_state import AppState
+    return AppState.get()
+
+# ── Visões sobre o catálogo do AppState ──────────────────────────────────────
+# Antes cada chamada relia e re-parseava os JSON do disco (e carregar_personagens
+# varria todas as armas para cada personagem). Agora tudo vem do AppState, que
+# carrega os arquivos uma vez e mantém índices por nome / deus / classe.
+
 def carregar_armas():
-    raw = carregar_json(ARQUIVO_ARMAS)
-    return [Arma(**item) for item in raw]
+    return list(_state().weapons)
 
 def carregar_personagens():
-    raw_chars = carregar_json(ARQUIVO_CHARS)
-    raw_armas = carregar_json(ARQUIVO_ARMAS)
-    
-    lista = []
-    for item in raw_chars:
-        peso_arma = 0
-        nome_arma = item.get("nome_arma", "")
-        
-        # Busca o peso atualizado da arma
-        for a in raw_armas:
-            if a["nome"] == nome_arma:
-                peso_arma = a["peso"]
-                break
-        
-        p = Personagem(
-            item["nome"], item["tamanho"], item["forca"], item["mana"],
-            nome_arma, peso_arma,
-            item.get("cor_r", 200), item.get("cor_g", 50), item.get("cor_b", 50),
-            item.get("classe", "Guerreiro (Força Bruta)"),
-            item.get("personalidade", "Aleatório"),
-            item.get("god_id", None),       # [PHASE 3] Carrega vínculo divino
-        )
-        lista.append(p)
-    return lista
+    return list(_state().characters)
 
 def salvar_lista_armas(lista):
-    salvar_json(ARQUIVO_ARMAS, [a.to_dict() for a in lista])
+    _state().set_weapons(lista)
 
 def salvar_lista_chars(lista):
     """Salva lista de personagens e notifica o WorldStateSync se ativo."""
-    dicts = [p.to_dict() for p in lista]
-    salvar_json(ARQUIVO_CHARS, dicts)
+    _state().set_characters(lista)
 
     # [PHASE 3] Hook do World Map — sincroniza campeões com gods.json
+    _init_worldmap_hook()
     if _worldmap_enabled and _world_sync:
         try:
-            for p in lista:
-                if p.god_id:
-                    _world_sync.on_character_update(p.nome, p.god_id)
-            _world_sync.reload()
+            _world_sync.reload()    # só relê o que outro processo alterou
+            with _world_sync.transacao():   # uma escrita para a lista toda
+                for p in lista:
+                    if p.god_id:
+                        _world_sync.on_character_update(p.nome, p.god_id)
         except Exception as e:
             print(f"[WorldMap Hook] Erro ao sincronizar: {e}")
 
 
 def carregar_arma_por_nome(nome_arma):
-    """Carrega uma arma específica pelo nome"""
-    armas = carregar_armas()
-    for arma in armas:
-        if arma.nome == nome_arma:
-            return arma
-    return None
+    """Carrega uma arma específica pelo nome (O(1), sem ler o disco)"""
+    return _state().get_weapon(nome_arma)
+
+def carregar_personagem_por_nome(nome):
+    """Carrega um personagem pelo nome (O(1), sem ler o disco)"""
+    return _state().get_character(nome)
+
+def personagens_por_deus(god_id):
+    return _state().get_characters_by_god(god_id)
+
+def personagens_por_classe(classe):
+    return _state().get_characters_by_class(classe)
 
 
 # [PHASE 3] Funções auxiliares para o wizard de criação de deuses
 def get_worldmap_sync():
     """Retorna o WorldStateSync ativo, ou None se indisponível."""
+    _init_worldmap_hook()
     return _world_sync if _worldmap_enabled else None
 
 def is_worldmap_active():
     """Retorna True se o hook do World Map está ativo."""
+    _init_worldmap_hook()
     return _worldmap_enabled
@@ -0,0 +1,255 @@
+"""
+NEURAL FIGHTS — FightJournal (append-only fight results)
+========================================================
+Durable, append-only log of fight results with running aggregates.
+
+Files (in data/):
+    fight_results.jsonl   one JSON object per fight, appended in batches
+    fight_stats.json      compacted snapshot: aggregates + last journal seq
+
+Each entry carries a monotonically increasing "seq".  On load the snapshot
+is read and only journal lines with seq > snapshot["seq"] are replayed, so a
+crash between writing the snapshot and truncating the journal is harmless,
+and a torn last line (crash mid-append) is simply skipped — the next append
+starts on a new line, so it never swallows the entries that follow.
+
+Aggregates are updated incrementally on every append — nothing is ever
+recomputed from the full history:
+    total_fights, total_kos, fastest_ko, longest_fight
+    fighters[name] → {wins, losses, kos, fights, elo}
+
+Writes are batched: results are buffered and appended when the buffer
+reaches flush_every entries or flush_interval seconds after the first
+buffered result (background timer).  Every compact_every journal lines the
+aggregates are snapshotted and the journal is truncated.
+
+Usage:
+    journal = FightJournal(path, snapshot_path)
+    journal.append("Caleb", "Bjorn", 42.5, ko=True)
+    journal.fighter("Caleb")        # {"wins": 1, "elo": 1016.0, ...}
+    journal.leaderboard(10)
+    journal.flush()                 # force pending results to disk
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from copy import deepcopy
+
+ELO_BASE = 1000.0
+ELO_K    = 32.0
+
+DEFAULT_AGGREGATES = {
+    "total_fights": 0,
+    "total_kos": 0,
+    "fastest_ko": None,
+    "longest_fight": None,
+    "fighters": {},
+}
+
+
+def elo_expected(rating_a: float, rating_b: float) -> float:
+    """Expected score of A against B."""
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400.0))
+
+
+class FightJournal:
+    def __init__(self, path: str, snapshot_path: str, flush_every: int = 64,
+                 flush_interval: float = 2.0, compact_every: int = 5000):
+        self.path           = path
+        self.snapshot_path  = snapshot_path
+        self.flush_every    = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self.compact_every  = max(1, compact_every)
+
+        self._lock    = threading.RLock()
+        self._agg     = deepcopy(DEFAULT_AGGREGATES)
+        self._seq     = 0
+        self._pending: list[str] = []
+        self._journal_lines = 0
+        self._timer: "threading.Timer | None" = None
+
+        self._load()
+        atexit.register(self.flush)
+
+    # ── Recording ─────────────────────────────────────────────────────────────
+
+    def append(self, winner: str, loser: str, duration: "float | None",
+               ko: bool, **extra) -> dict:
+        """Record one result: update aggregates now, persist in the next batch."""
+        with self._lock:
+            self._seq += 1
+            entry = {
+                "seq": self._seq, "ts": round(time.time(), 3),
+                "winner": winner, "loser": loser,
+                "duration": duration, "ko": bool(ko),
+                **extra,
+            }
+            self._apply(entry)
+            self._pending.append(json.dumps(entry, ensure_ascii=False))
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+            else:
+                self._schedule_flush()
+            return entry
+
+    def _apply(self, entry: dict):
+        agg = self._agg
+        winner, loser = entry.get("winner"), entry.get("loser")
+        duration, ko  = entry.get("duration"), entry.get("ko", False)
+
+        agg["total_fights"] += 1
+        if ko:
+            agg["total_kos"] += 1
+        if duration is not None:
+            if ko and (agg["fastest_ko"] is None or duration < agg["fastest_ko"]):
+                agg["fastest_ko"] = duration
+            if agg["longest_fight"] is None or duration > agg["longest_fight"]:
+                agg["longest_fight"] = duration
+
+        if not winner or not loser:
+            return
+        w = self._fighter_entry(winner)
+        l = self._fighter_entry(loser)
+        gain = ELO_K * (1.0 - elo_expected(w["elo"], l["elo"]))
+        w["elo"] = round(w["elo"] + gain, 2)
+        l["elo"] = round(l["elo"] - gain, 2)
+        w["wins"]   += 1
+        l["losses"] += 1
+        w["fights"] += 1
+        l["fights"] += 1
+        if ko:
+            w["kos"] += 1
+
+    def _fighter_entry(self, name: str) -> dict:
+        fighters = self._agg["fighters"]
+        f = fighters.get(name)
+        if f is None:
+            f = fighters[name] = {"wins": 0, "losses": 0, "kos": 0, "fights": 0, "elo": ELO_BASE}
+        return f
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def summary(self) -> dict:
+        """Global totals (same keys as tournament_state["stats"])."""
+        with self._lock:
+            return {k: self._agg[k] for k in
+                    ("total_fights", "total_kos", "fastest_ko", "longest_fight")}
+
+    def fighter(self, name: str) -> "dict | None":
+        with self._lock:
+            f = self._agg["fighters"].get(name)
+            return dict(f) if f else None
+
+    def elo(self, name: str) -> float:
+        f = self.fighter(name)
+        return f["elo"] if f else ELO_BASE
+
+    def leaderboard(self, n: int = 10, key: str = "elo") -> list[tuple[str, dict]]:
+        with self._lock:
+            ranked = sorted(self._agg["fighters"].items(), key=lambda kv: kv[1][key], reverse=True)
+            return [(name, dict(f)) for name, f in ranked[:n]]
+
+    @property
+    def aggregates(self) -> dict:
+        with self._lock:
+            return deepcopy(self._agg)
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+
+    def _schedule_flush(self):
+        if self._timer is None and self.flush_interval > 0:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Append buffered results to the journal (and compact if it grew too long)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            try:
+                # After a torn append the file ends mid-line: start on a fresh one,
+                # otherwise the first new entry would be glued to the garbage
+                prefix = "" if self._ends_with_newline() else "\n"
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(prefix + "\n".join(self._pending) + "\n")
+            except OSError as e:
+                print(f"[FightJournal] Error appending to {self.path}: {e}")
+                return
+            self._journal_lines += len(self._pending)
+            self._pending.clear()
+            if self._journal_lines >= self.compact_every:
+                self.compact()
+
+    def _ends_with_newline(self) -> bool:
+        """True if the journal is missing, empty or ends with a complete line."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
+
+    def compact(self):
+        """Snapshot aggregates and truncate the journal."""
+        with self._lock:
+            if self._pending:
+                self.flush()
+                if self._pending:       # append failed — keep the journal as is
+                    return
+            try:
+                tmp = self.snapshot_path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump({"seq": self._seq, **self._agg}, f, ensure_ascii=False)
+                os.replace(tmp, self.snapshot_path)
+                # Lines <= seq are now covered by the snapshot
+                open(self.path, "w", encoding="utf-8").close()
+                self._journal_lines = 0
+            except OSError as e:
+                print(f"[FightJournal] Error compacting {self.path}: {e}")
+
+    def _load(self):
+        snap_seq = 0
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    snap = json.load(f)
+                snap_seq = int(snap.pop("seq", 0))
+                self._agg = {**deepcopy(DEFAULT_AGGREGATES), **snap}
+            except (OSError, ValueError) as e:
+                print(f"[FightJournal] Warning loading {self.snapshot_path}: {e}")
+        self._seq = snap_seq
+
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue            # torn write at the tail
+                    self._journal_lines += 1
+                    seq = entry.get("seq", 0)
+                    if seq > snap_seq:
+                        self._apply(entry)
+                        self._seq = max(self._seq, seq)
+        except OSError as e:
+            print(f"[FightJournal] Warning loading {self.path}: {e}")
+
+    def __repr__(self):
+        return (f"<FightJournal  seq={self._seq}  fights={self._agg['total_fights']}"
+                f"  fighters={len(self._agg['fighters'])}  pending={len(self._pending)}>")
@@ -0,0 +1,54 @@
+"""
+NEURAL FIGHTS — FileWatcher (polling, stdlib only)
+==================================================
+Detects which data files changed on disk by comparing (mtime_ns, size)
+signatures.  No external dependencies and no OS notification APIs — a
+poll is one os.stat() per file, cheap enough to run every second from a
+Tk `after` loop.
+
+    watcher = FileWatcher({"weapons": ".../armas.json", ...})
+    changed = watcher.poll()          # → ["weapons"]  (keys whose file changed)
+    watcher.mark_seen("weapons")      # after writing the file ourselves
+
+The first poll establishes the baseline and reports nothing.  There is no
+background thread: reloading swaps AppState collections and fires
+subscribers (Tk views), so poll() runs on the thread that owns them.
+mark_seen() may be called from the storage write-behind thread.
+"""
+
+import os
+import threading
+
+
+def file_signature(path: str) -> "tuple[int, int] | None":
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class FileWatcher:
+    def __init__(self, paths: dict, interval: float = 1.0):
+        self.paths    = dict(paths)
+        self.interval = interval
+        self._lock    = threading.Lock()
+        self._seen    = {key: file_signature(path) for key, path in self.paths.items()}
+
+    def poll(self) -> list[str]:
+        """Keys whose file was created, modified or deleted since the last poll."""
+        changed = []
+        with self._lock:
+            for key, path in self.paths.items():
+                sig = file_signature(path)
+                if sig != self._seen.get(key):
+                    self._seen[key] = sig
+                    changed.append(key)
+        return changed
+
+    def mark_seen(self, key: str):
+        """Accept the file's current state (our own write is not an external change)."""
+        with self._lock:
+            if key in self.paths:
+                self._seen[key] = file_signature(self.paths[key])
+
@@ -0,0 +1,180 @@
+"""
+NEURAL FIGHTS — CatalogSnapshot (binary cache of the built catalogue)
+=====================================================================
+Pickles the fully constructed Arma / Personagem lists so a cold start
+skips JSON parsing and object construction.  Used by AppState with the
+JSON backend; app launch, headless workers and tournament subprocesses
+all go through AppState.get(), so they all hit the snapshot.
+
+File layout (data/catalog_snapshot.bin, gitignored) — two consecutive
+pickles (protocol 5), so a stale snapshot is rejected after reading only
+the small header:
+    header   {"version": SNAPSHOT_VERSION, "sources": {key: [mtime_ns, size, digest]},
+              "code": digest}
+    payload  whatever the caller saved (AppState: {"weapons": [...], "characters": [...]})
+
+Validation:
+    - version must equal SNAPSHOT_VERSION (bump when the layout changes)
+    - "code" is a digest of the model sources, so editing Arma/Personagem
+      (new attributes, changed derived stats) invalidates old pickles
+    - every source file must match: (mtime_ns, size) is checked first; on a
+      mismatch the file is hashed, so a touch without edits still hits
+
+A stale, missing or unreadable snapshot is never an error — load() returns
+None and the caller rebuilds from JSON and calls save().  Writes are
+atomic (per-process tmp file + os.replace).
+
+The payload is in-memory data, so the header must describe the bytes the
+payload was built from — not whatever is on disk when save() runs.  The
+caller passes the digests of the bytes it last read or wrote per source
+(JsonStorage.digests); sources not passed keep the digest of the loaded
+snapshot.  If a source no longer holds those bytes (another process edited
+it), save() writes nothing: the next load rebuilds from the file.
+
+    snap = CatalogSnapshot(path, {"weapons": ..., "characters": ...}, code_paths)
+    payload = snap.load()           # → payload | None
+    snap.save({"weapons": [...], "characters": [...]}, storage.digests)
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+
+SNAPSHOT_VERSION = 1
+PICKLE_PROTOCOL  = 5
+
+
+def bytes_digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def file_digest(path: str) -> "str | None":
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def _stat(path: str) -> "tuple[int, int] | None":
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class CatalogSnapshot:
+    def __init__(self, path: str, sources: dict, code_paths: "list[str] | tuple" = ()):
+        self.path       = path
+        self.sources    = dict(sources)
+        self.code_paths = list(code_paths)
+        self._code: "str | None" = None
+        # key → digest of the source bytes behind the last payload loaded / saved
+        self._known: dict = {}
+
+    # ── Keys ──────────────────────────────────────────────────────────────────
+
+    @property
+    def code_digest(self) -> str:
+        if self._code is None:
+            h = hashlib.blake2b(digest_size=16)
+            for path in self.code_paths:
+                h.update((file_digest(path) or "-").encode())
+            self._code = h.hexdigest()
+        return self._code
+
+    def _source_key(self, key: str, digest: "str | None") -> "list | None | bool":
+        """Header entry for a source holding `digest`; False if the file differs."""
+        path = self.sources[key]
+        sig = _stat(path)
+        if sig is None:
+            return None if digest is None else False
+        if digest is None or file_digest(path) != digest or _stat(path) != sig:
+            return False
+        return [sig[0], sig[1], digest]
+
+    def _source_matches(self, key: str, recorded) -> bool:
+        sig = _stat(self.sources[key])
+        if sig is None or not recorded:
+            return sig is None and not recorded
+        if (sig[0], sig[1]) == (recorded[0], recorded[1]):
+            return True
+        return sig[1] == recorded[1] and file_digest(self.sources[key]) == recorded[2]
+
+    # ── Public ────────────────────────────────────────────────────────────────
+
+    def _header_matches(self, header) -> bool:
+        if not isinstance(header, dict) or header.get("version") != SNAPSHOT_VERSION:
+            return False
+        if header.get("code") != self.code_digest:
+            return False
+        recorded = header.get("sources", {})
+        if set(recorded) != set(self.sources):
+            return False
+        return all(self._source_matches(key, recorded[key]) for key in self.sources)
+
+    def load(self):
+        """The cached payload if the snapshot is current, else None."""
+        # Unpickling allocates tens of thousands of objects at once; the cyclic
+        # GC would otherwise run repeatedly over them for nothing
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(self.path, "rb") as f:
+                header = pickle.load(f)
+                if not self._header_matches(header):
+                    return None
+                payload = pickle.load(f)
+            self._known = {key: (entry[2] if entry else None)
+                           for key, entry in header["sources"].items()}
+            return payload
+        except FileNotFoundError:
+            return None
+        except Exception as e:          # truncated file, class renamed, ...
+            print(f"[CatalogSnapshot] Ignoring {self.path}: {e}")
+            return None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def save(self, payload, digests: "dict | None" = None) -> bool:
+        """
+        Write payload built from source bytes with the given digests.
+        False (nothing written) if a source changed since then or on I/O error.
+        """
+        known = {**self._known, **{k: v for k, v in (digests or {}).items() if k in self.sources}}
+        sources = {}
+        for key in self.sources:
+            entry = self._source_key(key, known.get(key))
+            if entry is False:
+                return False            # payload doesn't match the file any more
+            sources[key] = entry
+        header = {
+            "version": SNAPSHOT_VERSION,
+            "sources": sources,
+            "code":    self.code_digest,
+        }
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".",
+                                       prefix=os.path.basename(self.path) + ".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(header, f, protocol=PICKLE_PROTOCOL)
+                pickle.dump(payload, f, protocol=PICKLE_PROTOCOL)
+            os.replace(tmp, self.path)
+            self._known = known
+            return True
+        except (OSError, pickle.PicklingError) as e:
+            print(f"[CatalogSnapshot] Error writing {self.path}: {e}")
+            if tmp:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            return False
@@ -0,0 +1,366 @@
+"""
+NEURAL FIGHTS — Storage backends for AppState
+=============================================
+AppState keeps everything in memory; a backend only decides how mutations
+reach the disk.
+
+    JsonStorage    whole-file JSON rewrites (default), debounced and written
+                   from a background thread (see data/write_behind.py)
+    SqliteStorage  stdlib sqlite3, one row per weapon / character, WAL mode,
+                   single-row transactional updates and indexed queries
+
+Both expose the same interface:
+    load_list(kind) → list[dict] | None        kind ∈ {"weapons", "characters"}
+    save_list(kind, items)                     full replace
+    update_item(kind, index, items)            items[index] changed
+    insert_item(kind, index, items)            items[index] was added
+    delete_item(kind, index, items)            row at index removed (items already updated)
+    load_doc(name) → dict | None               name ∈ {"match", "tournament", "gods"}
+    save_doc(name, data)
+    flush()                                    force pending writes to disk
+    has_pending(key) → bool                    a write for key is still queued
+    on_write = callable(key)                   called after a file/row is written
+
+`items` are model objects (Arma / Personagem) with to_dict(); the JSON
+backend needs the whole list, SQLite only touches the affected row.
+
+The JSON files stay the import/export format: an empty database imports
+them on first open, and export_json() writes them back.
+
+Selecting the backend:
+    NEURAL_FIGHTS_STORAGE=sqlite python run.py
+
+CLI:
+    python -m data.storage import   # JSON → neural_fights.db (replaces rows)
+    python -m data.storage export   # neural_fights.db → JSON
+    python -m data.storage query characters classe "Mago (Fogo)"
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from copy import deepcopy
+from functools import partial
+
+from data.snapshot import bytes_digest
+from data.write_behind import WriteBehind
+
+LIST_KINDS = ("weapons", "characters")
+DOC_NAMES  = ("match", "tournament", "gods")
+
+# Columns promoted out of the JSON blob so they can be indexed
+INDEXED_COLUMNS = {
+    "weapons":    ("nome", "tipo", "raridade"),
+    "characters": ("nome", "classe", "god_id", "nome_arma"),
+}
+
+
+def read_json(path: str):
+    """Parsed JSON or None if the file is missing / unreadable."""
+    return read_json_digest(path)[0]
+
+
+def read_json_digest(path: str) -> tuple:
+    """(parsed JSON or None, digest of the bytes read or None)."""
+    if not os.path.exists(path):
+        return None, None
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return json.loads(raw.decode("utf-8")), bytes_digest(raw)
+    except Exception as e:
+        print(f"[Storage] Warning loading {path}: {e}")
+        return None, None
+
+
+def write_json(path: str, data) -> "str | None":
+    """Atomic write; returns the digest of the bytes written (None on error)."""
+    try:
+        raw = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, path)          # atomic rename — no corrupt files
+        return bytes_digest(raw)
+    except Exception as e:
+        print(f"[Storage] Error saving {path}: {e}")
+        return None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+class JsonStorage:
+    """
+    One JSON file per list / document.  Saves are coalesced per file and
+    written in the background after `delay` seconds of quiet (delay=0 →
+    synchronous, the original behaviour).
+    """
+
+    name = "json"
+
+    def __init__(self, paths: dict, delay: float = 0.5):
+        # paths: {"weapons": ..., "characters": ..., "match": ..., "tournament": ..., "gods": ...}
+        self.paths = dict(paths)
+        self._writer = WriteBehind(delay) if delay > 0 else None
+        self.on_write = None        # e.g. FileWatcher.mark_seen: our writes aren't external changes
+        # key → digest of the bytes this process last read or wrote (CatalogSnapshot)
+        self.digests: dict = {}
+
+    def _read(self, key: str):
+        data, self.digests[key] = read_json_digest(self.paths[key])
+        return data
+
+    def _write(self, key: str, data):
+        self.digests[key] = write_json(self.paths[key], data)
+        if self.on_write is not None:
+            self.on_write(key)
+
+    def _save(self, key: str, produce):
+        write = partial(self._write, key)
+        if self._writer is None:
+            write(produce())
+        else:
+            self._writer.mark(key, produce, write)
+
+    def load_list(self, kind: str) -> "list[dict] | None":
+        return self._read(kind)
+
+    def save_list(self, kind: str, items: list):
+        self._save(kind, lambda: [x.to_dict() for x in items])
+
+    def update_item(self, kind: str, index: int, items: list):
+        self.save_list(kind, items)
+
+    def insert_item(self, kind: str, index: int, items: list):
+        self.save_list(kind, items)
+
+    def delete_item(self, kind: str, index: int, items: list):
+        self.save_list(kind, items)
+
+    def load_doc(self, name: str) -> "dict | None":
+        return self._read(name)
+
+    def save_doc(self, name: str, data: dict):
+        self._save(name, lambda: deepcopy(data))
+
+    def flush(self):
+        if self._writer is not None:
+            self._writer.flush()
+
+    def has_pending(self, key: str) -> bool:
+        return self._writer is not None and key in self._writer.pending
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+    def __repr__(self):
+        return f"<JsonStorage  dir={os.path.dirname(self.paths['weapons'])}>"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+class SqliteStorage:
+    """
+    One row per weapon / character.  Rows keep their list position in `pos`
+    so AppState's index-based mutations map to single-row statements.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str, json_paths: dict = None):
+        self.db_path    = db_path
+        self.json_paths = dict(json_paths or {})
+        self.on_write   = None
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        if self.json_paths and self._is_empty():
+            self.import_json()
+
+    # ── Schema ────────────────────────────────────────────────────────────────
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            for kind, cols in INDEXED_COLUMNS.items():
+                col_defs = ", ".join(f"{c} TEXT" for c in cols)
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {kind} ("
+                    f"id INTEGER PRIMARY KEY, pos INTEGER NOT NULL, {col_defs}, data TEXT NOT NULL)")
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{kind}_pos ON {kind}(pos)")
+                for c in cols:
+                    self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{kind}_{c} ON {kind}({c})")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS docs (name TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    def _is_empty(self) -> bool:
+        with self._lock:
+            for table in (*LIST_KINDS, "docs"):
+                if self._conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+                    return False
+            return True
+
+    @staticmethod
+    def _row(kind: str, pos: int, d: dict) -> tuple:
+        return (pos, *(d.get(c) for c in INDEXED_COLUMNS[kind]), json.dumps(d, ensure_ascii=False))
+
+    def _insert_sql(self, kind: str) -> str:
+        cols = INDEXED_COLUMNS[kind]
+        return (f"INSERT INTO {kind} (pos, {', '.join(cols)}, data) "
+                f"VALUES ({', '.join('?' * (len(cols) + 2))})")
+
+    # ── Lists ─────────────────────────────────────────────────────────────────
+
+    def load_list(self, kind: str) -> "list[dict] | None":
+        with self._lock:
+            rows = self._conn.execute(f"SELECT data FROM {kind} ORDER BY pos").fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def save_list(self, kind: str, items: list):
+        self._replace_rows(kind, [x.to_dict() for x in items])
+
+    def _replace_rows(self, kind: str, dicts: list):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {kind}")
+            self._conn.executemany(self._insert_sql(kind),
+                                   [self._row(kind, i, d) for i, d in enumerate(dicts)])
+
+    def clear(self, kind: str):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {kind}")
+
+    def append_rows(self, kind: str, dicts: list, start: int):
+        """Bulk insert of raw dicts at positions start.. (roster generators)."""
+        with self._lock, self._conn:
+            self._conn.executemany(self._insert_sql(kind),
+                                   [self._row(kind, start + i, d) for i, d in enumerate(dicts)])
+
+    def update_item(self, kind: str, index: int, items: list):
+        cols = INDEXED_COLUMNS[kind]
+        row = self._row(kind, index, items[index].to_dict())
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE {kind} SET {', '.join(f'{c} = ?' for c in cols)}, data = ? WHERE pos = ?",
+                (*row[1:], index))
+
+    def insert_item(self, kind: str, index: int, items: list):
+        with self._lock, self._conn:
+            self._conn.execute(f"UPDATE {kind} SET pos = pos + 1 WHERE pos >= ?", (index,))
+            self._conn.execute(self._insert_sql(kind), self._row(kind, index, items[index].to_dict()))
+
+    def delete_item(self, kind: str, index: int, items: list):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {kind} WHERE pos = ?", (index,))
+            self._conn.execute(f"UPDATE {kind} SET pos = pos - 1 WHERE pos > ?", (index,))
+
+    def query(self, kind: str, column: str, value) -> list[dict]:
+        """Indexed lookup, e.g. query("characters", "god_id", "ares")."""
+        if column not in INDEXED_COLUMNS[kind]:
+            raise ValueError(f"{kind}.{column} is not indexed (use one of {INDEXED_COLUMNS[kind]})")
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM {kind} WHERE {column} IS ? ORDER BY pos", (value,)).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def count(self, kind: str) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {kind}").fetchone()[0]
+
+    # ── Documents ─────────────────────────────────────────────────────────────
+
+    def load_doc(self, name: str) -> "dict | None":
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM docs WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_doc(self, name: str, data: dict):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO docs (name, data) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET data = excluded.data",
+                (name, json.dumps(data, ensure_ascii=False)))
+
+    # ── JSON import / export ──────────────────────────────────────────────────
+
+    def import_json(self, paths: dict = None):
+        """Load the JSON files into the database (replaces existing rows)."""
+        paths = paths or self.json_paths
+        for kind in LIST_KINDS:
+            data = read_json(paths[kind]) if kind in paths else None
+            if data is not None:
+                self._replace_rows(kind, data)
+        for name in DOC_NAMES:
+            data = read_json(paths[name]) if name in paths else None
+            if data is not None:
+                self.save_doc(name, data)
+
+    def export_json(self, paths: dict = None):
+        """Write the database back out as the JSON files."""
+        paths = paths or self.json_paths
+        for kind in LIST_KINDS:
+            if kind in paths:
+                write_json(paths[kind], self.load_list(kind))
+        for name in DOC_NAMES:
+            data = self.load_doc(name)
+            if name in paths and data is not None:
+                write_json(paths[name], data)
+
+    def flush(self):
+        pass                    # every statement is committed immediately
+
+    def has_pending(self, key: str) -> bool:
+        return False
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self):
+        return (f"<SqliteStorage  {os.path.basename(self.db_path)}"
+                f"  weapons={self.count('weapons')}  characters={self.count('characters')}>")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+def open_storage(json_paths: dict, db_path: str, backend: str = None):
+    """
+    Backend chosen by argument or NEURAL_FIGHTS_STORAGE ("json" | "sqlite").
+    Falls back to JSON if the database cannot be opened.
+    """
+    backend = (backend or os.environ.get("NEURAL_FIGHTS_STORAGE") or "json").lower()
+    if backend == "sqlite":
+        try:
+            return SqliteStorage(db_path, json_paths)
+        except sqlite3.Error as e:
+            print(f"[Storage] SQLite unavailable ({e}), using JSON files")
+    return JsonStorage(json_paths)
+
+
+def main():
+    import argparse
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data.app_state import FILE_DB, JSON_PATHS
+
+    parser = argparse.ArgumentParser(description="Neural Fights - SQLite storage import/export")
+    parser.add_argument("acao", choices=("import", "export", "query"))
+    parser.add_argument("args", nargs="*", help="query: <weapons|characters> <coluna> <valor>")
+    parser.add_argument("--db", default=FILE_DB)
+    args = parser.parse_args()
+
+    storage = SqliteStorage(args.db)
+    if args.acao == "import":
+        storage.import_json(JSON_PATHS)
+    elif args.acao == "export":
+        storage.export_json(JSON_PATHS)
+    else:
+        kind, column, value = args.args
+        for d in storage.query(kind, column, value):
+            print(d.get("nome"))
+    print(storage)
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
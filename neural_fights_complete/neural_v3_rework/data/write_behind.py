@@ -0,0 +1,121 @@
+"""
+NEURAL FIGHTS — WriteBehind (debounced background saves)
+========================================================
+Coalesces repeated saves of the same collection and performs them on a
+background thread once the caller has been quiet for `delay` seconds
+(or at most `max_delay` after the first pending change, so a continuous
+stream of edits still reaches the disk).
+
+    wb = WriteBehind(delay=0.5)
+    wb.mark("weapons", produce, write)   # cheap; called on every mutation
+    wb.flush()                           # synchronous, e.g. before launching a subprocess
+
+`produce()` builds the serialisable snapshot and runs at flush time, so N
+edits cost one serialisation and one write.  `write(snapshot)` does the
+actual I/O (JsonStorage uses tmp file + os.replace).  If the data changes
+while it is being snapshotted (RuntimeError from dict iteration), the key
+is re-queued for the next pass.  Pending writes are flushed at exit.
+
+flush() returns only once everything marked before the call is on disk:
+it waits for a write the worker already started (_io_lock) and repeats
+until nothing is pending, so callers can hand the files to a subprocess
+right after it.  The worker takes its batch under _io_lock too, so there is
+no window where a batch is neither pending nor being written under the lock.
+"""
+
+import atexit
+import threading
+import time
+from typing import Any, Callable
+
+
+class WriteBehind:
+    def __init__(self, delay: float = 0.5, max_delay: float = 5.0):
+        self.delay     = delay
+        self.max_delay = max_delay
+        self._pending: dict[str, tuple[Callable[[], Any], Callable[[Any], None]]] = {}
+        self._cond     = threading.Condition()
+        self._io_lock  = threading.Lock()      # one flush at a time (worker vs flush())
+        self._first_mark = 0.0
+        self._last_mark  = 0.0
+        self._thread: "threading.Thread | None" = None
+        self._closed = False
+        atexit.register(self.close)
+
+    # ── Public ────────────────────────────────────────────────────────────────
+
+    def mark(self, key: str, produce: Callable[[], Any], write: Callable[[Any], None]):
+        """Schedule `write(produce())` for key; a later mark replaces an earlier one."""
+        if self._closed:
+            write(produce())
+            return
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_mark = now
+            self._last_mark = now
+            self._pending[key] = (produce, write)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="AppState-WriteBehind",
+                                                daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def flush(self):
+        """Write everything pending now, in the calling thread; waits for an in-flight write."""
+        while True:
+            with self._io_lock:
+                with self._cond:
+                    batch, self._pending = self._pending, {}
+                if not batch:
+                    return
+                self._write(batch)
+
+    @property
+    def pending(self) -> list[str]:
+        with self._cond:
+            return list(self._pending)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+    # ── Worker ────────────────────────────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # Debounce: wait for a quiet period, capped by max_delay
+                while self._pending and not self._closed:
+                    now = time.monotonic()
+                    due = min(self._last_mark + self.delay, self._first_mark + self.max_delay)
+                    if now >= due:
+                        break
+                    self._cond.wait(due - now)
+            # Take the batch under _io_lock: a concurrent flush() waits for it
+            with self._io_lock:
+                with self._cond:
+                    batch, self._pending = self._pending, {}
+                self._write(batch)
+
+    def _write(self, batch: dict):
+        """Caller holds _io_lock."""
+        for key, (produce, write) in batch.items():
+            try:
+                snapshot = produce()
+            except RuntimeError:
+                # Mutated mid-snapshot (UI thread) — try again on the next pass
+                with self._cond:
+                    self._pending.setdefault(key, (produce, write))
+                    self._cond.notify()
+                continue
+            write(snapshot)
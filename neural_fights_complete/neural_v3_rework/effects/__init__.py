@@ -1,94 +1,80 @@
 """
 NEURAL FIGHTS - Módulo Effects
 Sistema de efeitos visuais, partículas e câmera.
-"""
-
-# Partículas
-from .particles import (
-    Particula,
-    HitSpark,
-    Shockwave,
-    EncantamentoEffect,
-    CORES_ENCANTAMENTOS,
-)
-
-# Impacto
-from .impact import (
-    ImpactFlash,
-    MagicClash,
-    BlockEffect,
-    DashTrail,
-)
-
-# Câmera
-from .camera import Câmera
-
-# Visual/UI
-from .visual import (
-    FloatingText,
-    Decal,
-)
-
-# === NOVO: Sistema de Animação de Movimento v8.0 ===
-from .movement import (
-    MovementAnimationManager,
-    AfterImageTrail,
-    DustCloud,
-    SpeedLinesEffect,
-    MotionBlur,
-    SquashStretch,
-    RecoveryFlash,
-    MovementType,
-)
 
-# === NOVO: Sistema de Animação de Ataque v8.0 IMPACT EDITION ===
-from .attack import (
-    AttackAnimationManager,
-    WeaponTrailEnhanced,
-    ImpactShockwave,
-    ImpactSparks,
-    ScreenFlash,
-    CraterMark,
-    GroundCrack,
-    AttackAnticipation,
-    get_impact_tier,
-    calcular_knockback_com_forca,
-)
-
-# === NOVO: Sistema de Animação de Armas v2.0 ===
-from .weapon_animations import (
-    WeaponAnimationManager,
-    WeaponAnimator,
-    WeaponTrailRenderer,
-    WeaponAnimationProfile,
-    WeaponAnimationState,
-    AttackPhase,
-    Easing,
-    WEAPON_PROFILES,
-    get_weapon_animation_manager,
-)
+Importação sob demanda (ver utils/importacao_tardia.py): `from effects.audio
+import AudioManager` carrega só o áudio, e `from effects import Câmera` só
+a câmera — o resto do stack de VFX fica fora de quem não renderiza.
+"""
 
-# v10.0 - Audio movido para effects
-from .audio import (
-    AudioManager,
-    play_sound,
-    play_attack_sound,
-    play_impact_sound,
-    play_skill_sound,
-)
+from utils.importacao_tardia import exportacoes_tardias
 
-# v11.0 - Efeitos de Magia Dramáticos
-from .magic_vfx import (
-    MagicVFXManager,
-    DramaticExplosion,
-    DramaticBeam,
-    DramaticAura,
-    DramaticSummon,
-    DramaticProjectileTrail,
-    MagicParticle,
-    ELEMENT_PALETTES,
-    get_element_from_skill,
-)
+__getattr__, __dir__ = exportacoes_tardias(__name__, {
+    # Partículas
+    'Particula':                      '.particles',
+    'HitSpark':                       '.particles',
+    'Shockwave':                      '.particles',
+    'EncantamentoEffect':             '.particles',
+    'CORES_ENCANTAMENTOS':            '.particles',
+    'ParticleBuffer':                 '.particle_engine',
+    'SpriteCache':                    '.sprite_cache',
+    # Impacto
+    'ImpactFlash':                    '.impact',
+    'MagicClash':                     '.impact',
+    'BlockEffect':                    '.impact',
+    'DashTrail':                      '.impact',
+    # Câmera
+    'Câmera':                         '.camera',
+    # Visual/UI
+    'FloatingText':                   '.visual',
+    'Decal':                          '.visual',
+    # === NOVO: Sistema de Animação de Movimento v8.0 ===
+    'MovementAnimationManager':       '.movement',
+    'AfterImageTrail':                '.movement',
+    'DustCloud':                      '.movement',
+    'SpeedLinesEffect':               '.movement',
+    'MotionBlur':                     '.movement',
+    'SquashStretch':                  '.movement',
+    'RecoveryFlash':                  '.movement',
+    'MovementType':                   '.movement',
+    # === NOVO: Sistema de Animação de Ataque v8.0 IMPACT EDITION ===
+    'AttackAnimationManager':         '.attack',
+    'WeaponTrailEnhanced':            '.attack',
+    'ImpactShockwave':                '.attack',
+    'ImpactSparks':                   '.attack',
+    'ScreenFlash':                    '.attack',
+    'CraterMark':                     '.attack',
+    'GroundCrack':                    '.attack',
+    'AttackAnticipation':             '.attack',
+    'get_impact_tier':                '.attack',
+    'calcular_knockback_com_forca':   '.attack',
+    # === NOVO: Sistema de Animação de Armas v2.0 ===
+    'WeaponAnimationManager':         '.weapon_animations',
+    'WeaponAnimator':                 '.weapon_animations',
+    'WeaponTrailRenderer':            '.weapon_animations',
+    'WeaponAnimationProfile':         '.weapon_animations',
+    'WeaponAnimationState':           '.weapon_animations',
+    'AttackPhase':                    '.weapon_animations',
+    'Easing':                         '.weapon_animations',
+    'WEAPON_PROFILES':                '.weapon_animations',
+    'get_weapon_animation_manager':   '.weapon_animations',
+    # v10.0 - Audio movido para effects
+    'AudioManager':                   '.audio',
+    'play_sound':                     '.audio',
+    'play_attack_sound':              '.audio',
+    'play_impact_sound':              '.audio',
+    'play_skill_sound':               '.audio',
+    # v11.0 - Efeitos de Magia Dramáticos
+    'MagicVFXManager':                '.magic_vfx',
+    'DramaticExplosion':              '.magic_vfx',
+    'DramaticBeam':                   '.magic_vfx',
+    'DramaticAura':                   '.magic_vfx',
+    'DramaticSummon':                 '.magic_vfx',
+    'DramaticProjectileTrail':        '.magic_vfx',
+    'MagicParticle':                  '.magic_vfx',
+    'ELEMENT_PALETTES':               '.magic_vfx',
+    'get_element_from_skill':         '.magic_vfx',
+})
 
 __all__ = [
     # Partículas
@@ -97,6 +83,8 @@ __all__ = [
     'Shockwave',
     'EncantamentoEffect',
     'CORES_ENCANTAMENTOS',
+    'ParticleBuffer',
+    'SpriteCache',
     # Impacto
     'ImpactFlash',
     'MagicClash',
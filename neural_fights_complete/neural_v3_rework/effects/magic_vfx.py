@@ -19,8 +19,12 @@ Cada elemento tem geometria, ritmo e personalidade únicos:
 import pygame
 import random
 import math
+import numpy as np
 from typing import List, Tuple, Optional, Dict
 from utils.config import PPM
+from effects.particle_engine import ParticleBuffer
+from effects.sprite_cache import (SpriteCache, quantizar_raio,
+                                  quantizar_angulo, angulo_do_balde)
 
 
 ELEMENT_PALETTES = {
@@ -138,14 +142,19 @@ def _safe_surface(w, h):
         return None
 
 
+def _rascunho(w, h):
+    """Superfície temporária reutilizada (geometria aleatória que não dá para cachear); None se faltar memória."""
+    return SpriteCache.get_instance().rascunho(max(4, int(w)), max(4, int(h)))
+
+
 def _draw_glow_circle(tela, cx, cy, radius, color, alpha, layers=4):
+    cache = SpriteCache.get_instance()
     for i in range(layers, 0, -1):
         r = int(radius * i / layers * 2.0)
         a = int(alpha * (1.0 - i / layers) * 0.55)
-        s = _safe_surface(r * 2 + 4, r * 2 + 4)
-        if s:
-            pygame.draw.circle(s, (*color[:3], a), (r + 2, r + 2), r)
-            tela.blit(s, (cx - r - 2, cy - r - 2))
+        if a <= 0:
+            continue
+        cache.blit_centrado(tela, cache.circulo(r, color, a), cx, cy)
 
 
 def _draw_lightning_bolt(tela, x1, y1, x2, y2, color, width=2, detail=5):
@@ -169,8 +178,9 @@ def _draw_lightning_bolt(tela, x1, y1, x2, y2, color, width=2, detail=5):
     min_y = min(p[1] for p in pts) - 10
     max_x = max(p[0] for p in pts) + 10
     max_y = max(p[1] for p in pts) + 10
-    s = _safe_surface(max_x - min_x + 4, max_y - min_y + 4)
-    if not s:
+    w, h = int(max_x - min_x + 4), int(max_y - min_y + 4)
+    s = _rascunho(w, h)
+    if s is None:
         return
     local = [(p[0] - min_x, p[1] - min_y) for p in pts]
     try:
@@ -179,24 +189,30 @@ def _draw_lightning_bolt(tela, x1, y1, x2, y2, color, width=2, detail=5):
         pygame.draw.lines(s, (255, 255, 255, 240), False, local, max(1, width - 1))
     except Exception:
         pass
-    tela.blit(s, (int(min_x), int(min_y)))
+    tela.blit(s, (int(min_x), int(min_y)), (0, 0, w, h))
 
 
-def _draw_crystal_shard(tela, cx, cy, size, angle, color, alpha):
+def _sprite_shard(size, balde, cor):
+    angle = angulo_do_balde(balde, 3)
+    s = _safe_surface(size * 3 + 4, size * 3 + 4)
     pts = []
     for i in range(6):
         a = angle + i * (math.pi * 2 / 6)
         r = size if i % 2 == 0 else size * 0.55
-        pts.append((cx + math.cos(a) * r, cy + math.sin(a) * r))
-    s = _safe_surface(size * 3 + 4, size * 3 + 4)
-    if s and len(pts) >= 3:
-        local = [(p[0] - cx + size * 1.5, p[1] - cy + size * 1.5) for p in pts]
-        try:
-            pygame.draw.polygon(s, (*color[:3], alpha), local)
-            pygame.draw.polygon(s, (255, 255, 255, min(255, alpha + 100)), local, 1)
-        except Exception:
-            pass
-        tela.blit(s, (cx - int(size * 1.5), cy - int(size * 1.5)))
+        pts.append((size * 1.5 + math.cos(a) * r, size * 1.5 + math.sin(a) * r))
+    try:
+        pygame.draw.polygon(s, cor, pts)
+        pygame.draw.polygon(s, (255, 255, 255), pts, 1)
+    except Exception:
+        pass
+    return s
+
+
+def _draw_crystal_shard(tela, cx, cy, size, angle, color, alpha):
+    size = quantizar_raio(size)
+    chave = ("shard", size, quantizar_angulo(angle, 3), tuple(color[:3]))
+    s = SpriteCache.get_instance().get(chave, _sprite_shard, *chave[1:], alpha=alpha)
+    tela.blit(s, (cx - int(size * 1.5), cy - int(size * 1.5)))
 
 
 # =============================================================================
@@ -240,94 +256,130 @@ class MagicParticle:
         if tam < 1:
             return
         alpha = int(255 * (self.vida / self.vida_max))
-        isx, isy = int(sx), int(sy)
-        itam = max(1, int(tam))
-
-        if self.shape == "shard":
-            _draw_crystal_shard(tela, isx, isy, itam, self.rotacao, self.cor, alpha)
-        elif self.shape == "ember":
-            s = _safe_surface(itam * 4 + 4, itam * 6 + 4)
-            if s:
-                cx_, cy_ = itam * 2 + 2, itam * 3 + 2
-                try:
-                    pygame.draw.ellipse(s, (*self.cor[:3], alpha),
-                                        (cx_ - itam, cy_ - itam * 2,
-                                         max(2, itam * 2), max(4, itam * 4)))
-                    pygame.draw.ellipse(s, (255, 255, 220, min(255, alpha + 80)),
-                                        (cx_ - max(1, itam//2), cy_ - itam,
-                                         max(1, itam), max(2, itam * 2)))
-                except Exception:
-                    pass
-                tela.blit(s, (isx - itam * 2 - 2, isy - itam * 3 - 2))
-        elif self.shape == "drop":
-            s = _safe_surface(itam * 3 + 4, itam * 4 + 4)
-            if s:
-                cx_, cy_ = itam + 2, itam + 2
-                try:
-                    pygame.draw.circle(s, (*self.cor[:3], alpha), (cx_, cy_), max(1, itam))
-                    pts = [(cx_ - max(1, itam//3), cy_),
-                           (cx_ + max(1, itam//3), cy_),
-                           (cx_, cy_ + max(2, itam * 2))]
-                    pygame.draw.polygon(s, (*self.cor[:3], alpha), pts)
-                except Exception:
-                    pass
-                tela.blit(s, (isx - itam - 2, isy - itam - 2))
-        elif self.shape == "wisp":
-            _draw_glow_circle(tela, isx, isy, max(2, itam), self.cor, alpha, 2)
-        elif self.shape == "star":
-            s = _safe_surface(itam * 4 + 4, itam * 4 + 4)
-            if s:
-                cx_, cy_ = itam * 2 + 2, itam * 2 + 2
-                star_pts = []
-                for si in range(8):
-                    a = self.rotacao + si * (math.pi / 4)
-                    r = itam * (1.5 if si % 2 == 0 else 0.65)
-                    star_pts.append((cx_ + math.cos(a) * r, cy_ + math.sin(a) * r))
-                if len(star_pts) >= 3:
-                    try:
-                        pygame.draw.polygon(s, (*self.cor[:3], alpha), star_pts)
-                    except Exception:
-                        pass
-                tela.blit(s, (isx - itam * 2 - 2, isy - itam * 2 - 2))
-        elif self.shape == "rune":
-            # Runa quadrada girando
-            s = _safe_surface(itam * 3 + 4, itam * 3 + 4)
-            if s:
-                cx_, cy_ = itam + 2, itam + 2
-                try:
-                    rect_pts = []
-                    for si in range(4):
-                        a = self.rotacao + si * (math.pi / 2) + math.pi / 4
-                        rect_pts.append((cx_ + math.cos(a) * itam, cy_ + math.sin(a) * itam))
-                    if len(rect_pts) >= 3:
-                        pygame.draw.polygon(s, (*self.cor[:3], 0), rect_pts)
-                        pygame.draw.polygon(s, (*self.cor[:3], alpha), rect_pts, 2)
-                except Exception:
-                    pass
-                tela.blit(s, (isx - itam - 2, isy - itam - 2))
-        elif self.shape == "thorn":
-            # Espinho triangular
-            s = _safe_surface(itam * 3 + 4, itam * 4 + 4)
-            if s:
-                cx_, cy_ = itam + 2, itam * 2 + 2
-                pts = [(cx_, cy_ - max(2, itam * 2)),
-                       (cx_ + max(1, itam // 2), cy_),
-                       (cx_ - max(1, itam // 2), cy_)]
-                try:
-                    pygame.draw.polygon(s, (*self.cor[:3], alpha), pts)
-                except Exception:
-                    pass
-                tela.blit(s, (isx - itam - 2, isy - itam * 2 - 2))
-        else:  # circle
-            if self.glow:
-                _draw_glow_circle(tela, isx, isy, max(2, itam), self.cor, alpha, 2)
-            else:
-                s = _safe_surface(itam * 3 + 4, itam * 3 + 4)
-                if s:
-                    cx_, cy_ = itam + 2, itam + 2
-                    pygame.draw.circle(s, (*self.cor[:3], alpha // 3), (cx_, cy_), max(2, int(itam * 1.5)))
-                    pygame.draw.circle(s, (*self.cor[:3], alpha),     (cx_, cy_), max(1, itam))
-                    tela.blit(s, (isx - itam - 2, isy - itam - 2))
+        _draw_magic_particle(tela, self.shape, int(sx), int(sy), max(1, int(tam)),
+                             self.rotacao, self.cor, alpha, self.glow)
+
+
+# Sprites das formas de partícula mágica. Cada construtor recebe (itam, ..., cor)
+# já quantizados e devolve a superfície opaca (o alpha é aplicado no blit pelo
+# SpriteCache); o deslocamento de blit vem de _OFFSETS.
+
+def _sprite_ember(itam, cor):
+    s = _safe_surface(itam * 4 + 4, itam * 6 + 4)
+    cx_, cy_ = itam * 2 + 2, itam * 3 + 2
+    try:
+        pygame.draw.ellipse(s, cor,
+                            (cx_ - itam, cy_ - itam * 2,
+                             max(2, itam * 2), max(4, itam * 4)))
+        pygame.draw.ellipse(s, (255, 255, 220),
+                            (cx_ - max(1, itam//2), cy_ - itam,
+                             max(1, itam), max(2, itam * 2)))
+    except Exception:
+        pass
+    return s
+
+
+def _sprite_drop(itam, cor):
+    s = _safe_surface(itam * 3 + 4, itam * 4 + 4)
+    cx_, cy_ = itam + 2, itam + 2
+    try:
+        pygame.draw.circle(s, cor, (cx_, cy_), max(1, itam))
+        pts = [(cx_ - max(1, itam//3), cy_),
+               (cx_ + max(1, itam//3), cy_),
+               (cx_, cy_ + max(2, itam * 2))]
+        pygame.draw.polygon(s, cor, pts)
+    except Exception:
+        pass
+    return s
+
+
+def _sprite_star(itam, balde, cor):
+    rotacao = angulo_do_balde(balde, 4)
+    s = _safe_surface(itam * 4 + 4, itam * 4 + 4)
+    cx_, cy_ = itam * 2 + 2, itam * 2 + 2
+    star_pts = []
+    for si in range(8):
+        a = rotacao + si * (math.pi / 4)
+        r = itam * (1.5 if si % 2 == 0 else 0.65)
+        star_pts.append((cx_ + math.cos(a) * r, cy_ + math.sin(a) * r))
+    try:
+        pygame.draw.polygon(s, cor, star_pts)
+    except Exception:
+        pass
+    return s
+
+
+def _sprite_rune(itam, balde, cor):
+    # Runa quadrada (contorno)
+    rotacao = angulo_do_balde(balde, 4)
+    s = _safe_surface(itam * 3 + 4, itam * 3 + 4)
+    cx_, cy_ = itam + 2, itam + 2
+    try:
+        rect_pts = []
+        for si in range(4):
+            a = rotacao + si * (math.pi / 2) + math.pi / 4
+            rect_pts.append((cx_ + math.cos(a) * itam, cy_ + math.sin(a) * itam))
+        pygame.draw.polygon(s, cor, rect_pts, 2)
+    except Exception:
+        pass
+    return s
+
+
+def _sprite_thorn(itam, cor):
+    # Espinho triangular
+    s = _safe_surface(itam * 3 + 4, itam * 4 + 4)
+    cx_, cy_ = itam + 2, itam * 2 + 2
+    pts = [(cx_, cy_ - max(2, itam * 2)),
+           (cx_ + max(1, itam // 2), cy_),
+           (cx_ - max(1, itam // 2), cy_)]
+    try:
+        pygame.draw.polygon(s, cor, pts)
+    except Exception:
+        pass
+    return s
+
+
+def _sprite_dot(itam, cor):
+    s = _safe_surface(itam * 3 + 4, itam * 3 + 4)
+    cx_, cy_ = itam + 2, itam + 2
+    pygame.draw.circle(s, (*cor, 85), (cx_, cy_), max(2, int(itam * 1.5)))
+    pygame.draw.circle(s, cor,        (cx_, cy_), max(1, itam))
+    return s
+
+
+_SPRITES_FIXOS = {"ember": _sprite_ember, "drop": _sprite_drop,
+                  "thorn": _sprite_thorn, "circle": _sprite_dot}
+_SPRITES_GIRATORIOS = {"star": _sprite_star, "rune": _sprite_rune}
+# Deslocamento (dx, dy) do canto do sprite em função de itam
+_OFFSETS = {
+    "ember": lambda t: (t * 2 + 2, t * 3 + 2),
+    "drop": lambda t: (t + 2, t + 2),
+    "thorn": lambda t: (t + 2, t * 2 + 2),
+    "circle": lambda t: (t + 2, t + 2),
+    "star": lambda t: (t * 2 + 2, t * 2 + 2),
+    "rune": lambda t: (t + 2, t + 2),
+}
+
+
+def _draw_magic_particle(tela, shape, isx, isy, itam, rotacao, cor, alpha, glow):
+    """Desenha uma partícula mágica já convertida para coordenadas de tela."""
+    if shape == "shard":
+        _draw_crystal_shard(tela, isx, isy, itam, rotacao, cor, alpha)
+        return
+    if shape == "wisp" or (shape == "circle" and glow):
+        _draw_glow_circle(tela, isx, isy, max(2, itam), cor, alpha, 2)
+        return
+    cache = SpriteCache.get_instance()
+    t = quantizar_raio(itam)
+    cor = tuple(cor[:3])
+    if shape in _SPRITES_GIRATORIOS:
+        balde = quantizar_angulo(rotacao, 4)
+        s = cache.get((shape, t, balde, cor), _SPRITES_GIRATORIOS[shape], t, balde, cor, alpha=alpha)
+    else:
+        shape = shape if shape in _SPRITES_FIXOS else "circle"
+        s = cache.get((shape, t, cor), _SPRITES_FIXOS[shape], t, cor, alpha=alpha)
+    dx, dy = _OFFSETS[shape](t)
+    tela.blit(s, (isx - dx, isy - dy))
 
 
 # =============================================================================
@@ -336,7 +388,7 @@ class MagicParticle:
 
 class DramaticProjectileTrail:
     def __init__(self, elemento="DEFAULT"):
-        self.particulas: List[MagicParticle] = []
+        self.particulas = ParticleBuffer()
         self.palette = ELEMENT_PALETTES.get(elemento, ELEMENT_PALETTES["DEFAULT"])
         self.spawn_timer = 0.0
         self.elemento = elemento
@@ -347,79 +399,78 @@ class DramaticProjectileTrail:
         while self.spawn_timer > rate:
             self.spawn_timer -= rate
             self._spawn(x, y)
-        self.particulas = [p for p in self.particulas if p.update(dt)]
+        self.particulas.update(dt)
 
     def _spawn(self, x, y):
         el = self.elemento
         pal = self.palette
         if el == "FOGO":
             cor = random.choice(pal["mid"] + pal["outer"])
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 x + random.uniform(-3, 3), y + random.uniform(-3, 3),
                 cor, random.uniform(-25, 25), random.uniform(-90, -30),
                 random.uniform(4, 9), random.uniform(0.22, 0.45),
-                gravidade=-40, arrasto=0.95, shape="ember"))
+                gravidade=-40, arrasto=0.95, shape="ember")
             # Faísca extra
             if random.random() < 0.4:
-                self.particulas.append(MagicParticle(
+                self.particulas.emit(
                     x, y, pal["spark"],
                     random.uniform(-50, 50), random.uniform(-60, 10),
                     random.uniform(1.5, 3), random.uniform(0.08, 0.18),
-                    gravidade=50, arrasto=0.90))
+                    gravidade=50, arrasto=0.90)
         elif el == "GELO":
             cor = random.choice(pal["mid"])
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 x + random.uniform(-5, 5), y + random.uniform(-5, 5),
                 cor, random.uniform(-45, 45), random.uniform(-45, 45),
                 random.uniform(2.5, 6), random.uniform(0.28, 0.55),
-                arrasto=0.90, shape="shard"))
+                arrasto=0.90, shape="shard")
         elif el == "RAIO":
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 x + random.uniform(-9, 9), y + random.uniform(-9, 9),
                 pal["spark"], random.uniform(-70, 70), random.uniform(-70, 70),
                 random.uniform(1.5, 3.5), random.uniform(0.04, 0.12),
-                arrasto=0.82, glow=True))
+                arrasto=0.82, glow=True)
         elif el == "TREVAS":
             cor = random.choice(pal["mid"])
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 x + random.uniform(-7, 7), y + random.uniform(-7, 7),
                 cor, random.uniform(-18, 18), random.uniform(-18, 18),
                 random.uniform(5, 11), random.uniform(0.35, 0.65),
-                gravidade=12, arrasto=0.985, shape="wisp"))
+                gravidade=12, arrasto=0.985, shape="wisp")
         elif el == "ARCANO":
             cor = random.choice(pal["mid"])
             shape = random.choice(["rune", "star", "circle"])
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 x + random.uniform(-6, 6), y + random.uniform(-6, 6),
                 cor, random.uniform(-30, 30), random.uniform(-30, 30),
                 random.uniform(3, 7), random.uniform(0.20, 0.40),
-                arrasto=0.93, shape=shape, glow=True))
+                arrasto=0.93, shape=shape, glow=True)
         elif el == "NATUREZA":
             cor = random.choice(pal["mid"])
             shape = random.choice(["thorn", "circle"])
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 x + random.uniform(-5, 5), y + random.uniform(-5, 5),
                 cor, random.uniform(-20, 20), random.uniform(-50, -10),
                 random.uniform(3, 7), random.uniform(0.25, 0.50),
-                gravidade=-20, arrasto=0.94, shape=shape))
+                gravidade=-20, arrasto=0.94, shape=shape)
         elif el == "SANGUE":
             cor = random.choice(pal["mid"])
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 x + random.uniform(-3, 3), y + random.uniform(-3, 3),
                 cor, random.uniform(-22, 22), random.uniform(-15, 35),
                 random.uniform(3, 7), random.uniform(0.18, 0.38),
-                gravidade=90, arrasto=0.93, shape="drop"))
+                gravidade=90, arrasto=0.93, shape="drop")
         else:
             cor = random.choice(pal["mid"])
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 x + random.uniform(-6, 6), y + random.uniform(-6, 6),
                 cor, random.uniform(-35, 35), random.uniform(-35, 35),
                 random.uniform(3, 7), random.uniform(0.20, 0.42),
-                arrasto=0.93))
+                arrasto=0.93)
 
     def draw(self, tela, cam):
-        for p in self.particulas:
-            p.draw(tela, cam)
+        self.particulas.draw(tela, cam, _draw_magic_particle)
 
 
 # =============================================================================
@@ -433,7 +484,7 @@ class DramaticExplosion:
         self.palette = ELEMENT_PALETTES.get(elemento, ELEMENT_PALETTES["DEFAULT"])
         self.elemento = elemento
         self.vida = self.vida_max = 1.2
-        self.particulas: List[MagicParticle] = []
+        self.particulas = ParticleBuffer()
         self.shockwaves = []
         self.crystals = []
         self.pillars = []
@@ -457,27 +508,21 @@ class DramaticExplosion:
                 "alpha_max": 220 - i * 25,
             })
         n = int(30 * tam + dano * 0.35)
+        g = self.particulas.rng
 
         if el == "FOGO":
             self.vida = self.vida_max = 1.3
             self.flash_raio = 30 * tam
             # Bola de fogo principal
-            for _ in range(n):
-                ang = random.uniform(-math.pi * 0.8, -math.pi * 0.2) + random.uniform(-0.8, 0.8)
-                vel = random.uniform(90, 280) * tam
-                cor = random.choice(pal["mid"] + [pal["core"]])
-                self.particulas.append(MagicParticle(self.x, self.y, cor,
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(6, 14) * tam, random.uniform(0.4, 0.8),
-                    gravidade=45, arrasto=0.94, shape="ember"))
+            self._burst(g, n, g.uniform(-math.pi * 0.8, -math.pi * 0.2, n) + g.uniform(-0.8, 0.8, n),
+                        g.uniform(90, 280, n) * tam, pal["mid"] + [pal["core"]],
+                        g.uniform(6, 14, n) * tam, g.uniform(0.4, 0.8, n),
+                        gravidade=45, arrasto=0.94, shapes="ember")
             # Faíscas radiais
-            for _ in range(int(n * 0.7)):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(120, 360) * tam
-                self.particulas.append(MagicParticle(self.x, self.y, pal["spark"],
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(2, 5), random.uniform(0.15, 0.35),
-                    gravidade=120, arrasto=0.91, shape="ember"))
+            nf = int(n * 0.7)
+            self._burst(g, nf, g.uniform(0, math.pi * 2, nf), g.uniform(120, 360, nf) * tam,
+                        pal["spark"], g.uniform(2, 5, nf), g.uniform(0.15, 0.35, nf),
+                        gravidade=120, arrasto=0.91, shapes="ember")
             # Pilares de chama (3)
             for i in range(3):
                 ang = (i / 3) * math.pi * 2 + random.uniform(-0.3, 0.3)
@@ -493,14 +538,9 @@ class DramaticExplosion:
         elif el == "GELO":
             self.vida = self.vida_max = 1.4
             # Fragmentos de cristal
-            for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(70, 210) * tam
-                cor = random.choice(pal["mid"])
-                self.particulas.append(MagicParticle(self.x, self.y, cor,
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 11) * tam, random.uniform(0.35, 0.65),
-                    gravidade=90, arrasto=0.92, shape="shard"))
+            self._burst(g, n, g.uniform(0, math.pi * 2, n), g.uniform(70, 210, n) * tam,
+                        pal["mid"], g.uniform(4, 11, n) * tam, g.uniform(0.35, 0.65, n),
+                        gravidade=90, arrasto=0.92, shapes="shard")
             # Cristais que ficam no chão (8 direções)
             for i in range(8):
                 ang = i * (math.pi * 2 / 8) + random.uniform(-0.15, 0.15)
@@ -527,13 +567,9 @@ class DramaticExplosion:
             self.flash_raio = 60 * tam
             self.flash_alpha = 255
             # Partículas elétricas rápidas
-            for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(140, 450) * tam
-                self.particulas.append(MagicParticle(self.x, self.y, pal["spark"],
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(2, 5), random.uniform(0.08, 0.22),
-                    arrasto=0.86, glow=True))
+            self._burst(g, n, g.uniform(0, math.pi * 2, n), g.uniform(140, 450, n) * tam,
+                        pal["spark"], g.uniform(2, 5, n), g.uniform(0.08, 0.22, n),
+                        arrasto=0.86, glow=True)
             # Raios em galho (6 direções)
             for i in range(6):
                 ang = i * (math.pi / 3) + random.uniform(-0.2, 0.2)
@@ -563,14 +599,9 @@ class DramaticExplosion:
             self.vida = self.vida_max = 1.6
             self.flash_alpha = 120
             # Wisps sombrios
-            for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(55, 175) * tam
-                cor = random.choice(pal["mid"])
-                self.particulas.append(MagicParticle(self.x, self.y, cor,
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(7, 16) * tam, random.uniform(0.55, 1.1),
-                    arrasto=0.975, shape="wisp"))
+            self._burst(g, n, g.uniform(0, math.pi * 2, n), g.uniform(55, 175, n) * tam,
+                        pal["mid"], g.uniform(7, 16, n) * tam, g.uniform(0.55, 1.1, n),
+                        arrasto=0.975, shapes="wisp")
             # Vórtex espirais
             for i in range(3):
                 self.vortex_rings.append({
@@ -597,25 +628,16 @@ class DramaticExplosion:
                     "cor": random.choice(pal["mid"]), "largura": 5,
                 })
             # Estrelas partículas
-            for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(110, 320) * tam
-                self.particulas.append(MagicParticle(self.x, self.y, pal["spark"],
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(2, 5), random.uniform(0.18, 0.38),
-                    arrasto=0.93, shape="star"))
+            self._burst(g, n, g.uniform(0, math.pi * 2, n), g.uniform(110, 320, n) * tam,
+                        pal["spark"], g.uniform(2, 5, n), g.uniform(0.18, 0.38, n),
+                        arrasto=0.93, shapes="star")
 
         elif el == "NATUREZA":
             self.vida = self.vida_max = 1.5
             # Esporos que sobem
-            for _ in range(n):
-                ang = random.uniform(-math.pi, -math.pi * 0.1)
-                vel = random.uniform(60, 200) * tam
-                cor = random.choice(pal["mid"])
-                self.particulas.append(MagicParticle(self.x, self.y, cor,
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 9) * tam, random.uniform(0.40, 0.80),
-                    gravidade=-20, arrasto=0.96, shape="circle"))
+            self._burst(g, n, g.uniform(-math.pi, -math.pi * 0.1, n), g.uniform(60, 200, n) * tam,
+                        pal["mid"], g.uniform(4, 9, n) * tam, g.uniform(0.40, 0.80, n),
+                        gravidade=-20, arrasto=0.96, shapes="circle")
             # Espinhos radiais
             for i in range(10):
                 ang = i * (math.pi * 2 / 10) + random.uniform(-0.2, 0.2)
@@ -630,15 +652,9 @@ class DramaticExplosion:
             self.vida = self.vida_max = 1.1
             self.flash_raio = 35 * tam
             # Fragmentos de runa
-            for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(80, 250) * tam
-                cor = random.choice(pal["mid"])
-                shape = random.choice(["rune", "star"])
-                self.particulas.append(MagicParticle(self.x, self.y, cor,
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 10) * tam, random.uniform(0.3, 0.6),
-                    arrasto=0.93, shape=shape, glow=True))
+            self._burst(g, n, g.uniform(0, math.pi * 2, n), g.uniform(80, 250, n) * tam,
+                        pal["mid"], g.uniform(4, 10, n) * tam, g.uniform(0.3, 0.6, n),
+                        arrasto=0.93, shapes=["rune", "star"], glow=True)
             # Anel de runas orbitando
             for i in range(6):
                 ang = i * (math.pi / 3)
@@ -657,14 +673,10 @@ class DramaticExplosion:
             self.vida = self.vida_max = 1.2
             self.flash_alpha = 200
             # Gotas de sangue que caem
-            for _ in range(n):
-                ang = random.uniform(-math.pi, 0) + random.uniform(-0.5, 0.5)
-                vel = random.uniform(90, 270) * tam
-                self.particulas.append(MagicParticle(self.x, self.y,
-                    random.choice(pal["mid"]),
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 10) * tam, random.uniform(0.3, 0.6),
-                    gravidade=230, arrasto=0.93, shape="drop"))
+            self._burst(g, n, g.uniform(-math.pi, 0, n) + g.uniform(-0.5, 0.5, n),
+                        g.uniform(90, 270, n) * tam, pal["mid"],
+                        g.uniform(4, 10, n) * tam, g.uniform(0.3, 0.6, n),
+                        gravidade=230, arrasto=0.93, shapes="drop")
             # Círculo ritual no chão
             for i in range(8):
                 ang = i * (math.pi / 4)
@@ -682,17 +694,13 @@ class DramaticExplosion:
             self.vida = self.vida_max = 1.5
             self.flash_alpha = 80
             # Wisps negros que puxam para dentro
-            for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                dist = random.uniform(60, 120) * tam
-                px = self.x + math.cos(ang) * dist
-                py = self.y + math.sin(ang) * dist
-                vel = random.uniform(80, 200) * tam
-                cor = random.choice(pal["mid"])
-                self.particulas.append(MagicParticle(px, py, cor,
-                    -math.cos(ang) * vel, -math.sin(ang) * vel,
-                    random.uniform(6, 14) * tam, random.uniform(0.45, 0.9),
-                    arrasto=0.96, shape="wisp"))
+            ang = g.uniform(0, math.pi * 2, n)
+            dist = g.uniform(60, 120, n) * tam
+            vel = g.uniform(80, 200, n) * tam
+            self.particulas.emit_many(n, self.x + np.cos(ang) * dist, self.y + np.sin(ang) * dist,
+                                      pal["mid"], -np.cos(ang) * vel, -np.sin(ang) * vel,
+                                      g.uniform(6, 14, n) * tam, g.uniform(0.45, 0.9, n),
+                                      arrasto=0.96, shapes="wisp", gerador=g)
             # Vórtex singulares
             for i in range(2):
                 self.vortex_rings.append({
@@ -706,14 +714,15 @@ class DramaticExplosion:
                 })
 
         else:  # DEFAULT / CAOS
-            for _ in range(n):
-                ang = random.uniform(0, math.pi * 2)
-                vel = random.uniform(80, 290) * tam
-                cor = random.choice(pal["mid"] + pal["outer"])
-                self.particulas.append(MagicParticle(self.x, self.y, cor,
-                    math.cos(ang) * vel, math.sin(ang) * vel,
-                    random.uniform(4, 11) * tam, random.uniform(0.3, 0.65),
-                    gravidade=40, arrasto=0.94))
+            self._burst(g, n, g.uniform(0, math.pi * 2, n), g.uniform(80, 290, n) * tam,
+                        pal["mid"] + pal["outer"], g.uniform(4, 11, n) * tam, g.uniform(0.3, 0.65, n),
+                        gravidade=40, arrasto=0.94)
+
+    def _burst(self, g, n, ang, vel, cores, tamanho, vida, **kw):
+        """Emite n partículas radiais a partir do centro num único lote vetorizado."""
+        self.particulas.emit_many(n, self.x, self.y, cores,
+                                  np.cos(ang) * vel, np.sin(ang) * vel,
+                                  tamanho, vida, gerador=g, **kw)
 
     def update(self, dt):
         self.vida -= dt
@@ -744,7 +753,7 @@ class DramaticExplosion:
             v["vida"] -= dt
             v["rot"] += v["vel_rot"] * dt
         self.vortex_rings = [v for v in self.vortex_rings if v["vida"] > 0]
-        self.particulas = [p for p in self.particulas if p.update(dt)]
+        self.particulas.update(dt)
         return True
 
     def draw(self, tela, cam):
@@ -752,6 +761,8 @@ class DramaticExplosion:
         ratio = self.vida / self.vida_max
         isx, isy = int(sx), int(sy)
 
+        cache = SpriteCache.get_instance()
+
         # Flash de impacto
         if self.flash_alpha > 0:
             fr = max(4, int(cam.converter_tam(self.flash_raio)))
@@ -765,10 +776,7 @@ class DramaticExplosion:
                 prog = w["raio"] / w["raio_max"]
                 alpha = int(w.get("alpha_max", 200) * (1 - prog) * ratio)
                 thick = max(1, int(w["largura"] * (1 - prog * 0.5)))
-                s = _safe_surface(r * 2 + 8, r * 2 + 8)
-                if s:
-                    pygame.draw.circle(s, (*w["cor"], alpha), (r + 4, r + 4), r, thick)
-                    tela.blit(s, (isx - r - 4, isy - r - 4))
+                cache.blit_centrado(tela, cache.circulo(r, w["cor"], alpha, thick), isx, isy)
 
         # Raios elétricos
         for b in self.lightning_bolts:
@@ -821,24 +829,25 @@ class DramaticExplosion:
             ey = py_s + math.sin(p["ang"]) * length
             alpha = int(230 * pr * ratio)
             larg = max(1, int(cam.converter_tam(p["largura"])))
-            s = _safe_surface(int(abs(ex - px_s)) + larg * 4 + 10, int(abs(ey - py_s)) + larg * 4 + 10)
-            if s:
-                ox, oy = min(px_s, ex) - larg * 2 - 4, min(py_s, ey) - larg * 2 - 4
-                try:
-                    pygame.draw.line(s, (*p["cor"], alpha // 3),
-                                     (int(px_s - ox), int(py_s - oy)), (int(ex - ox), int(ey - oy)), larg * 3)
-                    pygame.draw.line(s, (*p["cor"], alpha),
-                                     (int(px_s - ox), int(py_s - oy)), (int(ex - ox), int(ey - oy)), larg)
-                    pygame.draw.line(s, (255, 255, 255, alpha),
-                                     (int(px_s - ox), int(py_s - oy)), (int(ex - ox), int(ey - oy)),
-                                     max(1, larg - 2))
-                except Exception:
-                    pass
-                tela.blit(s, (int(ox), int(oy)))
+            w, h = int(abs(ex - px_s)) + larg * 4 + 10, int(abs(ey - py_s)) + larg * 4 + 10
+            s = _rascunho(w, h)
+            if s is None:
+                continue
+            ox, oy = min(px_s, ex) - larg * 2 - 4, min(py_s, ey) - larg * 2 - 4
+            try:
+                pygame.draw.line(s, (*p["cor"], alpha // 3),
+                                 (int(px_s - ox), int(py_s - oy)), (int(ex - ox), int(ey - oy)), larg * 3)
+                pygame.draw.line(s, (*p["cor"], alpha),
+                                 (int(px_s - ox), int(py_s - oy)), (int(ex - ox), int(ey - oy)), larg)
+                pygame.draw.line(s, (255, 255, 255, alpha),
+                                 (int(px_s - ox), int(py_s - oy)), (int(ex - ox), int(ey - oy)),
+                                 max(1, larg - 2))
+            except Exception:
+                pass
+            tela.blit(s, (int(ox), int(oy)), (0, 0, max(4, w), max(4, h)))
 
         # Partículas
-        for p in self.particulas:
-            p.draw(tela, cam)
+        self.particulas.draw(tela, cam, _draw_magic_particle)
 
 
 # =============================================================================
@@ -854,7 +863,7 @@ class DramaticBeam:
         self.largura = largura
         self.vida = self.vida_max = 0.6
         self.pulse_timer = 0.0
-        self.particulas: List[MagicParticle] = []
+        self.particulas = ParticleBuffer()
         self._spawn_particles()
 
     def _gerar_segments(self):
@@ -881,16 +890,14 @@ class DramaticBeam:
         el = self.elemento
         pal = self.palette
         n = max(4, int(dist / 22))
-        for _ in range(n):
-            t = random.random()
-            px = self.x1 + dx * t + random.uniform(-6, 6)
-            py = self.y1 + dy * t + random.uniform(-6, 6)
-            cor = random.choice(pal["mid"])
-            shape = "ember" if el == "FOGO" else "shard" if el == "GELO" else "rune" if el == "ARCANO" else "circle"
-            self.particulas.append(MagicParticle(px, py, cor,
-                random.uniform(-30, 30), random.uniform(-30, 30),
-                random.uniform(3, 7), random.uniform(0.12, 0.30),
-                arrasto=0.90, shape=shape))
+        g = self.particulas.rng
+        t = g.random(n)
+        shape = "ember" if el == "FOGO" else "shard" if el == "GELO" else "rune" if el == "ARCANO" else "circle"
+        self.particulas.emit_many(n,
+            self.x1 + dx * t + g.uniform(-6, 6, n), self.y1 + dy * t + g.uniform(-6, 6, n),
+            pal["mid"], g.uniform(-30, 30, n), g.uniform(-30, 30, n),
+            g.uniform(3, 7, n), g.uniform(0.12, 0.30, n),
+            arrasto=0.90, shapes=shape, gerador=g)
 
     def update(self, dt):
         self.vida -= dt
@@ -899,7 +906,7 @@ class DramaticBeam:
         self.pulse_timer += dt * 18
         if random.random() < dt * 18:
             self._spawn_particles()
-        self.particulas = [p for p in self.particulas if p.update(dt)]
+        self.particulas.update(dt)
         return True
 
     def draw(self, tela, cam):
@@ -914,8 +921,8 @@ class DramaticBeam:
         max_x = max(p[0] for p in pts) + 25
         max_y = max(p[1] for p in pts) + 25
         w, h = max(4, int(max_x - min_x)), max(4, int(max_y - min_y))
-        s = _safe_surface(w, h)
-        if s:
+        s = _rascunho(w, h)
+        if s is not None:
             local = [(p[0] - min_x, p[1] - min_y) for p in pts]
             gw = max(3, int((self.largura + 12) * pulse))
             try:
@@ -926,9 +933,8 @@ class DramaticBeam:
                                   max(1, int(self.largura * 0.28)))
             except Exception:
                 pass
-            tela.blit(s, (int(min_x), int(min_y)))
-        for p in self.particulas:
-            p.draw(tela, cam)
+            tela.blit(s, (int(min_x), int(min_y)), (0, 0, w, h))
+        self.particulas.draw(tela, cam, _draw_magic_particle)
 
 
 # =============================================================================
@@ -996,14 +1002,12 @@ class DramaticAura:
     def draw(self, tela, cam):
         sx, sy = cam.converter(self.x, self.y)
         ratio = self.vida / self.vida_max
+        cache = SpriteCache.get_instance()
         for a in self.aneis:
             pulse = 0.8 + 0.2 * math.sin(a["fase"])
             r = max(2, int(cam.converter_tam(a["raio"] * pulse)))
             alpha = int(150 * ratio * pulse)
-            s = _safe_surface(r * 2 + 8, r * 2 + 8)
-            if s:
-                pygame.draw.circle(s, (*a["cor"], alpha), (r + 4, r + 4), r, 2)
-                tela.blit(s, (int(sx) - r - 4, int(sy) - r - 4))
+            cache.blit_centrado(tela, cache.circulo(r, a["cor"], alpha, 2), sx, sy)
         for o in self.orbitantes:
             px = self.x + math.cos(o["ang"]) * o["dist"]
             py = self.y + math.sin(o["ang"]) * o["dist"]
@@ -1012,17 +1016,8 @@ class DramaticAura:
             if o["shape"] == "star":
                 _draw_crystal_shard(tela, int(spx), int(spy), tam, o["ang"], o["cor"], int(180 * ratio))
             elif o["shape"] == "rune":
-                s = _safe_surface(tam * 2 + 4, tam * 2 + 4)
-                if s:
-                    try:
-                        rpts = [(tam + 2 + math.cos(o["ang"] + i * math.pi / 2) * tam,
-                                 tam + 2 + math.sin(o["ang"] + i * math.pi / 2) * tam)
-                                for i in range(4)]
-                        pygame.draw.polygon(s, (*o["cor"], 0), rpts)
-                        pygame.draw.polygon(s, (*o["cor"], int(180 * ratio)), rpts, 2)
-                    except Exception:
-                        pass
-                    tela.blit(s, (int(spx) - tam - 2, int(spy) - tam - 2))
+                _draw_magic_particle(tela, "rune", int(spx), int(spy), tam,
+                                     o["ang"] - math.pi / 4, o["cor"], int(180 * ratio), False)
             else:
                 _draw_glow_circle(tela, int(spx), int(spy), tam, o["cor"], int(180 * ratio), 1)
         for e in self.energy_lines:
@@ -1045,7 +1040,7 @@ class MagicCastChargeup:
         self.elemento = elemento
         self.vida = self.vida_max = max(0.2, duracao)
         self.intensidade = intensidade
-        self.particulas: List[MagicParticle] = []
+        self.particulas = ParticleBuffer()
         self.timer = 0.0
         self.anel_raio = 70 * intensidade
         self.rings = []
@@ -1077,7 +1072,7 @@ class MagicCastChargeup:
         while self.timer_spawn > spawn_rate:
             self.timer_spawn -= spawn_rate
             self._spawn_particle(prog)
-        self.particulas = [p for p in self.particulas if p.update(dt)]
+        self.particulas.update(dt)
         return True
 
     def _spawn_particle(self, prog):
@@ -1099,29 +1094,26 @@ class MagicCastChargeup:
         cor = random.choice(self.palette["mid"])
         el = self.elemento
         shape = "ember" if el == "FOGO" else "shard" if el == "GELO" else "rune" if el == "ARCANO" else "circle"
-        self.particulas.append(MagicParticle(px, py, cor, vx, vy,
+        self.particulas.emit(px, py, cor, vx, vy,
             random.uniform(2.5, 6) * self.intensidade,
-            random.uniform(0.08, 0.25), arrasto=0.94, shape=shape, glow=(el in ("RAIO", "LUZ"))))
+            random.uniform(0.08, 0.25), arrasto=0.94, shape=shape, glow=(el in ("RAIO", "LUZ")))
 
     def draw(self, tela, cam):
         sx, sy = cam.converter(self.x, self.y)
         ratio = self.vida / self.vida_max
         prog = 1 - ratio
         isx, isy = int(sx), int(sy)
+        cache = SpriteCache.get_instance()
         # Anéis orbitando que contraem
         for ring in self.rings:
             rr = max(2, int(cam.converter_tam(self.anel_raio * (0.7 + 0.3 * abs(math.sin(ring["fase"]))))))
             alpha = int(120 * ratio * (0.6 + 0.4 * abs(math.sin(ring["fase"]))))
-            s = _safe_surface(rr * 2 + 8, rr * 2 + 8)
-            if s:
-                pygame.draw.circle(s, (*ring["cor"], alpha), (rr + 4, rr + 4), rr, 2)
-                tela.blit(s, (isx - rr - 4, isy - rr - 4))
+            cache.blit_centrado(tela, cache.circulo(rr, ring["cor"], alpha, 2), isx, isy)
         # Core crescendo no centro
         core_r = max(2, int(cam.converter_tam(10 * prog * self.intensidade)))
         _draw_glow_circle(tela, isx, isy, core_r, self.palette["core"], int(220 * prog), layers=3)
         # Partículas
-        for p in self.particulas:
-            p.draw(tela, cam)
+        self.particulas.draw(tela, cam, _draw_magic_particle)
 
 
 # =============================================================================
@@ -1134,7 +1126,7 @@ class ElementalImpactBurst:
         self.palette = ELEMENT_PALETTES.get(elemento, ELEMENT_PALETTES["DEFAULT"])
         self.elemento = elemento
         self.vida = self.vida_max = 0.45
-        self.particulas: List[MagicParticle] = []
+        self.particulas = ParticleBuffer()
         self.rings = []
         self.flash = 255
         self._build(elemento, intensidade)
@@ -1143,14 +1135,13 @@ class ElementalImpactBurst:
         pal = self.palette
         n = int(18 * i)
         shape = "shard" if el == "GELO" else "ember" if el == "FOGO" else "star" if el == "LUZ" else "circle"
-        for _ in range(n):
-            ang = random.uniform(0, math.pi * 2)
-            vel = random.uniform(110, 320) * i
-            cor = random.choice(pal["mid"])
-            self.particulas.append(MagicParticle(self.x, self.y, cor,
-                math.cos(ang) * vel, math.sin(ang) * vel,
-                random.uniform(3, 9) * i, random.uniform(0.14, 0.35),
-                gravidade=60 if el == "SANGUE" else 0, arrasto=0.91, shape=shape))
+        g = self.particulas.rng
+        ang = g.uniform(0, math.pi * 2, n)
+        vel = g.uniform(110, 320, n) * i
+        self.particulas.emit_many(n, self.x, self.y, pal["mid"],
+            np.cos(ang) * vel, np.sin(ang) * vel,
+            g.uniform(3, 9, n) * i, g.uniform(0.14, 0.35, n),
+            gravidade=60 if el == "SANGUE" else 0, arrasto=0.91, shapes=shape, gerador=g)
         for ri in range(3):
             self.rings.append({
                 "raio": 0, "raio_max": (28 + ri * 22) * i,
@@ -1169,7 +1160,7 @@ class ElementalImpactBurst:
             else:
                 r["raio"] += 520 * dt
         self.flash = max(0, self.flash - 1200 * dt)
-        self.particulas = [p for p in self.particulas if p.update(dt)]
+        self.particulas.update(dt)
         return True
 
     def draw(self, tela, cam):
@@ -1183,12 +1174,9 @@ class ElementalImpactBurst:
                 rr = max(1, int(cam.converter_tam(r["raio"])))
                 prog = r["raio"] / r["raio_max"]
                 a = int(r.get("alpha_max", 180) * (1 - prog) * ratio)
-                s = _safe_surface(rr * 2 + 6, rr * 2 + 6)
-                if s:
-                    pygame.draw.circle(s, (*r["cor"], a), (rr + 3, rr + 3), rr, 2)
-                    tela.blit(s, (int(sx) - rr - 3, int(sy) - rr - 3))
-        for p in self.particulas:
-            p.draw(tela, cam)
+                cache = SpriteCache.get_instance()
+                cache.blit_centrado(tela, cache.circulo(rr, r["cor"], a, 2), sx, sy)
+        self.particulas.draw(tela, cam, _draw_magic_particle)
 
 
 # =============================================================================
@@ -1204,7 +1192,7 @@ class DramaticSummon:
         self.circulo_raio = 0
         self.circulo_raio_max = 60
         self.rot = 0.0
-        self.particulas: List[MagicParticle] = []
+        self.particulas = ParticleBuffer()
         self.pilares = [
             {"ang": i * (math.pi / 3), "altura": 0, "max": random.uniform(65, 110),
              "delay": i * 0.09, "cor": random.choice(self.palette["mid"]),
@@ -1231,12 +1219,12 @@ class DramaticSummon:
             ang = random.uniform(0, math.pi * 2)
             dist = random.uniform(8, self.circulo_raio)
             cor = random.choice(self.palette["mid"])
-            self.particulas.append(MagicParticle(
+            self.particulas.emit(
                 self.x + math.cos(ang) * dist,
                 self.y + math.sin(ang) * dist,
                 cor, random.uniform(-10, 10), random.uniform(-90, -45),
-                random.uniform(2, 6), 0.5, arrasto=0.97, glow=True))
-        self.particulas = [p for p in self.particulas if p.update(dt)]
+                random.uniform(2, 6), 0.5, arrasto=0.97, glow=True)
+        self.particulas.update(dt)
         return True
 
     def draw(self, tela, cam):
@@ -1245,8 +1233,8 @@ class DramaticSummon:
         r = max(3, int(cam.converter_tam(self.circulo_raio)))
         if r > 3:
             alpha = int(210 * ratio)
-            s = _safe_surface(r * 2 + 10, r * 2 + 10)
-            if s:
+            s = _rascunho(r * 2 + 10, r * 2 + 10)
+            if s is not None:
                 pygame.draw.circle(s, (*self.palette["mid"][0], alpha), (r + 5, r + 5), r, 3)
                 for i in range(16):
                     a = self.rot + i * (math.pi / 8)
@@ -1258,7 +1246,7 @@ class DramaticSummon:
                                          (int(x1), int(y1)), (int(x2), int(y2)), 2)
                     except Exception:
                         pass
-                tela.blit(s, (int(sx) - r - 5, int(sy) - r - 5))
+                tela.blit(s, (int(sx) - r - 5, int(sy) - r - 5), (0, 0, r * 2 + 10, r * 2 + 10))
         for p in self.pilares:
             if p["delay"] <= 0 and p["altura"] > 0:
                 px = sx + math.cos(p["ang"]) * r * 0.85
@@ -1266,13 +1254,13 @@ class DramaticSummon:
                 h = max(1, int(cam.converter_tam(p["altura"])))
                 lw = max(3, int(cam.converter_tam(p["largura"])))
                 alpha = int(190 * ratio)
-                s = _safe_surface(lw * 4 + 4, h + 6)
-                if s:
-                    pygame.draw.rect(s, (*p["cor"], alpha), (0, 0, lw * 4, h))
-                    pygame.draw.rect(s, (255, 255, 255, alpha // 2), (lw, 0, lw * 2, h))
-                    tela.blit(s, (int(px) - lw, int(py) - h))
-        for p in self.particulas:
-            p.draw(tela, cam)
+                s = _rascunho(lw * 4 + 4, h + 6)
+                if s is None:
+                    continue
+                pygame.draw.rect(s, (*p["cor"], alpha), (0, 0, lw * 4, h))
+                pygame.draw.rect(s, (255, 255, 255, alpha // 2), (lw, 0, lw * 2, h))
+                tela.blit(s, (int(px) - lw, int(py) - h), (0, 0, lw * 4 + 4, h + 6))
+        self.particulas.draw(tela, cam, _draw_magic_particle)
 
 
 # =============================================================================
@@ -1339,7 +1327,7 @@ class MagicVFXManager:
         # Trails órfãos (projétil morreu) não recebem update() via simulacao,
         # então suas partículas ficavam congeladas no espaço indefinidamente.
         for trail in self.trails.values():
-            trail.particulas = [p for p in trail.particulas if p.update(dt)]
+            trail.particulas.update(dt)
 
     def draw(self, tela, cam):
         for c in self.chargeups:     c.draw(tela, cam)
@@ -0,0 +1,312 @@
+"""
+NEURAL FIGHTS - Motor de Partículas Vetorizado
+Partículas guardadas em arrays NumPy (x, y, vx, vy, vida, tamanho, índice de cor)
+com integração, amortecimento e descarte vetorizados.
+
+Substitui as listas de objetos Particula / MagicParticle nos pontos quentes:
+explosões e invocações disparam centenas de partículas de uma vez, e o custo
+passava a ser a aritmética Python por partícula.
+"""
+
+import math
+import random
+
+import numpy as np
+import pygame
+
+from effects.sprite_cache import SpriteCache, quantizar_raio
+
+
+# Formas suportadas pelo desenho das partículas mágicas (effects.magic_vfx)
+SHAPES = ("circle", "ember", "shard", "drop", "wisp", "star", "rune", "thorn")
+_SHAPE_IDX = {s: i for i, s in enumerate(SHAPES)}
+
+_CAMPOS_FLOAT = ("x", "y", "vx", "vy", "vida", "vida_max", "tam", "tam0",
+                 "grav", "arrasto", "rot", "rot_vel")
+
+
+def rng():
+    """
+    Gerador NumPy novo semeado a partir do `random` global.
+    Mantém as lutas reproduzíveis quando alguém chama random.seed(). Criar um
+    custa mais que sortear centenas de números: cada ParticleBuffer guarda o
+    seu (buf.rng) em vez de chamar isto a cada emissão.
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def _por_particula(valor, n, dtype=np.float64):
+    """Escalar → array de n elementos; array/sequência → array (tamanho n)."""
+    arr = np.asarray(valor, dtype=dtype)
+    if arr.ndim == 0:
+        return np.full(n, arr, dtype=dtype)
+    return arr
+
+
+class ParticleBuffer:
+    """
+    Conjunto de partículas em estrutura de arrays.
+
+    Lei de encolhimento por tipo de emissor:
+      encolhimento=None  → tamanho = tamanho_inicial * vida / vida_max (MagicParticle)
+      encolhimento=0.92  → tamanho *= 0.92 a cada update (Particula)
+
+    `arrasto` é o amortecimento padrão por update (Particula usa 1.0, sem arrasto).
+
+    API de emissão espelha os construtores antigos:
+      buf.emit(x, y, cor, vel_x, vel_y, tamanho, vida, gravidade=..., arrasto=..., shape=..., glow=...)
+      buf.emit_many(...)  → mesmos campos, mas aceitando arrays
+
+    `buf.rng` é o gerador NumPy do buffer, semeado do `random` global na
+    criação e em clear() (o Simulador reaproveitado entre lutas limpa o buffer
+    logo depois do random.seed da luta).
+    """
+
+    def __init__(self, capacidade: int = 64, encolhimento: float = None, arrasto: float = 0.97):
+        self.encolhimento = encolhimento
+        self.arrasto = arrasto
+        self._n = 0
+        self._cap = max(8, int(capacidade))
+        self._f = {c: np.zeros(self._cap) for c in _CAMPOS_FLOAT}
+        self._shape = np.zeros(self._cap, dtype=np.int8)
+        self._cor = np.zeros(self._cap, dtype=np.int16)
+        self._glow = np.zeros(self._cap, dtype=bool)
+        # Tabela de cores (índice → RGB)
+        self._cores = []
+        self._cor_idx = {}
+        self.rng = rng()
+
+    def __len__(self):
+        return self._n
+
+    def __bool__(self):
+        return self._n > 0
+
+    def clear(self):
+        self._n = 0
+        self._cores.clear()
+        self._cor_idx.clear()
+        self.rng = rng()
+
+    # ------------------------------------------------------------------
+    # Armazenamento
+    # ------------------------------------------------------------------
+
+    def _reservar(self, k):
+        necessario = self._n + k
+        if necessario <= self._cap:
+            return
+        nova = max(necessario, self._cap * 2)
+        for c, arr in self._f.items():
+            novo = np.zeros(nova)
+            novo[:self._n] = arr[:self._n]
+            self._f[c] = novo
+        for nome in ("_shape", "_cor", "_glow"):
+            arr = getattr(self, nome)
+            novo = np.zeros(nova, dtype=arr.dtype)
+            novo[:self._n] = arr[:self._n]
+            setattr(self, nome, novo)
+        self._cap = nova
+
+    def _indice_cor(self, cor):
+        chave = tuple(int(c) for c in cor[:3])
+        idx = self._cor_idx.get(chave)
+        if idx is None:
+            if self._n == 0 and len(self._cores) >= 256:
+                # Tabela só cresce com cores novas (índice int16): recomeça quando vazia
+                self._cores.clear()
+                self._cor_idx.clear()
+            idx = len(self._cores)
+            self._cores.append(chave)
+            self._cor_idx[chave] = idx
+        return idx
+
+    # ------------------------------------------------------------------
+    # Emissão
+    # ------------------------------------------------------------------
+
+    def emit(self, x, y, cor, vel_x=0.0, vel_y=0.0, tamanho=5.0, vida=1.0,
+             gravidade=0.0, arrasto=None, shape="circle", glow=False):
+        """Emite uma partícula (mesma assinatura de MagicParticle)."""
+        self._reservar(1)
+        i = self._n
+        f = self._f
+        f["x"][i] = x
+        f["y"][i] = y
+        f["vx"][i] = vel_x
+        f["vy"][i] = vel_y
+        f["vida"][i] = f["vida_max"][i] = vida
+        f["tam"][i] = f["tam0"][i] = tamanho
+        f["grav"][i] = gravidade
+        f["arrasto"][i] = self.arrasto if arrasto is None else arrasto
+        if self.encolhimento is None:
+            # Rotação só é usada pelas formas mágicas (shard/star/rune)
+            f["rot"][i] = random.uniform(0, math.pi * 2)
+            f["rot_vel"][i] = random.uniform(-7, 7)
+        else:
+            f["rot"][i] = f["rot_vel"][i] = 0.0
+        self._shape[i] = _SHAPE_IDX.get(shape, 0)
+        self._cor[i] = self._indice_cor(cor)
+        self._glow[i] = glow
+        self._n = i + 1
+
+    def emit_many(self, n, x, y, cores, vel_x, vel_y, tamanho, vida,
+                  gravidade=0.0, arrasto=None, shapes="circle", glow=False, gerador=None):
+        """
+        Emite n partículas de uma vez.
+
+        Campos numéricos aceitam escalar ou array de n elementos.
+        `cores` é uma cor RGB ou uma lista de cores (sorteada por partícula);
+        `shapes` idem para formas.
+        """
+        n = int(n)
+        if n <= 0:
+            return
+        g = gerador if gerador is not None else self.rng
+        self._reservar(n)
+        a, b = self._n, self._n + n
+        f = self._f
+        f["x"][a:b] = _por_particula(x, n)
+        f["y"][a:b] = _por_particula(y, n)
+        f["vx"][a:b] = _por_particula(vel_x, n)
+        f["vy"][a:b] = _por_particula(vel_y, n)
+        f["vida"][a:b] = f["vida_max"][a:b] = _por_particula(vida, n)
+        f["tam"][a:b] = f["tam0"][a:b] = _por_particula(tamanho, n)
+        f["grav"][a:b] = _por_particula(gravidade, n)
+        f["arrasto"][a:b] = _por_particula(self.arrasto if arrasto is None else arrasto, n)
+        if self.encolhimento is None:
+            f["rot"][a:b] = g.uniform(0, math.pi * 2, n)
+            f["rot_vel"][a:b] = g.uniform(-7, 7, n)
+        else:
+            f["rot"][a:b] = 0.0
+            f["rot_vel"][a:b] = 0.0
+
+        if isinstance(cores, tuple) and cores and not isinstance(cores[0], (tuple, list)):
+            self._cor[a:b] = self._indice_cor(cores)
+        else:
+            tabela = np.array([self._indice_cor(c) for c in cores], dtype=np.int16)
+            self._cor[a:b] = tabela[g.integers(0, len(tabela), n)]
+
+        if isinstance(shapes, str):
+            self._shape[a:b] = _SHAPE_IDX.get(shapes, 0)
+        else:
+            tabela = np.array([_SHAPE_IDX.get(s, 0) for s in shapes], dtype=np.int8)
+            self._shape[a:b] = tabela[g.integers(0, len(tabela), n)]
+
+        self._glow[a:b] = glow
+        self._n = b
+
+    # ------------------------------------------------------------------
+    # Simulação
+    # ------------------------------------------------------------------
+
+    def update(self, dt, coletar_mortas=False):
+        """
+        Integra todas as partículas e descarta as que morreram.
+        Com coletar_mortas=True retorna [(x, y, tamanho, cor), ...] das
+        partículas removidas neste passo (usado para decals de sangue).
+        """
+        n = self._n
+        if n == 0:
+            return [] if coletar_mortas else None
+        f = self._f
+        vida = f["vida"][:n]
+        vx, vy = f["vx"][:n], f["vy"][:n]
+        arrasto = f["arrasto"][:n]
+
+        vida -= dt
+        vy += f["grav"][:n] * dt
+        vx *= arrasto
+        vy *= arrasto
+        f["x"][:n] += vx * dt
+        f["y"][:n] += vy * dt
+        if self.encolhimento is None:
+            np.multiply(f["tam0"][:n], np.clip(vida / f["vida_max"][:n], 0.0, 1.0), out=f["tam"][:n])
+        else:
+            f["tam"][:n] *= self.encolhimento
+        f["rot"][:n] += f["rot_vel"][:n] * dt
+
+        vivas = vida > 0
+        mortas = []
+        if coletar_mortas:
+            for i in np.flatnonzero(~vivas).tolist():
+                mortas.append((f["x"][i], f["y"][i], f["tam"][i], self._cores[self._cor[i]]))
+        k = int(np.count_nonzero(vivas))
+        if k < n:
+            for arr in self._f.values():
+                arr[:k] = arr[:n][vivas]
+            self._shape[:k] = self._shape[:n][vivas]
+            self._cor[:k] = self._cor[:n][vivas]
+            self._glow[:k] = self._glow[:n][vivas]
+            self._n = k
+        return mortas if coletar_mortas else None
+
+    # ------------------------------------------------------------------
+    # Desenho
+    # ------------------------------------------------------------------
+
+    def _projetar(self, tela, cam, tam_minimo):
+        """Converte todas as partículas para tela e descarta as invisíveis."""
+        n = self._n
+        f = self._f
+        zoom = cam.zoom
+        sx = ((f["x"][:n] - cam.x) * zoom + cam.screen_width / 2 + cam.offset_x).astype(np.int32)
+        sy = ((f["y"][:n] - cam.y) * zoom + cam.screen_height / 2 + cam.offset_y).astype(np.int32)
+        tam = (f["tam"][:n] * zoom).astype(np.int32)
+        largura, altura = tela.get_size()
+        margem = tam * 3 + 4
+        visiveis = ((tam >= tam_minimo) & (sx > -margem) & (sy > -margem)
+                    & (sx < largura + margem) & (sy < altura + margem))
+        return sx, sy, tam, np.flatnonzero(visiveis)
+
+    def draw(self, tela, cam, desenhar=None):
+        """
+        Desenha o buffer.
+
+        desenhar(tela, shape, sx, sy, tam, rot, cor, alpha, glow) é chamado para
+        cada partícula visível. Sem callback usa o estilo padrão do Simulador
+        (círculo com glow), enviando todos os sprites num único tela.blits().
+        """
+        if self._n == 0:
+            return
+        if desenhar is None:
+            self._desenhar_padrao(tela, cam)
+            return
+        sx, sy, tam, idx = self._projetar(tela, cam, 1)
+        if idx.size == 0:
+            return
+        f = self._f
+        alpha = (255 * np.clip(f["vida"][:self._n] / f["vida_max"][:self._n], 0.0, 1.0)).astype(np.int32)
+        cores = self._cores
+        sxl, syl, taml = sx[idx].tolist(), sy[idx].tolist(), tam[idx].tolist()
+        rotl, al = f["rot"][idx].tolist(), alpha[idx].tolist()
+        shl, col, gll = self._shape[idx].tolist(), self._cor[idx].tolist(), self._glow[idx].tolist()
+        for j in range(len(sxl)):
+            desenhar(tela, SHAPES[shl[j]], sxl[j], syl[j], taml[j], rotl[j],
+                     cores[col[j]], al[j], gll[j])
+
+    def _desenhar_padrao(self, tela, cam):
+        sx, sy, tam, idx = self._projetar(tela, cam, 0)
+        if idx.size == 0:
+            return
+        cores = self._cores
+        cache = SpriteCache.get_instance()
+        sprites = []
+        for x, y, t, c in zip(sx[idx].tolist(), sy[idx].tolist(), tam[idx].tolist(),
+                              self._cor[idx].tolist()):
+            cor = cores[c]
+            if t > 2:
+                t = quantizar_raio(t)
+                s = cache.get(("particula", t, cor), _sprite_particula, t, cor)
+                sprites.append((s, (x - t - 2, y - t - 2)))
+            else:
+                pygame.draw.rect(tela, cor, (x, y, max(1, t), max(1, t)))
+        if sprites:
+            tela.blits(sprites, doreturn=False)
+
+
+def _sprite_particula(t, cor):
+    s = pygame.Surface((t * 2 + 4, t * 2 + 4), pygame.SRCALPHA)
+    pygame.draw.circle(s, (*cor, 100), (t + 2, t + 2), t)
+    pygame.draw.circle(s, cor, (t + 2, t + 2), max(1, int(t * 0.6)))
+    return s
@@ -5,8 +5,10 @@ Partículas, faíscas e efeitos de encantamento
 
 import pygame
 import random
-import math
+import numpy as np
 from utils.config import PPM
+from effects.particle_engine import ParticleBuffer, rng
+from effects.sprite_cache import SpriteCache
 
 
 # Cores dos encantamentos para partículas
@@ -43,57 +45,63 @@ class Particula:
 
 
 class HitSpark:
-    """Faíscas estilizadas de impacto"""
-    def __init__(self, x, y, cor, direcao, intensidade=1.0):
+    """Faíscas estilizadas de impacto (arrays NumPy por faísca)"""
+    def __init__(self, x, y, cor, direcao, intensidade=1.0, gerador=None):
         self.x = x
         self.y = y
         self.cor = cor
         self.vida = 0.2
         self.max_vida = 0.2
-        self.sparks = []
-        
-        for _ in range(int(12 * intensidade)):
-            ang = direcao + random.uniform(-0.8, 0.8)
-            vel = random.uniform(80, 200) * intensidade
-            vida = random.uniform(0.1, 0.2)
-            self.sparks.append({
-                'x': x, 'y': y,
-                'vx': math.cos(ang) * vel,
-                'vy': math.sin(ang) * vel,
-                'comprimento': random.uniform(8, 20) * intensidade,
-                'vida': vida,
-                'max_vida': vida,
-            })
-    
+
+        n = int(12 * intensidade)
+        g = gerador if gerador is not None else rng()
+        ang = direcao + g.uniform(-0.8, 0.8, n)
+        vel = g.uniform(80, 200, n) * intensidade
+        self.sx = np.full(n, float(x))
+        self.sy = np.full(n, float(y))
+        self.vx = np.cos(ang) * vel
+        self.vy = np.sin(ang) * vel
+        self.comprimento = g.uniform(8, 20, n) * intensidade
+        self.svida = g.uniform(0.1, 0.2, n)
+        self.smax_vida = self.svida.copy()
+
     def update(self, dt):
         self.vida -= dt
-        for s in self.sparks:
-            s['x'] += s['vx'] * dt
-            s['y'] += s['vy'] * dt
-            s['vida'] -= dt
-            s['comprimento'] *= 0.9
-        self.sparks = [s for s in self.sparks if s['vida'] > 0]
-    
+        self.sx += self.vx * dt
+        self.sy += self.vy * dt
+        self.svida -= dt
+        self.comprimento *= 0.9
+        vivas = self.svida > 0
+        if not vivas.all():
+            self.sx, self.sy = self.sx[vivas], self.sy[vivas]
+            self.vx, self.vy = self.vx[vivas], self.vy[vivas]
+            self.comprimento = self.comprimento[vivas]
+            self.svida, self.smax_vida = self.svida[vivas], self.smax_vida[vivas]
+
     def draw(self, tela, cam):
-        for s in self.sparks:
-            if s['vida'] <= 0:
+        if self.svida.size == 0:
+            return
+        zoom = cam.zoom
+        sx = ((self.sx - cam.x) * zoom + cam.screen_width / 2 + cam.offset_x).astype(np.int32)
+        sy = ((self.sy - cam.y) * zoom + cam.screen_height / 2 + cam.offset_y).astype(np.int32)
+        alpha = (255 * (self.svida / self.smax_vida)).astype(np.int32)
+        ang = np.arctan2(self.vy, self.vx)
+        comp = (self.comprimento * zoom).astype(np.int32)
+        ex = sx + np.cos(ang) * comp
+        ey = sy + np.sin(ang) * comp
+        cor = self.cor[:3]
+        cache = SpriteCache.get_instance()
+        for x0, y0, x1, y1, a in zip(sx.tolist(), sy.tolist(), ex.tolist(), ey.tolist(), alpha.tolist()):
+            size = max(int(abs(x1 - x0)) + 4, int(abs(y1 - y0)) + 4, 4)
+            surf = cache.rascunho(size * 2, size * 2)
+            if surf is None:
                 continue
-            sx, sy = cam.converter(s['x'], s['y'])
-            alpha = int(255 * (s['vida'] / s['max_vida']))
-            
-            ang = math.atan2(s['vy'], s['vx'])
-            comp = cam.converter_tam(s['comprimento'])
-            ex = sx + math.cos(ang) * comp
-            ey = sy + math.sin(ang) * comp
-            
-            size = max(int(abs(ex - sx)) + 4, int(abs(ey - sy)) + 4, 4)
-            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            ox, oy = sx - size, sy - size
-            pygame.draw.line(surf, (255, 255, 255, alpha),
-                             (int(sx - ox), int(sy - oy)), (int(ex - ox), int(ey - oy)), 2)
-            pygame.draw.line(surf, (*self.cor[:3], alpha),
-                             (int(sx - ox), int(sy - oy)), (int(ex - ox), int(ey - oy)), 3)
-            tela.blit(surf, (ox, oy))
+            ox, oy = x0 - size, y0 - size
+            pygame.draw.line(surf, (255, 255, 255, a),
+                             (int(x0 - ox), int(y0 - oy)), (int(x1 - ox), int(y1 - oy)), 2)
+            pygame.draw.line(surf, (*cor, a),
+                             (int(x0 - ox), int(y0 - oy)), (int(x1 - ox), int(y1 - oy)), 3)
+            tela.blit(surf, (ox, oy), (0, 0, size * 2, size * 2))
 
 
 class Shockwave:
@@ -126,7 +134,7 @@ class EncantamentoEffect:
     def __init__(self, encantamento, pos_func):
         self.encantamento = encantamento
         self.pos_func = pos_func
-        self.particulas = []
+        self.particulas = ParticleBuffer(encolhimento=0.92, arrasto=1.0)
         self.cores = CORES_ENCANTAMENTOS.get(encantamento, [(255, 255, 255)])
         self.timer = 0
         
@@ -153,15 +161,13 @@ class EncantamentoEffect:
                     vel_x = random.uniform(-10, 10)
                     vel_y = random.uniform(-10, 10)
                     
-                self.particulas.append(Particula(x, y, cor, vel_x, vel_y, 3, 0.5))
+                self.particulas.emit(x, y, cor, vel_x, vel_y, 3, 0.5)
         
-        for p in self.particulas:
-            p.atualizar(dt)
-        self.particulas = [p for p in self.particulas if p.vida > 0]
+        self.particulas.update(dt)
                 
     def draw(self, tela, cam):
-        for p in self.particulas:
-            sx, sy = cam.converter(p.x, p.y)
-            tam = cam.converter_tam(p.tamanho)
-            if tam > 0:
-                pygame.draw.circle(tela, p.cor, (sx, sy), max(1, tam))
+        self.particulas.draw(tela, cam, _desenhar_ponto)
+
+
+def _desenhar_ponto(tela, shape, sx, sy, tam, rot, cor, alpha, glow):
+    pygame.draw.circle(tela, cor, (sx, sy), max(1, tam))
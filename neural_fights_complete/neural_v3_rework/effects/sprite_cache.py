@@ -0,0 +1,213 @@
+"""
+NEURAL FIGHTS - Cache de Sprites (glow, anéis e formas)
+Superfícies SRCALPHA pré-construídas e reutilizadas entre frames.
+
+Antes cada camada de glow / anel / partícula criava um pygame.Surface(SRCALPHA)
+novo e preenchia o alpha a cada frame. Agora os sprites são chaveados por
+(forma, raio quantizado, cor, alpha quantizado, ...) num LRU limitado por
+memória. Os construtores desenham o sprite opaco e o alpha é multiplicado uma
+única vez na construção (BLEND_RGBA_MULT) — blitar com set_alpha() a cada frame
+tiraria o SDL do caminho rápido de alpha por pixel. Efeitos com geometria
+aleatória reaproveitam uma superfície de rascunho em vez de alocar uma por
+chamada; o rascunho tem lado máximo MAX_LADO_RASCUNHO e entra no orçamento
+de bytes do cache. Se a alocação falhar (pygame.error / MemoryError), rascunho()
+e circulo() retornam None e o efeito é pulado naquele frame.
+
+Uso:
+    cache = SpriteCache.get_instance()
+    s = cache.circulo(raio, cor, alpha)               # disco
+    s = cache.circulo(raio, cor, alpha, largura=2)    # anel
+    s = cache.get(("minha_forma", ...), construir, *args, alpha=a)
+    s = cache.rascunho(w, h)                          # superfície temporária limpa (ou None)
+    cache.stats()                                     # hits / misses / hit_rate
+"""
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+
+# Passos de rotação por período de simetria da forma
+PASSOS_ANGULO = 8
+
+# Círculos maiores que isto (explosões crescendo, ondas de choque) mudam de raio
+# a cada frame e ocupariam megabytes no cache: são desenhados no rascunho.
+RAIO_MAX_CACHE = 64
+
+# Lado máximo do rascunho (16 MB em RGBA): pedidos maiores são recortados —
+# um feixe atravessando a tela com zoom alto não aloca centenas de MB
+MAX_LADO_RASCUNHO = 2048
+
+
+def quantizar_raio(r):
+    """Raios pequenos são exatos; acima disso agrupados de 2 em 2 / 4 em 4 px."""
+    r = int(r)
+    if r <= 24:
+        return max(1, r)
+    if r <= 96:
+        return r - r % 2
+    return r - r % 4
+
+
+def quantizar_angulo(ang, simetria=1):
+    """Índice do balde de rotação (0..PASSOS_ANGULO-1) para uma forma com a simetria dada."""
+    periodo = math.pi * 2 / simetria
+    return int(round((ang % periodo) / periodo * PASSOS_ANGULO)) % PASSOS_ANGULO
+
+
+def quantizar_alpha(a):
+    """Alpha em degraus de 16, preservando 0 e 255."""
+    a = int(a)
+    if a <= 0:
+        return 0
+    if a >= 248:
+        return 255
+    return max(16, (a + 8) // 16 * 16)
+
+
+def angulo_do_balde(balde, simetria=1):
+    return balde * (math.pi * 2 / simetria) / PASSOS_ANGULO
+
+
+class SpriteCache:
+    """LRU de superfícies pré-renderizadas com contador de acertos."""
+
+    _instance = None
+
+    def __init__(self, max_sprites=16384, max_bytes=64 * 1024 * 1024):
+        self.max_sprites = max_sprites
+        self.max_bytes = max_bytes
+        self._sprites = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._rascunho = None
+        self._bytes_rascunho = 0
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = SpriteCache()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    # ------------------------------------------------------------------
+    # Núcleo LRU
+    # ------------------------------------------------------------------
+
+    def get(self, chave, construir, *args, alpha=255):
+        """
+        Retorna o sprite da chave. Se faltar, constrói com construir(*args)
+        (desenho opaco) e multiplica o canal alpha pelo alpha quantizado.
+        """
+        a = quantizar_alpha(alpha)
+        chave = (chave, a)
+        s = self._sprites.get(chave)
+        if s is not None:
+            self.hits += 1
+            self._sprites.move_to_end(chave)
+            return s
+        self.misses += 1
+        s = construir(*args)
+        if a < 255:
+            s.fill((255, 255, 255, a), special_flags=pygame.BLEND_RGBA_MULT)
+        self._sprites[chave] = s
+        self._bytes += s.get_width() * s.get_height() * 4
+        self._encolher()
+        return s
+
+    def _encolher(self):
+        """Descarta os sprites mais antigos até caber no orçamento (rascunho incluso)."""
+        while self._sprites and (len(self._sprites) > self.max_sprites
+                                 or self._bytes + self._bytes_rascunho > self.max_bytes):
+            _, velho = self._sprites.popitem(last=False)
+            self._bytes -= velho.get_width() * velho.get_height() * 4
+
+    def clear(self):
+        self._sprites.clear()
+        self._bytes = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "sprites": len(self._sprites),
+            "bytes": self._bytes + self._bytes_rascunho,
+        }
+
+    # ------------------------------------------------------------------
+    # Formas comuns
+    # ------------------------------------------------------------------
+
+    def circulo(self, raio, cor, alpha, largura=0):
+        """
+        Disco (largura=0) ou anel com alpha. A superfície tem lado 2r+4 e o
+        centro em (r+2, r+2): blit em (cx - r - 2, cy - r - 2) usando
+        s.get_width() // 2 como r+2. Acima de RAIO_MAX_CACHE o retorno é uma
+        superfície nova, fora do cache (None se a alocação falhar).
+        """
+        r = quantizar_raio(raio)
+        if r > RAIO_MAX_CACHE:
+            s = _superficie(r * 2 + 4, r * 2 + 4)
+            if s is not None:
+                pygame.draw.circle(s, (*cor[:3], quantizar_alpha(alpha)), (r + 2, r + 2), r, largura)
+            return s
+        chave = ("circulo", r, tuple(cor[:3]), largura)
+        return self.get(chave, _construir_circulo, r, chave[2], largura, alpha=alpha)
+
+    def blit_centrado(self, tela, sprite, cx, cy):
+        if sprite is None:
+            return
+        meio_w, meio_h = sprite.get_width() // 2, sprite.get_height() // 2
+        tela.blit(sprite, (int(cx) - meio_w, int(cy) - meio_h))
+
+    # ------------------------------------------------------------------
+    # Rascunho (geometria aleatória: raios, feixes, pilares)
+    # ------------------------------------------------------------------
+
+    def rascunho(self, w, h):
+        """
+        Superfície SRCALPHA reutilizável, limpa na região (0, 0, w, h).
+        Deve ser desenhada e blitada com area=(0, 0, w, h) antes da próxima
+        chamada. Lados acima de MAX_LADO_RASCUNHO são recortados (o blit com
+        area maior só copia o que existe); None se a alocação falhar.
+        """
+        w = min(max(1, int(w)), MAX_LADO_RASCUNHO)
+        h = min(max(1, int(h)), MAX_LADO_RASCUNHO)
+        s = self._rascunho
+        if s is None or s.get_width() < w or s.get_height() < h:
+            lw = min(1 << (max(w, s.get_width() if s else 0) - 1).bit_length(), MAX_LADO_RASCUNHO)
+            lh = min(1 << (max(h, s.get_height() if s else 0) - 1).bit_length(), MAX_LADO_RASCUNHO)
+            self._rascunho, self._bytes_rascunho = None, 0
+            s = _superficie(lw, lh)
+            if s is None:
+                return None
+            self._rascunho, self._bytes_rascunho = s, lw * lh * 4
+            self._encolher()
+        else:
+            s.fill((0, 0, 0, 0), (0, 0, w, h))
+        return s
+
+
+def _superficie(w, h):
+    """Surface SRCALPHA nova, ou None se o pygame não conseguir alocá-la."""
+    try:
+        return pygame.Surface((w, h), pygame.SRCALPHA)
+    except (pygame.error, MemoryError, ValueError):
+        return None
+
+
+def _construir_circulo(r, cor, largura):
+    s = pygame.Surface((r * 2 + 4, r * 2 + 4), pygame.SRCALPHA)
+    pygame.draw.circle(s, cor, (r + 2, r + 2), r, largura)
+    return s
@@ -32,6 +32,16 @@ class Personagem:
         self.resistencia = 0.0
         self.calcular_status(peso_arma_cache)
 
+    def __getstate__(self):
+        """Pickle/cópia sem class_data: é uma referência a CLASSES_DATA, refeita no load"""
+        state = self.__dict__.copy()
+        state.pop("class_data", None)
+        return state
+
+    def __setstate__(self, state):
+        state["class_data"] = get_class_data(state.get("classe"))
+        self.__dict__.update(state)
+
     def calcular_status(self, peso_arma=0):
         """Calcula status com modificadores da classe"""
         cd = self.class_data
@@ -20,6 +20,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.gerador_database import (
     gerar_database_completa, 
+    gerar_roster_rapido,
     salvar_database,
     gerar_arma,
     gerar_personagem,
@@ -66,7 +67,7 @@ def gerar_roster_completo():
             # Para raridades altas, adiciona versões com encantamentos
             if raridade in ["Épico", "Lendário", "Mítico"]:
                 for enc in LISTA_ENCANTAMENTOS[:3]:  # 3 encantamentos principais
-                    arma_enc = gerar_arma(tipo, raridade, encantamentos=[enc])
+                    arma_enc = gerar_arma(tipo, raridade, encantamento=enc)
                     armas.append(arma_enc)
                     arma_count += 1
     
@@ -167,16 +168,35 @@ def gerar_roster_torneio_16():
     return armas, personagens
 
 
+def gerar_roster_estresse(quantidade, workers=None, seed=0, destino="json"):
+    """Roster grande para testes de carga, gerado em shards paralelos"""
+    print("=" * 70)
+    print(f"  NEURAL FIGHTS - ROSTER DE ESTRESSE ({quantidade} lutadores)")
+    print("=" * 70)
+    
+    workers = workers or max(1, (os.cpu_count() or 2) - 1)
+    info = gerar_roster_rapido(quantidade, workers=workers, seed=seed, destino=destino)
+    
+    print(f"\n✅ {info['personagens']} lutadores e {info['armas']} armas em {info['segundos']}s")
+    return info
+
+
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="Gerador de Roster Neural Fights")
-    parser.add_argument("--modo", choices=["completo", "64", "16"], default="completo",
-                       help="Modo de geração: completo, 64 ou 16 lutadores")
+    parser.add_argument("--modo", choices=["completo", "64", "16", "estresse"], default="completo",
+                       help="Modo de geração: completo, 64, 16 lutadores ou estresse (--quantidade)")
+    parser.add_argument("--quantidade", type=int, default=100000, help="Lutadores no modo estresse")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--destino", choices=["json", "sqlite"], default="json")
     
     args = parser.parse_args()
     
-    if args.modo == "64":
+    if args.modo == "estresse":
+        gerar_roster_estresse(args.quantidade, args.workers, args.seed, args.destino)
+    elif args.modo == "64":
         gerar_roster_torneio_64()
     elif args.modo == "16":
         gerar_roster_torneio_16()
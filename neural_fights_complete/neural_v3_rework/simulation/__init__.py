@@ -3,7 +3,13 @@ NEURAL FIGHTS - Módulo Simulation
 Gerenciador principal de simulação de combate.
 """
 
-# Re-exporta do arquivo principal agora dentro de simulation/
-from .simulacao import Simulador
-
 __all__ = ['Simulador']
+
+
+def __getattr__(nome):
+    # Import tardio: `python -m simulation.exportador` não deve carregar pygame
+    # (nem imprimir nada em stdout) antes de configurar o driver SDL.
+    if nome == 'Simulador':
+        from .simulacao import Simulador
+        return Simulador
+    raise AttributeError(f"module 'simulation' has no attribute {nome!r}")
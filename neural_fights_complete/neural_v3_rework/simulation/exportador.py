@@ -0,0 +1,257 @@
+"""
+NEURAL FIGHTS - Exportador de Vídeo Offscreen
+=============================================
+Renderiza uma luta sem janela (SDL_VIDEODRIVER=dummy), com passo fixo, tão
+rápido quanto a CPU permitir, e envia os frames para um processo codificador
+separado — renderização e codificação acontecem em paralelo.
+
+Formatos de saída:
+  png     → sequência numerada  <saida>/frame_000000.png
+  raw     → stream RGB24 cru em <saida> ("-" = stdout, para pipe no ffmpeg)
+  ffmpeg  → MP4 H.264 via ffmpeg no PATH
+
+Uso:
+    python -m simulation.exportador --p1 Caleb --p2 Bjorn --cenario Coliseu \\
+        --saida luta.mp4 --formato ffmpeg --portrait
+
+    # Ou pelo código:
+    from simulation.exportador import exportar_luta
+    info = exportar_luta({"p1_nome": "Caleb", "p2_nome": "Bjorn"}, "frames/")
+"""
+
+import os
+import sys
+import time
+import random
+import contextlib
+import shutil
+import subprocess
+import multiprocessing as mp
+import queue
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FORMATOS = ("png", "raw", "ffmpeg")
+
+
+def _frame_bytes(pygame, superficie) -> bytes:
+    """Pixels RGB24 do frame (tobytes no pygame >= 2.1.3, tostring antes)."""
+    if hasattr(pygame.image, "tobytes"):
+        return pygame.image.tobytes(superficie, "RGB")
+    return pygame.image.tostring(superficie, "RGB")
+
+
+def _processo_codificador(fila, formato: str, destino: str, largura: int, altura: int, fps: int):
+    """
+    Processo filho: consome frames RGB24 da fila até receber None.
+    Roda em paralelo com a simulação, que só bloqueia se a fila encher.
+    """
+    if formato == "png":
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        import pygame
+        os.makedirs(destino, exist_ok=True)
+        i = 0
+        while True:
+            dados = fila.get()
+            if dados is None:
+                break
+            frame = pygame.image.frombuffer(dados, (largura, altura), "RGB")
+            pygame.image.save(frame, os.path.join(destino, f"frame_{i:06d}.png"))
+            i += 1
+        return
+
+    if formato == "ffmpeg":
+        cmd = [shutil.which("ffmpeg"), "-y", "-loglevel", "error",
+               "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{largura}x{altura}",
+               "-r", str(fps), "-i", "-",
+               "-c:v", "libx264", "-pix_fmt", "yuv420p", destino]
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        saida = proc.stdin
+    elif destino == "-":
+        # fd 1 direto: no processo pai sys.stdout pode estar redirecionado
+        proc = None
+        saida = os.fdopen(1, "wb", closefd=False)
+    else:
+        proc = None
+        saida = open(destino, "wb")
+
+    try:
+        while True:
+            dados = fila.get()
+            if dados is None:
+                break
+            saida.write(dados)
+    finally:
+        saida.close()
+        if proc is not None:
+            proc.wait()
+
+
+def _enviar(fila, codificador, dados) -> bool:
+    """put() com backpressure que não trava se o codificador morrer (ex.: pipe fechado)."""
+    while True:
+        try:
+            fila.put(dados, timeout=1.0)
+            return True
+        except queue.Full:
+            if not codificador.is_alive():
+                return False
+
+
+class ExportadorLuta:
+    """
+    Executa uma luta offscreen e exporta os frames.
+
+    config: dict no formato de match_config.json; aceita também "seed"
+            para lutas reproduzíveis.
+    """
+
+    def __init__(self, config: dict, saida: str, formato: str = "png", fps: int = 60,
+                 max_segundos: float = 180.0, cauda_segundos: float = 3.0, fila_max: int = 32):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato desconhecido: {formato} (use {', '.join(FORMATOS)})")
+        if formato == "ffmpeg" and shutil.which("ffmpeg") is None:
+            raise RuntimeError("ffmpeg não encontrado no PATH (use formato 'png' ou 'raw')")
+        self.config = dict(config)
+        self.saida = saida
+        self.formato = formato
+        self.fps = int(fps)
+        self.max_segundos = max_segundos
+        self.cauda_segundos = cauda_segundos
+        self.fila_max = fila_max
+
+    def executar(self, progresso=None) -> dict:
+        """
+        Roda a luta até o fim (vencedor + cauda) ou max_segundos.
+        progresso(frames, segundos_simulados) é chamado a cada segundo de vídeo.
+        Retorna um resumo da exportação.
+        """
+        # O driver precisa estar definido antes do pygame.init() do Simulador
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        if "seed" in self.config and self.config["seed"] is not None:
+            random.seed(self.config["seed"])
+
+        # Com saída em stdout, os prints da simulação não podem sujar o stream
+        redirecionar = contextlib.redirect_stdout(sys.stderr) if self.saida == "-" else contextlib.nullcontext()
+        with redirecionar:
+            import pygame
+            from simulation.simulacao import Simulador
+
+            sim = Simulador(self.config)
+            if not getattr(sim, "p1", None) or not getattr(sim, "p2", None):
+                pygame.quit()
+                raise ValueError(f"Luta inválida (lutadores não encontrados): "
+                                 f"{self.config.get('p1_nome')} vs {self.config.get('p2_nome')}")
+            sim.show_hud = self.config.get("mostrar_hud", True)
+            largura, altura = sim.tela.get_size()
+
+            fila = mp.Queue(maxsize=self.fila_max)
+            codificador = mp.Process(
+                target=_processo_codificador,
+                args=(fila, self.formato, self.saida, largura, altura, self.fps),
+                daemon=True,
+            )
+            codificador.start()
+
+            dt = 1.0 / self.fps
+            max_frames = int(round(self.max_segundos * self.fps))
+            frames = 0
+            tempo_sim = 0.0
+            cauda = None
+            inicio = time.perf_counter()
+            try:
+                while frames < max_frames:
+                    # Mesmo tratamento de slow motion do Simulador.run, com dt fixo
+                    if sim.slow_mo_timer > 0:
+                        sim.slow_mo_timer -= dt
+                        if sim.slow_mo_timer <= 0:
+                            sim.time_scale = 1.0
+                    sim.update(dt * sim.time_scale)
+                    sim.desenhar()
+                    pygame.event.pump()
+                    if not _enviar(fila, codificador, _frame_bytes(pygame, sim.tela)):
+                        raise RuntimeError(f"Codificador terminou com código {codificador.exitcode}")
+                    frames += 1
+                    tempo_sim += dt
+
+                    if progresso and frames % self.fps == 0:
+                        progresso(frames, tempo_sim)
+                    if sim.vencedor:
+                        if cauda is None:
+                            cauda = self.cauda_segundos
+                        cauda -= dt
+                        if cauda <= 0:
+                            break
+            finally:
+                _enviar(fila, codificador, None)
+                codificador.join()
+                if codificador.exitcode != 0:
+                    # Frames presos no pipe sem leitor travariam a saída do processo
+                    fila.cancel_join_thread()
+                pygame.quit()
+
+        tempo_real = time.perf_counter() - inicio
+        p1 = sim.p1.dados.nome if sim.p1 else self.config.get("p1_nome")
+        p2 = sim.p2.dados.nome if sim.p2 else self.config.get("p2_nome")
+        return {
+            "p1": p1,
+            "p2": p2,
+            "cenario": self.config.get("cenario", "Arena"),
+            "vencedor": sim.vencedor,
+            "frames": frames,
+            "duracao": round(tempo_sim, 3),
+            "tempo_real": round(tempo_real, 3),
+            "fps_export": round(frames / tempo_real, 1) if tempo_real > 0 else 0.0,
+            "largura": largura,
+            "altura": altura,
+            "formato": self.formato,
+            "saida": self.saida,
+            "codificador_ok": codificador.exitcode == 0,
+        }
+
+
+def exportar_luta(config: dict, saida: str, **kwargs) -> dict:
+    """Atalho: ExportadorLuta(config, saida, **kwargs).executar()"""
+    progresso = kwargs.pop("progresso", None)
+    return ExportadorLuta(config, saida, **kwargs).executar(progresso)
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Neural Fights - Exportador de vídeo offscreen")
+    parser.add_argument("--config", help="match_config.json a usar (padrão: o do diretório atual)")
+    parser.add_argument("--p1", help="Nome do lutador 1")
+    parser.add_argument("--p2", help="Nome do lutador 2")
+    parser.add_argument("--cenario", help="Arena (ex.: Coliseu)")
+    parser.add_argument("--seed", type=int, help="Seed para luta reproduzível")
+    parser.add_argument("--portrait", action="store_true", help="Modo retrato 9:16")
+    parser.add_argument("--saida", required=True, help="Pasta (png), arquivo (raw/ffmpeg) ou '-' (raw)")
+    parser.add_argument("--formato", choices=FORMATOS, default="png")
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--max-segundos", type=float, default=180.0)
+    args = parser.parse_args()
+
+    config = {}
+    caminho = args.config or "match_config.json"
+    if os.path.exists(caminho):
+        with open(caminho, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    if args.p1: config["p1_nome"] = args.p1
+    if args.p2: config["p2_nome"] = args.p2
+    if args.cenario: config["cenario"] = args.cenario
+    if args.seed is not None: config["seed"] = args.seed
+    if args.portrait: config["portrait_mode"] = True
+
+    def progresso(frames, segundos):
+        print(f"  {frames} frames ({segundos:.0f}s de luta)", file=sys.stderr)
+
+    info = exportar_luta(config, args.saida, formato=args.formato, fps=args.fps,
+                         max_segundos=args.max_segundos, progresso=progresso)
+    print(json.dumps(info, ensure_ascii=False, indent=2), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import pygame
+import copy
 import json
 import math
 import random
@@ -10,12 +11,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data import database
 from utils.config import *
-from effects import (Particula, FloatingText, Decal, Shockwave, Câmera, EncantamentoEffect,
+from effects import (FloatingText, Decal, Shockwave, Câmera, EncantamentoEffect,
                      ImpactFlash, MagicClash, BlockEffect, DashTrail, HitSpark,
                      MovementAnimationManager, MovementType,  # v8.0 Movement Animations
                      AttackAnimationManager, calcular_knockback_com_forca, get_impact_tier,  # v8.0 Attack Animations
                      MagicVFXManager, get_element_from_skill)  # v11.0 Magic VFX
 from effects.audio import AudioManager  # v10.0 Sistema de Áudio
+from effects.particle_engine import ParticleBuffer  # Partículas vetorizadas (NumPy)
+from effects.sprite_cache import SpriteCache  # Cache de sprites de glow/anéis
 from core.entities import Lutador
 from core.physics import colisao_linha_circulo, intersect_line_circle, colisao_linha_linha, normalizar_angulo
 from core.hitbox import sistema_hitbox, verificar_hit, get_debug_visual, atualizar_debug, DEBUG_VISUAL
@@ -24,7 +27,12 @@ from ai import CombatChoreographer  # Sistema de Coreografia v5.0
 from core.game_feel import GameFeelManager, HitStopManager  # Sistema de Game Feel v8.0
 
 class Simulador:
-    def __init__(self):
+    def __init__(self, config: dict = None):
+        """
+        config: dict no formato de match_config.json (p1_nome, p2_nome, cenario,
+        portrait_mode). Sem ele, lê match_config.json do diretório atual.
+        """
+        self._config_luta = config
         pygame.init()
         
         # Carrega config primeiro para saber o modo de tela
@@ -45,7 +53,7 @@ class Simulador:
         self.rodando = True
         
         self.cam = Câmera(self.screen_width, self.screen_height)
-        self.particulas = [] 
+        self.particulas = ParticleBuffer(encolhimento=0.92, arrasto=1.0)
         self.decals = [] 
         self.textos = [] 
         self.shockwaves = [] 
@@ -84,19 +92,24 @@ class Simulador:
         
         self.recarregar_tudo()
 
+    def _ler_config_luta(self) -> dict:
+        """Config recebida no construtor ou, na falta dela, match_config.json"""
+        if self._config_luta is not None:
+            return dict(self._config_luta)
+        with open("match_config.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+
     def _check_portrait_mode(self) -> bool:
         """Verifica se o modo retrato está ativado no config"""
         try:
-            with open("match_config.json", "r", encoding="utf-8") as f:
-                config = json.load(f)
-                return config.get("portrait_mode", False)
+            return self._ler_config_luta().get("portrait_mode", False)
         except:
             return False
 
     def recarregar_tudo(self):
         try:
             self.p1, self.p2, self.cenario, _ = self.carregar_luta_dados()
-            self.particulas = []; self.decals = []; self.textos = []; self.shockwaves = []; self.projeteis = []
+            self.particulas.clear(); self.decals = []; self.textos = []; self.shockwaves = []; self.projeteis = []
             # Reset novos efeitos v7.0
             self.impact_flashes = []; self.magic_clashes = []; self.block_effects = []
             self.dash_trails = []; self.hit_sparks = []
@@ -104,6 +117,9 @@ class Simulador:
             self.summons = []; self.traps = []; self.beams = []; self.areas = []
             self.time_scale = 1.0; self.slow_mo_timer = 0.0; self.hit_stop_timer = 0.0
             self.vencedor = None; self.paused = False; self.rastros = {self.p1: [], self.p2: []}
+            # Câmera nova: shake/zoom da luta anterior consomem random e mudariam
+            # o resultado de uma luta com seed (workers reaproveitam o Simulador)
+            self.cam = Câmera(self.screen_width, self.screen_height)
             if self.p1: self.vida_visual_p1 = self.p1.vida_max
             if self.p2: self.vida_visual_p2 = self.p2.vida_max
             
@@ -154,8 +170,13 @@ class Simulador:
             self._prev_z = {self.p1: 0, self.p2: 0}
             
             # === INICIALIZA SISTEMA DE ÁUDIO v10.0 ===
-            AudioManager.reset()
-            self.audio = AudioManager.get_instance()
+            # Recarregar a luta reaproveita os sons já carregados (carregar/gerar
+            # ~70 sons custa ~0.2s); só o primeiro load do Simulador recria o manager
+            if self.audio is not None and self.audio is AudioManager._instance:
+                self.audio.stop_all()
+            else:
+                AudioManager.reset()
+                self.audio = AudioManager.get_instance()
             self._prev_stagger = {self.p1: False, self.p2: False}
             self._prev_dash = {self.p1: 0, self.p2: 0}
             
@@ -173,13 +194,14 @@ class Simulador:
 
     def carregar_luta_dados(self):
         try:
-            with open("match_config.json", "r", encoding="utf-8") as f: config = json.load(f)
+            config = self._ler_config_luta()
         except: return None, None, "Arena", False
-        todos = database.carregar_personagens()
-        armas = database.carregar_armas()
         def montar(nome):
-            p = next((x for x in todos if x.nome == nome), None)
-            if p and p.nome_arma: p.arma_obj = next((a for a in armas if a.nome == p.nome_arma), None)
+            # Cópia rasa: o Personagem do catálogo é compartilhado e não recebe arma_obj
+            p = database.carregar_personagem_por_nome(nome)
+            if p is None: return None
+            p = copy.copy(p)
+            if p.nome_arma: p.arma_obj = database.carregar_arma_por_nome(p.nome_arma)
             return p
         l1 = Lutador(montar(config["p1_nome"]), 5.0, 8.0)
         l2 = Lutador(montar(config["p2_nome"]), 19.0, 8.0)
@@ -457,7 +479,7 @@ class Simulador:
                 direcao_impacto = math.atan2(dy, dx)
                 
                 # Hit Sparks na direção do impacto
-                self.hit_sparks.append(HitSpark(proj.x * PPM, proj.y * PPM, cor_impacto, direcao_impacto, 1.0))
+                self.hit_sparks.append(HitSpark(proj.x * PPM, proj.y * PPM, cor_impacto, direcao_impacto, 1.0, gerador=self.particulas.rng))
                 
                 # === EXPLOSÃO DRAMÁTICA v11.0 ===
                 if hasattr(self, 'magic_vfx') and self.magic_vfx:
@@ -930,12 +952,9 @@ class Simulador:
         if self.attack_anims:
             self.attack_anims.update(dt)
         
-        for p in self.particulas[:]:
-            p.atualizar(dt)
-            if p.vida <= 0: 
-                if p.cor == VERMELHO_SANGUE and random.random() < 0.3:
-                    self.decals.append(Decal(p.x, p.y, p.tamanho * 2, SANGUE_ESCURO))
-                self.particulas.remove(p)
+        for px, py, ptam, pcor in self.particulas.update(dt, coletar_mortas=True):
+            if pcor == VERMELHO_SANGUE and random.random() < 0.3:
+                self.decals.append(Decal(px, py, ptam * 2, SANGUE_ESCURO))
         if len(self.decals) > 100: self.decals.pop(0)
 
     def _criar_efeito_colisao_parede(self, lutador, intensidade_colisao: float):
@@ -1020,7 +1039,7 @@ class Simulador:
             angulo = random.uniform(0, math.pi * 2)
             vel = random.uniform(30, 80) * intensidade
             # Particula(x, y, cor, vel_x, vel_y, tamanho, vida_util)
-            self.particulas.append(Particula(
+            self.particulas.emit(
                 x_px + random.uniform(-15, 15),
                 y_px + random.uniform(-15, 15),
                 cor_parede,
@@ -1028,7 +1047,7 @@ class Simulador:
                 math.sin(angulo) * vel,
                 random.uniform(3, 6),
                 random.uniform(0.2, 0.5)
-            ))
+            )
         
         # Shake da câmera proporcional à intensidade
         if intensidade > 0.5:
@@ -1191,7 +1210,7 @@ class Simulador:
                 vy = random.uniform(-8, 8)
                 tamanho = random.randint(3, 7)
                 vida = random.uniform(0.4, 0.8)
-                self.particulas.append(Particula(x, y, cor, vx, vy, tamanho, vida))
+                self.particulas.emit(x, y, cor, vx, vy, tamanho, vida)
     
     def _beam_colide_alvo(self, beam, alvo):
         """Verifica se um beam colide com um alvo"""
@@ -1387,11 +1406,11 @@ class Simulador:
             ang = random.uniform(0, math.pi * 2)
             vel = random.uniform(80, 200)
             cor = random.choice([cor1, cor2])
-            self.particulas.append(Particula(
+            self.particulas.emit(
                 mx * PPM, my * PPM, cor,
                 math.cos(ang) * vel / 60, math.sin(ang) * vel / 60,
                 random.randint(4, 8), 0.4
-            ))
+            )
     
     def _executar_sword_clash(self):
         """Executa efeito de clash de espadas entre dois lutadores (momento cinematográfico)"""
@@ -1462,16 +1481,16 @@ class Simulador:
             ang = random.uniform(0, math.pi * 2)
             vel = random.uniform(100, 250)
             cor = random.choice([AMARELO_FAISCA, BRANCO, cor1, cor2, (255, 200, 100)])
-            self.particulas.append(Particula(
+            self.particulas.emit(
                 mx * PPM, my * PPM, cor,
                 math.cos(ang) * vel / 60, math.sin(ang) * vel / 60,
                 random.randint(3, 7), random.uniform(0.3, 0.6)
-            ))
+            )
         
         # === EFEITO ADICIONAL - Hit Sparks nas armas ===
         # Direção aleatória para as faíscas
         direcao_faiscas = random.uniform(0, math.pi * 2)
-        self.hit_sparks.append(HitSpark(mx * PPM, my * PPM, AMARELO_FAISCA, direcao_faiscas, 1.5))
+        self.hit_sparks.append(HitSpark(mx * PPM, my * PPM, AMARELO_FAISCA, direcao_faiscas, 1.5, gerador=self.particulas.rng))
         
         print(f"[SWORD CLASH] Épico clash de espadas em ({mx:.1f}, {my:.1f})!")
     
@@ -1560,7 +1579,7 @@ class Simulador:
         for _ in range(12):
             vx = math.cos(ang + random.uniform(-0.5, 0.5)) * random.uniform(3, 8)
             vy = math.sin(ang + random.uniform(-0.5, 0.5)) * random.uniform(3, 8)
-            self.particulas.append(Particula(proj.x * PPM, proj.y * PPM, AMARELO_FAISCA, vx, vy, 3, 0.3))
+            self.particulas.emit(proj.x * PPM, proj.y * PPM, AMARELO_FAISCA, vx, vy, 3, 0.3)
         
         # Shake leve
         self.cam.aplicar_shake(8.0, 0.1)
@@ -1597,7 +1616,7 @@ class Simulador:
         
         # Hit sparks dramáticas
         ang = math.atan2(proj.y - parryer.pos[1], proj.x - parryer.pos[0])
-        self.hit_sparks.append(HitSpark(proj.x * PPM, proj.y * PPM, AMARELO_FAISCA, ang, 1.5))
+        self.hit_sparks.append(HitSpark(proj.x * PPM, proj.y * PPM, AMARELO_FAISCA, ang, 1.5, gerador=self.particulas.rng))
         
         # Camera e timing
         self.cam.aplicar_shake(15.0, 0.15)
@@ -1687,7 +1706,7 @@ class Simulador:
             vel = random.uniform(80, 180)
             vx = math.cos(ang) * vel / 60
             vy = math.sin(ang) * vel / 60
-            self.particulas.append(Particula(mx, my, AMARELO_FAISCA, vx, vy, random.randint(3, 7), 0.5))
+            self.particulas.emit(mx, my, AMARELO_FAISCA, vx, vy, random.randint(3, 7), 0.5)
         
         # Cores das armas para o efeito
         cor1 = (p1.dados.arma_obj.r, p1.dados.arma_obj.g, p1.dados.arma_obj.b) if hasattr(p1.dados.arma_obj, 'r') else (255, 255, 255)
@@ -1699,8 +1718,8 @@ class Simulador:
         
         # Hit sparks em ambas direções
         ang_p1_p2 = math.atan2(p2.pos[1] - p1.pos[1], p2.pos[0] - p1.pos[0])
-        self.hit_sparks.append(HitSpark(mx, my, cor1, ang_p1_p2, 1.5))
-        self.hit_sparks.append(HitSpark(mx, my, cor2, ang_p1_p2 + math.pi, 1.5))
+        self.hit_sparks.append(HitSpark(mx, my, cor1, ang_p1_p2, 1.5, gerador=self.particulas.rng))
+        self.hit_sparks.append(HitSpark(mx, my, cor2, ang_p1_p2 + math.pi, 1.5, gerador=self.particulas.rng))
         
         # Empurra ambos para trás
         vec_x = p1.pos[0] - p2.pos[0]
@@ -1852,18 +1871,18 @@ class Simulador:
                     for _ in range(8):
                         ang = random.uniform(0, math.pi * 2)
                         vel = random.uniform(3, 8)
-                        self.particulas.append(Particula(
+                        self.particulas.emit(
                             dx, dy, (255, 200, 100), 
                             math.cos(ang) * vel, math.sin(ang) * vel,
                             random.randint(4, 8), 0.4
-                        ))
+                        )
             
             # === EFEITOS DE IMPACTO MELHORADOS v8.0 IMPACT EDITION ===
             direcao_impacto = math.atan2(vy, vx)
             forca_atacante = atacante.dados.forca
             
             # Hit Spark na direção do golpe
-            self.hit_sparks.append(HitSpark(dx, dy, AMARELO_FAISCA, direcao_impacto, 1.2))
+            self.hit_sparks.append(HitSpark(dx, dy, AMARELO_FAISCA, direcao_impacto, 1.2, gerador=self.particulas.rng))
             
             # Impact Flash colorido
             cor_arma = (arma.r, arma.g, arma.b) if hasattr(arma, 'r') else BRANCO
@@ -1974,7 +1993,7 @@ class Simulador:
         for _ in range(qtd):
             vx = dir_x * random.uniform(2, 12) + random.uniform(-4, 4)
             vy = dir_y * random.uniform(2, 12) + random.uniform(-4, 4)
-            self.particulas.append(Particula(x*PPM, y*PPM, cor, vx, vy, random.randint(3, 8)))
+            self.particulas.emit(x*PPM, y*PPM, cor, vx, vy, random.randint(3, 8))
 
     def ativar_slow_motion(self):
         self.time_scale = 0.2; self.slow_mo_timer = 2.0
@@ -1982,17 +2001,19 @@ class Simulador:
         self.audio.play_special("slowmo_start", 0.6)
 
     def desenhar(self):
-        self.tela.fill(COR_FUNDO)
-        
         # === DESENHA ARENA v9.0 (ANTES DE TUDO) ===
         if self.arena:
-            self.arena.desenhar(self.tela, self.cam)
+            # Camada estática em cache; a arena preenche o fundo fora dela
+            self.arena.desenhar(self.tela, self.cam, COR_FUNDO)
         else:
+            self.tela.fill(COR_FUNDO)
             # Fallback: grid antigo se não houver arena
             self.desenhar_grid()
         
         for d in self.decals: d.draw(self.tela, self.cam)
         
+        sprites = SpriteCache.get_instance()
+
         # === DESENHA ÁREAS COM EFEITOS DRAMÁTICOS v11.0 ===
         if hasattr(self, 'areas'):
             for area in self.areas:
@@ -2005,18 +2026,14 @@ class Simulador:
                         pulse = 0.85 + 0.15 * math.sin(pulse_time * 6)
                         ar_pulsing = int(ar * pulse)
                         
-                        # Múltiplas camadas para glow dramático
+                        # Múltiplas camadas para glow dramático (sprites cacheados)
                         # Camada externa (glow)
-                        s_glow = pygame.Surface((ar*4, ar*4), pygame.SRCALPHA)
                         glow_alpha = int(30 + 20 * math.sin(pulse_time * 4))
-                        pygame.draw.circle(s_glow, (*area.cor[:3], glow_alpha), (ar*2, ar*2), ar*2)
-                        self.tela.blit(s_glow, (ax - ar*2, ay - ar*2))
+                        sprites.blit_centrado(self.tela, sprites.circulo(ar*2, area.cor, glow_alpha), ax, ay)
                         
                         # Camada média
-                        s = pygame.Surface((ar*2, ar*2), pygame.SRCALPHA)
-                        cor_com_alpha = (*area.cor[:3], min(255, area.alpha // 3))
-                        pygame.draw.circle(s, cor_com_alpha, (ar, ar), ar_pulsing)
-                        self.tela.blit(s, (ax - ar, ay - ar))
+                        sprites.blit_centrado(self.tela, sprites.circulo(min(ar, ar_pulsing), area.cor,
+                                                                         min(255, area.alpha // 3)), ax, ay)
                         
                         # Anéis pulsantes (2-3 anéis)
                         for i in range(3):
@@ -2025,18 +2042,14 @@ class Simulador:
                             ring_r = int(ar * ring_pulse)
                             if ring_r > 2 and ring_r < ar:
                                 ring_alpha = int(150 * (1 - ring_pulse))
-                                s_ring = pygame.Surface((ring_r*2+4, ring_r*2+4), pygame.SRCALPHA)
-                                pygame.draw.circle(s_ring, (*area.cor[:3], ring_alpha), (ring_r+2, ring_r+2), ring_r, 2)
-                                self.tela.blit(s_ring, (ax - ring_r - 2, ay - ring_r - 2))
+                                sprites.blit_centrado(self.tela, sprites.circulo(ring_r, area.cor, ring_alpha, 2), ax, ay)
                         
                         # Borda principal (brilhante)
                         pygame.draw.circle(self.tela, area.cor, (ax, ay), ar_pulsing, 3)
                         # Core brilhante
                         inner_r = int(ar * 0.3)
                         if inner_r > 2:
-                            s_core = pygame.Surface((inner_r*2+4, inner_r*2+4), pygame.SRCALPHA)
-                            pygame.draw.circle(s_core, (255, 255, 255, 80), (inner_r+2, inner_r+2), inner_r)
-                            self.tela.blit(s_core, (ax - inner_r - 2, ay - inner_r - 2))
+                            sprites.blit_centrado(self.tela, sprites.circulo(inner_r, (255, 255, 255), 80), ax, ay)
         
         # === DESENHA BEAMS COM EFEITOS DRAMÁTICOS v11.0 ===
         if hasattr(self, 'beams'):
@@ -2061,8 +2074,8 @@ class Simulador:
                         w = int(max_x - min_x + 1)
                         h = int(max_y - min_y + 1)
                         
-                        if w > 0 and h > 0:
-                            s = pygame.Surface((w, h), pygame.SRCALPHA)
+                        s = sprites.rascunho(w, h) if w > 0 and h > 0 else None
+                        if s is not None:
                             local_pts = [(int(p[0] - min_x), int(p[1] - min_y)) for p in pts_screen]
                             
                             # Glow externo (muito largo, semi-transparente)
@@ -2079,14 +2092,14 @@ class Simulador:
                             core_largura = max(2, largura_efetiva // 2)
                             pygame.draw.lines(s, (255, 255, 255), False, local_pts, core_largura)
                             
-                            self.tela.blit(s, (min_x, min_y))
+                            self.tela.blit(s, (min_x, min_y), (0, 0, w, h))
                         
                         # Partículas ao longo do beam
                         if random.random() < 0.3:
                             idx = random.randint(0, len(pts_screen) - 1)
                             px, py = pts_screen[idx]
                             # Particula(x, y, cor, vel_x, vel_y, tamanho, vida_util)
-                            self.particulas.append(Particula(
+                            self.particulas.emit(
                                 px + random.uniform(-10, 10),
                                 py + random.uniform(-10, 10),
                                 beam.cor,
@@ -2094,18 +2107,10 @@ class Simulador:
                                 random.uniform(-30, 30),  # vel_y
                                 random.uniform(3, 6),     # tamanho
                                 0.3                       # vida_util
-                            ))
-        
-        for p in self.particulas:
-            sx, sy = self.cam.converter(p.x, p.y); tam = self.cam.converter_tam(p.tamanho)
-            # Desenha partícula com glow
-            if tam > 2:
-                s = pygame.Surface((int(tam*2)+4, int(tam*2)+4), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*p.cor, 100), (int(tam)+2, int(tam)+2), int(tam))
-                pygame.draw.circle(s, p.cor, (int(tam)+2, int(tam)+2), max(1, int(tam*0.6)))
-                self.tela.blit(s, (sx - int(tam) - 2, sy - int(tam) - 2))
-            else:
-                pygame.draw.rect(self.tela, p.cor, (sx, sy, max(1, int(tam)), max(1, int(tam))))
+                            )
+        
+        # Partículas com glow (buffer vetorizado, um único blits por frame)
+        self.particulas.draw(self.tela, self.cam)
         
         # === DESENHA SUMMONS (Invocações) v11.0 DRAMATIC ===
         if hasattr(self, 'summons') and self.summons:
@@ -2118,29 +2123,29 @@ class Simulador:
                     # Círculo mágico no chão (rotacionando)
                     rotacao = pulse_time * 2
                     circle_r = int(raio * 1.5)
-                    s_circle = pygame.Surface((circle_r*2+4, circle_r*2+4), pygame.SRCALPHA)
-                    pygame.draw.circle(s_circle, (*summon.cor, 60), (circle_r+2, circle_r+2), circle_r, 2)
-                    # Runas (linhas radiais)
-                    for i in range(8):
-                        ang = rotacao + i * (math.pi / 4)
-                        inner = circle_r * 0.6
-                        outer = circle_r
-                        x1 = circle_r + 2 + math.cos(ang) * inner
-                        y1 = circle_r + 2 + math.sin(ang) * inner
-                        x2 = circle_r + 2 + math.cos(ang) * outer
-                        y2 = circle_r + 2 + math.sin(ang) * outer
-                        pygame.draw.line(s_circle, (*summon.cor, 100), (int(x1), int(y1)), (int(x2), int(y2)), 2)
-                    self.tela.blit(s_circle, (sx - circle_r - 2, sy - circle_r - 2))
+                    s_circle = sprites.rascunho(circle_r*2+4, circle_r*2+4)
+                    if s_circle is not None:
+                        pygame.draw.circle(s_circle, (*summon.cor, 60), (circle_r+2, circle_r+2), circle_r, 2)
+                        # Runas (linhas radiais)
+                        for i in range(8):
+                            ang = rotacao + i * (math.pi / 4)
+                            inner = circle_r * 0.6
+                            outer = circle_r
+                            x1 = circle_r + 2 + math.cos(ang) * inner
+                            y1 = circle_r + 2 + math.sin(ang) * inner
+                            x2 = circle_r + 2 + math.cos(ang) * outer
+                            y2 = circle_r + 2 + math.sin(ang) * outer
+                            pygame.draw.line(s_circle, (*summon.cor, 100), (int(x1), int(y1)), (int(x2), int(y2)), 2)
+                        self.tela.blit(s_circle, (sx - circle_r - 2, sy - circle_r - 2), (0, 0, circle_r*2+4, circle_r*2+4))
                     
                     # Sombra
                     pygame.draw.ellipse(self.tela, (30, 30, 30), (sx - raio, sy + raio//2, raio*2, raio//2))
                     
                     # Glow exterior pulsante
                     glow_pulse = 0.8 + 0.4 * math.sin(pulse_time * 5 + summon.vida_timer)
-                    s = pygame.Surface((int(raio*4), int(raio*4)), pygame.SRCALPHA)
                     glow_alpha = int((60 + 40 * math.sin(summon.vida_timer * 3)) * glow_pulse)
-                    pygame.draw.circle(s, (*summon.cor, glow_alpha), (int(raio*2), int(raio*2)), int(raio * 1.8 * glow_pulse))
-                    self.tela.blit(s, (sx - raio*2, sy - raio*2))
+                    glow_r = min(int(raio * 2), int(raio * 1.8 * glow_pulse))
+                    sprites.blit_centrado(self.tela, sprites.circulo(glow_r, summon.cor, glow_alpha), sx, sy)
                     
                     # Corpo do summon (baseado na cor da skill) com gradiente
                     pygame.draw.circle(self.tela, summon.cor, (int(sx), int(sy)), int(raio))
@@ -2231,9 +2236,7 @@ class Simulador:
             glow_pulse = 0.8 + 0.4 * math.sin(pulse_time * 10 + id(proj) % 100)
             glow_r = int(pr * 2 * glow_pulse)
             if glow_r > 3:
-                s = pygame.Surface((glow_r*2+4, glow_r*2+4), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*cor[:3], 60), (glow_r+2, glow_r+2), glow_r)
-                self.tela.blit(s, (px - glow_r - 2, py - glow_r - 2))
+                sprites.blit_centrado(self.tela, sprites.circulo(glow_r, cor, 60), px, py)
             
             tipo_proj = getattr(proj, 'tipo', 'skill')
             ang_visual = getattr(proj, 'angulo_visual', proj.angulo) if hasattr(proj, 'angulo') else 0
@@ -2464,20 +2467,15 @@ class Simulador:
                     for part in orbe.particulas:
                         ppx, ppy = self.cam.converter(part['x'] * PPM, part['y'] * PPM)
                         palpha = int(255 * (part['vida'] / 0.3))
-                        s = pygame.Surface((6, 6), pygame.SRCALPHA)
-                        pygame.draw.circle(s, (*part['cor'], palpha), (3, 3), 3)
-                        self.tela.blit(s, (ppx - 3, ppy - 3))
+                        sprites.blit_centrado(self.tela, sprites.circulo(3, part['cor'], palpha), ppx, ppy)
                     
                     # Glow externo
                     glow_size = int(or_visual * 2.5)
                     if glow_size > 2:
-                        s = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
                         # Pulso de brilho
                         pulso = 0.7 + 0.3 * math.sin(orbe.pulso)
                         glow_alpha = int(100 * pulso)
-                        cor_glow = (*orbe.cor[:3], glow_alpha)
-                        pygame.draw.circle(s, cor_glow, (glow_size, glow_size), glow_size)
-                        self.tela.blit(s, (ox - glow_size, oy - glow_size))
+                        sprites.blit_centrado(self.tela, sprites.circulo(glow_size, orbe.cor, glow_alpha), ox, oy)
                     
                     # Orbe principal (núcleo brilhante)
                     if or_visual > 1:
@@ -3642,7 +3640,8 @@ class Simulador:
         s = pygame.Surface((300, self.screen_height)); s.fill(COR_UI_BG); self.tela.blit(s, (0,0))
         ft = pygame.font.SysFont("Consolas", 14)
         lines = [
-            "--- ANÁLISE ---", f"FPS: {int(self.clock.get_fps())}", f"Cam: {self.cam.modo}", "",
+            "--- ANÁLISE ---", f"FPS: {int(self.clock.get_fps())}", f"Cam: {self.cam.modo}",
+            f"Sprite cache: {SpriteCache.get_instance().hit_rate:.0%}", "",
             f"--- {self.p1.dados.nome} ---", f"HP: {int(self.p1.vida)}", f"Mana: {int(self.p1.mana)}", f"Estamina: {int(self.p1.estamina)}",
             f"Action: {self.p1.brain.acao_atual}", f"Skill: {self.p1.skill_arma_nome}", "",
             f"--- {self.p2.dados.nome} ---", f"HP: {int(self.p2.vida)}", f"Mana: {int(self.p2.mana)}", f"Estamina: {int(self.p2.estamina)}",
@@ -0,0 +1,78 @@
+"""
+NEURAL FIGHTS - Teste do CatalogSnapshot
+========================================
+Snapshot binário do catálogo (data/snapshot.py) com o AppState apontado para
+cópias dos JSON (fixture app_state_isolado, conftest.py): o snapshot é
+reaproveitado quando nada mudou, é invalidado quando outro processo edita um
+JSON entre a leitura e o flush() deste, e escritas concorrentes não deixam
+.tmp nem arquivo corrompido para trás.
+
+Uso:
+    python -m pytest test_catalog_snapshot.py
+"""
+
+import json
+import os
+import threading
+
+import data.app_state as app_state
+from data.app_state import AppState
+from data.snapshot import CatalogSnapshot
+
+
+def _snapshot():
+    return CatalogSnapshot(app_state.FILE_SNAPSHOT,
+                           {"weapons": app_state.FILE_WEAPONS, "characters": app_state.FILE_CHARS},
+                           app_state.SNAPSHOT_CODE)
+
+
+def test_snapshot_reaproveitado(app_state_isolado):
+    total = len(AppState.get().characters)        # 1º start: monta e grava o snapshot
+    assert _snapshot().load() is not None
+    AppState.reset()
+    assert len(AppState.get().characters) == total
+    assert _snapshot().load() is not None
+
+
+def test_edicao_externa_invalida_snapshot(app_state_isolado):
+    AppState.get()
+    AppState.reset()
+    state = AppState.get()                         # catálogo vindo do snapshot
+    state.update_weapon(0, state.weapons[0])
+
+    # Outro processo acrescenta um personagem antes do nosso flush()
+    with open(app_state.FILE_CHARS, "r", encoding="utf-8") as f:
+        chars = json.load(f)
+    chars.append(dict(chars[0], nome="EXTERNO_NOVO"))
+    with open(app_state.FILE_CHARS, "w", encoding="utf-8") as f:
+        json.dump(chars, f, indent=4, ensure_ascii=False)
+
+    state.flush()
+    AppState.reset()
+    assert AppState.get().get_character("EXTERNO_NOVO") is not None, \
+        "snapshot gravado sobre um personagens.json que mudou"
+
+
+def test_gravacoes_concorrentes(app_state_isolado):
+    AppState.get()
+    payload = _snapshot().load()
+    assert payload is not None
+    snaps = [_snapshot() for _ in range(4)]
+    for snap in snaps:
+        assert snap.load() is not None
+    erros = []
+
+    def gravar(snap):
+        for _ in range(5):
+            if not snap.save(payload):
+                erros.append(snap)
+
+    threads = [threading.Thread(target=gravar, args=(s,)) for s in snaps]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not erros, f"{len(erros)} gravações falharam"
+    assert _snapshot().load() is not None
+    sobras = [n for n in os.listdir(app_state_isolado) if n.endswith(".tmp")]
+    assert not sobras, sobras
@@ -0,0 +1,60 @@
+"""
+NEURAL FIGHTS - Teste do FightJournal
+=====================================
+Journal append-only de resultados (data/fight_journal.py) em tmp_path:
+recuperação de uma linha cortada no fim (crash no meio de um append), replay
+depois de compactar e agregados/Elo iguais aos recalculados.
+
+Uso:
+    python -m pytest test_fight_journal.py
+"""
+
+import json
+
+from data.fight_journal import FightJournal, ELO_BASE
+
+
+def _journal(pasta, **kwargs):
+    kwargs.setdefault("flush_interval", 0)        # sem timer: flush explícito
+    return FightJournal(str(pasta / "fight_results.jsonl"), str(pasta / "fight_stats.json"), **kwargs)
+
+
+def test_linha_cortada_no_fim(tmp_path):
+    j = _journal(tmp_path)
+    j.append("Caleb", "Bjorn", 30.0, ko=True)
+    j.flush()
+    # Crash no meio do próximo append: meia linha sem "\n"
+    with open(j.path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 2, "winner": "Bj')
+
+    j2 = _journal(tmp_path)
+    assert j2.summary()["total_fights"] == 1
+    j2.append("Suki", "Viktor", 12.5, ko=False)
+    j2.flush()
+
+    j3 = _journal(tmp_path)
+    assert j3.summary()["total_fights"] == 2, j3.summary()
+    assert j3.fighter("Suki")["wins"] == 1
+    with open(j3.path, "r", encoding="utf-8") as f:
+        linhas = f.read().splitlines()
+    assert json.loads(linhas[-1])["winner"] == "Suki"
+
+
+def test_compactacao_e_replay(tmp_path):
+    j = _journal(tmp_path, flush_every=3, compact_every=5)
+    lutas = [("A", "B", 10.0, True), ("B", "C", 50.0, False), ("A", "C", 5.0, True),
+             ("C", "A", 70.0, False), ("B", "A", 20.0, True), ("A", "B", 8.0, True),
+             ("C", "B", 33.0, False)]
+    for vencedor, perdedor, duracao, ko in lutas:
+        j.append(vencedor, perdedor, duracao, ko)
+    j.flush()
+    esperado = j.aggregates
+
+    relido = _journal(tmp_path, flush_every=3, compact_every=5)
+    assert relido.aggregates == esperado
+    assert relido.seq == len(lutas)
+    assert esperado["total_fights"] == 7 and esperado["total_kos"] == 4
+    assert esperado["fastest_ko"] == 5.0 and esperado["longest_fight"] == 70.0
+    # Elo é soma zero
+    soma = sum(f["elo"] for f in esperado["fighters"].values())
+    assert abs(soma - 3 * ELO_BASE) < 0.1, soma
@@ -0,0 +1,70 @@
+"""
+NEURAL FIGHTS - Teste dos Backends de Storage
+=============================================
+JsonStorage e SqliteStorage (data/storage.py) sobre cópias dos JSON de
+data/ (fixture json_paths, conftest.py): import/export JSON ⇄ SQLite sem
+perda, e as mesmas mutações por índice (update/insert/delete) deixando os
+dois backends com os mesmos dados.
+
+Uso:
+    python -m pytest test_storage.py
+"""
+
+from data.storage import JsonStorage, SqliteStorage, read_json, LIST_KINDS, DOC_NAMES
+
+
+class _Item(dict):
+    """Stand-in de Arma / Personagem: os backends só precisam de to_dict()."""
+    def to_dict(self):
+        return dict(self)
+
+
+def test_ida_e_volta_json_sqlite(tmp_path, json_paths):
+    originais = {k: read_json(p) for k, p in json_paths.items()}
+    db_path = str(tmp_path / "neural_fights.db")
+    db = SqliteStorage(db_path, json_paths)        # importa no 1º open
+    for kind in LIST_KINDS:
+        assert db.load_list(kind) == (originais[kind] or []), kind
+    for name in DOC_NAMES:
+        assert db.load_doc(name) == originais[name], name
+
+    export = {k: str(tmp_path / ("export_" + k + ".json")) for k in json_paths}
+    db.export_json(export)
+    db.close()
+    for chave in LIST_KINDS:
+        assert read_json(export[chave]) == (originais[chave] or []), chave
+    for chave in DOC_NAMES:
+        if originais[chave] is not None:
+            assert read_json(export[chave]) == originais[chave], chave
+
+    # Reabrir não reimporta por cima (o banco já tem dados)
+    db = SqliteStorage(db_path, json_paths)
+    assert db.count("weapons") == len(originais["weapons"] or [])
+    db.close()
+
+
+def test_mutacoes_iguais_nos_dois_backends(tmp_path, json_paths):
+    js = JsonStorage(json_paths, delay=0)
+    db = SqliteStorage(str(tmp_path / "neural_fights.db"), json_paths)
+    chars = [_Item(d) for d in js.load_list("characters")]
+    assert len(chars) >= 3, "roster precisa de pelo menos 3 personagens"
+
+    def aplicar(op, indice):
+        for backend in (js, db):
+            getattr(backend, op)("characters", indice, chars)
+
+    chars[1] = _Item(chars[1], forca=99.0)
+    aplicar("update_item", 1)
+    chars.insert(0, _Item(chars[2], nome="Novo Lutador"))
+    aplicar("insert_item", 0)
+    del chars[2]
+    aplicar("delete_item", 2)
+    js.save_doc("match", {"p1_nome": "A", "p2_nome": "B", "cenario": "Coliseu"})
+    db.save_doc("match", {"p1_nome": "A", "p2_nome": "B", "cenario": "Coliseu"})
+
+    esperado = [c.to_dict() for c in chars]
+    assert js.load_list("characters") == esperado
+    assert db.load_list("characters") == esperado
+    assert db.query("characters", "nome", "Novo Lutador") == [esperado[0]]
+    assert js.load_doc("match") == db.load_doc("match")
+    db.close()
@@ -0,0 +1,38 @@
+"""
+NEURAL FIGHTS - Teste do Pool de Workers Headless
+=================================================
+Verifica que um worker reaproveitado entre lutas não vaza estado de uma luta
+para a outra: a mesma luta com a mesma seed tem que dar o mesmo resultado
+sozinha ou depois de outras lutas no mesmo Simulador.
+
+Uso:
+    python -m pytest test_worker_pool.py -s
+"""
+
+from data.app_state import AppState
+from tournament.render_farm import MatchSpec
+from tournament.worker_pool import PoolLutas
+
+
+def _chave(res):
+    return (res.vencedor, res.frames, res.vida_p1, res.vida_p2)
+
+
+def test_seed_reproduzivel_entre_lutas():
+    nomes = AppState.get().character_names()
+    assert len(nomes) >= 4, "roster precisa de pelo menos 4 personagens"
+    luta_a = MatchSpec(nomes[0], nomes[1], seed=11)
+    outras = [MatchSpec(nomes[i], nomes[i + 1], seed=i) for i in range(2, min(len(nomes) - 1, 8), 2)]
+
+    # Um worker só: todas as lutas passam pelo mesmo Simulador, em ordem
+    with PoolLutas(workers=1, max_segundos=40.0) as pool:
+        primeira = pool.executar([luta_a])[0]
+        assert primeira.ok, primeira.erro
+        for outra in outras:
+            resultados = pool.executar([outra, luta_a])
+            assert all(r.ok for r in resultados), [r.erro for r in resultados]
+            assert _chave(resultados[1]) == _chave(primeira), \
+                f"{luta_a.p1} vs {luta_a.p2} mudou depois de {outra.p1} vs {outra.p2}: " \
+                f"{_chave(primeira)} → {_chave(resultados[1])}"
+    print(f"  {luta_a.p1} vs {luta_a.p2} (seed 11): {_chave(primeira)} em {len(outras) + 1} execuções")
+
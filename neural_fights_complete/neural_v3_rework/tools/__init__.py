@@ -1,7 +1,17 @@
 """
 NEURAL FIGHTS - Módulo Tools
 Ferramentas de diagnóstico e análise.
+
+Os nomes de diagnostico_hitbox e analise_armas são resolvidos sob demanda
+(ver utils/importacao_tardia.py): `python -m tools.gerador_database` e os
+workers do gerador não pagam mais a importação dos diagnósticos.
 """
 
-from tools.diagnostico_hitbox import *
-from tools.analise_armas import *
+from utils.importacao_tardia import exportacoes_tardias
+
+# Antes: `from tools.diagnostico_hitbox import *` seguido de
+# `from tools.analise_armas import *` — o último vence em nomes repetidos
+__getattr__, __dir__ = exportacoes_tardias(__name__, {}, (
+    "tools.analise_armas",
+    "tools.diagnostico_hitbox",
+))
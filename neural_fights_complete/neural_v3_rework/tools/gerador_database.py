@@ -504,40 +504,48 @@ def gerar_personagem(classe, personalidade, arma_nome, cor=None):
     return personagem
 
 
+PREFERENCIAS_ARMA = {
+    "Guerreiro": ["Reta", "Transformável"],
+    "Mago": ["Mágica", "Orbital"],
+    "Assassino": ["Dupla", "Arremesso"],
+    "Arqueiro": ["Arco"],
+    "Berserker": ["Reta", "Corrente"],
+    "Paladino": ["Reta", "Orbital"],
+    "Ladino": ["Dupla", "Arremesso"],
+    "Monge": ["Corrente", "Dupla"],
+    "Ninja": ["Dupla", "Arremesso"],
+    "Caçador": ["Arco", "Arremesso"],
+    "Cavaleiro": ["Reta"],
+    "Samurai": ["Reta", "Transformável"],
+    "Feiticeiro": ["Mágica"],
+    "Druida": ["Mágica", "Corrente"],
+    "Bárbaro": ["Reta", "Corrente"],
+    "Necromante": ["Mágica"],
+}
+
+
 def selecionar_arma_por_classe(classe, armas):
-    """Seleciona armas apropriadas para uma classe"""
-    preferencias = {
-        "Guerreiro": ["Reta", "Transformável"],
-        "Mago": ["Mágica", "Orbital"],
-        "Assassino": ["Dupla", "Arremesso"],
-        "Arqueiro": ["Arco"],
-        "Berserker": ["Reta", "Corrente"],
-        "Paladino": ["Reta", "Orbital"],
-        "Ladino": ["Dupla", "Arremesso"],
-        "Monge": ["Corrente", "Dupla"],
-        "Ninja": ["Dupla", "Arremesso"],
-        "Caçador": ["Arco", "Arremesso"],
-        "Cavaleiro": ["Reta"],
-        "Samurai": ["Reta", "Transformável"],
-        "Feiticeiro": ["Mágica"],
-        "Druida": ["Mágica", "Corrente"],
-        "Bárbaro": ["Reta", "Corrente"],
-        "Necromante": ["Mágica"],
-    }
-    
-    tipos_preferidos = preferencias.get(classe, LISTA_TIPOS_ARMA)
+    """Seleciona armas apropriadas para uma classe ("Mago (Arcano)" usa as preferências de "Mago")"""
+    tipos_preferidos = PREFERENCIAS_ARMA.get(classe.split(" (")[0], LISTA_TIPOS_ARMA)
     return [a for a in armas if a["tipo"] in tipos_preferidos]
 
 
-def gerar_database_diversa(num_personagens=64):
-    """Gera database com MÁXIMA DIVERSIDADE"""
-    
+def montar_pools_por_classe(armas):
+    """
+    Pré-calcula, uma vez, os nomes de armas apropriadas para cada classe.
+    Evita varrer todas as armas a cada personagem gerado.
+    """
+    todos = [a["nome"] for a in armas]
+    pools = {}
+    for classe in LISTA_CLASSES:
+        pools[classe] = [a["nome"] for a in selecionar_arma_por_classe(classe, armas)] or todos
+    return pools
+
+
+def gerar_armas_base():
+    """Uma arma por variante de cada tipo + Épico/Lendário/Mítico de cada tipo"""
     armas = []
-    personagens = []
     nomes_armas_usados = set()
-    nomes_personagens_usados = set()
-    
-    print("Gerando armas diversas...")
     
     for tipo in LISTA_TIPOS_ARMA:
         variantes = ESTILOS_ARMA.get(tipo, ESTILOS_ARMA["Reta"])["variantes"]
@@ -574,24 +582,36 @@ def gerar_database_diversa(num_personagens=64):
                 armas.append(arma)
                 nomes_armas_usados.add(arma["nome"])
     
+    return armas
+
+
+def gerar_database_diversa(num_personagens=64):
+    """Gera database com MÁXIMA DIVERSIDADE"""
+    
+    personagens = []
+    nome_unico = _NomesUnicos()
+    
+    print("Gerando armas diversas...")
+    armas = gerar_armas_base()
+    pools = montar_pools_por_classe(armas)
+    
     print(f"  → {len(armas)} armas geradas")
     print("Gerando personagens diversos...")
     
     for classe_idx, classe in enumerate(LISTA_CLASSES):
         personalidade = LISTA_PERSONALIDADES[classe_idx % len(LISTA_PERSONALIDADES)]
-        armas_apropriadas = selecionar_arma_por_classe(classe, armas)
-        arma = random.choice(armas_apropriadas) if armas_apropriadas else random.choice(armas)
+        arma_nome = random.choice(pools[classe])
         
-        personagem = gerar_personagem(classe, personalidade, arma["nome"])
+        personagem = gerar_personagem(classe, personalidade, arma_nome)
         
         tentativas = 0
-        while personagem["nome"] in nomes_personagens_usados and tentativas < 10:
-            personagem = gerar_personagem(classe, personalidade, arma["nome"])
+        while personagem["nome"] in nome_unico.usados and tentativas < 10:
+            personagem = gerar_personagem(classe, personalidade, arma_nome)
             tentativas += 1
         
-        if personagem["nome"] not in nomes_personagens_usados:
+        if personagem["nome"] not in nome_unico.usados:
             personagens.append(personagem)
-            nomes_personagens_usados.add(personagem["nome"])
+            nome_unico(personagem["nome"])
     
     while len(personagens) < num_personagens:
         classe = random.choice(LISTA_CLASSES)
@@ -599,16 +619,195 @@ def gerar_database_diversa(num_personagens=64):
         arma = random.choice(armas)
         
         personagem = gerar_personagem(classe, personalidade, arma["nome"])
-        
-        if personagem["nome"] not in nomes_personagens_usados:
-            personagens.append(personagem)
-            nomes_personagens_usados.add(personagem["nome"])
+        # Os nomes base se esgotam em rosters grandes: numera as repetições
+        personagem["nome"] = nome_unico(personagem["nome"])
+        personagens.append(personagem)
     
     print(f"  → {len(personagens)} personagens gerados")
     
     return armas, personagens
 
 
+def gerar_database_completa(num_personagens=64, modo="balanceada", seed=None):
+    """
+    Roster em memória com classes distribuídas igualmente (round-robin).
+    modo "representativa" garante ao menos um de cada classe antes de sortear.
+    Sem seed, sorteia uma (roster diferente a cada chamada).
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(32)
+    random.seed(seed)
+    armas = gerar_armas_base()
+    pools = montar_pools_por_classe(armas)
+    personagens = gerar_lote_personagens(0, 0, num_personagens, seed, pools,
+                                         balanceado=(modo != "representativa"))
+    nome_unico = _NomesUnicos()
+    for p in personagens:
+        p["nome"] = nome_unico(p["nome"])
+    return armas, personagens
+
+
+# =============================================================================
+# GERAÇÃO RÁPIDA EM LOTES (rosters grandes para testes de carga)
+# =============================================================================
+
+class _NomesUnicos:
+    """Os nomes base se esgotam em rosters grandes: numera as repetições ("Kael 2", "Kael 3"...)."""
+
+    def __init__(self, existentes=()):
+        self.usados = set(existentes)
+        self.proximo = {}
+
+    def __call__(self, nome):
+        if nome not in self.usados:
+            self.usados.add(nome)
+            return nome
+        n = self.proximo.get(nome, 2)
+        while f"{nome} {n}" in self.usados:
+            n += 1
+        self.proximo[nome] = n + 1
+        unico = f"{nome} {n}"
+        self.usados.add(unico)
+        return unico
+
+
+def gerar_lote_personagens(shard, inicio, quantidade, seed, pools, balanceado=True):
+    """
+    Gera `quantidade` personagens a partir do índice global `inicio`.
+    A seed do lote depende só de (seed, shard): o resultado é o mesmo com
+    qualquer número de workers. Roda no processo do pool.
+    """
+    random.seed(seed * 1_000_003 + shard)
+    n_classes = len(LISTA_CLASSES)
+    lote = []
+    for i in range(inicio, inicio + quantidade):
+        if balanceado or i < n_classes:
+            classe = LISTA_CLASSES[i % n_classes]
+        else:
+            classe = random.choice(LISTA_CLASSES)
+        personalidade = random.choice(LISTA_PERSONALIDADES)
+        lote.append(gerar_personagem(classe, personalidade, random.choice(pools[classe])))
+    return lote
+
+
+class _EscritorJsonStream:
+    """Escreve um array JSON item a item (arquivo .tmp + os.replace no final)."""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.tmp = caminho + ".tmp"
+        self.f = open(self.tmp, "w", encoding="utf-8")
+        self.f.write("[")
+        self.total = 0
+
+    def escrever(self, itens):
+        if not itens:
+            return
+        partes = [json.dumps(item, ensure_ascii=False) for item in itens]
+        self.f.write(("\n" if self.total == 0 else ",\n") + ",\n".join(partes))
+        self.total += len(itens)
+
+    def fechar(self):
+        self.f.write("\n]\n")
+        self.f.close()
+        os.replace(self.tmp, self.caminho)
+
+
+class _EscritorSqlite:
+    """Insere em lotes no neural_fights.db (ver data/storage.py)."""
+
+    def __init__(self, storage, kind, substituir):
+        self.storage = storage
+        self.kind = kind
+        if substituir:
+            storage.clear(kind)
+        self.total = storage.count(kind)
+
+    def escrever(self, itens):
+        self.storage.append_rows(self.kind, itens, self.total)
+        self.total += len(itens)
+
+    def fechar(self):
+        pass
+
+
+def gerar_roster_rapido(num_personagens, workers=1, seed=0, tamanho_lote=5000,
+                        destino="json", substituir=True, data_dir=None):
+    """
+    Gera um roster de `num_personagens` em lotes (shards) com seeds
+    determinísticas, opcionalmente em paralelo, gravando cada lote no destino
+    assim que fica pronto — o roster nunca fica inteiro na memória.
+
+    destino: "json" (armas.json / personagens.json) ou "sqlite" (neural_fights.db)
+    Retorna {"armas": n, "personagens": n, "segundos": t} — n = quantos foram
+    gravados nesta chamada (no modo adicionar, sem as armas que já existiam).
+    """
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    inicio_t = time.perf_counter()
+    data_dir = data_dir or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+    random.seed(seed)
+    armas = gerar_armas_base()
+    pools = montar_pools_por_classe(armas)
+
+    lotes = [(shard, i, min(tamanho_lote, num_personagens - i))
+             for shard, i in enumerate(range(0, num_personagens, tamanho_lote))]
+
+    storage = None
+    if destino == "sqlite":
+        from data.storage import SqliteStorage
+        storage = SqliteStorage(os.path.join(data_dir, "neural_fights.db"))
+        escritor_armas = _EscritorSqlite(storage, "weapons", substituir)
+        escritor = _EscritorSqlite(storage, "characters", substituir)
+        nome_unico = _NomesUnicos(d["nome"] for d in storage.load_list("characters")) if not substituir \
+            else _NomesUnicos()
+        nomes_armas = {a["nome"] for a in storage.load_list("weapons")} if not substituir else set()
+    else:
+        arquivo_armas = os.path.join(data_dir, "armas.json")
+        arquivo_chars = os.path.join(data_dir, "personagens.json")
+        existentes_armas, existentes_chars = [], []
+        if not substituir:
+            for caminho, destino_lista in ((arquivo_armas, existentes_armas), (arquivo_chars, existentes_chars)):
+                try:
+                    with open(caminho, "r", encoding="utf-8") as f:
+                        destino_lista.extend(json.load(f))
+                except (OSError, ValueError):
+                    pass
+        escritor_armas = _EscritorJsonStream(arquivo_armas)
+        escritor_armas.escrever(existentes_armas)
+        escritor = _EscritorJsonStream(arquivo_chars)
+        escritor.escrever(existentes_chars)
+        nome_unico = _NomesUnicos(p["nome"] for p in existentes_chars)
+        nomes_armas = {a["nome"] for a in existentes_armas}
+
+    # Armas base já presentes (modo adicionar) não são duplicadas
+    armas_novas = [a for a in armas if a["nome"] not in nomes_armas]
+    escritor_armas.escrever(armas_novas)
+    escritor_armas.fechar()
+
+    def _gravar(lote):
+        for p in lote:
+            p["nome"] = nome_unico(p["nome"])
+        escritor.escrever(lote)
+
+    args = [(shard, i, qtd, seed, pools) for shard, i, qtd in lotes]
+    if workers > 1 and len(lotes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map devolve os lotes em ordem: saída idêntica à execução serial
+            for lote in pool.map(gerar_lote_personagens, *zip(*args)):
+                _gravar(lote)
+    else:
+        for a in args:
+            _gravar(gerar_lote_personagens(*a))
+    escritor.fechar()
+    if storage:
+        storage.close()
+
+    return {"armas": len(armas_novas), "personagens": escritor.total,
+            "segundos": round(time.perf_counter() - inicio_t, 2)}
+
+
 def salvar_database(armas, personagens, substituir=True):
     """Salva a database gerada"""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -661,6 +860,26 @@ def salvar_database(armas, personagens, substituir=True):
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Gerador de database Neural Fights")
+    parser.add_argument("--rapido", type=int, metavar="N",
+                        help="Gera N personagens em lotes paralelos (ex.: 100000)")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lote", type=int, default=5000, help="Personagens por shard")
+    parser.add_argument("--destino", choices=["json", "sqlite"], default="json")
+    parser.add_argument("--adicionar", action="store_true", help="Mescla com a database existente")
+    args = parser.parse_args()
+    
+    if args.rapido:
+        info = gerar_roster_rapido(args.rapido, workers=args.workers, seed=args.seed,
+                                   tamanho_lote=args.lote, destino=args.destino,
+                                   substituir=not args.adicionar)
+        print(f"✅ {info['personagens']} personagens e {info['armas']} armas "
+              f"em {info['segundos']}s ({args.destino})")
+        sys.exit(0)
+    
     print("=" * 60)
     print("NEURAL FIGHTS - Gerador de Database v2.0 DIVERSITY EDITION")
     print("=" * 60)
@@ -0,0 +1,199 @@
+"""
+NEURAL FIGHTS - Perfil de Importação (startup)
+==============================================
+Mede quanto custa importar cada ponto de entrada do projeto. Cada alvo é
+importado num subprocesso limpo com `python -X importtime`, e o relatório
+mostra o tempo total, os módulos mais caros e quais pacotes pesados
+(pygame, numpy, effects, tkinter) vieram junto.
+
+Uso:
+    python -m tools.perfil_importacao                       # alvos padrão
+    python -m tools.perfil_importacao core ai --top 30
+    python -m tools.perfil_importacao --saida perfil.txt --json perfil.json
+    python -m tools.perfil_importacao --verificar-headless  # exit 1 se um worker
+                                                            # headless carregar pygame & cia.
+
+    from tools.perfil_importacao import medir
+    perfil = medir("core.entities")
+    perfil.total_ms, perfil.pesados
+"""
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ALVOS_PADRAO = [
+    "run",
+    "ui.main",
+    "simulation.simulacao",
+    "data.app_state",
+    "tournament.tournament_mode",
+    "tournament.render_farm",
+    "tools.gerador_database",
+    "core",
+    "ai",
+    "models",
+]
+
+# O que um worker headless importa: deve subir sem o stack de renderização
+ALVOS_HEADLESS = [
+    "core.entities",
+    "core.physics",
+    "core.skills",
+    "ai",
+    "models",
+    "data.app_state",
+    "tools.gerador_database",
+]
+
+# Pacotes que só fazem sentido quando há janela / renderização
+PESADOS = ("pygame", "numpy", "effects", "tkinter", "simulation.simulacao")
+
+_MARCA = "__perfil_importacao__"
+
+
+@dataclass
+class PerfilImportacao:
+    """Resultado de importar um alvo num processo novo"""
+    alvo: str
+    total_ms: float = 0.0
+    # (módulo, profundidade, self_us, cumulativo_us) na ordem do -X importtime
+    modulos: List[tuple] = field(default_factory=list)
+    pesados: List[str] = field(default_factory=list)
+    erro: str = ""
+
+    def top(self, n: int = 15, chave: str = "self") -> List[tuple]:
+        idx = 2 if chave == "self" else 3
+        return sorted(self.modulos, key=lambda m: m[idx], reverse=True)[:n]
+
+    def modulos_do_projeto(self) -> List[tuple]:
+        raizes = {n for n in os.listdir(PROJECT_DIR)
+                  if os.path.isdir(os.path.join(PROJECT_DIR, n)) or n.endswith(".py")}
+        raizes = {n[:-3] if n.endswith(".py") else n for n in raizes}
+        return [m for m in self.modulos if m[0].split(".")[0] in raizes]
+
+
+def _ambiente() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    env["PYTHONPATH"] = PROJECT_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _parse_importtime(stderr: str) -> List[tuple]:
+    modulos = []
+    for linha in stderr.splitlines():
+        if not linha.startswith("import time:"):
+            continue
+        partes = linha[len("import time:"):].split("|")
+        if len(partes) != 3 or not partes[0].strip().isdigit():
+            continue                    # cabeçalho
+        nome = partes[2].rstrip()
+        profundidade = (len(nome) - len(nome.lstrip())) // 2
+        modulos.append((nome.strip(), profundidade, int(partes[0]), int(partes[1])))
+    return modulos
+
+
+def medir(alvo: str, python: Optional[str] = None, timeout: float = 120.0) -> PerfilImportacao:
+    """Importa `alvo` num subprocesso com -X importtime e devolve o perfil."""
+    codigo = ("import time; _t = time.perf_counter(); "
+              f"import {alvo}; "
+              f"print({_MARCA!r}, (time.perf_counter() - _t) * 1000.0)")
+    perfil = PerfilImportacao(alvo)
+    try:
+        proc = subprocess.run([python or sys.executable, "-X", "importtime", "-c", codigo],
+                              cwd=PROJECT_DIR, env=_ambiente(), capture_output=True,
+                              text=True, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        perfil.erro = str(e)
+        return perfil
+
+    perfil.modulos = _parse_importtime(proc.stderr)
+    for linha in proc.stdout.splitlines():
+        if linha.startswith(_MARCA):
+            perfil.total_ms = round(float(linha.split()[-1]), 1)
+    if proc.returncode != 0:
+        erros = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+        perfil.erro = erros[-1] if erros else f"exit {proc.returncode}"
+
+    nomes = {m[0] for m in perfil.modulos}
+    perfil.pesados = [p for p in PESADOS
+                      if any(n == p or n.startswith(p + ".") for n in nomes)]
+    return perfil
+
+
+def relatorio(perfis: List[PerfilImportacao], top: int = 15) -> str:
+    """Relatório em texto: resumo por alvo + os módulos mais caros de cada um."""
+    linhas = ["NEURAL FIGHTS - Perfil de importação", "=" * 72, ""]
+    linhas.append(f"{'alvo':<30}{'total (ms)':>12}{'módulos':>10}   pesados")
+    linhas.append("-" * 72)
+    for p in perfis:
+        pesados = ", ".join(p.pesados) or "-"
+        if p.erro:
+            pesados = f"ERRO: {p.erro}"
+        linhas.append(f"{p.alvo:<30}{p.total_ms:>12.1f}{len(p.modulos):>10}   {pesados}")
+
+    for p in perfis:
+        if not p.modulos:
+            continue
+        linhas += ["", f"── {p.alvo} " + "─" * max(0, 68 - len(p.alvo))]
+        linhas.append(f"  {'self (ms)':>10}{'cumul. (ms)':>13}   módulo")
+        for nome, _prof, self_us, cumul_us in p.top(top, "self"):
+            linhas.append(f"  {self_us / 1000:>10.1f}{cumul_us / 1000:>13.1f}   {nome}")
+        projeto = sorted(p.modulos_do_projeto(), key=lambda m: m[3], reverse=True)[:top]
+        if projeto:
+            linhas.append("  módulos do projeto (cumulativo):")
+            for nome, _prof, self_us, cumul_us in projeto:
+                linhas.append(f"  {self_us / 1000:>10.1f}{cumul_us / 1000:>13.1f}   {nome}")
+    return "\n".join(linhas) + "\n"
+
+
+def verificar_headless(perfis: List[PerfilImportacao]) -> List[str]:
+    """Problemas encontrados: alvos headless que carregaram pacotes pesados ou falharam."""
+    problemas = []
+    for p in perfis:
+        if p.erro:
+            problemas.append(f"{p.alvo}: {p.erro}")
+        elif p.pesados:
+            problemas.append(f"{p.alvo} carrega {', '.join(p.pesados)}")
+    return problemas
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Perfil de importação do Neural Fights")
+    parser.add_argument("alvos", nargs="*", help="Módulos a medir (padrão: pontos de entrada)")
+    parser.add_argument("--top", type=int, default=15, help="Módulos listados por alvo")
+    parser.add_argument("--saida", help="Grava o relatório em texto neste arquivo")
+    parser.add_argument("--json", dest="saida_json", help="Grava os perfis brutos em JSON")
+    parser.add_argument("--verificar-headless", action="store_true",
+                        help="Mede os alvos headless e falha se algum carregar pygame/VFX")
+    args = parser.parse_args()
+
+    alvos = args.alvos or (ALVOS_HEADLESS if args.verificar_headless else ALVOS_PADRAO)
+    perfis = [medir(a) for a in alvos]
+    texto = relatorio(perfis, args.top)
+    print(texto)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    if args.saida_json:
+        with open(args.saida_json, "w", encoding="utf-8") as f:
+            json.dump([asdict(p) for p in perfis], f, indent=2, ensure_ascii=False)
+
+    if args.verificar_headless:
+        problemas = verificar_headless(perfis)
+        for prob in problemas:
+            print(f"❌ {prob}")
+        if problemas:
+            sys.exit(1)
+        print("✅ Workers headless sobem sem o stack de renderização")
@@ -0,0 +1,244 @@
+"""
+NEURAL FIGHTS - Render Farm de Lutas
+====================================
+Renderiza várias lutas offscreen em paralelo (uma luta por processo, cada
+processo com o seu próprio contexto SDL dummy) usando o exportador de
+simulation/exportador.py.
+
+Cada job grava o stream de frames em <saida>/<match_id>[.rgb|.mp4|/] e o
+resultado em <saida>/manifest.json (duração, vencedor, frames, status).
+O manifest é regravado a cada luta concluída: ao rodar de novo com a mesma
+pasta, lutas já concluídas são puladas e as que falharam são refeitas.
+
+Uso:
+    from tournament.render_farm import RenderFarm, MatchSpec
+    farm = RenderFarm("renders/noite_01", workers=4, formato="ffmpeg")
+    manifest = farm.executar([
+        MatchSpec("Caleb", "Bjorn", cenario="Coliseu", seed=1),
+        MatchSpec("Suki", "Viktor", seed=2, portrait=True),
+    ])
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import unicodedata
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MANIFEST = "manifest.json"
+EXTENSOES = {"png": "", "raw": ".rgb", "ffmpeg": ".mp4"}
+
+
+@dataclass
+class MatchSpec:
+    """Uma luta a renderizar"""
+    p1: str
+    p2: str
+    cenario: str = "Arena"
+    seed: Optional[int] = None
+    portrait: bool = False
+    match_id: str = ""
+
+    def to_config(self) -> Dict:
+        """Config no formato de match_config.json (ver Simulador)"""
+        return {
+            "p1_nome": self.p1,
+            "p2_nome": self.p2,
+            "cenario": self.cenario,
+            "portrait_mode": self.portrait,
+            "seed": self.seed,
+        }
+
+
+def _slug(texto: str) -> str:
+    texto = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode()
+    return re.sub(r"[^A-Za-z0-9]+", "_", texto).strip("_").lower() or "x"
+
+
+def _renderizar_job(config: Dict, saida: str, formato: str, fps: int, max_segundos: float) -> Dict:
+    """Executado no processo do pool: uma luta, um contexto SDL dummy."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from simulation.exportador import exportar_luta
+    return exportar_luta(config, saida, formato=formato, fps=fps, max_segundos=max_segundos)
+
+
+class RenderFarm:
+    """Fila de lutas distribuída num pool de processos, com manifest e retomada."""
+
+    def __init__(self, saida_dir: str, workers: int = None, formato: str = "png",
+                 fps: int = 60, max_segundos: float = 180.0, tentativas: int = 2):
+        self.saida_dir = saida_dir
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.formato = formato
+        self.fps = fps
+        self.max_segundos = max_segundos
+        self.tentativas = max(1, tentativas)
+        self.manifest_path = os.path.join(saida_dir, MANIFEST)
+        self.manifest: Dict = {"jobs": {}}
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def carregar_manifest(self) -> Dict:
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    self.manifest = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ Manifest ilegível, recomeçando: {e}")
+                self.manifest = {"jobs": {}}
+        self.manifest.setdefault("jobs", {})
+        return self.manifest
+
+    def _salvar_manifest(self):
+        """Escrita atômica: um crash no meio não corrompe o manifest."""
+        os.makedirs(self.saida_dir, exist_ok=True)
+        self.manifest["atualizado_em"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    def _caminho_saida(self, match_id: str) -> str:
+        return os.path.join(self.saida_dir, match_id + EXTENSOES.get(self.formato, ""))
+
+    def _ja_concluido(self, match_id: str) -> bool:
+        job = self.manifest["jobs"].get(match_id)
+        return bool(job and job.get("status") == "ok" and os.path.exists(job.get("saida", "")))
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+
+    def preparar(self, specs: List[MatchSpec]) -> List[MatchSpec]:
+        """Atribui match_id estável (índice + nomes) e registra os jobs no manifest."""
+        for i, spec in enumerate(specs):
+            if not spec.match_id:
+                spec.match_id = f"{i:03d}_{_slug(spec.p1)}_vs_{_slug(spec.p2)}"
+            job = self.manifest["jobs"].setdefault(spec.match_id, {"status": "pendente", "tentativas": 0})
+            job["spec"] = asdict(spec)
+            job["saida"] = self._caminho_saida(spec.match_id)
+        return specs
+
+    def executar(self, specs: List[MatchSpec],
+                 progresso: Optional[Callable[[int, int, str, Dict], None]] = None) -> Dict:
+        """
+        Renderiza todas as lutas pendentes. Retorna o manifest.
+        progresso(concluidas, total, match_id, job) é chamado a cada luta.
+        """
+        os.makedirs(self.saida_dir, exist_ok=True)
+        # Os workers carregam o AppState do disco: grava escritas pendentes
+        from data.app_state import AppState
+        AppState.get().flush()
+        self.carregar_manifest()
+        specs = self.preparar(list(specs))
+        self._salvar_manifest()
+
+        pendentes = [s for s in specs if not self._ja_concluido(s.match_id)]
+        total = len(specs)
+        concluidas = total - len(pendentes)
+        progresso = progresso or self._progresso_padrao
+        if concluidas:
+            print(f"↻ Retomando: {concluidas}/{total} lutas já renderizadas")
+
+        for rodada in range(self.tentativas):
+            if not pendentes:
+                break
+            falhas = []
+            # spawn: cada worker sobe limpo (sem herdar Tk/SDL nem a thread de
+            # write-behind do AppState do processo pai, como no worker_pool)
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(pendentes)),
+                                     mp_context=mp.get_context("spawn")) as pool:
+                futuros = {}
+                for spec in pendentes:
+                    job = self.manifest["jobs"][spec.match_id]
+                    self._limpar_saida(job["saida"])
+                    job["status"] = "rodando"
+                    job["tentativas"] = job.get("tentativas", 0) + 1
+                    fut = pool.submit(_renderizar_job, spec.to_config(), job["saida"],
+                                      self.formato, self.fps, self.max_segundos)
+                    futuros[fut] = spec
+                self._salvar_manifest()
+
+                for fut in as_completed(futuros):
+                    spec = futuros[fut]
+                    job = self.manifest["jobs"][spec.match_id]
+                    try:
+                        info = fut.result()
+                    except Exception as e:
+                        job.update(status="falhou", erro=f"{type(e).__name__}: {e}")
+                        falhas.append(spec)
+                    else:
+                        job.update(
+                            status="ok" if info.get("codificador_ok", True) else "falhou",
+                            erro=None if info.get("codificador_ok", True) else "codificador falhou",
+                            vencedor=info.get("vencedor"),
+                            duracao=info.get("duracao"),
+                            frames=info.get("frames"),
+                            tempo_real=info.get("tempo_real"),
+                            fps_export=info.get("fps_export"),
+                            resolucao=[info.get("largura"), info.get("altura")],
+                        )
+                        if job["status"] == "ok":
+                            concluidas += 1
+                        else:
+                            falhas.append(spec)
+                    self._salvar_manifest()
+                    progresso(concluidas, total, spec.match_id, job)
+            pendentes = falhas
+            if pendentes and rodada + 1 < self.tentativas:
+                print(f"⚠️ {len(pendentes)} luta(s) falharam, tentando de novo...")
+
+        return self.manifest
+
+    def _limpar_saida(self, caminho: str):
+        """Remove saída parcial de uma tentativa anterior."""
+        if os.path.isdir(caminho):
+            shutil.rmtree(caminho, ignore_errors=True)
+        elif os.path.exists(caminho):
+            os.remove(caminho)
+
+    @staticmethod
+    def _progresso_padrao(concluidas: int, total: int, match_id: str, job: Dict):
+        if job.get("status") == "ok":
+            vencedor = job.get("vencedor") or "sem vencedor"
+            print(f"[{concluidas}/{total}] ✅ {match_id}: {vencedor} "
+                  f"({job.get('duracao', 0):.1f}s, {job.get('fps_export', 0)} fps)")
+        else:
+            print(f"[{concluidas}/{total}] ❌ {match_id}: {job.get('erro')}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Neural Fights - Render farm de lutas offscreen")
+    parser.add_argument("lutas", help="JSON com lista de {p1, p2, cenario, seed, portrait}")
+    parser.add_argument("--saida", required=True, help="Pasta de saída (frames + manifest.json)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--formato", choices=list(EXTENSOES), default="png")
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--max-segundos", type=float, default=180.0)
+    args = parser.parse_args()
+
+    with open(args.lutas, "r", encoding="utf-8") as f:
+        specs = [MatchSpec(**d) for d in json.load(f)]
+    farm = RenderFarm(args.saida, workers=args.workers, formato=args.formato,
+                      fps=args.fps, max_segundos=args.max_segundos)
+    manifest = farm.executar(specs)
+    falhas = [k for k, j in manifest["jobs"].items() if j.get("status") != "ok"]
+    print(f"\n🏁 {len(manifest['jobs']) - len(falhas)} ok, {len(falhas)} com falha — {farm.manifest_path}")
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -501,15 +501,19 @@ class TournamentRunner:
             "auto_advance": True,
         }
     
-    def setup_match_config(self, fighter1_name: str, fighter2_name: str, cenario: str = "Arena"):
-        """Configura o match_config para a próxima luta via AppState"""
-        config = {
+    @staticmethod
+    def match_config(fighter1_name: str, fighter2_name: str, cenario: str = "Arena") -> Dict:
+        """Config de uma luta no formato de match_config.json (sem gravar nada)"""
+        return {
             "p1_nome": fighter1_name,
             "p2_nome": fighter2_name,
             "cenario": cenario,
             "portrait_mode": False
         }
-        AppState.get().set_match_config(config)
+
+    def setup_match_config(self, fighter1_name: str, fighter2_name: str, cenario: str = "Arena"):
+        """Configura o match_config para a próxima luta via AppState"""
+        AppState.get().set_match_config(self.match_config(fighter1_name, fighter2_name, cenario))
         return AppState.get().match_config  # return config dict for compatibility
     
     def launch_simulation(self):
@@ -520,9 +524,98 @@ class TournamentRunner:
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         sim_path = os.path.join(base_dir, "simulation", "simulacao.py")
         
+        # O processo do simulador lê os JSON: grava o que estiver pendente
+        AppState.get().flush()
+        
         # Executa o simulador
         subprocess.Popen(["python", sim_path], cwd=base_dir)
     
+    def render_round_offscreen(self, saida_dir: str, cenario: str = "Arena", workers: int = None,
+                               aplicar_resultados: bool = False, **kwargs) -> Dict:
+        """
+        Renderiza offscreen, em paralelo, todas as lutas pendentes da rodada atual
+        (ver tournament/render_farm.py). Retorna o manifest.
+        Com aplicar_resultados, registra os vencedores no bracket na ordem das lutas.
+        """
+        from tournament.render_farm import RenderFarm, MatchSpec
+
+        rodada = self.tournament.bracket[self.tournament.current_round]
+        lutas = [m for m in rodada.matches if not m.completed
+                 and not m.fighter1_name.startswith("BYE") and not m.fighter2_name.startswith("BYE")]
+        specs = []
+        for m in lutas:
+            # Cada job leva a sua config: o match_config.json em disco não é tocado
+            config = self.match_config(m.fighter1_name, m.fighter2_name, cenario)
+            specs.append(MatchSpec(config["p1_nome"], config["p2_nome"], cenario=config["cenario"],
+                                   portrait=config.get("portrait_mode", False),
+                                   match_id=f"r{m.round_num}_m{m.match_id:03d}"))
+
+        farm = RenderFarm(saida_dir, workers=workers, **kwargs)
+        manifest = farm.executar(specs)
+
+        if aplicar_resultados:
+            with AppState.get().batch():   # um único tournament_changed no fim
+                for spec in specs:
+                    match = self.tournament.get_current_match()
+                    job = manifest["jobs"].get(spec.match_id, {})
+                    if not match or not job.get("vencedor"):
+                        break
+                    if f"r{match.round_num}_m{match.match_id:03d}" != spec.match_id:
+                        break
+                    self.tournament.record_match_result(job["vencedor"], duration=job.get("duracao", 0.0))
+        return manifest
+
+    def run_round_headless(self, pool=None, cenario: str = "Arena", workers: int = None) -> List:
+        """
+        Simula sem janela todas as lutas pendentes da rodada atual num pool de
+        workers pré-aquecidos (ver tournament/worker_pool.py) e registra os
+        vencedores no bracket. Passe um PoolLutas já iniciado para reaproveitá-lo
+        entre rodadas; sem ele, um pool temporário é criado.
+        Lutas que falham são refeitas uma vez; se falharem de novo, nada é
+        registrado a partir delas (ResultadoLuta.erro diz o motivo).
+        Retorna a lista de ResultadoLuta.
+        """
+        from tournament.worker_pool import PoolLutas
+        from tournament.render_farm import MatchSpec
+
+        rodada = self.tournament.bracket[self.tournament.current_round]
+        lutas = [m for m in rodada.matches if not m.completed
+                 and not m.fighter1_name.startswith("BYE") and not m.fighter2_name.startswith("BYE")]
+        specs = [MatchSpec(m.fighter1_name, m.fighter2_name, cenario=cenario,
+                           match_id=f"r{m.round_num}_m{m.match_id:03d}") for m in lutas]
+
+        def rodar(p) -> List:
+            resultados = p.executar(specs)
+            # Lutas com erro (worker morto, lutador sumido...) têm uma segunda chance
+            falhas = [i for i, res in enumerate(resultados) if res.erro]
+            if falhas:
+                for i, res in zip(falhas, p.executar([specs[i] for i in falhas])):
+                    resultados[i] = res
+            return resultados
+
+        if pool is None:
+            with PoolLutas(workers=workers) as temporario:
+                resultados = rodar(temporario)
+        else:
+            resultados = rodar(pool)
+
+        with AppState.get().batch():   # um único tournament_changed no fim
+            for m, res in zip(lutas, resultados):
+                if self.tournament.get_current_match() is not m:
+                    break
+                if res.erro:
+                    # Sem resultado não há vencedor: a luta fica pendente (e as
+                    # seguintes também, o bracket avança em ordem)
+                    print(f"❌ Luta {m.fighter1_name} vs {m.fighter2_name} falhou: {res.erro}")
+                    break
+                if res.vencedor:
+                    self.tournament.record_match_result(res.vencedor, duration=res.duracao, ko_type="KO")
+                else:
+                    # Tempo esgotado: decide pela vida restante
+                    vencedor = m.fighter1_name if res.vida_p1 >= res.vida_p2 else m.fighter2_name
+                    self.tournament.record_match_result(vencedor, duration=res.duracao, ko_type="Decisão")
+        return resultados
+
     def run_single_match_visual(self, match: TournamentMatch) -> bool:
         """Configura e lança uma luta visual"""
         # Configura o match
@@ -535,16 +628,12 @@ class TournamentRunner:
     
     def run_single_match(self, match: TournamentMatch) -> Dict:
         """Executa uma única luta usando simulação simplificada"""
-        from data.database import carregar_armas, carregar_personagens, carregar_arma_por_nome
+        from data.database import carregar_personagem_por_nome, carregar_arma_por_nome
         from models.constants import CLASSES_DATA
         
-        # Carrega dados dos lutadores
-        personagens = carregar_personagens()
-        armas = carregar_armas()
-        
-        # Encontra os personagens
-        p1_data = next((p for p in personagens if p.nome == match.fighter1_name), None)
-        p2_data = next((p for p in personagens if p.nome == match.fighter2_name), None)
+        # Encontra os personagens (índice do catálogo, sem reler o disco)
+        p1_data = carregar_personagem_por_nome(match.fighter1_name)
+        p2_data = carregar_personagem_por_nome(match.fighter2_name)
         
         if not p1_data or not p2_data:
             print(f"❌ Personagens não encontrados: {match.fighter1_name}, {match.fighter2_name}")
@@ -605,8 +694,8 @@ class TournamentRunner:
             return poder_total
         
         # Busca armas
-        arma1 = next((a for a in armas if a.nome == p1_data.nome_arma), None)
-        arma2 = next((a for a in armas if a.nome == p2_data.nome_arma), None)
+        arma1 = carregar_arma_por_nome(p1_data.nome_arma)
+        arma2 = carregar_arma_por_nome(p2_data.nome_arma)
         
         # Calcula poderes
         poder1 = calcular_poder(p1_data, arma1)
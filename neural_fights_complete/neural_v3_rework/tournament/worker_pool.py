@@ -0,0 +1,402 @@
+"""
+NEURAL FIGHTS - Pool de Workers Headless
+========================================
+Processos de longa duração que simulam lutas sem janela. Abrir um processo
+novo por luta repaga a cada vez os imports (pygame, IA, VFX), a leitura do
+roster e a montagem do SKILL_DB; aqui cada worker faz isso uma vez só:
+
+  - importa o motor e carrega o AppState (catálogo via snapshot binário)
+  - mantém um Simulador reaproveitado entre lutas (sons carregados uma vez)
+  - consome jobs de uma fila multiprocessing e devolve ResultadoLuta
+  - é reciclado após `lutas_por_worker` lutas, limitando o crescimento de memória
+
+O custo por luta fica só na simulação (passo fixo, sem desenhar). Um worker
+que morrer no meio de uma luta é substituído e a luta volta com `erro`.
+Alterações no roster feitas por outros processos são relidas antes de cada
+luta (AppState.check_files).
+
+Uso:
+    from tournament.worker_pool import PoolLutas
+    from tournament.render_farm import MatchSpec
+
+    with PoolLutas(workers=4) as pool:
+        resultados = pool.executar([MatchSpec("Caleb", "Bjorn", seed=1),
+                                    MatchSpec("Suki", "Viktor")])
+        r = pool.lutar("Caleb", "Bjorn", cenario="Coliseu")
+        r.vencedor, r.duracao, r.tempo_real
+
+    python -m tournament.worker_pool --lutas 20 --workers 2   # benchmark
+"""
+
+import os
+import sys
+import time
+import queue
+import random
+import multiprocessing as mp
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tournament.render_farm import MatchSpec
+
+
+@dataclass
+class ResultadoLuta:
+    """Registro compacto de uma luta simulada por um worker"""
+    job_id: int
+    p1: str
+    p2: str
+    cenario: str = "Arena"
+    vencedor: Optional[str] = None
+    duracao: float = 0.0        # segundos simulados
+    frames: int = 0
+    tempo_real: float = 0.0     # segundos de CPU gastos na simulação (sem setup)
+    vida_p1: float = 0.0        # fração da vida máxima no fim
+    vida_p2: float = 0.0
+    worker: int = 0             # pid do worker
+    erro: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.erro is None
+
+    @property
+    def ko(self) -> bool:
+        return self.vencedor is not None
+
+
+# ----------------------------------------------------------------------
+# Lado do worker
+# ----------------------------------------------------------------------
+
+class _MotorHeadless:
+    """Estado quente de um worker: motor importado, catálogo e um Simulador."""
+
+    def __init__(self, fps: int, max_segundos: float):
+        from simulation.simulacao import Simulador
+        from data.app_state import AppState
+        from core.skills import SKILL_DB
+
+        self._Simulador = Simulador
+        self.skill_db = SKILL_DB
+        self.state = AppState.get()
+        self.state.watch_files()
+        self.fps = fps
+        self.max_segundos = max_segundos
+        self.sim = None
+        self._aquecer()
+
+    def _aquecer(self):
+        """Cria o Simulador (pygame, sons, arena) antes da primeira luta chegar."""
+        nomes = self.state.character_names()
+        if len(nomes) < 2:
+            return
+        self.sim = self._Simulador({"p1_nome": nomes[0], "p2_nome": nomes[1]})
+        if self.sim.audio:
+            self.sim.audio.enabled = False     # ninguém ouve um worker
+
+    def lutar(self, job_id: int, config: Dict) -> ResultadoLuta:
+        self.state.check_files()     # roster alterado por outro processo
+        for chave in ("p1_nome", "p2_nome"):
+            if self.state.get_character(config.get(chave, "")) is None:
+                raise ValueError(f"Lutador não encontrado: {config.get(chave)!r}")
+
+        if config.get("seed") is not None:
+            random.seed(config["seed"])
+        if self.sim is None:
+            self.sim = self._Simulador(config)
+            if self.sim.audio:
+                self.sim.audio.enabled = False
+        else:
+            self.sim._config_luta = dict(config)
+            self.sim.recarregar_tudo()
+        sim = self.sim
+        if not getattr(sim, "p1", None) or not getattr(sim, "p2", None):
+            raise ValueError(f"Luta inválida: {config.get('p1_nome')} vs {config.get('p2_nome')}")
+
+        # Mesmo laço do exportador (passo fixo + slow motion), sem desenhar
+        dt = 1.0 / self.fps
+        max_frames = int(round(self.max_segundos * self.fps))
+        frames = 0
+        inicio = time.perf_counter()
+        while frames < max_frames and not sim.vencedor:
+            if sim.slow_mo_timer > 0:
+                sim.slow_mo_timer -= dt
+                if sim.slow_mo_timer <= 0:
+                    sim.time_scale = 1.0
+            sim.update(dt * sim.time_scale)
+            frames += 1
+
+        return ResultadoLuta(
+            job_id=job_id,
+            p1=sim.p1.dados.nome,
+            p2=sim.p2.dados.nome,
+            cenario=config.get("cenario", "Arena"),
+            vencedor=sim.vencedor,
+            duracao=round(frames * dt, 3),
+            frames=frames,
+            tempo_real=round(time.perf_counter() - inicio, 3),
+            vida_p1=round(max(0.0, sim.p1.vida) / sim.p1.vida_max, 3) if sim.p1.vida_max else 0.0,
+            vida_p2=round(max(0.0, sim.p2.vida) / sim.p2.vida_max, 3) if sim.p2.vida_max else 0.0,
+            worker=os.getpid(),
+        )
+
+
+def _loop_worker(jobs, resultados, fps: int, max_segundos: float, max_lutas: int, silencioso: bool):
+    """Executado no processo do worker até receber None ou atingir max_lutas."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    if silencioso:
+        # A simulação imprime cada skill/som; num worker isso é só custo
+        sys.stdout = open(os.devnull, "w")
+    pid = os.getpid()
+
+    motor = _MotorHeadless(fps, max_segundos)
+    resultados.put(("pronto", pid, None))
+
+    lutas = 0
+    while lutas < max_lutas:
+        item = jobs.get()
+        if item is None:
+            break
+        job_id, config = item
+        resultados.put(("inicio", pid, job_id))
+        try:
+            res = motor.lutar(job_id, config)
+        except Exception as e:
+            res = ResultadoLuta(job_id, config.get("p1_nome", ""), config.get("p2_nome", ""),
+                                config.get("cenario", "Arena"), worker=pid,
+                                erro=f"{type(e).__name__}: {e}")
+        resultados.put(("resultado", pid, res))
+        lutas += 1
+    resultados.put(("saiu", pid, lutas))
+
+
+# ----------------------------------------------------------------------
+# Lado do processo principal
+# ----------------------------------------------------------------------
+
+class PoolLutas:
+    """Pool de workers headless pré-aquecidos, com reciclagem e substituição."""
+
+    def __init__(self, workers: int = None, lutas_por_worker: int = 100, fps: int = 60,
+                 max_segundos: float = 120.0, silencioso: bool = True, contexto: str = "spawn"):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.lutas_por_worker = max(1, lutas_por_worker)
+        self.fps = fps
+        self.max_segundos = max_segundos
+        self.silencioso = silencioso
+        # spawn: interpretador limpo, sem herdar Tk/SDL/threads do processo pai
+        self._ctx = mp.get_context(contexto)
+        self._jobs = None
+        self._resultados = None
+        self._procs: Dict[int, mp.Process] = {}
+        self._em_andamento: Dict[int, int] = {}        # pid → job_id
+        self._pendentes: Dict[int, MatchSpec] = {}     # job_id → spec ainda sem resultado
+        self._prontos: Dict[int, ResultadoLuta] = {}
+        self._proximo_id = 0
+        self._aquecidos = 0
+        self._encerrando = False
+        self.estatisticas = {"lutas": 0, "falhas": 0, "reciclados": 0, "mortos": 0, "iniciados": 0}
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def iniciar(self, aguardar: bool = True, timeout: float = 120.0) -> "PoolLutas":
+        """Sobe os workers; com aguardar, só retorna quando todos estão aquecidos."""
+        if self._procs:
+            return self
+        # Os workers leem o roster do disco: grava escritas pendentes
+        from data.app_state import AppState
+        AppState.get().flush()
+
+        self._encerrando = False
+        self._jobs = self._ctx.Queue()
+        self._resultados = self._ctx.Queue()
+        for _ in range(self.workers):
+            self._novo_worker()
+        if aguardar:
+            limite = time.monotonic() + timeout
+            while self._aquecidos < self.workers and time.monotonic() < limite:
+                self._processar(0.5)
+        return self
+
+    def encerrar(self, timeout: float = 10.0):
+        if not self._procs and self._jobs is None:
+            return
+        self._encerrando = True
+        for _ in list(self._procs):
+            self._jobs.put(None)
+        limite = time.monotonic() + timeout
+        for proc in list(self._procs.values()):
+            proc.join(max(0.0, limite - time.monotonic()))
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(1.0)
+        self._procs.clear()
+        self._em_andamento.clear()
+        for fila in (self._jobs, self._resultados):
+            fila.cancel_join_thread()
+            fila.close()
+        self._jobs = self._resultados = None
+
+    def __enter__(self) -> "PoolLutas":
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.encerrar()
+
+    def _novo_worker(self):
+        proc = self._ctx.Process(
+            target=_loop_worker,
+            args=(self._jobs, self._resultados, self.fps, self.max_segundos,
+                  self.lutas_por_worker, self.silencioso),
+            daemon=True,
+        )
+        proc.start()
+        self._procs[proc.pid] = proc
+        self.estatisticas["iniciados"] += 1
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def submeter(self, spec: MatchSpec) -> int:
+        """Enfileira uma luta; retorna o job_id para resultado()."""
+        if self._jobs is None:
+            self.iniciar(aguardar=False)
+        job_id = self._proximo_id
+        self._proximo_id += 1
+        self._pendentes[job_id] = spec
+        self._jobs.put((job_id, spec.to_config()))
+        return job_id
+
+    def resultado(self, job_id: int, timeout: float = None) -> ResultadoLuta:
+        """Bloqueia até o resultado do job chegar (TimeoutError após timeout)."""
+        limite = None if timeout is None else time.monotonic() + timeout
+        while job_id not in self._prontos:
+            if limite is not None and time.monotonic() >= limite:
+                raise TimeoutError(f"Job {job_id} sem resultado após {timeout}s")
+            self._processar(0.5)
+        return self._prontos.pop(job_id)
+
+    def executar(self, specs: List[MatchSpec],
+                 progresso: Optional[Callable[[int, int, ResultadoLuta], None]] = None) -> List[ResultadoLuta]:
+        """Roda todas as lutas; resultados na ordem de specs."""
+        ids = [self.submeter(spec) for spec in specs]
+        restantes = set(ids)
+        while restantes:
+            for job_id in [j for j in restantes if j in self._prontos]:
+                restantes.discard(job_id)
+                if progresso:
+                    progresso(len(ids) - len(restantes), len(ids), self._prontos[job_id])
+            if restantes:
+                self._processar(0.5)
+        return [self._prontos.pop(job_id) for job_id in ids]
+
+    def lutar(self, p1: str, p2: str, cenario: str = "Arena", seed: int = None,
+              timeout: float = None) -> ResultadoLuta:
+        """Uma luta, bloqueante."""
+        return self.resultado(self.submeter(MatchSpec(p1, p2, cenario=cenario, seed=seed)), timeout)
+
+    # ------------------------------------------------------------------
+    # Mensagens dos workers
+    # ------------------------------------------------------------------
+
+    def _processar(self, timeout: float):
+        try:
+            msg = self._resultados.get(timeout=timeout)
+        except queue.Empty:
+            self._verificar_workers()
+            return
+        self._tratar(*msg)
+
+    def _tratar(self, tipo: str, pid: int, dado):
+        if tipo == "pronto":
+            self._aquecidos += 1
+        elif tipo == "inicio":
+            self._em_andamento[pid] = dado
+        elif tipo == "resultado":
+            self._em_andamento.pop(pid, None)
+            if self._pendentes.pop(dado.job_id, None) is not None:
+                self._prontos[dado.job_id] = dado
+                self.estatisticas["lutas"] += 1
+                if not dado.ok:
+                    self.estatisticas["falhas"] += 1
+        elif tipo == "saiu":
+            proc = self._procs.pop(pid, None)
+            if proc is not None:
+                proc.join(5.0)
+                self._aquecidos -= 1
+                if not self._encerrando:
+                    self.estatisticas["reciclados"] += 1
+                    self._novo_worker()
+
+    def _verificar_workers(self):
+        """Substitui workers que morreram sem avisar e falha a luta que estavam rodando."""
+        mortos = [pid for pid, proc in self._procs.items() if not proc.is_alive()]
+        if not mortos:
+            return
+        # Mensagens enviadas antes de morrer podem ainda estar na fila
+        while True:
+            try:
+                self._tratar(*self._resultados.get_nowait())
+            except queue.Empty:
+                break
+        for pid in mortos:
+            proc = self._procs.pop(pid, None)
+            if proc is None:
+                continue                 # saiu normalmente (reciclado)
+            self._aquecidos -= 1
+            self.estatisticas["mortos"] += 1
+            job_id = self._em_andamento.pop(pid, None)
+            spec = self._pendentes.pop(job_id, None) if job_id is not None else None
+            if spec is not None:
+                self._prontos[job_id] = ResultadoLuta(
+                    job_id, spec.p1, spec.p2, spec.cenario, worker=pid,
+                    erro=f"worker morreu (exit {proc.exitcode})")
+                self.estatisticas["lutas"] += 1
+                self.estatisticas["falhas"] += 1
+            if not self._encerrando:
+                self._novo_worker()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Neural Fights - pool de lutas headless")
+    parser.add_argument("--lutas", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--reciclar", type=int, default=100, help="Lutas por worker antes de reciclar")
+    parser.add_argument("--max-segundos", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from data.app_state import AppState
+    nomes = AppState.get().character_names()
+    if len(nomes) < 2:
+        sys.exit("Roster com menos de 2 personagens")
+    rng = random.Random(args.seed)
+    specs = [MatchSpec(*rng.sample(nomes, 2), seed=args.seed + i) for i in range(args.lutas)]
+
+    t0 = time.perf_counter()
+    with PoolLutas(workers=args.workers, lutas_por_worker=args.reciclar,
+                   max_segundos=args.max_segundos) as pool:
+        aquecimento = time.perf_counter() - t0
+        t1 = time.perf_counter()
+        resultados = pool.executar(specs, progresso=lambda n, total, r: print(
+            f"[{n}/{total}] {r.p1} vs {r.p2}: {r.vencedor or r.erro or 'sem vencedor'} "
+            f"({r.duracao:.1f}s simulados em {r.tempo_real:.2f}s)"))
+        parede = time.perf_counter() - t1
+        stats = dict(pool.estatisticas)
+
+    simulado = sum(r.tempo_real for r in resultados)
+    overhead = (parede * pool.workers - simulado) / max(1, len(resultados))
+    print(f"\nAquecimento: {aquecimento:.2f}s ({pool.workers} workers)")
+    print(f"{len(resultados)} lutas em {parede:.2f}s; simulação {simulado:.2f}s; "
+          f"overhead médio por luta ≈ {overhead * 1000:.0f} ms")
+    print(f"Estatísticas: {stats}")
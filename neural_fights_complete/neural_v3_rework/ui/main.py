@@ -7,7 +7,7 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from data.app_state import AppState
+from data.app_state import AppState, ChangeSet
 import os as _os
 import sys as _sys
 
@@ -17,18 +17,30 @@ def _setup_worldmap_hook():
     Fires on every characters_changed / gods_changed event instead of only at import time.
     Replaces the _init_worldmap_hook() call in database.py.
     """
+    sync_cache = {}
+
     def _worldmap_sync(data=None):
         try:
-            base = _os.path.dirname(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
-            wm_path = _os.path.join(base, "world_map_module", "world_map")
-            if wm_path not in _sys.path:
-                _sys.path.insert(0, wm_path)
-            from map_god_registry import WorldStateSync
-            sync = WorldStateSync(_os.path.join(base, "world_map_module", "data"))
-            for p in AppState.get().characters:
-                if p.god_id:
-                    sync.on_character_update(p.nome, p.god_id)
-            sync.reload()
+            sync = sync_cache.get("sync")
+            if sync is None:
+                base = _os.path.dirname(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
+                wm_path = _os.path.join(base, "world_map_module", "world_map")
+                if wm_path not in _sys.path:
+                    _sys.path.insert(0, wm_path)
+                from map_god_registry import WorldStateSync
+                sync = sync_cache["sync"] = WorldStateSync(_os.path.join(base, "world_map_module", "data"))
+            else:
+                sync.reload()       # relê só gods/world_state alterados por fora
+            # characters_changed traz o diff: só sincroniza quem mudou
+            if isinstance(data, ChangeSet) and not data.reset:
+                nomes = data.added | data.updated
+                alvos = [p for p in data if p.nome in nomes]
+            else:
+                alvos = AppState.get().characters
+            with sync.transacao():
+                for p in alvos:
+                    if p.god_id:
+                        sync.on_character_update(p.nome, p.god_id)
         except Exception:
             pass  # WorldMap module absent — silent skip
 
@@ -79,6 +91,18 @@ class SistemaApp(tk.Tk):
         self.show_frame("MenuPrincipal")
         self.tournament_window = None
 
+        # ── Hot reload: files written by the generator / scripts / server ─────
+        self._state.watch_files()
+        self.after(1000, self._verificar_arquivos)
+
+    def _verificar_arquivos(self):
+        """Reload only the collections another process changed on disk."""
+        try:
+            self._state.check_files()
+        except Exception as e:
+            print(f"[AppState] Hot reload falhou: {e}")
+        self.after(1000, self._verificar_arquivos)
+
     # ── Properties that mirror AppState (backward compat for old views) ───────
 
     @property
@@ -162,6 +186,7 @@ class MenuPrincipal(tk.Frame):
             "world_map_module", "run_worldmap.py",
         )
         if os.path.exists(worldmap_script):
+            AppState.get().flush()      # o World Map lê os JSON do disco
             subprocess.Popen([sys.executable, worldmap_script])
         else:
             messagebox.showwarning(
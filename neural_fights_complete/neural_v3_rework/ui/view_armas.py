@@ -53,8 +53,9 @@ class TelaArmas(tk.Frame):
         # Subscribe: refresh when characters change (weapon validation needs them)
         AppState.get().subscribe("characters_changed", self._on_chars_changed)
 
-    def _on_chars_changed(self, _data=None):
-        if hasattr(self, "atualizar_dados"):
+    def _on_chars_changed(self, change=None):
+        # A lista de armas não depende dos personagens: só recarrega num reset (reload_all)
+        if getattr(change, "reset", True) and hasattr(self, "atualizar_dados"):
             self.atualizar_dados()
 
     def setup_ui(self):
@@ -52,9 +52,14 @@ class TelaPersonagens(tk.Frame):
         # Subscribe: refresh weapon dropdown when weapons change
         AppState.get().subscribe("weapons_changed", self._on_weapons_changed)
 
-    def _on_weapons_changed(self, _data=None):
-        if hasattr(self, "atualizar_dados"):
-            self.atualizar_dados()
+    def _on_weapons_changed(self, change=None):
+        # A árvore mostra só o nome da arma de cada personagem; o que depende da
+        # lista de armas é o passo de equipamento, redesenhado se estiver aberto
+        if getattr(change, "reset", True):
+            if hasattr(self, "atualizar_dados"):
+                self.atualizar_dados()
+        elif getattr(self, "passo_atual", None) == 5:
+            self.mostrar_passo(5)
 
     def setup_ui(self):
         """Configura a interface principal"""
@@ -9,7 +9,6 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from simulation import simulacao
 from data.app_state import AppState
 from ui.theme import (
     COR_BG, COR_BG_SECUNDARIO, COR_HEADER, COR_ACCENT, COR_SUCCESS,
@@ -27,16 +26,71 @@ class TelaLuta(tk.Frame):
         
         self.personagem_p1 = None
         self.personagem_p2 = None
+        self._nomes_lista = []      # nome de cada linha das listboxes
         
         self.setup_ui()
 
-        # Subscribe: refresh fighter list when chars or weapons change
-        AppState.get().subscribe("characters_changed", self._on_data_changed)
-        AppState.get().subscribe("weapons_changed",    self._on_data_changed)
+        # Subscribe: atualiza a lista / previews com o diff de cada mudança
+        AppState.get().subscribe("characters_changed", self._on_chars_changed)
+        AppState.get().subscribe("weapons_changed",    self._on_weapons_changed)
 
-    def _on_data_changed(self, _data=None):
-        if hasattr(self, "atualizar_dados"):
+    def _on_chars_changed(self, change=None):
+        """Aplica só o que mudou; recarrega tudo em reset ou se a lista divergir."""
+        if change is None or getattr(change, "reset", True) or not self._nomes_lista:
             self.atualizar_dados()
+            return
+        personagens = list(change)
+        por_nome = {p.nome: p for p in personagens}
+
+        for i in reversed(range(len(self._nomes_lista))):
+            if self._nomes_lista[i] in change.removed:
+                self.listbox_p1.delete(i)
+                self.listbox_p2.delete(i)
+                del self._nomes_lista[i]
+        for i, nome in enumerate(self._nomes_lista):
+            if nome in change.updated and nome in por_nome:
+                texto = self._texto_item(por_nome[nome])
+                for lb in (self.listbox_p1, self.listbox_p2):
+                    selecionado = i in lb.curselection()
+                    lb.delete(i)
+                    lb.insert(i, texto)
+                    if selecionado:
+                        lb.selection_set(i)
+        for p in personagens:
+            if p.nome in change.added and p.nome not in self._nomes_lista:
+                self.listbox_p1.insert(tk.END, self._texto_item(p))
+                self.listbox_p2.insert(tk.END, self._texto_item(p))
+                self._nomes_lista.append(p.nome)
+
+        if self._nomes_lista != [p.nome for p in personagens]:
+            self.atualizar_dados()
+            return
+
+        # Mantém as seleções apontando para os objetos atuais
+        mudou = change.updated | change.removed
+        for attr, canvas, lbl_nome, lbl_stats, cor in (
+                ("personagem_p1", self.canvas_p1, self.lbl_nome_p1, self.lbl_stats_p1, COR_P1),
+                ("personagem_p2", self.canvas_p2, self.lbl_nome_p2, self.lbl_stats_p2, COR_P2)):
+            atual = getattr(self, attr)
+            if atual is not None and atual.nome in mudou:
+                novo = por_nome.get(atual.nome)
+                setattr(self, attr, novo)
+                self._desenhar_preview(novo, canvas, lbl_nome, lbl_stats, cor)
+        self._atualizar_botao()
+
+    def _on_weapons_changed(self, change=None):
+        """A lista não mostra armas: só redesenha os previews afetados."""
+        nomes = None if change is None or getattr(change, "reset", True) else \
+            change.added | change.updated | change.removed
+        for p, canvas, lbl_nome, lbl_stats, cor in (
+                (self.personagem_p1, self.canvas_p1, self.lbl_nome_p1, self.lbl_stats_p1, COR_P1),
+                (self.personagem_p2, self.canvas_p2, self.lbl_nome_p2, self.lbl_stats_p2, COR_P2)):
+            if p is not None and (nomes is None or p.nome_arma in nomes):
+                self._desenhar_preview(p, canvas, lbl_nome, lbl_stats, cor)
+
+    @staticmethod
+    def _texto_item(p):
+        return f"{p.nome} ({getattr(p, 'classe', 'Guerreiro')})"
 
     def setup_ui(self):
         """Configura a interface"""
@@ -233,6 +287,7 @@ class TelaLuta(tk.Frame):
         self.personagem_p2 = None
         
         personagens = self.controller.lista_personagens
+        self._nomes_lista = [p.nome for p in personagens]
         
         if not personagens:
             self.listbox_p1.insert(tk.END, "(Nenhum personagem)")
@@ -242,8 +297,7 @@ class TelaLuta(tk.Frame):
         
         # Popula listas
         for p in personagens:
-            classe = getattr(p, 'classe', 'Guerreiro')
-            texto = f"{p.nome} ({classe})"
+            texto = self._texto_item(p)
             self.listbox_p1.insert(tk.END, texto)
             self.listbox_p2.insert(tk.END, texto)
         
@@ -358,6 +412,7 @@ class TelaLuta(tk.Frame):
         
         try:
             AppState.get().set_match_config(match_data)
+            AppState.get().flush()      # o simulador lê os JSON do disco
         except Exception as e:
             messagebox.showerror("Erro", f"Falha ao salvar config: {e}")
             return
@@ -365,6 +420,8 @@ class TelaLuta(tk.Frame):
         self.controller.withdraw()
         
         try:
+            # Import tardio: pygame + VFX + áudio só carregam ao abrir a luta
+            from simulation import simulacao
             sim = simulacao.Simulador()
             sim.run()
         except Exception as e:
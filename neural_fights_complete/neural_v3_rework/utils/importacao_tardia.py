@@ -0,0 +1,53 @@
+"""
+NEURAL FIGHTS - Importação Tardia de Pacotes
+Re-exportações sob demanda (PEP 562) para os __init__ dos pacotes.
+
+`import core.physics` executa core/__init__.py; se ele importar tudo de
+uma vez, um worker headless acaba carregando pygame (via core.arena) e
+numpy só para calcular um ângulo. Com exportacoes_tardias o submódulo só
+é importado quando o nome é acessado pela primeira vez:
+
+    # core/__init__.py
+    __getattr__, __dir__ = exportacoes_tardias(__name__, {
+        "Arena": ".arena",
+        "Lutador": ".entities",
+    })
+
+    from core import Arena      # importa core.arena agora, não antes
+
+O valor resolvido é gravado no módulo, então o custo é pago uma vez só.
+`from pacote import *` continua funcionando via __all__.
+"""
+
+import importlib
+import sys
+
+
+def exportacoes_tardias(pacote: str, origem: dict, modulos_estrela: tuple = ()):
+    """
+    Retorna (__getattr__, __dir__) para o módulo `pacote`.
+
+    origem: {nome_exportado: submódulo}, relativo (".arena") ou absoluto.
+    modulos_estrela: submódulos consultados em ordem para nomes fora de
+    `origem` (equivale a `from submodulo import *`; o primeiro que tiver
+    o nome vence).
+    """
+    def __getattr__(nome):
+        sub = origem.get(nome)
+        if sub is not None:
+            valor = getattr(importlib.import_module(sub, pacote), nome)
+        else:
+            for sub in modulos_estrela:
+                modulo = importlib.import_module(sub, pacote)
+                if not nome.startswith("_") and hasattr(modulo, nome):
+                    valor = getattr(modulo, nome)
+                    break
+            else:
+                raise AttributeError(f"module {pacote!r} has no attribute {nome!r}")
+        setattr(sys.modules[pacote], nome, valor)
+        return valor
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[pacote])) | set(origem))
+
+    return __getattr__, __dir__
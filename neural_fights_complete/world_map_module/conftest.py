@@ -0,0 +1,44 @@
+"""
+Shared pytest fixtures. Tests that write world data run against a copy of
+data/ in tmp_path; server globals are swapped with monkeypatch and restored
+on teardown, so nothing leaks into the next test or touches the real files.
+"""
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import server
+
+WORLD_FILES = ("world_state.json", "gods.json", "world_regions.json")
+
+
+def _read(d, name):
+    with open(os.path.join(d, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def world(tmp_path, monkeypatch):
+    """
+    Copy of data/ with two extra test gods; server.DATA_DIR and a fresh
+    ClaimWriter point at it. Yields (data_dir, god_ids, zone_ids).
+    """
+    d = str(tmp_path)
+    for name in WORLD_FILES:
+        shutil.copy(os.path.join(server.BASE_DIR, "data", name), d)
+    sync = server.WorldStateSync(d)
+    with sync.transacao():
+        for i, nature in enumerate(("fire", "ice")):
+            sync.create_god(f"Test God {i}", "test", nature)
+    monkeypatch.setattr(server, "DATA_DIR", d)
+    monkeypatch.setattr(server, "claims", server.ClaimWriter())
+    server.payloads.invalidate()
+    gods = [g["god_id"] for g in _read(d, "gods.json")["gods"]]
+    zones = [z["zone_id"] for r in _read(d, "world_regions.json")["regions"] for z in r["zones"]]
+    yield d, gods, zones
+    server.payloads.invalidate()
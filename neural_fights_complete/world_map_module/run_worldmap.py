@@ -6,6 +6,10 @@ Usage:
   python run_worldmap.py
   python run_worldmap.py --port 8080
   python run_worldmap.py --no-browser   (server only, open manually)
+  python run_worldmap.py --benchmark    (scale benchmark on generated worlds, then exit)
+  python run_worldmap.py --benchmark --zones 1000,5000 --frames 60 --json bench.json
+  python run_worldmap.py --snapshot data/tiles --levels 4   (headless PNG tile pyramid, then exit)
+  python run_worldmap.py --snapshot poster --width 16384    (one poster, written as tiles)
 """
 import sys
 import os
@@ -21,9 +25,47 @@ def parse_args():
     p = argparse.ArgumentParser(description="Neural Fights — 3D Globe Map Server")
     p.add_argument("--port",       type=int, default=7331, help="Server port (default: 7331)")
     p.add_argument("--no-browser", action="store_true",   help="Start server without opening browser")
+    p.add_argument("--benchmark",  action="store_true",
+                   help="Run the world map scale benchmark (generated worlds) and exit")
+    p.add_argument("--zones",      default="1000,5000,20000,50000",
+                   help="Benchmark world sizes, comma separated")
+    p.add_argument("--frames",     type=int, default=120, help="Frames per render measurement")
+    p.add_argument("--json",       dest="json_out", help="Also write benchmark results as JSON")
+    p.add_argument("--snapshot",   metavar="DIR",
+                   help="Render the current world headlessly to PNG tiles + manifest.json in DIR and exit")
+    p.add_argument("--width",      type=int, help="Snapshot as a single poster this many px wide")
+    p.add_argument("--levels",     type=int, help="Snapshot tile pyramid levels (default: 3)")
+    p.add_argument("--tile",       type=int, default=1024, help="Snapshot tile size in px")
+    p.add_argument("--no-labels",  action="store_true", help="Snapshot without zone labels")
     return p.parse_args()
 
 
+def run_benchmark(args):
+    """Generate worlds of each size and measure load, hit-test, borders, save and render FPS."""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "world_map"))
+    from map_benchmark import main as benchmark_main
+
+    argv = ["--zonas", args.zones, "--frames", str(args.frames)]
+    if args.json_out:
+        argv += ["--json", args.json_out]
+    benchmark_main(argv)
+
+
+def run_snapshot(args):
+    """Render ownership, contested borders and seals from data/ to PNG tiles, without a window."""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "world_map"))
+    from map_snapshot import main as snapshot_main
+
+    argv = ["--saida", args.snapshot, "--tile", str(args.tile)]
+    if args.width:
+        argv += ["--largura", str(args.width)]
+    elif args.levels:
+        argv += ["--niveis", str(args.levels)]
+    if args.no_labels:
+        argv.append("--sem-labels")
+    snapshot_main(argv)
+
+
 def wait_for_server(port, timeout=12):
     """Poll until the Flask server is accepting connections."""
     deadline = time.time() + timeout
@@ -61,9 +103,8 @@ def install_deps(missing):
 
 
 def run_server(port):
-    """Run the Flask server in the current thread."""
-    # Patch the port into server.py at runtime
-    import importlib, sys as _sys
+    """Run the Flask server (server.py) in the current thread."""
+    import sys as _sys
     server_dir = os.path.dirname(os.path.abspath(__file__))
     if server_dir not in _sys.path:
         _sys.path.insert(0, server_dir)
@@ -71,73 +112,8 @@ def run_server(port):
     # Patch port via env so server.py can pick it up
     os.environ["WORLDMAP_PORT"] = str(port)
 
-    from flask import Flask, jsonify, send_from_directory
-    from flask_cors import CORS
-    import json
-
-    app = Flask(__name__, static_folder=server_dir)
-    CORS(app)
-
-    DATA_DIR = os.path.join(server_dir, "data")
-
-    def load_json(filename):
-        try:
-            with open(os.path.join(DATA_DIR, filename), "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"[Server] Load error {filename}: {e}")
-            return {}
-
-    @app.route("/")
-    @app.route("/globe.html")
-    def globe():
-        return send_from_directory(server_dir, "globe.html")
-
-    @app.route("/api/state")
-    def api_state():
-        return jsonify(load_json("world_state.json"))
-
-    @app.route("/api/gods")
-    def api_gods():
-        return jsonify(load_json("gods.json"))
-
-    @app.route("/api/regions")
-    def api_regions():
-        raw = load_json("world_regions.json")
-        result = {r["region_id"]: r for r in raw.get("regions", [])}
-        return jsonify(result)
-
-    @app.route("/api/full")
-    def api_full():
-        return jsonify({
-            "state":   load_json("world_state.json"),
-            "gods":    load_json("gods.json"),
-            "regions": load_json("world_regions.json"),
-        })
-
-    @app.route("/api/claim/<zone_id>/<god_id>", methods=["POST"])
-    def claim_zone(zone_id, god_id):
-        try:
-            state_path = os.path.join(DATA_DIR, "world_state.json")
-            gods_path  = os.path.join(DATA_DIR, "gods.json")
-
-            with open(state_path, "r", encoding="utf-8") as f: state = json.load(f)
-            with open(gods_path,  "r", encoding="utf-8") as f: gods  = json.load(f)
-
-            state["zone_ownership"][zone_id] = god_id
-            for god in gods.get("gods", []):
-                if god["god_id"] == god_id:
-                    if zone_id not in god.get("owned_zones", []):
-                        god.setdefault("owned_zones", []).append(zone_id)
-                else:
-                    if zone_id in god.get("owned_zones", []):
-                        god["owned_zones"].remove(zone_id)
-
-            with open(state_path, "w", encoding="utf-8") as f: json.dump(state, f, indent=2)
-            with open(gods_path,  "w", encoding="utf-8") as f: json.dump(gods,  f, indent=2)
-            return jsonify({"ok": True})
-        except Exception as e:
-            return jsonify({"ok": False, "error": str(e)}), 500
+    # One app for both entry points: the payload cache lives in server.py
+    from server import app
 
     import logging
     log = logging.getLogger('werkzeug')
@@ -148,6 +124,12 @@ def run_server(port):
 
 def main():
     args = parse_args()
+    if args.benchmark:
+        run_benchmark(args)
+        return
+    if args.snapshot:
+        run_snapshot(args)
+        return
     port = args.port
 
     print("=" * 56)
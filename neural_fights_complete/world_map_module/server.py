@@ -2,10 +2,37 @@
 NEURAL FIGHTS — 3D Globe API Server
 Serves world_state.json, gods.json, and world_regions.json to the Three.js globe.
 Runs on localhost:7331. Launched by run_worldmap.py.
+
+Read endpoints are served from PayloadCache: each payload is serialised
+once per change of its source files (mtime/size) and answered with an
+ETag, so polling clients that send If-None-Match get a bodyless 304.
+
+/api/events streams ownership / contested-border deltas (server-sent
+events) whenever world_state.json changes, through the claim endpoint or
+any other writer. Each delta has a sequence number; reconnecting clients
+resume from Last-Event-ID.
+
+Claims go through ClaimWriter, the only thread in this process that writes
+world_state.json / gods.json: requests queue claims and the writer applies
+everything queued in one WorldStateSync transaction (one atomic write per
+file), so bursts of claims neither race nor rewrite the files per claim.
+Other processes (run_worldmap.py, the neural_v3_rework database hook) write
+the same files too; the writer reloads them before each batch, and every
+write goes through its own temp file, so nobody replaces a half-written one.
+
+/tiles/ serves the pre-rendered PNG tile pyramid written to data/tiles by
+`python run_worldmap.py --snapshot data/tiles` (see manifest.json there).
 """
+import gzip
+import hashlib
 import json
 import os
-from flask import Flask, jsonify, send_from_directory
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from flask import Flask, Response, jsonify, request, send_from_directory, stream_with_context
 from flask_cors import CORS
 
 app = Flask(__name__, static_folder=os.path.dirname(os.path.abspath(__file__)))
@@ -13,16 +40,250 @@ CORS(app)
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TILES_DIR = os.path.join(DATA_DIR, "tiles")
+
+sys.path.insert(0, os.path.join(BASE_DIR, "world_map"))
+from map_god_registry import WorldStateSync
+
+
+# ── Payload Cache ─────────────────────────────────────────────────
+
+GZIP_MIN_BYTES = 1024      # Smaller bodies are not worth compressing
+
+
+def _signature(filenames):
+    """(mtime_ns, size) of each source file; None marks a missing file."""
+    sig = []
+    for name in filenames:
+        try:
+            st = os.stat(os.path.join(DATA_DIR, name))
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
 
+class Payload:
+    """A pre-serialised response body with its ETag and (lazy) gzip form."""
+    __slots__ = ("signature", "body", "etag", "_gzipped")
 
-def load_json(filename):
+    def __init__(self, signature, body: bytes):
+        self.signature = signature
+        self.body      = body
+        self.etag      = hashlib.blake2b(body, digest_size=12).hexdigest()
+        self._gzipped  = None
+
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6)
+        return self._gzipped
+
+
+class PayloadCache:
+    """
+    JSON payloads keyed by endpoint, rebuilt only when a source file's
+    mtime/size changes. build() receives the parsed source files in order.
+    If a source fails to parse (e.g. caught mid-write by another process)
+    the last good payload is kept.
+    """
+
+    def __init__(self):
+        self._payloads: dict[str, Payload] = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def get(self, key: str, sources: tuple, build) -> Payload:
+        sig = _signature(sources)
+        cached = self._payloads.get(key)
+        if cached is not None and cached.signature == sig:
+            return cached
+        with self._lock:
+            cached = self._payloads.get(key)
+            if cached is not None and cached.signature == sig:
+                return cached
+            try:
+                parsed = [_load_strict(name) for name in sources]
+            except (OSError, ValueError) as e:
+                print(f"[Server] Could not load {key} sources: {e}")
+                if cached is not None:
+                    return cached
+                parsed = [{} for _ in sources]
+                sig = None                       # retry on the next request
+            body = json.dumps(build(*parsed), ensure_ascii=False,
+                              separators=(",", ":")).encode("utf-8")
+            payload = Payload(sig, body)
+            self._payloads[key] = payload
+            self.builds += 1
+            return payload
+
+    def invalidate(self):
+        with self._lock:
+            self._payloads.clear()
+
+
+def _load_strict(filename):
     path = os.path.join(DATA_DIR, filename)
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[Server] Could not load {filename}: {e}")
+    if not os.path.exists(path):
         return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+payloads = PayloadCache()
+
+
+def cached_json(key: str, sources: tuple, build=lambda data: data):
+    """Response for a cached payload: 304 on a matching ETag, gzip when accepted."""
+    payload = payloads.get(key, sources, build)
+    if request.if_none_match.contains(payload.etag):
+        resp = Response(status=304)
+    elif (len(payload.body) >= GZIP_MIN_BYTES
+          and "gzip" in request.accept_encodings):
+        resp = Response(payload.gzipped(), mimetype="application/json")
+        resp.headers["Content-Encoding"] = "gzip"
+    else:
+        resp = Response(payload.body, mimetype="application/json")
+    resp.set_etag(payload.etag)
+    resp.headers["Cache-Control"] = "no-cache"    # always revalidate with the ETag
+    resp.headers["Vary"] = "Accept-Encoding"
+    return resp
+
+
+def _regions_by_id(raw):
+    # Reshape from list of regions to dict keyed by region_id
+    return {region["region_id"]: region for region in raw.get("regions", [])}
+
+
+# ── Live Updates (SSE) ────────────────────────────────────────────
+
+EVENTS_POLL_S      = 0.5     # world_state.json stat interval of the watcher thread
+EVENTS_HEARTBEAT_S = 15      # keep-alive comment so proxies don't drop idle streams
+EVENTS_BACKLOG     = 512     # deltas kept for resuming clients
+
+
+def _border_key(border):
+    return f"{border.get('zone_a')}|{border.get('zone_b')}"
+
+
+class WorldEvents:
+    """
+    Sequence-numbered deltas of world_state.json (+ a flag when gods.json
+    changed). check() diffs the files against the last snapshot and is
+    called by the watcher thread and directly after our own writes.
+
+    Delta: {"seq": n, "own": {zone: god|null}, "cadd": [border, ...],
+            "cdel": ["zone_a|zone_b", ...], "seals": {zone: seal}, "gods": 1}
+    Only the keys that changed are present; a border whose gods changed is
+    in both cdel and cadd.
+    """
+
+    def __init__(self, backlog: int = EVENTS_BACKLOG):
+        self.seq = 0
+        self._log: deque = deque(maxlen=backlog)     # (seq, serialised delta)
+        self._cond = threading.Condition()
+        self._state_sig = self._gods_sig = None
+        self._ownership: dict = {}
+        self._contested: dict = {}                   # border key → border
+        self._seals: dict = {}
+        self._watcher = None
+
+    def _snapshot(self, state):
+        self._ownership = dict(state.get("zone_ownership", {}))
+        self._contested = {_border_key(b): b for b in state.get("contested_borders", [])}
+        self._seals = dict(state.get("ancient_seals", {}))
+
+    def start(self):
+        """Takes the baseline snapshot and starts the watcher thread (once)."""
+        with self._cond:
+            if self._watcher is not None:
+                return
+            try:
+                self._snapshot(_load_strict("world_state.json"))
+                self._state_sig = _signature(("world_state.json",))
+            except (OSError, ValueError):
+                pass                                 # first check() publishes everything
+            self._gods_sig = _signature(("gods.json",))
+            self._watcher = threading.Thread(target=self._watch, daemon=True)
+            self._watcher.start()
+
+    def _watch(self):
+        while True:
+            time.sleep(EVENTS_POLL_S)
+            self.check()
+
+    def check(self) -> bool:
+        """Publishes a delta if the files changed since the last snapshot."""
+        with self._cond:
+            if self._watcher is None:
+                return False                         # nobody subscribed yet: no baseline
+            state_sig = _signature(("world_state.json",))
+            gods_sig  = _signature(("gods.json",))
+            if state_sig == self._state_sig and gods_sig == self._gods_sig:
+                return False
+            delta = {}
+            if state_sig != self._state_sig:
+                try:
+                    state = _load_strict("world_state.json")
+                except (OSError, ValueError):
+                    return False                     # caught mid-write: next check retries
+                self._state_sig = state_sig
+                delta.update(self._diff(state))
+            if gods_sig != self._gods_sig:
+                self._gods_sig = gods_sig
+                delta["gods"] = 1
+            if not delta:
+                return False
+            self.seq += 1
+            delta["seq"] = self.seq
+            self._log.append((self.seq, json.dumps(delta, ensure_ascii=False, separators=(",", ":"))))
+            self._cond.notify_all()
+            return True
+
+    def _diff(self, state) -> dict:
+        delta = {}
+        ownership = state.get("zone_ownership", {})
+        own = {z: g for z, g in ownership.items() if self._ownership.get(z) != g}
+        own.update({z: None for z in self._ownership if z not in ownership})
+        if own:
+            delta["own"] = own
+
+        contested = {_border_key(b): b for b in state.get("contested_borders", [])}
+        cadd = [b for k, b in contested.items() if self._contested.get(k) != b]
+        cdel = [k for k, b in self._contested.items() if contested.get(k) != b]
+        if cadd:
+            delta["cadd"] = cadd
+        if cdel:
+            delta["cdel"] = cdel
+
+        seals = state.get("ancient_seals", {})
+        changed = {z: v for z, v in seals.items() if self._seals.get(z) != v}
+        if changed:
+            delta["seals"] = changed
+        self._snapshot(state)
+        return delta
+
+    def since(self, seq: int):
+        """Deltas after `seq`, or None if they are no longer in the backlog."""
+        with self._cond:
+            if seq > self.seq:
+                return None                          # sequence from a previous server run
+            if seq == self.seq:
+                return []
+            if not self._log or self._log[0][0] > seq + 1:
+                return None
+            return [(n, data) for n, data in self._log if n > seq]
+
+    def wait(self, seq: int, timeout: float):
+        with self._cond:
+            self._cond.wait_for(lambda: self.seq != seq, timeout=timeout)
+
+
+events = WorldEvents()
+
+
+def _sse(event: str, data: str, seq: int | None = None) -> str:
+    head = f"id: {seq}\n" if seq is not None else ""
+    return f"{head}event: {event}\ndata: {data}\n\n"
 
 
 # ── Static Files ──────────────────────────────────────────────────
@@ -35,79 +296,273 @@ def index():
 def globe():
     return send_from_directory(BASE_DIR, "globe.html")
 
+@app.route("/tiles/<path:filename>")
+def tiles(filename):
+    """Snapshot tile pyramid (manifest.json + <level>/<x>_<y>.png) from world_map/map_snapshot.py."""
+    return send_from_directory(TILES_DIR, filename)
+
 
 # ── API Endpoints ─────────────────────────────────────────────────
 
 @app.route("/api/state")
 def api_state():
     """Live world state — zone ownership, contested borders, ancient seals."""
-    return jsonify(load_json("world_state.json"))
+    return cached_json("state", ("world_state.json",))
 
 
 @app.route("/api/gods")
 def api_gods():
     """All registered gods and their stats."""
-    return jsonify(load_json("gods.json"))
+    return cached_json("gods", ("gods.json",))
 
 
 @app.route("/api/regions")
 def api_regions():
     """World geography — all 27 zones with polygon vertices."""
-    raw = load_json("world_regions.json")
-    # Reshape from list of regions to dict keyed by region_id
-    result = {}
-    for region in raw.get("regions", []):
-        result[region["region_id"]] = region
-    return jsonify(result)
+    return cached_json("regions", ("world_regions.json",), _regions_by_id)
 
 
 @app.route("/api/full")
 def api_full():
     """Single endpoint returning everything — for initial load."""
-    return jsonify({
-        "state":   load_json("world_state.json"),
-        "gods":    load_json("gods.json"),
-        "regions": load_json("world_regions.json"),
-    })
+    return cached_json("full", ("world_state.json", "gods.json", "world_regions.json"),
+                       lambda state, gods, regions: {
+                           "state":   state,
+                           "gods":    gods,
+                           "regions": regions,
+                       })
+
+
+@app.route("/api/events")
+def api_events():
+    """
+    Server-sent events: `delta` for each change, `reset` when the client
+    must refetch /api/state (first connect, or its sequence is too old).
+    """
+    events.start()
+    last = request.headers.get("Last-Event-ID") or request.args.get("since")
+    try:
+        last = int(last) if last is not None else None
+    except ValueError:
+        last = None
+
+    def stream(last):
+        yield "retry: 3000\n\n"
+        while True:
+            pending = events.since(last) if last is not None else None
+            if pending is None:
+                last = events.seq
+                yield _sse("reset", json.dumps({"seq": last}), last)
+                continue
+            for seq, data in pending:
+                yield _sse("delta", data, seq)
+                last = seq
+            if not pending:
+                events.wait(last, EVENTS_HEARTBEAT_S)
+                if events.seq == last:
+                    yield ": keep-alive\n\n"
+
+    resp = Response(stream_with_context(stream(last)), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
+
+# ── Claim Writer (single writer per process) ──────────────────────────────────
+
+MAX_BULK_CLAIMS  = 5000
+CLAIM_TIMEOUT_S  = 30
+REMEMBERED_REQUESTS = 1024   # request ids whose result is replayed on retry
+
+
+class _ClaimCommand:
+    __slots__ = ("claims", "request_id", "result", "done")
+
+    def __init__(self, claims: list, request_id: str | None):
+        self.claims     = claims
+        self.request_id = request_id
+        self.result     = None
+        self.done       = threading.Event()
+
+
+class ClaimWriter:
+    """
+    This process's writer for world_state.json / gods.json (other processes
+    may write them too; see the module docstring). submit() queues a list
+    of claims and blocks until they are on disk; the writer thread drains
+    every command queued meanwhile and applies them together in one
+    WorldStateSync transaction (group commit).
+
+    Idempotent: claiming a zone its god already owns is a no-op, and a
+    request_id seen recently gets its original result back.
+
+    Each command is all-or-nothing: if any of its claims is rejected none is
+    applied, and a command that raises is rolled back (discard + replay of
+    the commands before it) without affecting the rest of the batch.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._lock    = threading.Lock()
+        self._thread  = None
+        self._sync    = None
+        self._results: OrderedDict = OrderedDict()   # request_id → result
+        self.commits  = 0
+
+    def submit(self, claims: list, request_id: str | None = None) -> dict:
+        self._start()
+        cmd = _ClaimCommand(claims, request_id)
+        self._queue.put(cmd)
+        if not cmd.done.wait(CLAIM_TIMEOUT_S):
+            return {"ok": False, "error": "claim writer timed out"}
+        return cmd.result
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._commit(batch)
+            except Exception as e:
+                print(f"[Server] Claim batch failed: {e}")
+                if self._sync is not None:
+                    self._sync.reload(forcar=True)   # memory may be ahead of disk
+                for cmd in batch:
+                    cmd.result = {"ok": False, "error": str(e)}
+            for cmd in batch:
+                cmd.done.set()
+
+    def _commit(self, batch: list):
+        if self._sync is None:
+            self._sync = WorldStateSync(DATA_DIR)
+        sync = self._sync
+        sync.reload()                     # someone else may have written the files
+        applied_cmds = []
+        with sync.transacao():            # one atomic write per file for the batch
+            for cmd in batch:
+                if cmd.request_id is not None and cmd.request_id in self._results:
+                    cmd.result = self._results[cmd.request_id]
+                    continue
+                try:
+                    cmd.result = self._apply(sync, cmd.claims)
+                    applied_cmds.append(cmd)
+                except Exception as e:
+                    print(f"[Server] Claim command failed: {e}")
+                    cmd.result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                    # Undo whatever it half-applied: back to disk, replay the ones before it
+                    sync.descartar()
+                    for earlier in applied_cmds:
+                        self._apply(sync, earlier.claims)
+        self.commits += 1
+        for cmd in batch:
+            if cmd.request_id is not None:
+                self._results[cmd.request_id] = cmd.result
+                self._results.move_to_end(cmd.request_id)
+        while len(self._results) > REMEMBERED_REQUESTS:
+            self._results.popitem(last=False)
+        payloads.invalidate()             # don't rely on mtime granularity for our own writes
+        events.check()                    # push the delta now instead of on the next poll
+
+    @staticmethod
+    def _rejection(sync, claim: dict) -> str | None:
+        zone_id, god_id = claim.get("zone_id"), claim.get("god_id")
+        if not isinstance(zone_id, str) or not zone_id or not sync.has_zone(zone_id):
+            return "unknown zone"
+        if god_id is not None and (not isinstance(god_id, str) or god_id not in sync.gods):
+            return "unknown god"
+        return None
+
+    @classmethod
+    def _apply(cls, sync, items: list) -> dict:
+        rejected = []
+        for claim in items:
+            error = cls._rejection(sync, claim)
+            if error:
+                rejected.append({**claim, "error": error})
+        if rejected:                      # all-or-nothing: a bad claim applies none
+            return {"ok": False, "applied": [], "unchanged": [], "rejected": rejected}
+
+        applied, unchanged = [], []
+        for claim in items:
+            zone_id, god_id = claim["zone_id"], claim.get("god_id")
+            if sync.ownership.get(zone_id) == god_id:
+                unchanged.append(zone_id)
+            else:
+                if god_id is None:
+                    sync.on_zone_released(zone_id)
+                else:
+                    sync.on_zone_claimed(zone_id, god_id)
+                applied.append(zone_id)
+        return {"ok": True, "applied": applied, "unchanged": unchanged, "rejected": []}
+
+
+claims = ClaimWriter()
+
+
+def _claim_response(result: dict, **extra):
+    if result.get("error"):
+        return jsonify(result), 503
+    status = 200 if result["ok"] else 400
+    return jsonify({**extra, **result}), status
 
 
 # ── Write Endpoints (for future God Wizard integration) ───────────
 
 @app.route("/api/claim/<zone_id>/<god_id>", methods=["POST"])
 def claim_zone(zone_id, god_id):
-    """Claim a zone for a god. Updates world_state.json."""
-    try:
-        state_path = os.path.join(DATA_DIR, "world_state.json")
-        with open(state_path, "r", encoding="utf-8") as f:
-            state = json.load(f)
+    """Claim a zone for a god. Updates world_state.json and gods.json."""
+    result = claims.submit([{"zone_id": zone_id, "god_id": god_id}])
+    return _claim_response(result, zone=zone_id, god=god_id)
 
-        state["zone_ownership"][zone_id] = god_id
 
-        # Update god's owned_zones in gods.json
-        gods_path = os.path.join(DATA_DIR, "gods.json")
-        with open(gods_path, "r", encoding="utf-8") as f:
-            gods = json.load(f)
-
-        for god in gods.get("gods", []):
-            if god["god_id"] == god_id:
-                if zone_id not in god.get("owned_zones", []):
-                    god.setdefault("owned_zones", []).append(zone_id)
-            else:
-                # Remove from other gods
-                if zone_id in god.get("owned_zones", []):
-                    god["owned_zones"].remove(zone_id)
+@app.route("/api/release/<zone_id>", methods=["POST"])
+def release_zone(zone_id):
+    """Release a zone (no owner)."""
+    result = claims.submit([{"zone_id": zone_id, "god_id": None}])
+    return _claim_response(result, zone=zone_id)
 
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
-        with open(gods_path, "w", encoding="utf-8") as f:
-            json.dump(gods, f, indent=2, ensure_ascii=False)
 
-        return jsonify({"ok": True, "zone": zone_id, "god": god_id})
-    except Exception as e:
-        return jsonify({"ok": False, "error": str(e)}), 500
+@app.route("/api/claims", methods=["POST"])
+def claim_bulk():
+    """
+    Bulk claims, applied in one transaction, all-or-nothing (any rejected
+    claim → 400 with the `rejected` list and nothing applied):
+        {"claims": [{"zone_id": ..., "god_id": ... | null}, ...],
+         "request_id": "optional, makes retries idempotent"}
+    The Idempotency-Key header works as request_id too.
+    """
+    body = request.get_json(silent=True)
+    items = body.get("claims") if isinstance(body, dict) else None
+    if not isinstance(items, list) or not all(isinstance(c, dict) for c in items):
+        return jsonify({"ok": False, "error": "expected {\"claims\": [{zone_id, god_id}, ...]}"}), 400
+    if len(items) > MAX_BULK_CLAIMS:
+        return jsonify({"ok": False, "error": f"at most {MAX_BULK_CLAIMS} claims per request"}), 413
+    malformed = [{"index": i, **c, "error": "zone_id must be a string, god_id a string or null"}
+                 for i, c in enumerate(items)
+                 if not isinstance(c.get("zone_id"), str)
+                 or not (c.get("god_id") is None or isinstance(c.get("god_id"), str))]
+    if malformed:
+        return jsonify({"ok": False, "applied": [], "unchanged": [], "rejected": malformed}), 400
+    request_id = body.get("request_id") or request.headers.get("Idempotency-Key")
+    if request_id is not None and not isinstance(request_id, str):
+        return jsonify({"ok": False, "error": "request_id must be a string"}), 400
+    result = claims.submit([{"zone_id": c.get("zone_id"), "god_id": c.get("god_id")} for c in items],
+                           request_id=request_id)
+    return _claim_response(result)
 
 
 if __name__ == "__main__":
-    print("[Neural Fights] Globe server starting on http://localhost:7331")
-    print("[Neural Fights] Open your browser to http://localhost:7331")
-    app.run(host="127.0.0.1", port=7331, debug=False, threaded=True)
+    port = int(os.environ.get("WORLDMAP_PORT", 7331))
+    print(f"[Neural Fights] Globe server starting on http://localhost:{port}")
+    print(f"[Neural Fights] Open your browser to http://localhost:{port}")
+    app.run(host="127.0.0.1", port=port, debug=False, threaded=True)
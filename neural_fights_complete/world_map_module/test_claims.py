@@ -0,0 +1,125 @@
+"""
+NEURAL FIGHTS — ClaimWriter tests
+Claims against server.py's writer on a copy of data/ (the `world` fixture,
+conftest.py): concurrent claims, malformed and partially rejected
+bulk requests, idempotent retries and a command that fails halfway through
+a group commit.
+
+Usage:
+  python -m pytest test_claims.py
+"""
+import json
+import os
+import threading
+
+import server
+
+
+def _read(d, name):
+    with open(os.path.join(d, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _ownership(d):
+    return {z: g for z, g in _read(d, "world_state.json")["zone_ownership"].items() if g}
+
+
+def _assert_consistent(d):
+    """world_state.json ownership and gods.json owned_zones describe the same map."""
+    owned = {z: g["god_id"] for g in _read(d, "gods.json")["gods"] for z in g["owned_zones"]}
+    own = _ownership(d)
+    assert own == owned, f"world_state {own} != gods {owned}"
+    assert _read(d, "world_state.json")["global_stats"]["zones_claimed"] == len(own)
+
+
+def test_concurrent_claims(world):
+    d, gods, zones = world
+    client = server.app.test_client()
+    n = 40
+
+    def claim(i):
+        r = server.app.test_client().post(f"/api/claim/{zones[i % len(zones)]}/{gods[i % len(gods)]}")
+        assert r.status_code == 200, r.json
+
+    threads = [threading.Thread(target=claim, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    _assert_consistent(d)
+    assert server.claims.commits <= n
+    assert client.get("/api/state").status_code == 200
+
+
+def test_idempotent_claims(world):
+    d, gods, zones = world
+    client = server.app.test_client()
+    r = client.post(f"/api/claim/{zones[0]}/{gods[0]}")
+    assert r.status_code == 200 and r.json["applied"] == [zones[0]]
+    r = client.post(f"/api/claim/{zones[0]}/{gods[0]}")
+    assert r.status_code == 200 and r.json["unchanged"] == [zones[0]]
+
+    body = {"claims": [{"zone_id": z, "god_id": gods[1]} for z in zones[1:4]], "request_id": "req-1"}
+    first = client.post("/api/claims", json=body)
+    assert first.status_code == 200 and len(first.json["applied"]) == 3
+    commits = server.claims.commits
+    # Same request_id after someone else changed a zone: the original result comes back
+    client.post(f"/api/release/{zones[1]}")
+    retry = client.post("/api/claims", json=body)
+    assert retry.json == first.json
+    assert zones[1] not in _ownership(d)
+    assert server.claims.commits == commits + 2
+    r = client.post(f"/api/release/{zones[1]}")
+    assert r.status_code == 200 and r.json["unchanged"] == [zones[1]]
+    _assert_consistent(d)
+
+
+def test_malformed_and_rejected_bulk(world):
+    d, gods, zones = world
+    client = server.app.test_client()
+    before = _ownership(d)
+
+    for body in ({"claims": [{"zone_id": zones[0], "god_id": gods[0]}, {"zone_id": ["x"], "god_id": gods[0]}]},
+                 {"claims": [{"zone_id": zones[0], "god_id": {"a": 1}}]},
+                 {"claims": [{"zone_id": zones[0], "god_id": gods[0]}], "request_id": ["r"]},
+                 {"claims": "nope"}, ["not", "an", "object"]):
+        r = client.post("/api/claims", json=body)
+        assert r.status_code == 400, (body, r.status_code, r.json)
+    # Unknown zone / god: all-or-nothing, the valid claim is not applied either
+    r = client.post("/api/claims", json={"claims": [{"zone_id": zones[0], "god_id": gods[0]},
+                                                    {"zone_id": "no_such_zone", "god_id": gods[0]},
+                                                    {"zone_id": zones[1], "god_id": "no_such_god"}]})
+    assert r.status_code == 400 and r.json["applied"] == [] and len(r.json["rejected"]) == 2
+    assert _ownership(d) == before
+    _assert_consistent(d)
+
+
+def test_failing_command_does_not_poison_batch(world):
+    d, gods, zones = world
+    before = _ownership(d)
+    writer = server.claims
+    writer._commit([])                       # opens the WorldStateSync
+    sync = writer._sync
+    original = sync.on_zone_claimed
+
+    def flaky(zone_id, god_id):
+        if zone_id == zones[3]:
+            raise RuntimeError("disk on fire")
+        return original(zone_id, god_id)
+
+    sync.on_zone_claimed = flaky
+    good1 = server._ClaimCommand([{"zone_id": zones[0], "god_id": gods[0]}], None)
+    # Claims zones[2] and then fails on zones[3]: neither may stay applied
+    bad = server._ClaimCommand([{"zone_id": zones[2], "god_id": gods[1]},
+                                {"zone_id": zones[3], "god_id": gods[1]}], None)
+    good2 = server._ClaimCommand([{"zone_id": zones[1], "god_id": gods[0]}], None)
+    writer._commit([good1, bad, good2])
+    sync.on_zone_claimed = original
+
+    assert good1.result["ok"] and good2.result["ok"], (good1.result, good2.result)
+    assert bad.result["error"].startswith("RuntimeError"), bad.result
+    own = _ownership(d)
+    assert own.get(zones[0]) == gods[0] and own.get(zones[1]) == gods[0]
+    assert own.get(zones[2]) == before.get(zones[2]) and own.get(zones[3]) == before.get(zones[3]), own
+    _assert_consistent(d)
+
@@ -0,0 +1,237 @@
+"""
+NEURAL FIGHTS - World Map Scale Benchmark
+Mede o módulo do mapa com mundos gerados (map_generator) de 1k a 50k zonas:
+
+  - geração + gravação do world_regions.json
+  - carga (TerritoryManager: JSON + índice espacial)
+  - hit-test (get_zone_at_world_pos em pontos aleatórios)
+  - bordas contestadas (reconstrução completa e update incremental)
+  - save do world_state.json (WorldStateSync.save_all), claim completo e a
+    ocupação inicial inteira como um lote (WorldStateSync.transacao)
+  - render headless do MapRenderer: primeiro frame, FPS na visão geral e
+    arrastando com zoom 2x (opcional: precisa de pygame)
+
+Cada tamanho roda num diretório temporário; nada em data/ é tocado.
+
+Uso:
+    python run_worldmap.py --benchmark
+    python run_worldmap.py --benchmark --zones 1000,5000 --frames 60 --json bench.json
+    python world_map/map_benchmark.py --zonas 1000,20000
+
+    from map_benchmark import medir_escala
+    r = medir_escala(5000)
+    r.hit_test_us, r.fps_visao_geral
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+
+from map_generator import gerar_mundo, salvar_mundo
+from map_territories import TerritoryManager
+from map_god_registry import WorldStateSync
+
+TAMANHOS_PADRAO = (1000, 5000, 20000, 50000)
+
+
+@dataclass
+class ResultadoEscala:
+    zonas:              int
+    regioes:            int   = 0
+    gerar_s:            float = 0.0
+    gravar_regioes_ms:  float = 0.0
+    carregar_ms:        float = 0.0
+    hit_test_us:        float = 0.0
+    contested_full_ms:  float = 0.0
+    contested_inc_us:   float = 0.0
+    n_contested:        int   = 0
+    save_state_ms:      float = 0.0
+    lote_claims_ms:     float = 0.0     # ocupação inicial inteira dentro de transacao()
+    claim_ms:           float = 0.0
+    primeiro_frame_ms:  float = 0.0
+    fps_visao_geral:    float = 0.0
+    fps_zoom_2x:        float = 0.0
+    render:             str   = ""      # "" = medido; senão o motivo de ter pulado
+
+
+def _ms(t0: float) -> float:
+    return round((time.perf_counter() - t0) * 1000, 2)
+
+
+def _medir_render(r: ResultadoEscala, territories, world_state,
+                  frames: int, largura: float, altura: float):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    try:
+        import pygame
+    except ImportError:
+        r.render = "pygame não instalado"
+        return
+    from map_camera import MapCamera
+    from map_renderer import MapRenderer
+    from map_text import reset_fonts
+
+    pygame.init()
+    screen = pygame.display.set_mode((1600, 900))
+    camera = MapCamera(1600, 900, int(largura), int(altura))
+    renderer = MapRenderer(screen, camera, territories, world_state)
+
+    t0 = time.perf_counter()
+    renderer.update(1 / 60)
+    renderer.draw()
+    r.primeiro_frame_ms = _ms(t0)
+
+    def fps(n: int) -> float:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            camera.offset_x += 2.0 / camera.zoom     # arrasto contínuo
+            renderer.update(1 / 60)
+            renderer.draw()
+        return round(n / max(time.perf_counter() - t0, 1e-9), 1)
+
+    r.fps_visao_geral = fps(frames)
+    camera.zoom = 2.0
+    camera.offset_x = largura / 2 - 800 / camera.zoom
+    camera.offset_y = altura / 2 - 450 / camera.zoom
+    renderer.draw()                                  # rasteriza o bucket novo
+    r.fps_zoom_2x = fps(frames)
+    pygame.quit()
+    reset_fonts()       # as fontes registradas morrem com o pygame.quit()
+
+
+def medir_escala(n_zonas: int, frames: int = 120, seed: int = 1234,
+                 n_deuses: int = 8, ocupacao: float = 0.7,
+                 render: bool = True) -> ResultadoEscala:
+    """Roda todas as medições para um mundo de n_zonas."""
+    rng = random.Random(seed)
+    r = ResultadoEscala(n_zonas)
+    pasta = tempfile.mkdtemp(prefix="worldmap_bench_")
+    try:
+        t0 = time.perf_counter()
+        mundo = gerar_mundo(n_zonas, seed=seed)
+        r.gerar_s = round(time.perf_counter() - t0, 2)
+        r.regioes = mundo["_meta"]["total_regions"]
+        largura, altura = mundo["_meta"]["world_width"], mundo["_meta"]["world_height"]
+
+        t0 = time.perf_counter()
+        salvar_mundo(mundo, os.path.join(pasta, "world_regions.json"))
+        r.gravar_regioes_ms = _ms(t0)
+        del mundo
+
+        t0 = time.perf_counter()
+        territories = TerritoryManager(pasta)
+        r.carregar_ms = _ms(t0)
+
+        pontos = [(rng.uniform(0, largura), rng.uniform(0, altura)) for _ in range(10_000)]
+        t0 = time.perf_counter()
+        for x, y in pontos:
+            territories.get_zone_at_world_pos(x, y)
+        r.hit_test_us = round((time.perf_counter() - t0) / len(pontos) * 1e6, 2)
+
+        world_state = WorldStateSync(pasta, territories=territories)
+        zonas = list(territories.zones)
+        # Ocupação inicial: um lote só (uma gravação no fim, não uma por claim)
+        t0 = time.perf_counter()
+        with world_state.transacao():
+            deuses = [world_state.create_god(f"Bench{i}", "bench", rng.choice(
+                ("fire", "ice", "nature", "greed", "void", "chaos", "arcane", "balanced")))
+                for i in range(n_deuses)]
+            for zid in zonas:
+                if rng.random() < ocupacao:
+                    world_state.on_zone_claimed(zid, rng.choice(deuses).god_id)
+        r.lote_claims_ms = _ms(t0)
+
+        t0 = time.perf_counter()
+        world_state.contested = territories.get_contested_borders(world_state.ownership)
+        r.contested_full_ms = _ms(t0)
+        r.n_contested = len(world_state.contested)
+
+        amostra = [rng.choice(zonas) for _ in range(1000)]
+        t0 = time.perf_counter()
+        for zid in amostra:
+            world_state.ownership[zid] = rng.choice(deuses).god_id
+            territories.update_contested(zid, world_state.ownership)
+        r.contested_inc_us = round((time.perf_counter() - t0) / len(amostra) * 1e6, 2)
+
+        t0 = time.perf_counter()
+        world_state.save_all()
+        r.save_state_ms = _ms(t0)
+
+        # Claim completo: ownership + bordas + save, como vem do jogo
+        claims = 5
+        t0 = time.perf_counter()
+        for _ in range(claims):
+            world_state.on_zone_claimed(rng.choice(zonas), rng.choice(deuses).god_id)
+        r.claim_ms = round((time.perf_counter() - t0) / claims * 1000, 2)
+
+        if render:
+            _medir_render(r, territories, world_state, frames, largura, altura)
+        else:
+            r.render = "desligado"
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+    return r
+
+
+def rodar_benchmark(tamanhos=TAMANHOS_PADRAO, frames: int = 120, seed: int = 1234,
+                    render: bool = True, progresso=None) -> list[ResultadoEscala]:
+    resultados = []
+    for n in tamanhos:
+        if progresso:
+            progresso(f"[Bench] {n} zonas...")
+        resultados.append(medir_escala(n, frames=frames, seed=seed, render=render))
+    return resultados
+
+
+def relatorio(resultados: list[ResultadoEscala]) -> str:
+    colunas = [
+        ("zonas",             "zonas",        "{:>8}"),
+        ("regioes",           "regiões",      "{:>8}"),
+        ("gerar_s",           "gerar s",      "{:>8.2f}"),
+        ("carregar_ms",       "carga ms",     "{:>9.1f}"),
+        ("hit_test_us",       "hit µs",       "{:>8.1f}"),
+        ("contested_full_ms", "borda ms",     "{:>9.1f}"),
+        ("contested_inc_us",  "borda+ µs",    "{:>10.1f}"),
+        ("save_state_ms",     "save ms",      "{:>8.1f}"),
+        ("lote_claims_ms",    "lote ms",      "{:>9.1f}"),
+        ("claim_ms",          "claim ms",     "{:>9.1f}"),
+        ("primeiro_frame_ms", "1º frame ms",  "{:>12.1f}"),
+        ("fps_visao_geral",   "FPS geral",    "{:>10.1f}"),
+        ("fps_zoom_2x",       "FPS 2x",       "{:>8.1f}"),
+    ]
+    cab = "".join(f"{titulo:>{len(fmt.format(0))}}" for _, titulo, fmt in colunas)
+    linhas = ["NEURAL FIGHTS - World Map: benchmark de escala", "=" * len(cab), cab, "-" * len(cab)]
+    for r in resultados:
+        linhas.append("".join(fmt.format(getattr(r, campo)) for campo, _, fmt in colunas))
+    puladas = [f"  {r.zonas} zonas: render pulado ({r.render})" for r in resultados if r.render]
+    return "\n".join(linhas + puladas) + "\n"
+
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Benchmark de escala do World Map")
+    parser.add_argument("--zonas", default=",".join(map(str, TAMANHOS_PADRAO)),
+                        help="Tamanhos separados por vírgula (padrão: 1000,5000,20000,50000)")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--sem-render", action="store_true", help="Pula a medição de FPS")
+    parser.add_argument("--json", dest="saida_json", help="Grava os resultados em JSON")
+    args = parser.parse_args(argv)
+
+    tamanhos = [int(z) for z in args.zonas.split(",") if z.strip()]
+    resultados = rodar_benchmark(tamanhos, args.frames, args.seed,
+                                 render=not args.sem_render, progresso=print)
+    print(relatorio(resultados))
+    if args.saida_json:
+        with open(args.saida_json, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in resultados], f, indent=2, ensure_ascii=False)
+    return resultados
+
+
+if __name__ == "__main__":
+    main()
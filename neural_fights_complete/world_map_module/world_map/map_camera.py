@@ -211,6 +211,13 @@ class MapCamera:
         return (-margin <= sx <= self.screen_w + margin and
                 -margin <= sy <= self.screen_h + margin)
 
+    def visible_world_rect(self, sx0: float, sy0: float, sx1: float, sy1: float,
+                           margin: float = 0) -> tuple[float, float, float, float]:
+        """Retângulo do mundo (x0, y0, x1, y1) coberto pela área de tela dada (+ margem em px)."""
+        x0, y0 = self.screen_to_world(sx0 - margin, sy0 - margin)
+        x1, y1 = self.screen_to_world(sx1 + margin, sy1 + margin)
+        return (x0, y0, x1, y1)
+
     def is_polygon_visible(self, vertices: list, margin: float = 50) -> bool:
         """Verifica se algum vértice do polígono está visível (culling básico)."""
         return any(self.is_world_point_visible(vx, vy, margin) for vx, vy in vertices)
@@ -0,0 +1,271 @@
+"""
+NEURAL FIGHTS - World Generator
+Gera mundos procedurais no mesmo schema do world_regions.json, para testar
+o mapa em escala (1k–50k zonas) antes de crescer o lore à mão.
+
+Zonas: células de Voronoi de pontos numa grade com jitter. Cada célula é o
+retângulo do mundo recortado pelas mediatrizes dos sites vizinhos, em ordem
+de distância, até nenhum site restante poder cortar mais (raio > 2x o
+vértice mais distante). Cada aresta guarda qual site a gerou, então
+`neighboring_zones` sai exato, sem teste de adjacência depois.
+
+Regiões: BFS multi-fonte sobre o grafo de vizinhança a partir de sementes
+aleatórias, então toda região é contígua. A zona herda a natureza da região
+(com alguma variação).
+
+Uso:
+    python world_map/map_generator.py --zonas 5000 --saida data/world_5k.json
+    python world_map/map_generator.py --zonas 50000 --regioes 400 --seed 7
+
+    from map_generator import gerar_mundo, salvar_mundo
+    mundo = gerar_mundo(5000, seed=1)
+    salvar_mundo(mundo, "data/world_5k.json")
+"""
+
+import json
+import math
+import os
+import random
+from collections import deque
+
+NATUREZAS_BASE = ("balanced", "fire", "ice", "darkness", "nature",
+                  "chaos", "void", "greed", "arcane", "fear")
+
+_ADJETIVOS = ("Ashen", "Broken", "Crimson", "Drowned", "Elder", "Frozen", "Gilded",
+              "Hollow", "Iron", "Jade", "Lost", "Molten", "Nameless", "Obsidian",
+              "Pale", "Quiet", "Rusted", "Silent", "Thorned", "Umbral", "Veiled",
+              "Withered", "Sunken", "Howling", "Shattered", "Verdant", "Bleached")
+_LUGARES = ("Reach", "Hollow", "Fields", "Pass", "Crown", "Marsh", "Spire", "Gate",
+            "Wastes", "Grove", "Shore", "Barrens", "Vale", "Crossing", "Pit",
+            "Highlands", "Quarter", "Ridge", "Sanctum", "Flats", "Steppe", "Deep")
+
+_EPS = 1e-9
+
+
+# ── Voronoi (recorte por semiplanos) ─────────────────────────────────────────
+
+def _recortar(poly: list, rotulos: list, p: tuple, q: tuple, j: int):
+    """
+    Mantém a parte de `poly` mais perto de p que de q. rotulos[k] é o site
+    que gerou a aresta poly[k] → poly[k+1] (-1 = borda do mundo); a aresta
+    nova, sobre a mediatriz, recebe o rótulo j.
+    """
+    dx, dy = q[0] - p[0], q[1] - p[1]
+    c = (dx * (p[0] + q[0]) + dy * (p[1] + q[1])) / 2.0
+    lados = [dx * x + dy * y - c for x, y in poly]
+    if all(s <= _EPS for s in lados):
+        return poly, rotulos
+    novo, novos_rot = [], []
+    n = len(poly)
+    for k in range(n):
+        a, b = poly[k], poly[(k + 1) % n]
+        sa, sb = lados[k], lados[(k + 1) % n]
+        dentro_a, dentro_b = sa <= _EPS, sb <= _EPS
+        if dentro_a:
+            novo.append(a)
+            novos_rot.append(rotulos[k])
+        if dentro_a != dentro_b:
+            t = sa / (sa - sb)
+            ponto = (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t)
+            novo.append(ponto)
+            # saindo: a aresta seguinte corre sobre a mediatriz; entrando: continua a original
+            novos_rot.append(j if dentro_a else rotulos[k])
+    return novo, novos_rot
+
+
+def _celula(i: int, sites: list, candidatos: list, largura: float, altura: float):
+    p = sites[i]
+    poly = [(0.0, 0.0), (largura, 0.0), (largura, altura), (0.0, altura)]
+    rotulos = [-1, -1, -1, -1]
+    ordem = sorted(candidatos, key=lambda j: (sites[j][0] - p[0]) ** 2 + (sites[j][1] - p[1]) ** 2)
+    for j in ordem:
+        q = sites[j]
+        d2 = (q[0] - p[0]) ** 2 + (q[1] - p[1]) ** 2
+        r2 = max((x - p[0]) ** 2 + (y - p[1]) ** 2 for x, y in poly)
+        if d2 > 4 * r2:
+            break                       # nenhum site mais distante corta a célula
+        poly, rotulos = _recortar(poly, rotulos, p, q, j)
+        if len(poly) < 3:
+            break
+    return poly, rotulos
+
+
+def _centroide(poly: list) -> list:
+    area = cx = cy = 0.0
+    n = len(poly)
+    for k in range(n):
+        x0, y0 = poly[k]
+        x1, y1 = poly[(k + 1) % n]
+        cruz = x0 * y1 - x1 * y0
+        area += cruz
+        cx += (x0 + x1) * cruz
+        cy += (y0 + y1) * cruz
+    if abs(area) < _EPS:
+        return [sum(x for x, _ in poly) / n, sum(y for _, y in poly) / n]
+    return [cx / (3 * area), cy / (3 * area)]
+
+
+def _sites_jitter(n: int, largura: float, altura: float, rng: random.Random):
+    """n sites, um por célula de uma grade ~quadrada; devolve (sites, grade, lado)."""
+    cols = max(1, round(math.sqrt(n * largura / altura)))
+    linhas = max(1, math.ceil(n / cols))
+    lado_x, lado_y = largura / cols, altura / linhas
+    celulas = [(cx, cy) for cy in range(linhas) for cx in range(cols)]
+    if len(celulas) > n:
+        celulas = sorted(rng.sample(celulas, n), key=lambda c: (c[1], c[0]))
+    sites, grade = [], {}
+    for cx, cy in celulas:
+        grade[(cx, cy)] = len(sites)
+        sites.append(((cx + rng.uniform(0.1, 0.9)) * lado_x,
+                      (cy + rng.uniform(0.1, 0.9)) * lado_y))
+    return sites, grade
+
+
+def _voronoi(sites: list, grade: dict, largura: float, altura: float, raio: int = 3):
+    """Polígonos + vizinhos de cada site."""
+    celula_de = {i: c for c, i in grade.items()}
+    polys, vizinhos = [], [set() for _ in sites]
+    for i in range(len(sites)):
+        cx, cy = celula_de[i]
+        candidatos = [grade[(cx + ox, cy + oy)]
+                      for ox in range(-raio, raio + 1) for oy in range(-raio, raio + 1)
+                      if (ox or oy) and (cx + ox, cy + oy) in grade]
+        poly, rotulos = _celula(i, sites, candidatos, largura, altura)
+        polys.append(poly)
+        n = len(poly)
+        for k, j in enumerate(rotulos):
+            if j < 0:
+                continue
+            a, b = poly[k], poly[(k + 1) % n]
+            if math.hypot(b[0] - a[0], b[1] - a[1]) > 1e-6:   # ignora arestas degeneradas
+                vizinhos[i].add(j)
+    # Simetriza (erro de ponto flutuante pode perder um dos lados)
+    for i, viz in enumerate(vizinhos):
+        for j in viz:
+            vizinhos[j].add(i)
+    return polys, vizinhos
+
+
+# ── Regiões ───────────────────────────────────────────────────────────────────
+
+def _regioes(vizinhos: list, n_regioes: int, rng: random.Random) -> list:
+    """Região de cada zona por BFS multi-fonte (regiões contíguas)."""
+    n = len(vizinhos)
+    regiao = [-1] * n
+    fila = deque()
+    for r, semente in enumerate(rng.sample(range(n), min(n_regioes, n))):
+        regiao[semente] = r
+        fila.append(semente)
+    while fila:
+        i = fila.popleft()
+        vizinhos_i = list(vizinhos[i])
+        rng.shuffle(vizinhos_i)         # fronteiras menos retas
+        for j in vizinhos_i:
+            if regiao[j] < 0:
+                regiao[j] = regiao[i]
+                fila.append(j)
+    # Componentes sem semente (raro: ilhas por erro numérico) viram região 0
+    return [r if r >= 0 else 0 for r in regiao]
+
+
+def _nome(rng: random.Random, usados: set) -> str:
+    base = f"The {rng.choice(_ADJETIVOS)} {rng.choice(_LUGARES)}"
+    nome, k = base, 2
+    while nome in usados:
+        nome = f"{base} {k}"
+        k += 1
+    usados.add(nome)
+    return nome
+
+
+# ── API ───────────────────────────────────────────────────────────────────────
+
+def gerar_mundo(n_zonas: int, n_regioes: int | None = None,
+                largura: float = 2000, altura: float = 1400,
+                seed: int | None = None, variacao_natureza: float = 0.2,
+                nome_mundo: str = "Procedural Aethermoor") -> dict:
+    """
+    Gera um mundo com n_zonas no schema do world_regions.json.
+    n_regioes: padrão ~sqrt(n_zonas). largura/altura: world units (a câmera
+    usa 2000x1400 por padrão). Mesma seed → mesmo mundo.
+    """
+    if n_zonas < 1:
+        raise ValueError("n_zonas deve ser >= 1")
+    rng = random.Random(seed)
+    n_regioes = n_regioes or max(1, round(math.sqrt(n_zonas)))
+
+    sites, grade = _sites_jitter(n_zonas, largura, altura, rng)
+    polys, vizinhos = _voronoi(sites, grade, largura, altura)
+    regiao_de = _regioes(vizinhos, n_regioes, rng)
+
+    nomes: set = set()
+    zone_ids = [f"zone_{i:05d}" for i in range(len(sites))]
+    regioes = []
+    for r in range(n_regioes):
+        regioes.append({
+            "region_id":   f"region_{r:04d}",
+            "region_name": _nome(rng, nomes),
+            "description": "Procedurally generated region.",
+            "base_nature": rng.choice(NATUREZAS_BASE),
+            "zones":       [],
+        })
+
+    for i, poly in enumerate(polys):
+        if len(poly) < 3:
+            continue
+        regiao = regioes[regiao_de[i]]
+        natureza = regiao["base_nature"]
+        if rng.random() < variacao_natureza:
+            natureza = rng.choice(NATUREZAS_BASE)
+        regiao["zones"].append({
+            "zone_id":           zone_ids[i],
+            "zone_name":         _nome(rng, nomes),
+            "lore":              "",
+            "vertices":          [[round(x, 1), round(y, 1)] for x, y in poly],
+            "centroid":          [round(v, 1) for v in _centroide(poly)],
+            "neighboring_zones": [zone_ids[j] for j in sorted(vizinhos[i])],
+            "ancient_seal":      False,
+            "base_nature":       natureza,
+        })
+
+    regioes = [r for r in regioes if r["zones"]]
+    return {
+        "_meta": {
+            "world_name":    nome_mundo,
+            "world_width":   largura,
+            "world_height":  altura,
+            "total_zones":   sum(len(r["zones"]) for r in regioes),
+            "total_regions": len(regioes),
+            "generator":     {"algorithm": "jittered-voronoi", "seed": seed},
+        },
+        "regions": regioes,
+    }
+
+
+def salvar_mundo(mundo: dict, path: str):
+    """Grava o mundo (escrita atômica; JSON compacto — 50k zonas passam de 10 MB indentado)."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(mundo, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Gerador procedural de mundos (world_regions.json)")
+    parser.add_argument("--zonas", type=int, default=1000)
+    parser.add_argument("--regioes", type=int, default=None)
+    parser.add_argument("--largura", type=float, default=2000)
+    parser.add_argument("--altura", type=float, default=1400)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--saida", default="world_regions_gerado.json")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    mundo = gerar_mundo(args.zonas, args.regioes, args.largura, args.altura, args.seed)
+    salvar_mundo(mundo, args.saida)
+    meta = mundo["_meta"]
+    print(f"[WorldGen] {meta['total_zones']} zonas / {meta['total_regions']} regiões "
+          f"→ {args.saida} ({time.perf_counter() - t0:.1f}s)")
@@ -6,11 +6,15 @@ Camada API-ready: suporta Manual e stub para TikTok/YouTube futuro.
 
 import json
 import os
+import tempfile
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
 from typing import Optional
 
+from map_territories import TerritoryManager
+
 
 # ── Paleta de Naturezas ───────────────────────────────────────────────────────
 # Mapeia element name → (cor primária, cor secundária)
@@ -94,15 +98,34 @@ class WorldStateSync:
       - Receber notificações de mudanças (hook do database.py)
       - Calcular estatísticas globais
       - Stub para API futura (TikTok/YouTube comments)
+
+    Gravação: cada hook marca o arquivo que mudou (gods.json e/ou
+    world_state.json) como sujo e grava na hora — a não ser que esteja dentro
+    de transacao(), quando as gravações se juntam numa só no fim do bloco:
+
+        with sync.transacao():
+            for p in personagens:
+                sync.on_character_update(p.nome, p.god_id)   # 1 escrita, não N
     """
 
-    def __init__(self, data_dir: str):
+    def __init__(self, data_dir: str, territories: TerritoryManager | None = None):
         self.data_dir = data_dir
+        # Topologia para as bordas contestadas; criada sob demanda a partir de
+        # world_regions.json quando não é passada
+        self._territories = territories
         self.gods:      dict[str, God] = {}        # god_id → God
         self.ownership: dict[str, str | None] = {} # zone_id → god_id | None
-        self.contested: list[dict]             = []
+        self._contested: list[dict]            = []
+        self._contested_pendente = False              # lista a remontar do cache do TerritoryManager
         self.ancient_seals: dict               = {}
         self.global_stats:  dict               = {}
+        self._ancient_gods: list               = []   # bloco ancient_gods do gods.json, regravado como veio
+        self._assinaturas:  dict[str, tuple]   = {}  # arquivo → (mtime_ns, tamanho)
+        self._zonas_ocupadas = 0                      # mantido pelos hooks; recontado na carga
+        self._sujos: set[str] = set()                 # arquivos com mudança ainda não gravada
+        self._profundidade    = 0                     # transacao() aninhadas
+        # Incrementada a cada mudança de deuses/ownership (caches de labels comparam)
+        self.revisao: int = 0
         self._load_all()
 
     # ── Carregamento ─────────────────────────────────────────────────────────
@@ -110,13 +133,26 @@ class WorldStateSync:
     def _load_all(self):
         self._load_gods()
         self._load_world_state()
+        self.revisao += 1
+
+    def _assinatura(self, nome: str):
+        try:
+            st = os.stat(os.path.join(self.data_dir, nome))
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _marcar_lido(self, nome: str):
+        self._assinaturas[nome] = self._assinatura(nome)
 
     def _load_gods(self):
         path = os.path.join(self.data_dir, "gods.json")
+        self._marcar_lido("gods.json")
         if not os.path.exists(path):
             return
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
+        self._ancient_gods = data.get("ancient_gods", [])
         self.gods = {}
         for g in data.get("gods", []):
             god = God(
@@ -142,23 +178,94 @@ class WorldStateSync:
 
     def _load_world_state(self):
         path = os.path.join(self.data_dir, "world_state.json")
+        self._marcar_lido("world_state.json")
         if not os.path.exists(path):
             return
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
         self.ownership    = data.get("zone_ownership", {})
         self.contested    = data.get("contested_borders", [])
+        if self._territories is not None:
+            self._territories.reset_contested()
         self.ancient_seals= data.get("ancient_seals", {})
         self.global_stats = data.get("global_stats", {})
+        self._zonas_ocupadas = sum(1 for v in self.ownership.values() if v is not None)
+
+    @property
+    def contested(self) -> list[dict]:
+        if self._contested_pendente:
+            self._contested = self._territories.contested_borders(self.ownership)
+            self._contested_pendente = False
+        return self._contested
+
+    @contested.setter
+    def contested(self, contested: list[dict]):
+        self._contested = contested
+        self._contested_pendente = False
 
     # ── Persistência ──────────────────────────────────────────────────────────
 
+    @contextmanager
+    def transacao(self):
+        """
+        Agrupa mutações: dentro do bloco os hooks só marcam o que mudou e
+        gods.json / world_state.json são gravados uma vez, na saída do bloco
+        mais externo (também se houver exceção — a memória já mudou).
+        """
+        self._profundidade += 1
+        try:
+            yield self
+        finally:
+            self._profundidade -= 1
+            if self._profundidade == 0:
+                self.flush()
+
+    def _marcar_sujo(self, *arquivos: str):
+        self._sujos.update(arquivos)
+        if self._profundidade == 0:
+            self.flush()
+
+    def flush(self):
+        """Grava os arquivos marcados como sujos (no-op se nada mudou)."""
+        sujos, self._sujos = self._sujos, set()
+        if "gods.json" in sujos:
+            self._save_gods()
+        if "world_state.json" in sujos:
+            self._save_world_state()
+
+    def _mudou(self, *arquivos: str):
+        """Mudança vinda de um hook: invalida caches de labels e marca os arquivos."""
+        self.revisao += 1
+        self._marcar_sujo(*arquivos)
+
     def save_all(self):
-        self._save_gods()
-        self._save_world_state()
+        """Grava tudo — para quem alterou campos de God/ownership diretamente."""
+        self.revisao += 1
+        self._zonas_ocupadas = sum(1 for v in self.ownership.values() if v is not None)
+        self._marcar_sujo("gods.json", "world_state.json")
+
+    def _gravar_json(self, nome: str, data: dict):
+        """
+        Escrita atômica (tmp + replace): quem lê em paralelo nunca vê meio
+        arquivo. O tmp é único por escrita (mkstemp) — server.py, run_worldmap.py
+        e o hook do neural_v3_rework gravam os mesmos arquivos de processos
+        diferentes, e um tmp fixo deixaria um sobrescrever o do outro.
+        """
+        path = os.path.join(self.data_dir, nome)
+        fd, tmp = tempfile.mkstemp(dir=self.data_dir, prefix=nome + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        self._marcar_lido(nome)         # escrita própria não conta como mudança externa
 
     def _save_gods(self):
-        path = os.path.join(self.data_dir, "gods.json")
         gods_list = []
         for god in self.gods.values():
             gods_list.append({
@@ -180,19 +287,11 @@ class WorldStateSync:
                 "border_style":         god.border_style,
                 "lore_description":     god.lore_description,
             })
-        # Preserva ancient_gods do arquivo original
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                original = json.load(f)
-            ancient = original.get("ancient_gods", [])
-        except Exception:
-            ancient = []
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({"_meta": {"version":"1.0"}, "gods": gods_list, "ancient_gods": ancient},
-                      f, indent=2, ensure_ascii=False)
+        # ancient_gods vem do arquivo original (guardado em _load_gods)
+        self._gravar_json("gods.json", {"_meta": {"version":"1.0"}, "gods": gods_list,
+                                        "ancient_gods": self._ancient_gods})
 
     def _save_world_state(self):
-        path = os.path.join(self.data_dir, "world_state.json")
         self._recalc_global_stats()
         data = {
             "_meta": {"last_updated": datetime.now().isoformat()},
@@ -201,16 +300,15 @@ class WorldStateSync:
             "ancient_seals":   self.ancient_seals,
             "global_stats":    self.global_stats,
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._gravar_json("world_state.json", data)
 
     def _recalc_global_stats(self):
-        claimed = sum(1 for v in self.ownership.values() if v is not None)
+        # zones_claimed vem do contador dos hooks: varrer ownership custa O(zonas)
         total_followers = sum(g.follower_count for g in self.gods.values())
         self.global_stats = {
             "total_gods":       len(self.gods),
             "total_followers":  total_followers,
-            "zones_claimed":    claimed,
+            "zones_claimed":    self._zonas_ocupadas,
             "zones_contested":  len(self.contested),
             "war_intensity":    min(1.0, len(self.contested) / 10),
         }
@@ -222,52 +320,82 @@ class WorldStateSync:
         Chamado pelo database.py quando um personagem é salvo com god_id.
         Atualiza o campeão do deus correspondente.
         """
-        if god_id and god_id in self.gods:
-            self.gods[god_id].champion_character_id = char_id
-            self._save_world_state()
+        god = self.gods.get(god_id) if god_id else None
+        if god is not None and god.champion_character_id != char_id:
+            god.champion_character_id = char_id
+            self._marcar_sujo("gods.json")      # o campeão vive no gods.json
 
-    def on_zone_claimed(self, zone_id: str, god_id: str):
-        """
-        Chamado quando um deus reivindica uma zona.
-        Atualiza ownership e lista de zonas do deus.
-        """
+    def _set_owner(self, zone_id: str, god_id: str | None):
+        """Troca o dono de uma zona mantendo owned_zones, contador e bordas."""
         prev_god = self.ownership.get(zone_id)
         if prev_god and prev_god in self.gods:
             if zone_id in self.gods[prev_god].owned_zones:
                 self.gods[prev_god].owned_zones.remove(zone_id)
+        self._zonas_ocupadas += (god_id is not None) - (prev_god is not None)
         self.ownership[zone_id] = god_id
         if god_id in self.gods and zone_id not in self.gods[god_id].owned_zones:
             self.gods[god_id].owned_zones.append(zone_id)
-        self.save_all()
+        self._update_contested(zone_id)
+
+    def on_zone_claimed(self, zone_id: str, god_id: str):
+        """
+        Chamado quando um deus reivindica uma zona.
+        Atualiza ownership e lista de zonas do deus. Reivindicar de novo o
+        que já é do deus não grava nada (claims repetidos são idempotentes).
+        """
+        if self._ja_e_dono(zone_id, god_id):
+            return
+        self._set_owner(zone_id, god_id)
+        self._mudou("gods.json", "world_state.json")
 
     def on_zone_released(self, zone_id: str):
         """Remove um deus de uma zona."""
-        prev_god = self.ownership.get(zone_id)
-        if prev_god and prev_god in self.gods:
-            if zone_id in self.gods[prev_god].owned_zones:
-                self.gods[prev_god].owned_zones.remove(zone_id)
-        self.ownership[zone_id] = None
-        self.save_all()
+        if self.ownership.get(zone_id) is None:
+            return
+        self._set_owner(zone_id, None)
+        self._mudou("gods.json", "world_state.json")
+
+    def _ja_e_dono(self, zone_id: str, god_id: str) -> bool:
+        god = self.gods.get(god_id)
+        return (self.ownership.get(zone_id) == god_id
+                and (god is None or zone_id in god.owned_zones))
 
     def on_follower_update(self, god_id: str, count: int):
         """
         API stub: atualiza contagem de seguidores.
         Futuramente chamado pela integração TikTok/YouTube.
         """
-        if god_id in self.gods:
+        if god_id in self.gods and self.gods[god_id].follower_count != count:
             self.gods[god_id].follower_count = count
-            self.save_all()
+            self._mudou("gods.json", "world_state.json")
 
     def on_contested_borders_update(self, contested: list[dict]):
         """Atualiza bordas contestadas (chamado pelo TerritoryManager)."""
         self.contested = contested
-        self._save_world_state()
+        if self._territories is not None:
+            self._territories.reset_contested()
+        self._marcar_sujo("world_state.json")
 
     def on_seal_crack(self, seal_zone_id: str, new_crack_level: int):
         """Incrementa o nível de crack de um selo antigo."""
         if seal_zone_id in self.ancient_seals:
             self.ancient_seals[seal_zone_id]["crack_level"] = new_crack_level
-            self.save_all()
+            self._mudou("world_state.json")
+
+    def _get_territories(self) -> TerritoryManager | None:
+        if self._territories is None:
+            if not os.path.exists(os.path.join(self.data_dir, "world_regions.json")):
+                return None
+            self._territories = TerritoryManager(self.data_dir)
+        return self._territories
+
+    def _update_contested(self, zone_id: str):
+        """Reavalia só as bordas de `zone_id` (cache incremental do TerritoryManager)."""
+        territories = self._get_territories()
+        if territories is not None:
+            # A lista é remontada uma vez, quando alguém ler self.contested
+            territories.update_contested(zone_id, self.ownership, listar=False)
+            self._contested_pendente = True
 
     # ── God CRUD ──────────────────────────────────────────────────────────────
 
@@ -290,7 +418,7 @@ class WorldStateSync:
             api_source     = api_source,
         )
         self.gods[god_id] = god
-        self.save_all()
+        self._mudou("gods.json", "world_state.json")
         return god
 
     def update_god(self, god_id: str, **kwargs):
@@ -301,7 +429,7 @@ class WorldStateSync:
         for key, value in kwargs.items():
             if hasattr(god, key):
                 setattr(god, key, value)
-        self.save_all()
+        self._mudou("gods.json", "world_state.json")
 
     def delete_god(self, god_id: str):
         """Remove um deus e libera suas zonas."""
@@ -309,9 +437,9 @@ class WorldStateSync:
             return
         for zone_id, gid in list(self.ownership.items()):
             if gid == god_id:
-                self.ownership[zone_id] = None
+                self._set_owner(zone_id, None)
         del self.gods[god_id]
-        self.save_all()
+        self._mudou("gods.json", "world_state.json")
 
     # ── Queries ───────────────────────────────────────────────────────────────
 
@@ -325,9 +453,32 @@ class WorldStateSync:
     def get_all_gods(self) -> list[God]:
         return list(self.gods.values())
 
-    def reload(self):
-        """Recarrega do disco — para hot-reload durante desenvolvimento."""
-        self._load_all()
+    def has_zone(self, zone_id: str) -> bool:
+        """A zona existe no mapa? (sem world_regions.json não há como validar: True)"""
+        territories = self._get_territories()
+        return territories is None or zone_id in territories.zones
+
+    def descartar(self):
+        """Abandona as mutações ainda não gravadas (ex.: comando que falhou no meio de uma transação)."""
+        self._sujos.clear()
+        self.reload(forcar=True)
+
+    def reload(self, forcar: bool = False) -> list[str]:
+        """
+        Recarrega do disco só os arquivos alterados por outro processo
+        (mtime/tamanho mudaram desde a última leitura ou escrita nossa).
+        Retorna os arquivos relidos.
+        """
+        relidos = []
+        if forcar or self._assinatura("gods.json") != self._assinaturas.get("gods.json"):
+            self._load_gods()
+            relidos.append("gods.json")
+        if forcar or self._assinatura("world_state.json") != self._assinaturas.get("world_state.json"):
+            self._load_world_state()
+            relidos.append("world_state.json")
+        if relidos:
+            self.revisao += 1
+        return relidos
 
     # ── API Stub (Futuro) ─────────────────────────────────────────────────────
 
@@ -0,0 +1,171 @@
+"""
+NEURAL FIGHTS - Territory Layers
+Camadas estáticas dos territórios pré-rasterizadas por faixa de zoom.
+
+Preencher um polígono com alpha exige uma superfície SRCALPHA; fazer isso
+para cada zona a cada frame (do tamanho da tela!) domina o tempo do mapa.
+Aqui a parte que não depende do tempo (fill base, borda base, fundo dos
+selos) é rasterizada uma vez por zona, num recorte do tamanho do polígono,
+em zooms discretos (ZOOM_BUCKETS_POR_OITAVA por oitava). No frame:
+
+  - pan: a camada é só blitada com outro offset
+  - zoom fora do bucket: a camada do bucket mais próximo é reescalada uma
+    vez e reaproveitada enquanto o zoom não mudar
+  - zoom muito acima de ZOOM_MAX_RASTER (pôsteres do map_snapshot): se a
+    versão reescalada passar de max_pixels_escala, a zona é desenhada direto
+    num rascunho do tamanho do destino — memória limitada pelo destino
+
+A chave de cada camada inclui o estilo (natureza, cores, alpha), então
+trocar o dono de uma zona gera uma camada nova; as antigas saem pela ordem
+LRU quando o orçamento de pixels estoura.
+
+    cache = TerritoryLayerCache()
+    cache.blit(map_surface, camera, PANEL_W, ("zone_x", estilo), zone.vertices,
+               lambda s, verts, zoom: pygame.draw.polygon(s, cor, verts))
+    cache.end_frame()
+"""
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+ZOOM_BUCKETS_POR_OITAVA = 4
+ZOOM_MIN_RASTER = 0.25
+ZOOM_MAX_RASTER = 2.0     # Acima disso a camada é ampliada (bordas escalam linearmente)
+PAD = 8                   # Margem em px para a espessura da borda
+
+
+def zoom_bucket(zoom: float) -> float:
+    """Zoom discreto mais próximo, em passos de 2^(1/N)."""
+    k = round(math.log2(max(zoom, 1e-3)) * ZOOM_BUCKETS_POR_OITAVA)
+    return min(max(2.0 ** (k / ZOOM_BUCKETS_POR_OITAVA), ZOOM_MIN_RASTER), ZOOM_MAX_RASTER)
+
+
+class ZoneLayer:
+    """Recorte rasterizado de uma zona: pixel (0, 0) = mundo (x0, y0) - PAD/zoom."""
+    __slots__ = ("surface", "x0", "y0", "zoom")
+
+    def __init__(self, surface: pygame.Surface, x0: float, y0: float, zoom: float):
+        self.surface = surface
+        self.x0      = x0
+        self.y0      = y0
+        self.zoom    = zoom
+
+    @property
+    def pixels(self) -> int:
+        return self.surface.get_width() * self.surface.get_height()
+
+
+class TerritoryLayerCache:
+    """
+    LRU de ZoneLayer por (key, bucket), limitado por max_pixels.
+    As versões reescaladas para o zoom exato ficam num segundo dicionário
+    que só guarda o que foi desenhado no último frame.
+    """
+
+    def __init__(self, max_pixels: int = 16_000_000, max_pixels_escala: int = 4_000_000):
+        self.max_pixels = max_pixels
+        self.max_pixels_escala = max_pixels_escala
+        self._rascunho: pygame.Surface | None = None
+        self._layers: OrderedDict = OrderedDict()   # (key, bucket) → ZoneLayer
+        self._pixels  = 0
+        self._scaled: dict = {}                     # key → (bucket, zoom, Surface)
+        self._used: set   = set()
+        self.rasterized = 0
+        self.rescaled   = 0
+
+    def get(self, key, vertices: list, zoom: float, draw_fn) -> ZoneLayer:
+        """
+        Camada da zona no bucket de `zoom`. draw_fn(surface, verts_locais, zoom_bucket)
+        só é chamado quando a camada não está no cache.
+        """
+        bucket = zoom_bucket(zoom)
+        k = (key, bucket)
+        layer = self._layers.get(k)
+        if layer is not None:
+            self._layers.move_to_end(k)
+            return layer
+
+        xs = [v[0] for v in vertices]
+        ys = [v[1] for v in vertices]
+        x0, y0 = min(xs), min(ys)
+        w = int((max(xs) - x0) * bucket) + 2 * PAD + 1
+        h = int((max(ys) - y0) * bucket) + 2 * PAD + 1
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        local = [((x - x0) * bucket + PAD, (y - y0) * bucket + PAD) for x, y in vertices]
+        draw_fn(surf, local, bucket)
+
+        layer = ZoneLayer(surf, x0, y0, bucket)
+        self._layers[k] = layer
+        self._pixels += layer.pixels
+        self.rasterized += 1
+        while self._pixels > self.max_pixels and len(self._layers) > 1:
+            _, old = self._layers.popitem(last=False)
+            self._pixels -= old.pixels
+        return layer
+
+    def blit(self, dest: pygame.Surface, camera, offset_x: int,
+             key, vertices: list, draw_fn):
+        """Desenha a camada da zona em `dest` na posição atual da câmera."""
+        zoom  = camera.zoom
+        layer = self.get(key, vertices, zoom, draw_fn)
+        scale = zoom / layer.zoom
+
+        surf = layer.surface
+        if abs(scale - 1.0) > 1e-3:
+            cached = self._scaled.get(key)
+            if cached and cached[0] == layer.zoom and cached[1] == zoom:
+                surf = cached[2]
+            else:
+                size = (max(1, round(surf.get_width() * scale)),
+                        max(1, round(surf.get_height() * scale)))
+                if size[0] * size[1] > self.max_pixels_escala:
+                    self._desenhar_direto(dest, camera, offset_x, vertices, draw_fn)
+                    return
+                surf = pygame.transform.smoothscale(surf, size)
+                self._scaled[key] = (layer.zoom, zoom, surf)
+                self.rescaled += 1
+        self._used.add(key)
+
+        sx = (layer.x0 - camera.offset_x) * zoom - PAD * scale - offset_x
+        sy = (layer.y0 - camera.offset_y) * zoom - PAD * scale
+        dest.blit(surf, (round(sx), round(sy)))
+
+    def _desenhar_direto(self, dest: pygame.Surface, camera, offset_x: int,
+                         vertices: list, draw_fn):
+        """Rasteriza a zona no zoom exato, só no recorte visível do destino."""
+        zoom = camera.zoom
+        verts = [((x - camera.offset_x) * zoom - offset_x, (y - camera.offset_y) * zoom)
+                 for x, y in vertices]
+        pad = int(PAD * max(1.0, zoom / ZOOM_MAX_RASTER))
+        xs = [v[0] for v in verts]
+        ys = [v[1] for v in verts]
+        area = pygame.Rect(int(min(xs)) - pad, int(min(ys)) - pad, 0, 0)
+        area.width  = int(max(xs)) + pad - area.x + 1
+        area.height = int(max(ys)) + pad - area.y + 1
+        area = area.clip(dest.get_rect())
+        if not area.width or not area.height:
+            return
+        if self._rascunho is None or self._rascunho.get_size() != dest.get_size():
+            self._rascunho = pygame.Surface(dest.get_size(), pygame.SRCALPHA)
+        rascunho = self._rascunho
+        rascunho.fill((0, 0, 0, 0), area)
+        rascunho.set_clip(area)
+        draw_fn(rascunho, verts, zoom)
+        rascunho.set_clip(None)
+        dest.blit(rascunho, area.topleft, area)
+
+    def end_frame(self):
+        """Descarta as versões reescaladas de zonas que não apareceram no frame."""
+        for key in [k for k in self._scaled if k not in self._used]:
+            del self._scaled[key]
+        self._used.clear()
+
+    def invalidate(self):
+        self._layers.clear()
+        self._scaled.clear()
+        self._pixels = 0
+
+    def __len__(self) -> int:
+        return len(self._layers)
@@ -11,6 +11,7 @@ Coordena todas as camadas visuais:
 """
 
 import math
+import numpy as np
 import pygame
 from map_camera import MapCamera
 from map_territories import TerritoryManager, Zone
@@ -20,6 +21,8 @@ from map_vfx import (
     BattleFlareRenderer, SealCrackRenderer,
     ParticleSystem, hex_to_rgb, lerp_color, pulse
 )
+from map_text import get_font, TextCache
+from map_layers import TerritoryLayerCache
 
 
 # ── Cores do Tema (do theme.py original) ─────────────────────────────────────
@@ -61,20 +64,33 @@ class MapRenderer:
         self.map_surface = pygame.Surface(
             (self.screen_w - self.PANEL_W, self.screen_h), pygame.SRCALPHA)
 
+        # Partes animadas (pulsos, rachaduras, seleção) — limpo e blitado uma vez por frame
+        self.live_overlay = pygame.Surface(self.map_surface.get_size(), pygame.SRCALPHA)
+        # Partes estáticas dos territórios, pré-rasterizadas por faixa de zoom
+        self.layers = TerritoryLayerCache()
+
         self.particles    = ParticleSystem()
         self.battle_flare = BattleFlareRenderer()
 
         self._init_fonts()
+        # Labels das zonas dependem do dono: cache próprio, limpo a cada revisão do mundo
+        self._labels = TextCache(capacidade=256)
+        self._labels_revisao = -1
         self._selected_zone: Zone | None = None
+        self._visible_zones: list[Zone] = []
+        # Arrays dos flares de batalha (ver _flare_arrays)
+        self._flares_lista = None
+        self._flares_chave = None
+        self._flares = None
         self._time: float = 0.0
 
     def _init_fonts(self):
-        self.font_tiny   = pygame.font.SysFont("consolas", 9)
-        self.font_small  = pygame.font.SysFont("consolas", 11)
-        self.font_medium = pygame.font.SysFont("consolas", 14, bold=True)
-        self.font_large  = pygame.font.SysFont("consolas", 18, bold=True)
-        self.font_title  = pygame.font.SysFont("consolas", 22, bold=True)
-        self.font_huge   = pygame.font.SysFont("consolas", 28, bold=True)
+        self.font_tiny   = get_font(9)
+        self.font_small  = get_font(11)
+        self.font_medium = get_font(14, bold=True)
+        self.font_large  = get_font(18, bold=True)
+        self.font_title  = get_font(22, bold=True)
+        self.font_huge   = get_font(28, bold=True)
 
     # ── Loop Principal ────────────────────────────────────────────────────────
 
@@ -88,13 +104,7 @@ class MapRenderer:
         self.screen.fill(BG_COLOR)
 
         # 2. Renderiza o mapa na sua superfície
-        self.map_surface.fill(BG_COLOR)
-        self._draw_map_background()
-        self._draw_territories()
-        self._draw_ancient_seals()
-        self._draw_battle_flares()
-        self._draw_zone_labels()
-        self.particles.draw(self.map_surface)
+        self.render_map()
         self._draw_map_overlay()
 
         # 3. Blita o mapa na tela principal
@@ -106,6 +116,32 @@ class MapRenderer:
         # 5. HUD global (barra superior)
         self._draw_top_hud()
 
+    def render_map(self, particulas: bool = True) -> pygame.Surface:
+        """
+        Só o mapa (sem painel, HUD e moldura) em self.map_surface.
+        particulas=False: flares não emitem nem desenham partículas (snapshots
+        saem iguais a cada execução).
+        """
+        self.map_surface.fill(BG_COLOR)
+        self.live_overlay.fill((0, 0, 0, 0))
+        self._update_visible_zones()
+        self._draw_map_background()
+        self._draw_territories()
+        self._draw_ancient_seals()
+        self.map_surface.blit(self.live_overlay, (0, 0))
+        self.layers.end_frame()
+        self._draw_battle_flares(self.particles if particulas else None)
+        self._draw_zone_labels()
+        if particulas:
+            self.particles.draw(self.map_surface)
+        return self.map_surface
+
+    def _update_visible_zones(self):
+        """Culling pelo índice espacial: zonas cuja bbox toca a área do mapa (+100px)."""
+        rect = self.camera.visible_world_rect(
+            self.PANEL_W, 0, self.screen_w, self.screen_h, margin=100)
+        self._visible_zones = self.territories.zones_in_rect(*rect)
+
     # ── Background do Mapa ────────────────────────────────────────────────────
 
     def _draw_map_background(self):
@@ -114,33 +150,32 @@ class MapRenderer:
         grid_color = (30, 34, 54)
         grid_world = 100  # A cada 100 world units, uma linha
 
+        # Só as linhas dentro da área visível (índices calculados, sem varrer o mundo)
+        cam = self.camera
+        w0, _ = cam.screen_to_world(self.PANEL_W, 0)
+        w1, _ = cam.screen_to_world(self.PANEL_W + s.get_width(), 0)
+        _, h0 = cam.screen_to_world(0, 0)
+        _, h1 = cam.screen_to_world(0, s.get_height())
+
         # Linhas verticais
-        wx = 0
-        while wx <= 2000:
-            sx, _ = self.camera.world_to_screen(wx, 0)
+        for i in range(max(0, int(w0 // grid_world)), min(2000, int(w1)) // grid_world + 1):
+            sx, _ = cam.world_to_screen(i * grid_world, 0)
             sx -= self.PANEL_W  # Ajusta para coordenada da map_surface
-            if -2 < sx < s.get_width() + 2:
-                pygame.draw.line(s, grid_color, (sx, 0), (sx, s.get_height()), 1)
-            wx += grid_world
+            pygame.draw.line(s, grid_color, (sx, 0), (sx, s.get_height()), 1)
 
         # Linhas horizontais
-        wy = 0
-        while wy <= 1400:
-            _, sy = self.camera.world_to_screen(0, wy)
-            if -2 < sy < s.get_height() + 2:
-                pygame.draw.line(s, grid_color, (0, sy), (s.get_width(), sy), 1)
-            wy += grid_world
+        for i in range(max(0, int(h0 // grid_world)), min(1400, int(h1)) // grid_world + 1):
+            _, sy = cam.world_to_screen(0, i * grid_world)
+            pygame.draw.line(s, grid_color, (0, sy), (s.get_width(), sy), 1)
 
     # ── Territórios ───────────────────────────────────────────────────────────
 
     def _draw_territories(self):
         ownership = self.world_state.ownership
 
-        for zone in self.territories.get_all_zones():
+        for zone in self._visible_zones:
             if zone.ancient_seal:
                 continue
-            if not self.camera.is_polygon_visible(zone.vertices, 100):
-                continue
 
             verts = self._zone_verts_to_map_surface(zone.vertices)
             if not verts:
@@ -154,38 +189,44 @@ class MapRenderer:
                 cs = hex_to_rgb(god.color_secondary)
                 nature = god.nature_element
                 alpha = 110 if zone != self._selected_zone else 150
-                # Fill
-                TerritoryFillRenderer.draw(
-                    self.map_surface, verts, nature, cp, cs, self._time, alpha)
-                # Border
-                NatureBorderRenderer.draw(
-                    self.map_surface, verts, nature, cp, cs,
+                # Fill + borda: base pré-rasterizada, pulso no overlay
+                self.layers.blit(
+                    self.map_surface, self.camera, self.PANEL_W,
+                    (zone.zone_id, nature, cp, cs, alpha), zone.vertices,
+                    lambda s, v, z, n=nature, cp=cp, cs=cs, a=alpha: (
+                        TerritoryFillRenderer.draw_static(s, v, n, cp, cs, a),
+                        NatureBorderRenderer.draw_static(s, v, n, cp, cs, z)))
+                TerritoryFillRenderer.draw_live(
+                    self.live_overlay, verts, nature, cp, cs, self._time, alpha)
+                NatureBorderRenderer.draw_live(
+                    self.live_overlay, verts, nature, cp, cs,
                     self._time, self.camera.zoom)
             else:
                 # Território não reivindicado
-                self._draw_unclaimed(verts, zone)
+                self.layers.blit(
+                    self.map_surface, self.camera, self.PANEL_W,
+                    (zone.zone_id, "unclaimed"), zone.vertices, self._draw_unclaimed)
 
             # Highlight de seleção
             if zone == self._selected_zone:
                 self._draw_selection_highlight(verts)
 
-    def _draw_unclaimed(self, verts, zone: Zone):
+    @staticmethod
+    def _draw_unclaimed(layer: pygame.Surface, verts, zoom: float):
         """Território sem dono — cinza com sutíl variação baseada na natureza base."""
-        s = pygame.Surface(self.map_surface.get_size(), pygame.SRCALPHA)
-        pygame.draw.polygon(s, (*UNCLAIMED_COLOR, 80), verts)
-        self.map_surface.blit(s, (0, 0))
-        pygame.draw.polygon(self.map_surface, UNCLAIMED_BORDER, verts, 1)
+        pygame.draw.polygon(layer, (*UNCLAIMED_COLOR, 80), verts)
+        pygame.draw.polygon(layer, UNCLAIMED_BORDER, verts, 1)
 
     def _draw_selection_highlight(self, verts):
         """Borda pulsante no território selecionado."""
         glow = int(200 + pulse(self._time, 3) * 55)
-        pygame.draw.polygon(self.map_surface, (glow, glow, 100), verts, 3)
+        pygame.draw.polygon(self.live_overlay, (glow, glow, 100), verts, 3)
 
     # ── Selos Antigos ─────────────────────────────────────────────────────────
 
     def _draw_ancient_seals(self):
-        for zone in self.territories.get_ancient_seal_zones():
-            if not self.camera.is_polygon_visible(zone.vertices, 100):
+        for zone in self._visible_zones:
+            if not zone.ancient_seal:
                 continue
 
             verts = self._zone_verts_to_map_surface(zone.vertices)
@@ -196,20 +237,22 @@ class MapRenderer:
             crack_level = seal_data.get("crack_level", zone.crack_level)
             status      = seal_data.get("status", "sleeping")
 
-            # Fundo escuro do selo
-            s = pygame.Surface(self.map_surface.get_size(), pygame.SRCALPHA)
-            pygame.draw.polygon(s, (*ANCIENT_BG, 200), verts)
-            self.map_surface.blit(s, (0, 0))
+            # Fundo escuro do selo (estático)
+            self.layers.blit(
+                self.map_surface, self.camera, self.PANEL_W,
+                (zone.zone_id, "seal"), zone.vertices,
+                lambda s, v, z: pygame.draw.polygon(s, (*ANCIENT_BG, 200), v))
 
             # Borda dourada antiga
-            NatureBorderRenderer.draw(
-                self.map_surface, verts, "ancient",
+            NatureBorderRenderer.draw_live(
+                self.live_overlay, verts, "ancient",
                 (180, 140, 60), (220, 200, 120), self._time, self.camera.zoom)
 
             # Rachaduras
             SealCrackRenderer.draw(
-                self.map_surface, verts, zone.zone_id,
-                crack_level, zone.max_cracks, self._time, self.camera.zoom)
+                self.live_overlay, verts, zone.zone_id,
+                crack_level, zone.max_cracks, self._time, self.camera.zoom,
+                overlay=True)
 
             # Ícone de status
             self._draw_seal_status_icon(verts, zone, status, crack_level)
@@ -220,32 +263,47 @@ class MapRenderer:
         icons = {"sleeping": "😴", "stirring": "👁", "awakened": "⚡"}
         icon = icons.get(status, "?")
         font_size = max(10, int(16 * self.camera.zoom))
-        try:
-            font = pygame.font.SysFont("segoeuiemoji", font_size)
-        except Exception:
-            font = self.font_medium
-        label = font.render(icon, True, (220, 200, 120))
-        self.map_surface.blit(label, label.get_rect(center=(cx, cy)))
+        font = get_font(font_size, "segoeuiemoji")
+        label = self._labels.render(icon, font, (220, 200, 120))
+        self.live_overlay.blit(label, label.get_rect(center=(cx, cy)))
 
     # ── Flares de Batalha ─────────────────────────────────────────────────────
 
-    def _draw_battle_flares(self):
-        if not self.world_state.contested:
+    def _draw_battle_flares(self, particles: ParticleSystem | None):
+        contested = self.world_state.contested
+        if not contested:
             return
-        for contest in self.world_state.contested:
-            god_a = self.world_state.get_god(contest.get("god_a"))
-            god_b = self.world_state.get_god(contest.get("god_b"))
-            midpoint = contest.get("midpoint", [1000, 700])
-            if not god_a or not god_b:
-                continue
-            sx, sy = self.camera.world_to_screen(midpoint[0], midpoint[1])
-            sx -= self.PANEL_W
-            if 0 < sx < self.map_surface.get_width() and 0 < sy < self.map_surface.get_height():
-                ca = hex_to_rgb(god_a.color_primary)
-                cb = hex_to_rgb(god_b.color_primary)
-                self.battle_flare.draw(
-                    self.map_surface, (sx, sy), ca, cb,
-                    self._time, self.camera.zoom, self.particles)
+        mid, ia, ib, cores = self._flare_arrays(contested)
+        zoom = self.camera.zoom
+        sx = (mid[:, 0] - self.camera.offset_x) * zoom - self.PANEL_W
+        sy = (mid[:, 1] - self.camera.offset_y) * zoom
+        w, h = self.map_surface.get_size()
+        idx = np.flatnonzero((sx > 0) & (sx < w) & (sy > 0) & (sy < h) & (ia >= 0) & (ib >= 0))
+        if idx.size == 0:
+            return
+        flares = [(x, y, cores[a], cores[b]) for x, y, a, b in zip(
+            sx[idx].astype(np.int32).tolist(), sy[idx].astype(np.int32).tolist(),
+            ia[idx].tolist(), ib[idx].tolist())]
+        self.battle_flare.draw_all(self.map_surface, flares, self._time, zoom, particles)
+
+    def _flare_arrays(self, contested: list):
+        """
+        Midpoints e índices de cor dos deuses de cada borda contestada, em
+        arrays — refeitos só quando a lista de bordas ou os deuses mudam.
+        """
+        chave = (self.world_state.revisao, len(contested))
+        if self._flares_lista is not contested or self._flares_chave != chave:
+            indice, cores = {}, []
+            for god in self.world_state.get_all_gods():
+                indice[god.god_id] = len(cores)
+                cores.append(hex_to_rgb(god.color_primary))
+            mid = np.array([c.get("midpoint", (1000, 700)) for c in contested],
+                           dtype=np.float64).reshape(-1, 2)
+            ia = np.array([indice.get(c.get("god_a"), -1) for c in contested], dtype=np.int32)
+            ib = np.array([indice.get(c.get("god_b"), -1) for c in contested], dtype=np.int32)
+            self._flares = (mid, ia, ib, cores)
+            self._flares_lista, self._flares_chave = contested, chave
+        return self._flares
 
     # ── Labels das Zonas ──────────────────────────────────────────────────────
 
@@ -253,7 +311,13 @@ class MapRenderer:
         if self.camera.zoom < 0.5:
             return  # Muito pequeno para ler
 
-        for zone in self.territories.get_all_zones():
+        if self._labels_revisao != self.world_state.revisao:
+            self._labels.invalidar()
+            self._labels_revisao = self.world_state.revisao
+
+        font_size  = max(8, int(10 * self.camera.zoom))
+        font_size2 = max(7, int(9 * self.camera.zoom))
+        for zone in self._visible_zones:
             cx, cy = zone.centroid
             sx, sy = self.camera.world_to_screen(cx, cy)
             sx -= self.PANEL_W
@@ -264,13 +328,11 @@ class MapRenderer:
 
             # Nome da zona
             if self.camera.zoom >= 0.6:
-                font_size = max(8, int(10 * self.camera.zoom))
-                font = pygame.font.SysFont("consolas", font_size)
+                font = get_font(font_size)
                 god = self.world_state.get_god_for_zone(zone.zone_id)
                 color = TEXT_COLOR if god else TEXT_DIM
 
-                name_surf = font.render(zone.zone_name, True, color)
-                shadow    = font.render(zone.zone_name, True, (0, 0, 0))
+                name_surf, shadow = self._labels.render_sombra(zone.zone_name, font, color)
                 nr = name_surf.get_rect(center=(sx, sy))
                 self.map_surface.blit(shadow, nr.move(1, 1))
                 self.map_surface.blit(name_surf, nr)
@@ -279,10 +341,9 @@ class MapRenderer:
             if self.camera.zoom >= 1.0:
                 god = self.world_state.get_god_for_zone(zone.zone_id)
                 if god:
-                    font_size2 = max(7, int(9 * self.camera.zoom))
-                    font2 = pygame.font.SysFont("consolas", font_size2)
+                    font2 = get_font(font_size2)
                     gcp = hex_to_rgb(god.color_primary)
-                    gsurf = font2.render(f"{god.god_name}", True, gcp)
+                    gsurf = self._labels.render(god.god_name, font2, gcp)
                     gr = gsurf.get_rect(center=(sx, sy + int(12 * self.camera.zoom)))
                     self.map_surface.blit(gsurf, gr)
 
@@ -0,0 +1,201 @@
+"""
+NEURAL FIGHTS - World Map Snapshot
+Renderiza o mapa (ownership atual, bordas contestadas, selos, labels) sem
+janela, pelo próprio MapRenderer com o driver dummy do SDL, e grava tiles PNG
++ manifest.json — para overlays de stream, thumbnails e a pirâmide de tiles
+servida pelo server.py (/tiles/...).
+
+Cada tile é renderizado numa superfície offscreen do tamanho do tile (mais
+uma margem, para labels e flares que cruzam a borda) e gravado na hora: a
+memória não depende do tamanho do pôster. Zonas que ficariam enormes no zoom
+do pôster são rasterizadas direto no tile (ver TerritoryLayerCache).
+
+Modos:
+  - pôster: uma largura em px (a altura segue a proporção do mundo)
+      → <saida>/full/{x}_{y}.png
+  - pirâmide: níveis 0..N-1; o nível L cobre o mundo com 2^L tiles de largura
+      → <saida>/{L}/{x}_{y}.png
+
+Uso:
+    python world_map/map_snapshot.py --largura 16384 --saida snapshots/poster
+    python world_map/map_snapshot.py --niveis 5 --saida data/tiles
+    python run_worldmap.py --snapshot data/tiles --levels 5
+
+    from map_snapshot import gerar_snapshot
+    manifest = gerar_snapshot("data", "snapshots/thumb", largura=1024)
+"""
+
+import json
+import math
+import os
+import time
+from datetime import datetime
+
+TILE_PADRAO = 1024
+MARGEM      = 96          # px renderizados além do tile e descartados
+
+
+def _iniciar_pygame():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))      # fontes e convert() precisam de um display
+    return pygame
+
+
+class SnapshotRenderer:
+    """
+    Um MapRenderer offscreen reaproveitado para todos os tiles.
+    render_tile(x0, y0, zoom) devolve a superfície do tile cujo canto
+    superior esquerdo é o ponto (x0, y0) do mundo.
+    """
+
+    def __init__(self, territories, world_state, tile: int = TILE_PADRAO,
+                 labels: bool = True, t: float = 0.0):
+        import pygame
+        from map_camera import MapCamera
+        from map_renderer import MapRenderer
+
+        self.tile   = tile
+        self.labels = labels
+        lado = tile + 2 * MARGEM
+        meta = territories.meta
+        self.world_w = meta.get("world_width", 2000)
+        self.world_h = meta.get("world_height", 1400)
+
+        # A "tela" inclui a faixa do painel: o mapa começa em PANEL_W
+        self._screen = pygame.Surface((lado + MapRenderer.PANEL_W, lado))
+        self.camera = MapCamera(lado + MapRenderer.PANEL_W, lado,
+                                int(self.world_w), int(self.world_h))
+        self.renderer = MapRenderer(self._screen, self.camera, territories, world_state)
+        self.renderer._time = t                 # animações congeladas num instante fixo
+        if not labels:
+            self.renderer._draw_zone_labels = lambda: None
+
+    def render_tile(self, x0: float, y0: float, zoom: float):
+        cam = self.camera
+        cam.zoom = zoom
+        cam.offset_x = x0 - (self.renderer.PANEL_W + MARGEM) / zoom
+        cam.offset_y = y0 - MARGEM / zoom
+        mapa = self.renderer.render_map(particulas=False)
+        return mapa.subsurface((MARGEM, MARGEM, self.tile, self.tile))
+
+
+def _grade(largura: int, altura: int, tile: int) -> tuple[int, int]:
+    return math.ceil(largura / tile), math.ceil(altura / tile)
+
+
+def renderizar_nivel(snap: SnapshotRenderer, pasta: str, largura: int, nome: str,
+                     progresso=None) -> dict:
+    """Renderiza o mundo com `largura` px em tiles dentro de pasta/nome/."""
+    import pygame
+
+    zoom   = largura / snap.world_w
+    altura = max(1, round(snap.world_h * zoom))
+    tile   = snap.tile
+    colunas, linhas = _grade(largura, altura, tile)
+    destino = os.path.join(pasta, nome)
+    os.makedirs(destino, exist_ok=True)
+
+    for ty in range(linhas):
+        for tx in range(colunas):
+            surf = snap.render_tile(tx * tile / zoom, ty * tile / zoom, zoom)
+            # Tiles da borda direita/inferior são cortados no tamanho do pôster
+            w = min(tile, largura - tx * tile)
+            h = min(tile, altura - ty * tile)
+            if (w, h) != (tile, tile):
+                surf = surf.subsurface((0, 0, w, h))
+            caminho = os.path.join(destino, f"{tx}_{ty}.png")
+            pygame.image.save(surf, caminho + ".tmp.png")
+            os.replace(caminho + ".tmp.png", caminho)
+        if progresso:
+            progresso(f"[Snapshot] {nome}: linha {ty + 1}/{linhas}")
+
+    return {
+        "level":  nome,
+        "zoom":   zoom,
+        "width":  largura,
+        "height": altura,
+        "cols":   colunas,
+        "rows":   linhas,
+        "tiles":  f"{nome}/{{x}}_{{y}}.png",
+    }
+
+
+def gerar_snapshot(data_dir: str, saida: str, largura: int | None = None,
+                   niveis: int | None = None, tile: int = TILE_PADRAO,
+                   labels: bool = True, progresso=None) -> dict:
+    """
+    Renderiza o estado atual de data_dir em `saida` e grava saida/manifest.json.
+    largura: modo pôster. niveis: pirâmide 0..niveis-1 (padrão se nenhum for dado: 3).
+    Retorna o manifest.
+    """
+    _iniciar_pygame()
+    from map_god_registry import WorldStateSync
+    from map_territories import TerritoryManager
+    from map_text import reset_fonts
+
+    territories = TerritoryManager(data_dir)
+    world_state = WorldStateSync(data_dir, territories=territories)
+    snap = SnapshotRenderer(territories, world_state, tile=tile, labels=labels)
+    os.makedirs(saida, exist_ok=True)
+
+    t0 = time.perf_counter()
+    if largura:
+        levels = [renderizar_nivel(snap, saida, int(largura), "full", progresso)]
+    else:
+        levels = [renderizar_nivel(snap, saida, tile * 2 ** nivel, str(nivel), progresso)
+                  for nivel in range(niveis or 3)]
+
+    manifest = {
+        "world": {
+            "name":   territories.meta.get("world_name", ""),
+            "width":  snap.world_w,
+            "height": snap.world_h,
+        },
+        "tile_size":      tile,
+        "labels":         labels,
+        "generated_at":   datetime.now().isoformat(timespec="seconds"),
+        "render_seconds": round(time.perf_counter() - t0, 2),
+        "world_state":    {
+            "revision":       world_state.revisao,
+            "zones_claimed":  sum(1 for g in world_state.ownership.values() if g),
+            "contested":      len(world_state.contested),
+        },
+        "levels": levels,
+    }
+    caminho = os.path.join(saida, "manifest.json")
+    with open(caminho + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(caminho + ".tmp", caminho)
+    reset_fonts()
+    return manifest
+
+
+def main(argv=None):
+    import argparse
+
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Snapshot headless do World Map em tiles PNG")
+    parser.add_argument("--dados", default=os.path.join(raiz, "data"),
+                        help="Pasta com world_regions.json / world_state.json / gods.json")
+    parser.add_argument("--saida", default=os.path.join(raiz, "data", "tiles"))
+    modo = parser.add_mutually_exclusive_group()
+    modo.add_argument("--largura", type=int, help="Pôster com esta largura em px")
+    modo.add_argument("--niveis", type=int, help="Pirâmide de tiles com N níveis (padrão: 3)")
+    parser.add_argument("--tile", type=int, default=TILE_PADRAO)
+    parser.add_argument("--sem-labels", action="store_true")
+    args = parser.parse_args(argv)
+
+    manifest = gerar_snapshot(args.dados, args.saida, largura=args.largura,
+                              niveis=args.niveis, tile=args.tile,
+                              labels=not args.sem_labels, progresso=print)
+    total = sum(l["cols"] * l["rows"] for l in manifest["levels"])
+    print(f"[Snapshot] {total} tiles em {manifest['render_seconds']}s → {args.saida}")
+    return manifest
+
+
+if __name__ == "__main__":
+    main()
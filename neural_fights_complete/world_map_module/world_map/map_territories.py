@@ -1,6 +1,11 @@
 """
 NEURAL FIGHTS - Territory System
 Carrega world_regions.json, detecta cliques em polígonos, busca vizinhos.
+
+Índice espacial: cada zona tem sua bounding box pré-calculada e é registrada
+numa grade uniforme (célula ~ tamanho médio de zona). Cliques e culling da
+câmera consultam só as células tocadas, então o custo não cresce com o
+número de zonas do mundo.
 """
 
 import json
@@ -46,13 +51,24 @@ class TerritoryManager:
       - Hit detection (ponto dentro de polígono)
       - Lookup de vizinhos por zone_id
       - Lookup de zonas por god_id (via world_state)
+      - Índice espacial (grade de bounding boxes) e cache de bordas contestadas
     """
 
     def __init__(self, data_dir: str):
         self.data_dir = data_dir
+        self.meta:      dict              = {}   # _meta do world_regions.json (world_width, ...)
         self.regions:   dict[str, Region] = {}   # region_id → Region
         self.zones:     dict[str, Zone]   = {}   # zone_id   → Zone
+        self.bounds:    dict[str, tuple]  = {}   # zone_id   → (x0, y0, x1, y1)
+        self._ordem:    dict[str, int]    = {}   # zone_id   → ordem de carga (ordem de desenho)
+        self._grade:    dict[tuple, list] = {}   # (cx, cy)  → [zone_id, ...]
+        self._celula:   float             = 100.0
+        self._pares:    dict[str, list]   = {}   # zone_id   → [(a, b), ...] pares vizinhos
+        self._midpoints: dict[tuple, list] = {}  # (a, b)    → [x, y]
+        self._contested: dict | None      = None  # (a, b)   → borda; None = não semeado
+        self._claimable_total = 0
         self._load()
+        self._build_index()
 
     # ── Carregamento ─────────────────────────────────────────────────────────
 
@@ -60,6 +76,7 @@ class TerritoryManager:
         path = os.path.join(self.data_dir, "world_regions.json")
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
+        self.meta = data.get("_meta", {})
 
         for rdata in data["regions"]:
             region = Region(
@@ -90,18 +107,78 @@ class TerritoryManager:
 
             self.regions[region.region_id] = region
 
+    def _build_index(self):
+        """Bounding boxes, grade espacial e pares de vizinhos (uma vez, na carga)."""
+        self.bounds.clear()
+        self._grade.clear()
+        for i, (zid, zone) in enumerate(self.zones.items()):
+            xs = [v[0] for v in zone.vertices]
+            ys = [v[1] for v in zone.vertices]
+            self.bounds[zid] = (min(xs), min(ys), max(xs), max(ys))
+            self._ordem[zid] = i
+
+        if self.bounds:
+            lados = [max(b[2] - b[0], b[3] - b[1]) for b in self.bounds.values()]
+            self._celula = max(8.0, sum(lados) / len(lados))
+        for zid, box in self.bounds.items():
+            for celula in self._celulas(*box):
+                self._grade.setdefault(celula, []).append(zid)
+
+        # Vizinhança simétrica: basta um dos lados declarar
+        self._pares = {zid: [] for zid in self.zones}
+        self._midpoints.clear()
+        for zid, zone in self.zones.items():
+            for nid in zone.neighboring_zones:
+                if nid not in self.zones or nid == zid:
+                    continue
+                par = (zid, nid) if zid < nid else (nid, zid)
+                if par in self._midpoints:
+                    continue
+                self._midpoints[par] = self._midpoint(
+                    self.zones[par[0]].centroid, self.zones[par[1]].centroid)
+                self._pares[par[0]].append(par)
+                self._pares[par[1]].append(par)
+        self._contested = None
+        self._claimable_total = sum(1 for z in self.zones.values() if not z.ancient_seal)
+
+    def _celulas(self, x0: float, y0: float, x1: float, y1: float):
+        c = self._celula
+        for cx in range(math.floor(x0 / c), math.floor(x1 / c) + 1):
+            for cy in range(math.floor(y0 / c), math.floor(y1 / c) + 1):
+                yield (cx, cy)
+
     # ── Hit Detection ─────────────────────────────────────────────────────────
 
     def get_zone_at_world_pos(self, wx: float, wy: float) -> Zone | None:
         """
         Retorna a zona que contém o ponto (wx, wy) em world units.
-        Usa o algoritmo ray-casting para polígonos arbitrários.
+        Usa o algoritmo ray-casting para polígonos arbitrários, só nas zonas
+        da célula da grade cuja bounding box contém o ponto.
         """
-        for zone in self.zones.values():
-            if self._point_in_polygon(wx, wy, zone.vertices):
-                return zone
+        c = self._celula
+        for zid in self._grade.get((math.floor(wx / c), math.floor(wy / c)), ()):
+            x0, y0, x1, y1 = self.bounds[zid]
+            if x0 <= wx <= x1 and y0 <= wy <= y1:
+                zone = self.zones[zid]
+                if self._point_in_polygon(wx, wy, zone.vertices):
+                    return zone
         return None
 
+    def zones_in_rect(self, x0: float, y0: float, x1: float, y1: float) -> list[Zone]:
+        """
+        Zonas cuja bounding box intersecta o retângulo (world units), na ordem
+        de carga. Usado para culling: o renderer passa a área visível da câmera.
+        """
+        achadas = set()
+        for celula in self._celulas(x0, y0, x1, y1):
+            for zid in self._grade.get(celula, ()):
+                if zid in achadas:
+                    continue
+                bx0, by0, bx1, by1 = self.bounds[zid]
+                if bx0 <= x1 and bx1 >= x0 and by0 <= y1 and by1 >= y0:
+                    achadas.add(zid)
+        return [self.zones[zid] for zid in sorted(achadas, key=self._ordem.__getitem__)]
+
     @staticmethod
     def _point_in_polygon(px: float, py: float, vertices: list) -> bool:
         """
@@ -133,33 +210,51 @@ class TerritoryManager:
         Encontra todas as bordas contestadas — pares de zonas vizinhas com donos diferentes.
         ownership: {zone_id: god_id | None}
         Retorna lista de {zone_a, zone_b, god_a, god_b, midpoint}
+
+        Reconstrói o cache inteiro; depois disso update_contested(zone_id, ...)
+        reavalia só as bordas da zona que mudou de dono.
         """
-        seen = set()
-        contested = []
-        for zone_id, god_a in ownership.items():
-            if god_a is None:
-                continue
-            zone = self.zones.get(zone_id)
-            if not zone:
-                continue
-            for neighbor in self.get_neighbors(zone_id):
-                god_b = ownership.get(neighbor.zone_id)
-                if god_b is None or god_b == god_a:
-                    continue
-                # Evita duplicatas (A-B e B-A)
-                pair = tuple(sorted([zone_id, neighbor.zone_id]))
-                if pair in seen:
-                    continue
-                seen.add(pair)
-                midpoint = self._midpoint(zone.centroid, neighbor.centroid)
-                contested.append({
-                    "zone_a":   zone_id,
-                    "zone_b":   neighbor.zone_id,
-                    "god_a":    god_a,
-                    "god_b":    god_b,
-                    "midpoint": midpoint,
-                })
-        return contested
+        self._contested = {}
+        for par in self._midpoints:
+            self._avaliar_par(par, ownership)
+        return list(self._contested.values())
+
+    def update_contested(self, zone_id: str, ownership: dict,
+                         listar: bool = True) -> list[dict] | None:
+        """
+        Atualiza o cache após `zone_id` mudar de dono e retorna as bordas contestadas.
+        listar=False só atualiza o cache (lotes de claims montam a lista uma vez no fim).
+        """
+        if self._contested is None:
+            self.get_contested_borders(ownership)
+        else:
+            for par in self._pares.get(zone_id, ()):
+                self._avaliar_par(par, ownership)
+        return list(self._contested.values()) if listar else None
+
+    def contested_borders(self, ownership: dict) -> list[dict]:
+        """Bordas contestadas do cache (reconstrói se ainda não foi semeado)."""
+        if self._contested is None:
+            return self.get_contested_borders(ownership)
+        return list(self._contested.values())
+
+    def reset_contested(self):
+        """Descarta o cache (ex.: ownership recarregado do disco)."""
+        self._contested = None
+
+    def _avaliar_par(self, par: tuple, ownership: dict):
+        god_a = ownership.get(par[0])
+        god_b = ownership.get(par[1])
+        if god_a is None or god_b is None or god_a == god_b:
+            self._contested.pop(par, None)
+            return
+        self._contested[par] = {
+            "zone_a":   par[0],
+            "zone_b":   par[1],
+            "god_a":    god_a,
+            "god_b":    god_b,
+            "midpoint": list(self._midpoints[par]),
+        }
 
     @staticmethod
     def _midpoint(a: list, b: list) -> list:
@@ -174,7 +269,7 @@ class TerritoryManager:
 
     def get_territory_percentage(self, god_id: str, ownership: dict) -> float:
         """Porcentagem do mundo controlada por um deus (ignora selos antigos)."""
-        total = sum(1 for z in self.zones.values() if not z.ancient_seal)
+        total = self._claimable_total
         owned = sum(1 for zid, gid in ownership.items()
                     if gid == god_id and zid in self.zones
                     and not self.zones[zid].ancient_seal)
@@ -0,0 +1,95 @@
+"""
+NEURAL FIGHTS - World Map Text
+Registro de fontes + cache LRU de superfícies de texto.
+
+pygame.font.SysFont faz uma busca nas fontes do sistema a cada chamada e
+font.render rasteriza o texto de novo toda vez. O mapa desenha as mesmas
+labels (nome da zona, sombra, deus dono, "⚔ CONTESTED") a cada frame, então
+as duas coisas são feitas uma vez só e reaproveitadas:
+
+    font = get_font(12, bold=True)              # mesma instância sempre
+    surf = get_text_cache().render("Ashlands", font, (255, 255, 255))
+    label, sombra = get_text_cache().render_sombra("Ashlands", font, cor)
+
+O cache é indexado por (texto, fonte, cor). Quem desenha texto que depende
+do estado do mundo (dono da zona, nome do deus) chama invalidar() quando
+esse estado muda; o resto sai pela ordem LRU.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+FONTE_PADRAO = "consolas"
+SOMBRA       = (0, 0, 0)
+
+
+# ── Registro de Fontes ───────────────────────────────────────────────────────
+
+_fontes: dict[tuple, pygame.font.Font] = {}
+
+
+def get_font(size: int, family: str = FONTE_PADRAO, bold: bool = False) -> pygame.font.Font:
+    """Fonte compartilhada por (família, tamanho, negrito). Criada na primeira vez."""
+    chave = (family, size, bold)
+    font = _fontes.get(chave)
+    if font is None:
+        try:
+            font = pygame.font.SysFont(family, size, bold=bold)
+        except Exception:
+            font = pygame.font.Font(None, size)
+        _fontes[chave] = font
+    return font
+
+
+def reset_fonts():
+    """Descarta as fontes registradas (ex.: depois de pygame.font.quit())."""
+    _fontes.clear()
+    if TextCache._instance is not None:
+        TextCache._instance.invalidar()
+
+
+# ── Cache de Superfícies ─────────────────────────────────────────────────────
+
+class TextCache:
+    """LRU de superfícies renderizadas, chave (texto, fonte, cor)."""
+
+    _instance: "TextCache | None" = None
+
+    def __init__(self, capacidade: int = 512):
+        self.capacidade = capacidade
+        self._surfs: OrderedDict = OrderedDict()
+        self.hits   = 0
+        self.misses = 0
+
+    def render(self, text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+        # Fontes vêm do registro e vivem o processo todo: a identidade basta como chave
+        chave = (text, font, tuple(color))
+        surf = self._surfs.get(chave)
+        if surf is not None:
+            self._surfs.move_to_end(chave)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, True, color)
+        self._surfs[chave] = surf
+        if len(self._surfs) > self.capacidade:
+            self._surfs.popitem(last=False)
+        return surf
+
+    def render_sombra(self, text: str, font: pygame.font.Font, color: tuple,
+                      sombra: tuple = SOMBRA) -> tuple[pygame.Surface, pygame.Surface]:
+        """(label, sombra) — a sombra é desenhada deslocada (1, 1) pelo chamador."""
+        return self.render(text, font, color), self.render(text, font, sombra)
+
+    def invalidar(self):
+        self._surfs.clear()
+
+    def __len__(self) -> int:
+        return len(self._surfs)
+
+
+def get_text_cache() -> TextCache:
+    if TextCache._instance is None:
+        TextCache._instance = TextCache()
+    return TextCache._instance
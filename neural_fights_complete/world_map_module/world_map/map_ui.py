@@ -8,6 +8,7 @@ import pygame
 from map_god_registry import WorldStateSync, God, NATURE_COLORS, hex_to_rgb
 from map_territories import TerritoryManager
 from map_vfx import pulse
+from map_text import get_font, get_text_cache
 
 
 # Cores do tema
@@ -125,11 +126,11 @@ class GodCreationPanel:
         ox, oy = self.ox, self.oy
         p = 20  # Padding
 
-        self.font_title  = pygame.font.SysFont("consolas", 18, bold=True)
-        self.font_label  = pygame.font.SysFont("consolas", 12, bold=True)
-        self.font_body   = pygame.font.SysFont("consolas", 12)
-        self.font_small  = pygame.font.SysFont("consolas", 10)
-        self.font_btn    = pygame.font.SysFont("consolas", 13, bold=True)
+        self.font_title  = get_font(18, bold=True)
+        self.font_label  = get_font(12, bold=True)
+        self.font_body   = get_font(12)
+        self.font_small  = get_font(10)
+        self.font_btn    = get_font(13, bold=True)
 
         # Campos de texto
         self.field_name = TextField(
@@ -359,9 +360,7 @@ class GodCreationPanel:
             surface.blit(s, rect.topleft)
             pygame.draw.rect(surface, cp, rect, 1 if not selected else 2)
 
-            font_size = 9
-            font = pygame.font.SysFont("consolas", font_size)
-            txt = font.render(label.split()[-1], True, TEXT if selected else DIM)
+            txt = get_text_cache().render(label.split()[-1], get_font(9), TEXT if selected else DIM)
             surface.blit(txt, txt.get_rect(center=rect.center))
 
     def _draw_source_selector(self, surface, x, y):
@@ -375,8 +374,7 @@ class GodCreationPanel:
             color = CYAN if selected else PANEL
             pygame.draw.rect(surface, color, rect, border_radius=4)
             pygame.draw.rect(surface, CYAN if selected else DIM, rect, 1, border_radius=4)
-            font = pygame.font.SysFont("consolas", 11)
-            txt = font.render(label, True, TEXT if selected else DIM)
+            txt = get_text_cache().render(label, get_font(11), TEXT if selected else DIM)
             surface.blit(txt, txt.get_rect(center=rect.center))
 
     def _draw_btn(self, surface, rect, text, color):
@@ -6,7 +6,11 @@ animação de bordas, flares de batalha, rachaduras nos selos antigos.
 
 import math
 import random
+from collections import OrderedDict
+
+import numpy as np
 import pygame
+from map_text import get_font, get_text_cache
 
 
 # ── Utilitários de Cor ────────────────────────────────────────────────────────
@@ -28,65 +32,140 @@ def pulse(t: float, speed: float = 1.0) -> float:
 
 # ── Partículas ────────────────────────────────────────────────────────────────
 
-class Particle:
-    def __init__(self, x, y, vx, vy, color, life, size=2):
-        self.x = x; self.y = y
-        self.vx = vx; self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size
-
-    def update(self, dt: float):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.life -= dt
-
-    @property
-    def alive(self) -> bool:
-        return self.life > 0
-
-    @property
-    def alpha(self) -> int:
-        return int(255 * max(0, self.life / self.max_life))
+PASSOS_ALPHA = 16     # alpha das partículas em degraus: (cor, tamanho, degrau) vira chave de sprite
 
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles: list[Particle] = []
+    """
+    Partículas do mapa em arrays NumPy (x, y, vx, vy, vida, vida_max,
+    tamanho, índice de cor). update() integra e descarta as mortas de uma
+    vez; draw() corta o que está fora da superfície e manda todos os sprites
+    (cacheados por cor/tamanho/alpha) num único blits().
+    """
+
+    _CAMPOS = ("x", "y", "vx", "vy", "vida", "vida_max")
+
+    def __init__(self, capacidade: int = 256):
+        self._n   = 0
+        self._cap = capacidade
+        self._f   = {c: np.zeros(capacidade, dtype=np.float32) for c in self._CAMPOS}
+        self._tam = np.zeros(capacidade, dtype=np.int16)
+        self._cor = np.zeros(capacidade, dtype=np.int16)
+        self._cores: list[tuple] = []          # índice → RGB
+        self._cor_idx: dict[tuple, int] = {}
+        self._sprites: dict[tuple, pygame.Surface] = {}   # (cor, tamanho, degrau) → sprite
+        self._rng = np.random.default_rng()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _reservar(self, k: int):
+        necessario = self._n + k
+        if necessario <= self._cap:
+            return
+        nova = max(necessario, self._cap * 2)
+        for c, arr in self._f.items():
+            novo = np.zeros(nova, dtype=arr.dtype)
+            novo[:self._n] = arr[:self._n]
+            self._f[c] = novo
+        for nome in ("_tam", "_cor"):
+            arr = getattr(self, nome)
+            novo = np.zeros(nova, dtype=arr.dtype)
+            novo[:self._n] = arr[:self._n]
+            setattr(self, nome, novo)
+        self._cap = nova
+
+    def _indice_cor(self, color) -> int:
+        chave = tuple(int(c) for c in color[:3])
+        idx = self._cor_idx.get(chave)
+        if idx is None:
+            if self._n == 0 and len(self._cores) >= 256:
+                # Tabela só cresce com cores novas (deuses criados): recomeça quando vazia
+                self._cores.clear(); self._cor_idx.clear(); self._sprites.clear()
+            idx = len(self._cores)
+            self._cores.append(chave)
+            self._cor_idx[chave] = idx
+        return idx
 
     def emit(self, x, y, color, count=5, speed=30, life=1.5, size=2, direction=None):
-        for _ in range(count):
-            if direction is not None:
-                angle = math.radians(direction + random.uniform(-30, 30))
-            else:
-                angle = random.uniform(0, math.pi * 2)
-            spd = random.uniform(speed * 0.5, speed)
-            vx = math.cos(angle) * spd
-            vy = math.sin(angle) * spd
-            self.particles.append(Particle(
-                x + random.uniform(-5, 5),
-                y + random.uniform(-5, 5),
-                vx, vy, color,
-                random.uniform(life * 0.5, life),
-                size
-            ))
+        n = int(count)
+        if n <= 0:
+            return
+        g = self._rng
+        if direction is not None:
+            angle = np.radians(direction + g.uniform(-30, 30, n))
+        else:
+            angle = g.uniform(0, math.pi * 2, n)
+        spd = g.uniform(speed * 0.5, speed, n)
+        self._reservar(n)
+        a, b = self._n, self._n + n
+        f = self._f
+        f["x"][a:b]  = x + g.uniform(-5, 5, n)
+        f["y"][a:b]  = y + g.uniform(-5, 5, n)
+        f["vx"][a:b] = np.cos(angle) * spd
+        f["vy"][a:b] = np.sin(angle) * spd
+        f["vida"][a:b] = f["vida_max"][a:b] = g.uniform(life * 0.5, life, n)
+        self._tam[a:b] = size
+        self._cor[a:b] = self._indice_cor(color)
+        self._n = b
 
     def update(self, dt: float):
-        self.particles = [p for p in self.particles if p.alive]
-        for p in self.particles:
-            p.update(dt)
+        n = self._n
+        if n == 0:
+            return
+        f = self._f
+        vivas = f["vida"][:n] > 0          # mesma ordem de antes: descarta, depois integra
+        k = int(np.count_nonzero(vivas))
+        if k < n:
+            for arr in f.values():
+                arr[:k] = arr[:n][vivas]
+            self._tam[:k] = self._tam[:n][vivas]
+            self._cor[:k] = self._cor[:n][vivas]
+            self._n = n = k
+        f["x"][:n] += f["vx"][:n] * dt
+        f["y"][:n] += f["vy"][:n] * dt
+        f["vida"][:n] -= dt
 
     def draw(self, surface: pygame.Surface):
-        for p in self.particles:
-            if p.size <= 1:
-                px, py = int(p.x), int(p.y)
-                if 0 <= px < surface.get_width() and 0 <= py < surface.get_height():
-                    surface.set_at((px, py), (*p.color[:3], p.alpha))
-            else:
-                s = pygame.Surface((p.size*2, p.size*2), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*p.color[:3], p.alpha), (p.size, p.size), p.size)
-                surface.blit(s, (int(p.x - p.size), int(p.y - p.size)))
+        n = self._n
+        if n == 0:
+            return
+        f = self._f
+        w, h = surface.get_size()
+        x, y, tam = f["x"][:n], f["y"][:n], self._tam[:n]
+        idx = np.flatnonzero((x > -tam) & (y > -tam) & (x < w + tam) & (y < h + tam))
+        if idx.size == 0:
+            return
+        ratio = np.clip(f["vida"][idx] / f["vida_max"][idx], 0.0, 1.0)
+        degrau = np.ceil(ratio * PASSOS_ALPHA).astype(np.int32)
+        raio = tam[idx].astype(np.int32)
+        canto = np.where(raio > 1, raio, 0)      # sprite de 1 px fica no próprio ponto
+        px = (x[idx] - canto).astype(np.int32)
+        py = (y[idx] - canto).astype(np.int32)
+
+        sprites = self._sprites
+        cores = self._cores
+        blits = []
+        for sx, sy, r, c, d in zip(px.tolist(), py.tolist(), raio.tolist(),
+                                   self._cor[idx].tolist(), degrau.tolist()):
+            if d <= 0:
+                continue
+            chave = (c, r, d)
+            sprite = sprites.get(chave)
+            if sprite is None:
+                sprite = sprites[chave] = _sprite_particula(cores[c], r, d * 255 // PASSOS_ALPHA)
+            blits.append((sprite, (sx, sy)))
+        surface.blits(blits, doreturn=False)
+
+
+def _sprite_particula(color: tuple, size: int, alpha: int) -> pygame.Surface:
+    if size <= 1:
+        s = pygame.Surface((1, 1), pygame.SRCALPHA)
+        s.fill((*color, alpha))
+        return s
+    s = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(s, (*color, alpha), (size, size), size)
+    return s
 
 
 # ── Renderizador de Bordas por Natureza ───────────────────────────────────────
@@ -95,6 +174,12 @@ class NatureBorderRenderer:
     """
     Renderiza a borda de um território baseado na Natureza do deus dono.
     Cada natureza tem estilo visual único.
+
+    Cada estilo é dividido em duas partes:
+      - estática: não depende do tempo, vai para a camada pré-rasterizada
+        do território (ver map_layers.TerritoryLayerCache)
+      - animada: desenhada a cada frame num overlay SRCALPHA transparente
+        que o chamador blita por cima (cores RGBA são escritas direto)
     """
 
     @staticmethod
@@ -102,6 +187,8 @@ class NatureBorderRenderer:
              color_primary: tuple, color_secondary: tuple, t: float,
              zoom: float):
         """
+        Desenho imediato (estática + animada no mesmo frame, sem camadas).
+
         surface: onde desenhar
         screen_verts: polígono em screen pixels
         nature: nature_element do deus
@@ -109,36 +196,47 @@ class NatureBorderRenderer:
         t: tempo global (para animações)
         zoom: zoom atual da câmera
         """
+        NatureBorderRenderer.draw_static(
+            surface, screen_verts, nature, color_primary, color_secondary, zoom)
+        if NatureBorderRenderer.is_animated(nature):
+            overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            NatureBorderRenderer.draw_live(
+                overlay, screen_verts, nature, color_primary, color_secondary, t, zoom)
+            surface.blit(overlay, (0, 0))
+
+    @staticmethod
+    def draw_static(surface: pygame.Surface, screen_verts: list, nature: str,
+                    color_primary: tuple, color_secondary: tuple, zoom: float):
+        if len(screen_verts) < 3:
+            return
         w = max(1, int(2 * zoom))  # Espessura base da borda
+        fn = _BORDER_STYLES.get(nature, _BORDER_DEFAULT)[0]
+        if fn:
+            fn(surface, screen_verts, color_primary, color_secondary, w)
 
-        dispatch = {
-            "balanced":    NatureBorderRenderer._balance,
-            "fire":        NatureBorderRenderer._fire,
-            "ice":         NatureBorderRenderer._ice,
-            "darkness":    NatureBorderRenderer._darkness,
-            "nature":      NatureBorderRenderer._nature,
-            "nature_vines":NatureBorderRenderer._nature,
-            "chaos":       NatureBorderRenderer._chaos,
-            "void":        NatureBorderRenderer._void,
-            "greed":       NatureBorderRenderer._greed,
-            "fear":        NatureBorderRenderer._fear_spikes,
-            "fear_spikes": NatureBorderRenderer._fear_spikes,
-            "arcane":      NatureBorderRenderer._arcane,
-            "ancient":     NatureBorderRenderer._ancient,
-        }
-        fn = dispatch.get(nature, NatureBorderRenderer._default)
-        fn(surface, screen_verts, color_primary, color_secondary, t, w)
-
-    @staticmethod
-    def _default(surface, verts, cp, cs, t, w):
-        if len(verts) >= 3:
-            pygame.draw.polygon(surface, cp, verts, max(1, w))
+    @staticmethod
+    def draw_live(overlay: pygame.Surface, screen_verts: list, nature: str,
+                  color_primary: tuple, color_secondary: tuple, t: float, zoom: float):
+        if len(screen_verts) < 3:
+            return
+        w = max(1, int(2 * zoom))
+        fn = _BORDER_STYLES.get(nature, _BORDER_DEFAULT)[1]
+        if fn:
+            fn(overlay, screen_verts, color_primary, color_secondary, t, w)
+
+    @staticmethod
+    def is_animated(nature: str) -> bool:
+        return _BORDER_STYLES.get(nature, _BORDER_DEFAULT)[1] is not None
+
+    # ── Estilos (estático: surface, verts, cp, cs, w / animado: + t) ─────────
+
+    @staticmethod
+    def _default(surface, verts, cp, cs, w):
+        pygame.draw.polygon(surface, cp, verts, max(1, w))
 
     @staticmethod
     def _balance(surface, verts, cp, cs, t, w):
         """Borda que alterna entre as duas cores do Balance."""
-        if len(verts) < 3:
-            return
         blend = pulse(t, 0.4)
         color = lerp_color(cp, cs, blend)
         pygame.draw.polygon(surface, color, verts, max(2, w + 1))
@@ -150,18 +248,14 @@ class NatureBorderRenderer:
     @staticmethod
     def _fire(surface, verts, cp, cs, t, w):
         """Borda flamejante laranja com jitter."""
-        if len(verts) < 3:
-            return
         jitter = int(math.sin(t * 12) * 2)
         jv = [(x + jitter, y + int(math.sin(t * 8 + i) * 2))
               for i, (x, y) in enumerate(verts)]
         pygame.draw.polygon(surface, cp, jv, max(2, w + 2))
 
     @staticmethod
-    def _ice(surface, verts, cp, cs, t, w):
+    def _ice(surface, verts, cp, cs, w):
         """Borda cristalina azul fria."""
-        if len(verts) < 3:
-            return
         pygame.draw.polygon(surface, cp, verts, max(2, w + 1))
         # Detalhe geométrico de cristal
         inner = _shrink_polygon(verts, 4)
@@ -171,18 +265,12 @@ class NatureBorderRenderer:
     @staticmethod
     def _darkness(surface, verts, cp, cs, t, w):
         """Borda que pulsa entre visível e quase invisível."""
-        if len(verts) < 3:
-            return
         alpha = int(180 + pulse(t, 0.3) * 75)
-        s = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        pygame.draw.polygon(s, (*cp, alpha), verts, max(2, w + 2))
-        surface.blit(s, (0, 0))
+        pygame.draw.polygon(surface, (*cp, alpha), verts, max(2, w + 2))
 
     @staticmethod
     def _nature(surface, verts, cp, cs, t, w):
         """Borda orgânica verde com ondulação leve."""
-        if len(verts) < 3:
-            return
         wave = [(x + int(math.sin(t * 3 + i * 0.8) * 2),
                  y + int(math.cos(t * 3 + i * 0.8) * 2))
                 for i, (x, y) in enumerate(verts)]
@@ -191,8 +279,6 @@ class NatureBorderRenderer:
     @staticmethod
     def _chaos(surface, verts, cp, cs, t, w):
         """Borda que treme aleatoriamente — nunca quieta."""
-        if len(verts) < 3:
-            return
         seed = int(t * 20)
         random.seed(seed)
         jv = [(x + random.randint(-3, 3), y + random.randint(-3, 3))
@@ -204,31 +290,28 @@ class NatureBorderRenderer:
     @staticmethod
     def _void(surface, verts, cp, cs, t, w):
         """Borda quase invisível — a escuridão não precisa de bordas."""
-        if len(verts) < 3:
-            return
         alpha = int(80 + pulse(t, 0.2) * 60)
-        s = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        pygame.draw.polygon(s, (*cs, alpha), verts, max(1, w))
-        surface.blit(s, (0, 0))
+        pygame.draw.polygon(surface, (*cs, alpha), verts, max(1, w))
 
     @staticmethod
-    def _greed(surface, verts, cp, cs, t, w):
+    def _greed(surface, verts, cp, cs, w):
         """Borda dupla dourada — mais espessa que o necessário."""
-        if len(verts) < 3:
-            return
         pygame.draw.polygon(surface, cp, verts, max(3, w + 3))
+
+    @staticmethod
+    def _greed_shimmer(surface, verts, cp, cs, t, w):
         inner = _shrink_polygon(verts, 3)
         if inner:
             shimmer = lerp_color(cp, (255, 255, 255), pulse(t, 1.5) * 0.4)
             pygame.draw.polygon(surface, shimmer, inner, 1)
 
     @staticmethod
-    def _fear_spikes(surface, verts, cp, cs, t, w):
-        """Borda com espinhos que se projetam para fora."""
-        if len(verts) < 3:
-            return
+    def _fear_border(surface, verts, cp, cs, w):
         pygame.draw.polygon(surface, cp, verts, max(2, w))
-        # Adiciona espinhos nos vértices
+
+    @staticmethod
+    def _fear_spikes(surface, verts, cp, cs, t, w):
+        """Espinhos que se projetam para fora dos vértices."""
         spike_len = int(8 * (1 + pulse(t, 1.5) * 0.5))
         cx = sum(x for x, y in verts) / len(verts)
         cy = sum(y for x, y in verts) / len(verts)
@@ -244,83 +327,118 @@ class NatureBorderRenderer:
     @staticmethod
     def _arcane(surface, verts, cp, cs, t, w):
         """Borda arcana com brilho pulsante."""
-        if len(verts) < 3:
-            return
         glow = lerp_color(cp, (255, 255, 255), pulse(t, 0.8) * 0.3)
         pygame.draw.polygon(surface, glow, verts, max(2, w + 2))
 
     @staticmethod
     def _ancient(surface, verts, cp, cs, t, w):
         """Borda dourada antiga com padrão de selo."""
-        if len(verts) < 3:
-            return
         glow = lerp_color(cp, (200, 180, 100), pulse(t, 0.5) * 0.5)
         pygame.draw.polygon(surface, glow, verts, max(3, w + 3))
 
 
+_B = NatureBorderRenderer
+_BORDER_DEFAULT = (_B._default, None)
+# nature → (parte estática, parte animada)
+_BORDER_STYLES = {
+    "balanced":    (None,            _B._balance),
+    "fire":        (None,            _B._fire),
+    "ice":         (_B._ice,         None),
+    "darkness":    (None,            _B._darkness),
+    "nature":      (None,            _B._nature),
+    "nature_vines":(None,            _B._nature),
+    "chaos":       (None,            _B._chaos),
+    "void":        (None,            _B._void),
+    "greed":       (_B._greed,       _B._greed_shimmer),
+    "fear":        (_B._fear_border, _B._fear_spikes),
+    "fear_spikes": (_B._fear_border, _B._fear_spikes),
+    "arcane":      (None,            _B._arcane),
+    "ancient":     (None,            _B._ancient),
+}
+
+
 # ── Preenchimento do Território ───────────────────────────────────────────────
 
 class TerritoryFillRenderer:
-    """Renderiza o preenchimento interior de um território."""
+    """
+    Renderiza o preenchimento interior de um território.
+    Mesma divisão estática/animada do NatureBorderRenderer: a base vai para
+    a camada pré-rasterizada e só o pulso é desenhado a cada frame.
+    """
 
     @staticmethod
     def draw(surface: pygame.Surface, screen_verts: list, nature: str,
              color_primary: tuple, color_secondary: tuple, t: float,
              alpha_base: int = 100):
+        """Desenho imediato (estática + animada no mesmo frame, sem camadas)."""
         if len(screen_verts) < 3:
             return
-
         s = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-
-        dispatch = {
-            "balanced":    TerritoryFillRenderer._balance,
-            "fire":        TerritoryFillRenderer._fire,
-            "ice":         TerritoryFillRenderer._ice,
-            "darkness":    TerritoryFillRenderer._darkness,
-            "nature":      TerritoryFillRenderer._nature,
-            "nature_vines":TerritoryFillRenderer._nature,
-            "chaos":       TerritoryFillRenderer._chaos,
-            "void":        TerritoryFillRenderer._void,
-            "greed":       TerritoryFillRenderer._greed,
-            "fear":        TerritoryFillRenderer._darkness,
-            "fear_spikes": TerritoryFillRenderer._darkness,
-            "arcane":      TerritoryFillRenderer._arcane,
-            "ancient":     TerritoryFillRenderer._ancient,
-        }
-        fn = dispatch.get(nature, TerritoryFillRenderer._default)
-        fn(s, screen_verts, color_primary, color_secondary, t, alpha_base)
+        TerritoryFillRenderer.draw_static(
+            s, screen_verts, nature, color_primary, color_secondary, alpha_base)
         surface.blit(s, (0, 0))
+        if TerritoryFillRenderer.is_animated(nature):
+            s.fill((0, 0, 0, 0))
+            TerritoryFillRenderer.draw_live(
+                s, screen_verts, nature, color_primary, color_secondary, t, alpha_base)
+            surface.blit(s, (0, 0))
+
+    @staticmethod
+    def draw_static(layer: pygame.Surface, screen_verts: list, nature: str,
+                    color_primary: tuple, color_secondary: tuple, alpha_base: int = 100):
+        """layer deve ser SRCALPHA: o alpha do polígono é escrito direto."""
+        if len(screen_verts) < 3:
+            return
+        fn = _FILL_STYLES.get(nature, _FILL_DEFAULT)[0]
+        if fn:
+            fn(layer, screen_verts, color_primary, color_secondary, alpha_base)
+
+    @staticmethod
+    def draw_live(overlay: pygame.Surface, screen_verts: list, nature: str,
+                  color_primary: tuple, color_secondary: tuple, t: float,
+                  alpha_base: int = 100):
+        if len(screen_verts) < 3:
+            return
+        fn = _FILL_STYLES.get(nature, _FILL_DEFAULT)[1]
+        if fn:
+            fn(overlay, screen_verts, color_primary, color_secondary, t, alpha_base)
+
+    @staticmethod
+    def is_animated(nature: str) -> bool:
+        return _FILL_STYLES.get(nature, _FILL_DEFAULT)[1] is not None
+
+    # ── Estilos (estático: s, verts, cp, cs, a / animado: + t) ───────────────
 
     @staticmethod
-    def _default(s, verts, cp, cs, t, a):
+    def _default(s, verts, cp, cs, a):
         pygame.draw.polygon(s, (*cp, a), verts)
 
     @staticmethod
     def _balance(s, verts, cp, cs, t, a):
-        # Metade esquerda cp, metade direita cs
-        pygame.draw.polygon(s, (*cp, a), verts)
         # Overlay pulsante da segunda cor
         overlay_a = int(a * pulse(t, 0.4) * 0.4)
         pygame.draw.polygon(s, (*cs, overlay_a), verts)
 
+    @staticmethod
+    def _fire_base(s, verts, cp, cs, a):
+        pygame.draw.polygon(s, (*cp, int(a * 0.7)), verts)
+
     @staticmethod
     def _fire(s, verts, cp, cs, t, a):
-        flicker = int(a * (0.7 + pulse(t, 5) * 0.3))
+        flicker = int(a * pulse(t, 5) * 0.3)
         pygame.draw.polygon(s, (*cp, flicker), verts)
 
     @staticmethod
     def _ice(s, verts, cp, cs, t, a):
-        pygame.draw.polygon(s, (*cp, int(a * 0.7)), verts)
         frost = int(30 * pulse(t, 0.3))
         pygame.draw.polygon(s, (*cs, frost), verts)
 
     @staticmethod
-    def _darkness(s, verts, cp, cs, t, a):
-        pygame.draw.polygon(s, (*cp, int(a * 1.2)), verts)
+    def _darkness(s, verts, cp, cs, a):
+        pygame.draw.polygon(s, (*cp, min(255, int(a * 1.2))), verts)
 
     @staticmethod
     def _nature(s, verts, cp, cs, t, a):
-        pygame.draw.polygon(s, (*cp, a), verts)
         pulse_a = int(20 * pulse(t, 0.6))
         pygame.draw.polygon(s, (*cs, pulse_a), verts)
 
@@ -330,68 +448,139 @@ class TerritoryFillRenderer:
         pygame.draw.polygon(s, (*color, a), verts)
 
     @staticmethod
-    def _void(s, verts, cp, cs, t, a):
+    def _void(s, verts, cp, cs, a):
+        pygame.draw.polygon(s, (*cp, int(a * 0.8)), verts)
+
+    @staticmethod
+    def _greed_base(s, verts, cp, cs, a):
         pygame.draw.polygon(s, (*cp, int(a * 0.8)), verts)
 
     @staticmethod
     def _greed(s, verts, cp, cs, t, a):
-        shimmer = int(a * (0.8 + pulse(t, 1.5) * 0.2))
+        shimmer = int(a * pulse(t, 1.5) * 0.2)
         pygame.draw.polygon(s, (*cp, shimmer), verts)
 
     @staticmethod
     def _arcane(s, verts, cp, cs, t, a):
-        pygame.draw.polygon(s, (*cp, a), verts)
         glow_a = int(25 * pulse(t, 0.9))
         pygame.draw.polygon(s, (255, 255, 255, glow_a), verts)
 
     @staticmethod
     def _ancient(s, verts, cp, cs, t, a):
-        pygame.draw.polygon(s, (*cp, int(a * 0.5)), verts)
         crack_a = int(40 * pulse(t, 0.3))
         pygame.draw.polygon(s, (*cs, crack_a), verts)
 
 
+_F = TerritoryFillRenderer
+_FILL_DEFAULT = (_F._default, None)
+# nature → (parte estática, parte animada)
+# balanced/ice/nature/arcane/ancient não têm base: no desenho antigo a
+# segunda draw.polygon sobrescrevia (não mesclava) a primeira na mesma
+# superfície, então só o pulso aparecia — mantido assim
+_FILL_STYLES = {
+    "balanced":    (None,           _F._balance),
+    "fire":        (_F._fire_base,  _F._fire),
+    "ice":         (None,           _F._ice),
+    "darkness":    (_F._darkness,   None),
+    "nature":      (None,           _F._nature),
+    "nature_vines":(None,           _F._nature),
+    "chaos":       (None,           _F._chaos),
+    "void":        (_F._void,       None),
+    "greed":       (_F._greed_base, _F._greed),
+    "fear":        (_F._darkness,   None),
+    "fear_spikes": (_F._darkness,   None),
+    "arcane":      (None,           _F._arcane),
+    "ancient":     (None,           _F._ancient),
+}
+
+
 # ── Flare de Batalha (⚔ CONTESTED) ───────────────────────────────────────────
 
 class BattleFlareRenderer:
-    """Renderiza o indicador visual de borda contestada entre dois deuses."""
+    """
+    Renderiza o indicador visual de borda contestada entre dois deuses.
+
+    O relâmpago é pré-desenhado em sprites por (cor, tamanho, quadro): o
+    tempo é discretizado em QUADROS_RELAMPAGO quadros por volta, e num frame
+    todos os flares com o mesmo par de cores usam o mesmo sprite.
+    """
+
+    # Passos de cor do texto piscante: a cor vira chave do cache de texto,
+    # então o lerp contínuo é discretizado para não renderizar todo frame
+    PASSOS_COR = 16
+    QUADROS_RELAMPAGO = 48       # por volta completa (2π s)
+    MAX_SPRITES = 2048
 
     def __init__(self):
-        self._font_cache: dict = {}
+        self._sprites: OrderedDict = OrderedDict()   # (cor, tamanho, quadro) → Surface
 
     def get_font(self, size: int) -> pygame.font.Font:
-        if size not in self._font_cache:
-            self._font_cache[size] = pygame.font.SysFont("consolas", size, bold=True)
-        return self._font_cache[size]
+        return get_font(size, bold=True)
 
     def draw(self, surface: pygame.Surface, midpoint_screen: tuple,
              god_a_color: tuple, god_b_color: tuple, t: float, zoom: float,
              particles: ParticleSystem):
-        sx, sy = int(midpoint_screen[0]), int(midpoint_screen[1])
+        self.draw_all(surface, [(midpoint_screen[0], midpoint_screen[1], god_a_color, god_b_color)],
+                      t, zoom, particles)
 
-        # Emite partículas ocasionalmente
-        if random.random() < 0.04:
-            c = god_a_color if random.random() < 0.5 else god_b_color
-            particles.emit(sx, sy, c, count=3, speed=40, life=1.0, size=2)
-
-        # Linha relâmpago entre os dois lados
+    def draw_all(self, surface: pygame.Surface, flares: list, t: float, zoom: float,
+                 particles: ParticleSystem | None):
+        """
+        flares: [(sx, sy, cor_a, cor_b), ...] já em coordenadas da superfície.
+        particles=None: sem emissão de partículas.
+        """
+        if not flares:
+            return
         blend = pulse(t, 4)
-        flash_color = lerp_color(god_a_color, god_b_color, blend)
-        self._draw_lightning(surface, sx, sy, flash_color, t, zoom)
-
-        # Ícone ⚔ e texto CONTESTED
-        font_size = max(8, int(11 * zoom))
-        font = self.get_font(font_size)
-        label = font.render("⚔ CONTESTED", True, flash_color)
-        shadow = font.render("⚔ CONTESTED", True, (0, 0, 0))
-        rect = label.get_rect(center=(sx, sy - int(12 * zoom)))
-        surface.blit(shadow, rect.move(1, 1))
-        surface.blit(label, rect)
+        passo = round(blend * self.PASSOS_COR) / self.PASSOS_COR
+        size = max(4, int(6 * zoom))
+        quadro = int(t / (math.pi * 2) * self.QUADROS_RELAMPAGO) % self.QUADROS_RELAMPAGO
+        font = self.get_font(max(8, int(11 * zoom)))
+        texto = get_text_cache()
+        dy = int(12 * zoom)
+
+        # Emite partículas ocasionalmente (~4% dos flares por frame)
+        if particles is not None:
+            for k in np.flatnonzero(np.random.random(len(flares)) < 0.04).tolist():
+                sx, sy, ca, cb = flares[k]
+                particles.emit(int(sx), int(sy), ca if random.random() < 0.5 else cb,
+                               count=3, speed=40, life=1.0, size=2)
+
+        blits = []
+        por_par: dict = {}
+        for sx, sy, ca, cb in flares:
+            par = por_par.get((ca, cb))
+            if par is None:
+                cor = lerp_color(ca, cb, passo)
+                relampago = self._sprite(cor, size, quadro)
+                label, shadow = texto.render_sombra("⚔ CONTESTED", font, cor)
+                par = por_par[(ca, cb)] = (relampago, relampago.get_width() // 2, label, shadow)
+            relampago, meio, label, shadow = par
+            sx, sy = int(sx), int(sy)
+            rect = label.get_rect(center=(sx, sy - dy))
+            blits.append((relampago, (sx - meio, sy - meio)))
+            blits.append((shadow, rect.move(1, 1)))
+            blits.append((label, rect))
+        surface.blits(blits, doreturn=False)
+
+    def _sprite(self, color: tuple, size: int, quadro: int) -> pygame.Surface:
+        chave = (color, size, quadro)
+        sprite = self._sprites.get(chave)
+        if sprite is not None:
+            self._sprites.move_to_end(chave)
+            return sprite
+        meio = size + 5                       # raio máximo + jitter + espessura
+        sprite = pygame.Surface((meio * 2, meio * 2), pygame.SRCALPHA)
+        t = quadro / self.QUADROS_RELAMPAGO * math.pi * 2
+        self._draw_lightning(sprite, meio, meio, color, t, size, random.Random(quadro))
+        self._sprites[chave] = sprite
+        if len(self._sprites) > self.MAX_SPRITES:
+            self._sprites.popitem(last=False)
+        return sprite
 
     @staticmethod
-    def _draw_lightning(surface, cx, cy, color, t, zoom):
-        """Linha relâmpago simples com jitter."""
-        size = max(4, int(6 * zoom))
+    def _draw_lightning(surface, cx, cy, color, t, size, rng):
+        """Linha relâmpago simples com jitter (o jitter é fixo por quadro)."""
         for i in range(3):
             angle = t * 8 + i * 2.1
             r = size + int(math.sin(angle) * 2)
@@ -399,17 +588,21 @@ class BattleFlareRenderer:
             segs = 5
             for s in range(segs):
                 a = (s / segs) * math.pi * 2 + t
-                jx = cx + int(math.cos(a) * r + random.uniform(-2, 2))
-                jy = cy + int(math.sin(a) * r + random.uniform(-2, 2))
+                jx = cx + int(math.cos(a) * r + rng.uniform(-2, 2))
+                jy = cy + int(math.sin(a) * r + rng.uniform(-2, 2))
                 pts.append((jx, jy))
-            if len(pts) >= 3:
-                pygame.draw.lines(surface, color, True, pts, 1)
+            pygame.draw.lines(surface, color, True, pts, 1)
 
 
 # ── Animação de Rachaduras nos Selos ─────────────────────────────────────────
 
 class SealCrackRenderer:
-    """Renderiza rachaduras progressivas nos selos dos deuses antigos."""
+    """
+    Renderiza rachaduras progressivas nos selos dos deuses antigos.
+    A geometria (ângulos e comprimentos relativos) só depende da zona e do
+    nível de rachadura: é calculada uma vez e reaproveitada; no frame só
+    entram centro, zoom e o pulso do alpha.
+    """
 
     CRACK_COLOR_MAP = {
         "seal_of_balance": (  0, 217, 255),   # #00d9ff
@@ -417,45 +610,57 @@ class SealCrackRenderer:
         "seal_of_greed":   (184, 134,  11),   # #b8860b
     }
 
+    _geometria: dict[tuple, list] = {}       # (zona, nível, máx) → [(dx, dy, bx, by), ...]
+
+    @classmethod
+    def geometria(cls, zone_id: str, crack_level: int, max_cracks: int) -> list:
+        """
+        Pontas das rachaduras e ramos relativas ao centro, para zoom 1.
+        Mesma sequência aleatória de antes (semente = zone_id).
+        """
+        chave = (zone_id, crack_level, max_cracks)
+        geo = cls._geometria.get(chave)
+        if geo is None:
+            rng = random.Random(zone_id)
+            ratio = crack_level / max(max_cracks, 1)
+            geo = []
+            for _ in range(max(1, int(crack_level * 2))):
+                angle = rng.uniform(0, math.pi * 2)
+                length = rng.uniform(10, 40) * ratio
+                branch_angle = angle + rng.uniform(-0.8, 0.8)
+                blen = length * 0.5
+                geo.append((math.cos(angle) * length, math.sin(angle) * length,
+                            math.cos(branch_angle) * blen, math.sin(branch_angle) * blen))
+            cls._geometria[chave] = geo
+        return geo
+
     @staticmethod
     def draw(surface: pygame.Surface, screen_verts: list, zone_id: str,
-             crack_level: int, max_cracks: int, t: float, zoom: float):
+             crack_level: int, max_cracks: int, t: float, zoom: float,
+             overlay: bool = False):
+        """overlay=True: surface já é um overlay SRCALPHA, desenha direto nele."""
         if crack_level == 0 or not screen_verts:
             return
 
         color = SealCrackRenderer.CRACK_COLOR_MAP.get(zone_id, (200, 200, 200))
         cx = sum(x for x, y in screen_verts) / len(screen_verts)
         cy = sum(y for x, y in screen_verts) / len(screen_verts)
+        centro = (int(cx), int(cy))
+        largura, largura_ramo = max(1, int(2 * zoom)), max(1, int(zoom))
 
-        ratio = crack_level / max(max_cracks, 1)
-        n_cracks = max(1, int(crack_level * 2))
-
-        random.seed(zone_id)  # Seed consistente por zona
-        for i in range(n_cracks):
-            angle = random.uniform(0, math.pi * 2)
-            length = random.uniform(10, 40) * ratio * zoom
-            pulse_offset = pulse(t + i * 0.5, 0.8) * 0.3
-
+        s = surface if overlay else pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        for i, (dx, dy, bx, by) in enumerate(
+                SealCrackRenderer.geometria(zone_id, crack_level, max_cracks)):
+            alpha = int(180 + pulse(t + i * 0.5, 0.8) * 0.3 * 75)
             # Linha principal da rachadura
-            end_x = int(cx + math.cos(angle) * length)
-            end_y = int(cy + math.sin(angle) * length)
-
-            alpha = int(180 + pulse_offset * 75)
-            s = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            pygame.draw.line(s, (*color, alpha), (int(cx), int(cy)), (end_x, end_y),
-                             max(1, int(2 * zoom)))
+            pygame.draw.line(s, (*color, alpha), centro,
+                             (int(cx + dx * zoom), int(cy + dy * zoom)), largura)
             # Ramos menores
-            branch_angle = angle + random.uniform(-0.8, 0.8)
-            blen = length * 0.5
-            bx = int(cx + math.cos(branch_angle) * blen)
-            by = int(cy + math.sin(branch_angle) * blen)
-            pygame.draw.line(s, (*color, int(alpha * 0.6)),
-                             (int(cx), int(cy)), (bx, by),
-                             max(1, int(zoom)))
+            pygame.draw.line(s, (*color, int(alpha * 0.6)), centro,
+                             (int(cx + bx * zoom), int(cy + by * zoom)), largura_ramo)
+        if not overlay:
             surface.blit(s, (0, 0))
 
-        random.seed()
-
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 